@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Detect and delete falsely merged multi-source properties.
 
-Walks all multi-source properties in the DB, hashes their cached gallery
-images per source, and flags any merge where two sources share zero
+Walks all multi-source properties in the DB, looks up pHashes for their cached
+gallery images per source (from the ``image_hashes`` index, hashing from disk
+only what isn't indexed yet), and flags any merge where two sources share zero
 matching gallery images (with 3+ images each) as a false merge.
 
 Deleted properties will re-appear on the next scrape as fresh listings
@@ -29,10 +30,23 @@ DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
 MIN_GALLERY_IMAGES = 3
 
 
+def _load_hash_index(conn: sqlite3.Connection, unique_id: str) -> dict[str, tuple[int, str | None]]:
+    """Load indexed gallery pHashes for a property ({filename: (size, phash)})."""
+    try:
+        rows = conn.execute(
+            "SELECT filename, file_size, phash FROM image_hashes WHERE property_unique_id = ?",
+            (unique_id,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return {}  # DB predates the image_hashes migration
+    return {row["filename"]: (row["file_size"], row["phash"]) for row in rows}
+
+
 def _hash_gallery_for_source(
     data_dir: str,
     unique_id: str,
     urls: list[str],
+    indexed: dict[str, tuple[int, str | None]],
 ) -> list[str]:
     """Hash cached gallery images for a single source's URL list."""
     hashes: list[str] = []
@@ -40,7 +54,11 @@ def _hash_gallery_for_source(
         path = find_cached_file(data_dir, unique_id, url, "gallery")
         if path is None:
             continue
-        h = hash_from_disk(path)
+        entry = indexed.get(path.name)
+        if entry is not None and entry[0] == path.stat().st_size:
+            h = entry[1]
+        else:
+            h = hash_from_disk(path)
         if h is not None:
             hashes.append(h)
     return hashes
@@ -89,11 +107,10 @@ def main(data_dir: str, *, dry_run: bool = False) -> None:
             continue
 
         # Hash gallery images per source
+        indexed = _load_hash_index(conn, unique_id)
         hashes_by_source: dict[str, list[str]] = {}
         for source, urls in by_source.items():
-            hashes_by_source[source] = _hash_gallery_for_source(
-                data_dir, unique_id, urls
-            )
+            hashes_by_source[source] = _hash_gallery_for_source(data_dir, unique_id, urls, indexed)
 
         # Compare all source pairs
         pair_matches: dict[tuple[str, str], int] = {}
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark commute lookups: one request per mode vs one request for all modes.
+
+Replays ``tests/fixtures/traveltime_response.json`` through a stand-in
+TravelTime client that adds ``--latency`` ms per call. Every departure
+location in a search gets a travel time taken from the recorded response
+(cycled by location, offset by mode). ``--properties`` synthetic listings are
+then checked two ways:
+
+- ``per-mode``: ``filter_properties`` once per transport mode — a separate
+  time-filter request per mode, each carrying the same locations.
+- ``batched``: ``filter_properties_by_modes`` — one arrival search per mode in
+  each request, with the location chunks sent concurrently.
+
+Both must pick the same best mode per property; the script fails if they don't.
+
+Usage:
+    uv run python scripts/bench_commute.py
+    uv run python scripts/bench_commute.py --properties 500 5000 --latency 300
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from pydantic import HttpUrl
+from traveltimepy.responses.time_filter import TimeFilterResponse
+
+from home_finder.filters.commute import CommuteFilter, CommuteResult, best_commutes
+from home_finder.models import Property, PropertySource, TransportMode
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "traveltime_response.json"
+MODES = (TransportMode.CYCLING, TransportMode.PUBLIC_TRANSPORT)
+
+
+class RecordedClient:
+    """Stand-in for ``traveltimepy.AsyncClient`` answering from the fixture."""
+
+    def __init__(self, recorded: dict[str, Any], latency: float) -> None:
+        self._times = [
+            loc["properties"][0]["travel_time"] for loc in recorded["results"][0]["locations"]
+        ]
+        self._latency = latency
+        self.requests = 0
+
+    def __call__(self, **_: Any) -> "RecordedClient":
+        return self
+
+    async def __aenter__(self) -> "RecordedClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    async def geocoding(self, **_: Any) -> SimpleNamespace:
+        point = SimpleNamespace(geometry=SimpleNamespace(coordinates=[-0.0934, 51.5448]))
+        return SimpleNamespace(features=[point])
+
+    async def time_filter(self, *, arrival_searches: list[Any], **_: Any) -> TimeFilterResponse:
+        self.requests += 1
+        await asyncio.sleep(self._latency)
+        results = []
+        for search in arrival_searches:
+            offset = MODES.index(TransportMode(search.id))
+            locations = []
+            for i, loc_id in enumerate(search.departure_location_ids):
+                seconds = self._times[(i + offset) % len(self._times)]
+                if seconds <= search.travel_time:
+                    locations.append({"id": loc_id, "properties": [{"travel_time": seconds}]})
+            results.append({"search_id": search.id, "locations": locations, "unreachable": []})
+        return TimeFilterResponse.model_validate({"results": results})
+
+
+def _properties(count: int, rng: random.Random) -> list[Property]:
+    return [
+        Property(
+            source=PropertySource.OPENRENT,
+            source_id=str(i),
+            url=HttpUrl(f"https://www.openrent.com/property/{i}"),
+            title=f"Flat {i}",
+            price_pcm=2000,
+            bedrooms=1,
+            address=f"{i} Test Street",
+            postcode="E8 3RH",
+            latitude=51.5 + rng.random() / 10,
+            longitude=-0.1 + rng.random() / 10,
+        )
+        for i in range(count)
+    ]
+
+
+async def _per_mode(commute_filter: CommuteFilter, props: list[Property]) -> list[CommuteResult]:
+    results: list[CommuteResult] = []
+    for mode in MODES:
+        results += await commute_filter.filter_properties(
+            props, max_minutes=30, transport_mode=mode
+        )
+    return results
+
+
+async def _batched(commute_filter: CommuteFilter, props: list[Property]) -> list[CommuteResult]:
+    return await commute_filter.filter_properties_by_modes(
+        props, max_minutes=30, transport_modes=MODES
+    )
+
+
+async def _run(counts: list[int], latency: float) -> None:
+    recorded = json.loads(FIXTURE.read_text())
+    print(f"{'props':>7}  {'per-mode':>14}  {'batched':>14}  {'speedup':>8}")
+    for count in counts:
+        props = _properties(count, random.Random(0))
+        row: list[str] = []
+        picks = []
+        elapsed = []
+        for strategy in (_per_mode, _batched):
+            client = RecordedClient(recorded, latency)
+            CommuteFilter._geocoding_cache.clear()
+            commute_filter = CommuteFilter(
+                app_id="bench", api_key="bench", destination_postcode="N1 5AA"
+            )
+            with patch("traveltimepy.AsyncClient", client):
+                t0 = time.perf_counter()
+                results = await strategy(commute_filter, props)
+                elapsed.append(time.perf_counter() - t0)
+            picks.append(best_commutes(results))
+            row.append(f"{elapsed[-1] * 1000:>8.0f} ms/{client.requests:<3}")
+        if picks[0] != picks[1]:
+            raise SystemExit(f"Mismatch for {count} properties")
+        print(f"{count:>7}  {row[0]:>14}  {row[1]:>14}  {elapsed[0] / elapsed[1]:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--properties", type=int, nargs="+", default=[100, 2500, 10_000])
+    parser.add_argument("--latency", type=float, default=250, help="ms per time-filter call")
+    args = parser.parse_args()
+    asyncio.run(_run(args.properties, args.latency / 1000))
+
+
+if __name__ == "__main__":
+    main()
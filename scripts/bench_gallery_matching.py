@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark gallery-hash matching for a dedup block: scalar loop vs packed uint64.
+
+Builds synthetic dedup blocks (one outcode+bedrooms group) in which properties
+are spread across the four platforms. Cross-platform listings of the same flat
+share most of their photos, with a few bits of pHash noise. Every cross-source
+pair in the block is then scored two ways:
+
+- ``scalar``: the previous implementation — ``imagehash.hex_to_hash`` on both
+  strings for every comparison inside a nested Python loop.
+- ``packed``: ``PackedGalleryHashes`` — pack the block once, one XOR + popcount
+  match matrix, per-pair greedy counts from slices.
+
+Both must produce identical match counts; the script fails if they don't.
+
+Usage:
+    uv run python scripts/bench_gallery_matching.py
+    uv run python scripts/bench_gallery_matching.py --blocks 8 16 32 64 --images 20
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from home_finder.utils.image_hash import PackedGalleryHashes, hashes_match
+
+_PLATFORMS = ("openrent", "rightmove", "zoopla", "onthemarket")
+
+
+def _scalar_count(hashes1: list[str], hashes2: list[str]) -> int:
+    """Previous count_gallery_hash_matches: hashes_match in a nested loop."""
+    matched: set[int] = set()
+    count = 0
+    for h1 in hashes1:
+        for j, h2 in enumerate(hashes2):
+            if j not in matched and hashes_match(h1, h2):
+                count += 1
+                matched.add(j)
+                break
+    return count
+
+
+def _noisy(h: int, rng: random.Random, max_flips: int) -> int:
+    for _ in range(rng.randint(0, max_flips)):
+        h ^= 1 << rng.randrange(64)
+    return h
+
+
+def _make_block(n_props: int, images: int, rng: random.Random) -> dict[str, list[str]]:
+    """Gallery hashes for ``n_props`` listings, ~1 flat per 2 listings."""
+    flats = [[rng.getrandbits(64) for _ in range(images)] for _ in range(max(1, n_props // 2))]
+    block: dict[str, list[str]] = {}
+    for i in range(n_props):
+        photos = rng.choice(flats)
+        count = rng.randint(max(1, images // 2), images)
+        gallery = [_noisy(h, rng, 6) for h in rng.sample(photos, min(count, len(photos)))]
+        block[f"{_PLATFORMS[i % len(_PLATFORMS)]}:{i}"] = [f"{h:016x}" for h in gallery]
+    return block
+
+
+def _cross_source_pairs(block: dict[str, list[str]]) -> list[tuple[str, str]]:
+    ids = list(block)
+    return [
+        (a, b)
+        for i, a in enumerate(ids)
+        for b in ids[i + 1 :]
+        if a.split(":")[0] != b.split(":")[0]
+    ]
+
+
+def _run_scalar(block: dict[str, list[str]]) -> list[int]:
+    return [_scalar_count(block[a], block[b]) for a, b in _cross_source_pairs(block)]
+
+
+def _run_packed(block: dict[str, list[str]]) -> list[int]:
+    packed = PackedGalleryHashes(block)
+    return [packed.count_matches(a, b) for a, b in _cross_source_pairs(block)]
+
+
+def _time(
+    fn: Callable[[dict[str, list[str]]], list[int]], block: dict[str, list[str]], repeat: int
+) -> tuple[float, list[int]]:
+    timings: list[float] = []
+    result: list[int] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(block)
+        timings.append(time.perf_counter() - t0)
+    return statistics.median(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--blocks", type=int, nargs="+", default=[4, 8, 16, 32], help="Properties per block"
+    )
+    parser.add_argument("--images", type=int, default=20, help="Max gallery images per listing")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per mode (median)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'props':>5} {'pairs':>6} {'scalar':>10} {'packed':>10} {'speedup':>8}")
+    for n_props in args.blocks:
+        block = _make_block(n_props, args.images, rng)
+        scalar_s, scalar_counts = _time(_run_scalar, block, args.repeat)
+        packed_s, packed_counts = _time(_run_packed, block, args.repeat)
+        if scalar_counts != packed_counts:
+            raise SystemExit(f"match counts differ for block of {n_props}")
+        print(
+            f"{n_props:>5} {len(scalar_counts):>6} {scalar_s * 1000:>8.1f}ms "
+            f"{packed_s * 1000:>8.1f}ms {scalar_s / packed_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark dashboard latency while gallery images are being processed.
+
+Serves the dashboard in-process (as ``--serve`` does) from an empty
+temporary database and requests ``/`` every ``--interval`` ms. Meanwhile,
+``--images`` synthetic gallery photos are run through
+``extract_image_features`` with the enrichment stage's concurrency, in
+three phases:
+
+- ``idle``: no image work, the baseline.
+- ``threads``: image work on the default thread pool (``image_workers = 0``).
+- ``pool``: image work on the shared process pool (``--workers`` processes).
+
+Reports request latency percentiles and the image throughput per phase.
+
+Usage:
+    uv run python scripts/bench_image_pool.py
+    uv run python scripts/bench_image_pool.py --images 200 --workers 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from PIL import Image, ImageDraw
+from pydantic import SecretStr
+
+from home_finder.config import Settings
+from home_finder.utils.image_features import extract_image_features
+from home_finder.utils.image_pool import image_pool, run_image_task
+from home_finder.web.app import create_app
+
+# Matches detail_enrichment._ENRICHMENT_CONCURRENCY
+CONCURRENCY = 5
+
+
+def _write_photos(directory: Path, count: int) -> list[Path]:
+    """Noisy 1600x1200 JPEGs, about the size of a listing photo."""
+    size = (1600, 1200)
+    noise = Image.merge("RGB", [Image.effect_noise((200, 150), 64) for _ in range(3)])
+    base = Image.new("RGB", size, (135, 206, 235))
+    ImageDraw.Draw(base).rectangle([0, 800, 1600, 1200], fill=(34, 139, 34))
+    photo = Image.blend(base, noise.resize(size, Image.Resampling.NEAREST), 0.5)
+    paths = []
+    for i in range(count):
+        path = directory / f"gallery_{i:03d}_bench.jpg"
+        photo.save(path, "JPEG", quality=90)
+        paths.append(path)
+    return paths
+
+
+async def _process(paths: list[Path]) -> float:
+    """Extract features for every path; returns images per second."""
+    for thumb in paths[0].parent.glob("thumb_*"):
+        thumb.unlink()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def _one(path: Path) -> None:
+        async with semaphore:
+            await run_image_task(extract_image_features, path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(p) for p in paths))
+    return len(paths) / (time.perf_counter() - started)
+
+
+async def _probe(client: httpx.AsyncClient, interval: float, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def _phase(
+    client: httpx.AsyncClient, paths: list[Path], interval: float, workers: int | None
+) -> tuple[list[float], float | None]:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(client, interval, stop))
+    throughput = None
+    if workers is None:
+        await asyncio.sleep(3)
+    else:
+        async with image_pool(workers):
+            if workers:
+                await run_image_task(extract_image_features, paths[0])  # spawn workers
+            throughput = await _process(paths)
+    stop.set()
+    return await probe, throughput
+
+
+async def _run(images: int, workers: int, interval: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_photos(Path(tmp), images)
+        settings = Settings(
+            telegram_bot_token=SecretStr("bench:token"),
+            telegram_chat_id=0,
+            database_path=str(Path(tmp) / "properties.db"),
+        )
+        app = create_app(settings, run_pipeline=False)
+        transport = httpx.ASGITransport(app=app)
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+        ):
+            await client.get("/")  # warm templates and the read pool
+            print(f"{'phase':>8}  {'requests':>8}  {'p50':>7}  {'p95':>7}  {'max':>7}  img/s")
+            for name, phase_workers in (("idle", None), ("threads", 0), ("pool", workers)):
+                latencies, throughput = await _phase(client, paths, interval, phase_workers)
+                p95 = statistics.quantiles(latencies, n=20)[-1]
+                rate = f"{throughput:.1f}" if throughput is not None else "-"
+                print(
+                    f"{name:>8}  {len(latencies):>8}  {statistics.median(latencies):>5.1f}ms"
+                    f"  {p95:>5.1f}ms  {max(latencies):>5.1f}ms  {rate}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=2, help="pool size for the pool phase")
+    parser.add_argument("--interval", type=float, default=50, help="ms between requests")
+    args = parser.parse_args()
+    asyncio.run(_run(args.images, args.workers, args.interval / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark dashboard pagination: LIMIT/OFFSET vs keyset cursors.
+
+Builds a synthetic database of ``--rows`` listings (all passing the default
+dashboard filter) and times fetching page N of the grid two ways:
+
+- ``offset``: ``get_properties_paginated(page=N)`` — SQLite walks and discards
+  ``(N - 1) * per_page`` rows before returning the page.
+- ``keyset``: ``get_properties_paginated(after=cursor)`` with the cursor of the
+  last item on page N - 1 — seeks straight to the page via the sort index.
+
+Both must return the same listings; the script fails if they don't. Also
+reports the COUNT(*) total with a cold and a warm count cache.
+
+Usage:
+    uv run python scripts/bench_pagination.py
+    uv run python scripts/bench_pagination.py --rows 50000 --pages 1 50 500 2000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from home_finder.db import PropertyStorage
+from home_finder.db.web_queries import encode_page_cursor
+from home_finder.web.filters import PropertyFilter
+
+PER_PAGE = 24
+
+
+async def _seed(storage: PropertyStorage, rows: int, rng: random.Random) -> None:
+    conn = await storage._get_connection()
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    await conn.executemany(
+        """INSERT INTO properties (
+            unique_id, source, source_id, url, title, price_pcm, bedrooms,
+            address, postcode, image_url, first_seen
+        ) VALUES (?, 'openrent', ?, ?, 'Flat', ?, ?, 'Somewhere', 'E8 1AA',
+            'https://example.com/img.jpg', ?)""",
+        [
+            (
+                f"openrent:{i}",
+                str(i),
+                f"https://openrent.com/{i}",
+                rng.randrange(1500, 2600, 25),
+                rng.choice((1, 2)),
+                (start + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))).isoformat(),
+            )
+            for i in range(rows)
+        ],
+    )
+    await conn.commit()
+
+
+def _timed(samples: list[float], t0: float) -> None:
+    samples.append((time.perf_counter() - t0) * 1000)
+
+
+async def _run(rows: int, pages: list[int], sort: str, repeats: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = PropertyStorage(str(Path(tmp) / "bench.db"), read_pool_size=1)
+        await storage.initialize()
+        await _seed(storage, rows, random.Random(0))
+        web = storage.web
+        filters = PropertyFilter()
+
+        t0 = time.perf_counter()
+        total = await web.get_filter_count(filters)
+        cold = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        await web.get_filter_count(filters)
+        warm = (time.perf_counter() - t0) * 1000
+        print(f"{total} rows, sort={sort}: COUNT cold {cold:.2f} ms, cached {warm:.3f} ms\n")
+
+        print(f"{'page':>6}  {'offset ms':>10}  {'keyset ms':>10}  {'speedup':>8}")
+        for page in pages:
+            if page < 2 or (page - 1) * PER_PAGE >= total:
+                continue
+            prev, _ = await web.get_properties_paginated(
+                filters, sort=sort, page=page - 1, per_page=PER_PAGE
+            )
+            cursor = encode_page_cursor(prev[-1], sort)
+
+            offset_ms: list[float] = []
+            keyset_ms: list[float] = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                by_offset, _ = await web.get_properties_paginated(
+                    filters, sort=sort, page=page, per_page=PER_PAGE
+                )
+                _timed(offset_ms, t0)
+                t0 = time.perf_counter()
+                by_keyset, _ = await web.get_properties_paginated(
+                    filters, sort=sort, per_page=PER_PAGE, after=cursor
+                )
+                _timed(keyset_ms, t0)
+
+            if [p["unique_id"] for p in by_offset] != [p["unique_id"] for p in by_keyset]:
+                raise SystemExit(f"Mismatch on page {page}")
+            o, k = statistics.median(offset_ms), statistics.median(keyset_ms)
+            print(f"{page:>6}  {o:>10.2f}  {k:>10.2f}  {o / k:>7.1f}x")
+
+        await storage.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 10, 100, 400, 800])
+    parser.add_argument("--sort", default="newest")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.pages, args.sort, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark Rightmove per-page fetch latency: per-page crawler vs persistent session.
+
+Serves ``tests/fixtures/rightmove_search.html`` from a local HTTP server and
+times fetch + parse of N result pages two ways:
+
+- ``crawler``: the previous approach — a fresh ``BeautifulSoupCrawler`` with a
+  fresh ``MemoryStorageClient`` for every page.
+- ``session``: ``RightmoveScraper._fetch_page`` over its keep-alive client.
+
+Page delays are not included; only the fetch/parse work per page is timed.
+
+Usage:
+    uv run python scripts/bench_rightmove_fetch.py              # 20 pages each
+    uv run python scripts/bench_rightmove_fetch.py --pages 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from home_finder.logging import configure_logging
+from home_finder.scrapers.rightmove import RightmoveScraper
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "rightmove_search.html"
+
+
+def _start_server(body: bytes) -> ThreadingHTTPServer:
+    """Serve the fixture for every GET on an ephemeral localhost port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # allow keep-alive
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _fetch_with_crawler(scraper: RightmoveScraper, url: str) -> int:
+    """Legacy path: one crawler per page."""
+    from crawlee.crawlers import BeautifulSoupCrawler, BeautifulSoupCrawlingContext
+    from crawlee.storage_clients import MemoryStorageClient
+
+    found: list[int] = []
+
+    async def handle_page(context: BeautifulSoupCrawlingContext) -> None:
+        parsed = scraper._parse_search_results(context.soup, str(context.request.url))
+        found.append(len(parsed or []))
+
+    crawler = BeautifulSoupCrawler(
+        max_requests_per_crawl=1,
+        storage_client=MemoryStorageClient(),
+    )
+    crawler.router.default_handler(handle_page)
+    await crawler.run([url])
+    return found[0] if found else 0
+
+
+async def _fetch_with_session(scraper: RightmoveScraper, url: str) -> int:
+    """Current path: persistent keep-alive client."""
+    html = await scraper._fetch_page(url)
+    parsed = scraper._parse_search_results(BeautifulSoup(html or "", "html.parser"), url)
+    return len(parsed or [])
+
+
+async def _time_pages(
+    name: str,
+    fetch: Callable[[RightmoveScraper, str], Awaitable[int]],
+    base_url: str,
+    pages: int,
+) -> list[float]:
+    scraper = RightmoveScraper()
+    timings: list[float] = []
+    try:
+        for i in range(pages):
+            # Unique URLs so the crawler's request dedup doesn't short-circuit
+            url = f"{base_url}/property-to-rent/find.html?index={i * 24}"
+            t0 = time.perf_counter()
+            count = await fetch(scraper, url)
+            timings.append(time.perf_counter() - t0)
+            if count == 0:
+                raise RuntimeError(f"{name}: page {i} parsed no properties")
+    finally:
+        await scraper.close()
+    return timings
+
+
+def _report(name: str, timings: list[float]) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(
+        f"{name:<8} pages={len(ms):<4} mean={statistics.mean(ms):7.1f}ms "
+        f"p50={statistics.median(ms):7.1f}ms p95={p95:7.1f}ms total={sum(ms) / 1000:6.2f}s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--pages", type=int, default=20, help="Pages to fetch per mode")
+    args = parser.parse_args()
+
+    import logging
+
+    configure_logging(json_output=False, level=logging.WARNING)
+    server = _start_server(FIXTURE.read_bytes())
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        crawler_timings = await _time_pages("crawler", _fetch_with_crawler, base_url, args.pages)
+        session_timings = await _time_pages("session", _fetch_with_session, base_url, args.pages)
+    finally:
+        server.shutdown()
+
+    _report("crawler", crawler_timings)
+    _report("session", session_timings)
+    speedup = statistics.mean(crawler_timings) / statistics.mean(session_timings)
+    print(f"speedup  {speedup:.1f}x mean per-page latency")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Benchmark Zoopla RSC parsing: per-field regex scans vs the single-pass decoder.
+
+Parses each page two ways, ``--repeat`` times:
+
+- ``per-field``: what the scraper and detail fetcher used to do — a separate
+  DOTALL regex over the whole page for listings, taxonomy and size (each
+  doing a double ``json.loads`` per matching push call and a recursive walk),
+  plus a regex over the raw HTML for gallery captions.
+- ``single-pass``: ``zoopla_rsc.parse_page``.
+
+Pass saved Zoopla search or detail pages (``curl ... > page.html``). Without
+any, a synthetic search page and detail page of about ``--size-mb`` MB each
+are generated in the same flight format. Both methods must find the same
+listings, size and captions; the script fails if they don't.
+
+Usage:
+    uv run python scripts/bench_zoopla_rsc.py
+    uv run python scripts/bench_zoopla_rsc.py saved/search.html saved/detail.html
+"""
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from home_finder.scrapers.zoopla_rsc import parse_page
+
+_PUSH = r"self\.__next_f\.push\(\s*\[(.*?)\]\s*\)"
+_CAPTION = (
+    r'\\"caption\\":(?:\\"([^\\]*)\\"|null),'
+    r'\\"filename\\":\\"([a-f0-9]+\.(?:jpg|jpeg|png|webp))\\"'
+)
+
+
+def _find_dict(data: Any, key: str, depth: int = 0) -> dict[str, Any] | None:
+    if depth > 10:
+        return None
+    children = data.values() if isinstance(data, dict) else data if isinstance(data, list) else ()
+    if isinstance(data, dict) and key in data:
+        return data
+    for child in children:
+        found = _find_dict(child, key, depth + 1)
+        if found:
+            return found
+    return None
+
+
+def _find_listings(data: Any, depth: int = 0) -> list[dict[str, Any]]:
+    if depth > 15:
+        return []
+    if isinstance(data, dict):
+        if isinstance(data.get("regularListingsFormatted"), list):
+            return [i for i in data["regularListingsFormatted"] if "listingId" in i]
+        if "listingId" in data:
+            return [data]
+        data = list(data.values())
+    if isinstance(data, list):
+        return [x for item in data for x in _find_listings(item, depth + 1)]
+    return []
+
+
+def _rows(html: str, *markers: str) -> list[Any]:
+    rows = []
+    for match in re.findall(_PUSH, html, re.DOTALL):
+        if not all(m in match for m in markers):
+            continue
+        try:
+            payload = json.loads(f"[{match}]")[1]
+            rows.append(json.loads(payload[payload.find(":") + 1 :]))
+        except (json.JSONDecodeError, IndexError, TypeError):
+            continue
+    return rows
+
+
+def per_field(html: str) -> tuple[int, bool, float | None, int]:
+    listings = [x for row in _rows(html, "listingId") for x in _find_listings(row)]
+    taxonomy = next(
+        (t for row in _rows(html, "epcRating", "numBaths") if (t := _find_dict(row, "epcRating"))),
+        None,
+    )
+    size = next(
+        (d["sizeSqft"] for row in _rows(html, "sizeSqft") if (d := _find_dict(row, "sizeSqft"))),
+        None,
+    )
+    captions = re.findall(_CAPTION, html, re.IGNORECASE)
+    return len(listings), taxonomy is not None, size, len(captions)
+
+
+def single_pass(html: str) -> tuple[int, bool, float | None, int]:
+    page = parse_page(html)
+    size = page.sizes_sqft[0] if page.sizes_sqft else None
+    return len(page.listings), page.taxonomy is not None, size, len(page.captions)
+
+
+def _push(row_id: str, data: object) -> str:
+    row = f"{row_id}:{json.dumps(data, separators=(',', ':'))}\n"
+    return f"<script>self.__next_f.push({json.dumps([1, row])})</script>"
+
+
+def _filler(size_mb: float) -> str:
+    """Markup and component-tree rows, as a real page has around the data."""
+    tree = ["$", "div", None, {"className": "c-abc", "children": ["$", "span", None, {}]}]
+    rows = []
+    length, i = 0, 0
+    while length < size_mb * 1_000_000:
+        chunk = f'<div class="css-{i:x}"><a href="/to-rent/">link</a></div>' + _push(
+            f"{i:x}", [tree] * 20
+        )
+        rows.append(chunk)
+        length += len(chunk)
+        i += 1
+    return "\n".join(rows)
+
+
+def _synthetic_pages(size_mb: float) -> dict[str, str]:
+    listings = [
+        {
+            "listingId": 60_000_000 + i,
+            "price": "£1,850 pcm",
+            "address": f"{i} Mare Street, London E8",
+            "listingUris": {"detail": f"/to-rent/details/{60_000_000 + i}/"},
+            "features": [{"iconId": "bed", "content": 1}],
+            "image": {"src": f"//lid.zoocdn.com/u/354/255/{i:08x}.jpg"},
+        }
+        for i in range(25)
+    ]
+    taxonomy = {
+        "listingId": 61_000_000,
+        "epcRating": "C",
+        "numBaths": 1,
+        "sizeSqft": 650,
+        "detailedDescription": "A bright one bedroom flat. " * 40,
+        "images": [{"caption": None, "filename": f"{i:08x}.jpg"} for i in range(30)],
+    }
+    filler = _filler(size_mb)
+    return {
+        "synthetic search": filler + _push("ff0", {"regularListingsFormatted": listings}),
+        "synthetic detail": filler + _push("ff1", taxonomy),
+    }
+
+
+def _time(fn: Callable[[str], object], html: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(html)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="saved Zoopla HTML pages")
+    parser.add_argument("--size-mb", type=float, default=3.0, help="synthetic page size")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = {p.name: p.read_text() for p in args.pages} or _synthetic_pages(args.size_mb)
+    print(f"{'page':>20}  {'MB':>5}  {'per-field':>10}  {'single-pass':>11}  speedup")
+    for name, html in pages.items():
+        expected = per_field(html)
+        if single_pass(html) != expected:
+            raise SystemExit(f"{name}: results differ: {single_pass(html)} != {expected}")
+        mb = len(html.encode()) / 1_000_000
+        old = _time(per_field, html, args.repeat)
+        new = _time(single_pass, html, args.repeat)
+        print(
+            f"{name:>20}  {mb:>5.1f}  {mb / old:>6.1f}MB/s  {mb / new:>7.1f}MB/s"
+            f"  {old / new:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ import argparse
 import sqlite3
 from pathlib import Path
 
+from home_finder.db.image_ops import FIRST_GALLERY_URL_SQL
 from home_finder.utils.epc_detector import detect_epc
 from home_finder.utils.image_cache import find_cached_file
 
@@ -93,6 +94,12 @@ def _reclassify_in_db(
                     "UPDATE property_images SET image_type = 'epc' WHERE id = ?",
                     (row_id,),
                 )
+                # Keep the dashboard card thumbnail off the reclassified EPC
+                conn.execute(
+                    f"UPDATE properties SET first_gallery_url = ({FIRST_GALLERY_URL_SQL})"
+                    " WHERE unique_id = ?",
+                    (prop_id,),
+                )
                 epc_path = cached.parent / epc_name
                 cached.rename(epc_path)
             reclassified += 1
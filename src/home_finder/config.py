@@ -37,6 +37,11 @@ class Settings(BaseSettings):
         default=SecretStr(""),
         description="TravelTime API key",
     )
+    commute_isochrones: bool = Field(
+        default=False,
+        description="Classify commutes offline against stored TravelTime isochrones;"
+        " only properties near the commute limit's boundary use the time-filter API",
+    )
 
     # Anthropic API (optional, needed for property quality analysis)
     anthropic_api_key: SecretStr = Field(
@@ -89,6 +94,15 @@ class Settings(BaseSettings):
         " (including SDK retries)",
     )
 
+    # CPU-bound image work (decode, pHash, thumbnails, resizing)
+    image_workers: int = Field(
+        default=2,
+        ge=0,
+        le=32,
+        description="Worker processes for image decoding and page parsing during a pipeline run"
+        " (0 = use threads instead)",
+    )
+
     # Enrichment retry
     max_enrichment_attempts: int = Field(
         default=3,
@@ -104,6 +118,14 @@ class Settings(BaseSettings):
         description="Keep property events for the last N pipeline runs",
     )
 
+    # Off-market checking
+    off_market_check_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds of each live pipeline run spent spot-checking listings for"
+        " off-market signals, highest churn first (0 = only via --check-off-market)",
+    )
+
     # Deduplication
     enable_image_hash_matching: bool = Field(
         default=True,
@@ -147,6 +169,12 @@ class Settings(BaseSettings):
         description="Max search areas per Zoopla run (rotate subset to avoid Cloudflare blocks)",
     )
 
+    # Scraper orchestration
+    concurrent_scraping: bool = Field(
+        default=True,
+        description="Run platform scrapers concurrently (each keeps its own pacing)",
+    )
+
     # Proxy (for accessing geo-restricted sites like Zoopla from outside the UK)
     proxy_url: str = Field(
         default="",
@@ -174,6 +202,12 @@ class Settings(BaseSettings):
 
     # Database
     database_path: str = Field(default="data/properties.db")
+    web_read_connections: int = Field(
+        default=3,
+        ge=0,
+        description="Read-only SQLite connections for dashboard queries in serve mode "
+        "(0 = share the pipeline's writer connection)",
+    )
 
     @model_validator(mode="after")
     def _validate_csv_fields(self) -> "Settings":
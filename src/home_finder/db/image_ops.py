@@ -0,0 +1,67 @@
+"""Shared property_images operations used by both storage and pipeline_repo."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import aiosqlite
+
+from home_finder.models import PropertyImage, PropertySource
+
+# First non-EPC gallery image of the enclosing ``properties`` row. Denormalized
+# onto properties.first_gallery_url so card and map queries don't run it per row.
+FIRST_GALLERY_URL_SQL = """
+    SELECT pi.url FROM property_images pi
+    WHERE pi.property_unique_id = properties.unique_id
+    AND pi.image_type = 'gallery'
+    AND LOWER(pi.url) NOT LIKE '%epc%'
+    AND LOWER(pi.url) NOT LIKE '%energy-performance%'
+    AND LOWER(pi.url) NOT LIKE '%energy_performance%'
+    ORDER BY pi.id LIMIT 1
+"""
+
+
+async def load_images_by_property(
+    conn: aiosqlite.Connection,
+    unique_ids: Sequence[str],
+) -> dict[str, list[PropertyImage]]:
+    """Bulk-load property_images for many properties in chunked IN queries.
+
+    Per-property ordering matches ``PropertyStorage.get_property_images``
+    (image_type, then insertion order), so callers can swap one for the other.
+
+    Returns:
+        Dict mapping unique_id to its images. Properties without images
+        are absent.
+    """
+    images: dict[str, list[PropertyImage]] = {}
+    chunk_size = 500
+    for i in range(0, len(unique_ids), chunk_size):
+        chunk = list(unique_ids[i : i + chunk_size])
+        placeholders = ",".join("?" * len(chunk))
+        cursor = await conn.execute(
+            f"""
+            SELECT property_unique_id, source, url, image_type
+            FROM property_images
+            WHERE property_unique_id IN ({placeholders})
+            ORDER BY property_unique_id, image_type, id
+            """,
+            chunk,
+        )
+        for row in await cursor.fetchall():
+            images.setdefault(row["property_unique_id"], []).append(
+                PropertyImage(
+                    source=PropertySource(row["source"]),
+                    url=row["url"],
+                    image_type=row["image_type"],
+                )
+            )
+    return images
+
+
+async def refresh_first_gallery_url(conn: aiosqlite.Connection, unique_id: str) -> None:
+    """Recompute properties.first_gallery_url after a property's images change."""
+    await conn.execute(
+        f"UPDATE properties SET first_gallery_url = ({FIRST_GALLERY_URL_SQL}) WHERE unique_id = ?",
+        (unique_id,),
+    )
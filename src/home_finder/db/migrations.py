@@ -716,6 +716,519 @@ async def migrate_006_off_market_enhancements(conn: aiosqlite.Connection) -> Non
                 raise
 
 
+async def migrate_007_image_hashes(conn: aiosqlite.Connection) -> None:
+    """Add a persisted perceptual-hash index for cached gallery images.
+
+    Keyed by (property, cached filename) with the file size as a staleness
+    check, so dedup can look hashes up instead of re-decoding every image.
+    No FK to properties: galleries are cached (and hashed) during enrichment,
+    before the property row is saved.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS image_hashes (
+            property_unique_id TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            phash TEXT,
+            hashed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (property_unique_id, filename)
+        )
+    """)
+
+
+async def migrate_008_quality_filter_columns(conn: aiosqlite.Connection) -> None:
+    """Promote dashboard filter fields out of analysis_json into real columns.
+
+    build_filter_clauses used to json_extract these on every request, which
+    parses every analysis blob and can't use an index. The columns are
+    written by ``save_quality_analysis`` and backfilled here; the more
+    selective ones get partial indexes.
+    """
+    columns: list[tuple[str, str, str]] = [
+        (
+            "property_type",
+            "TEXT",
+            "json_extract(analysis_json, '$.listing_extraction.property_type')",
+        ),
+        ("natural_light", "TEXT", "json_extract(analysis_json, '$.light_space.natural_light')"),
+        (
+            "pets_allowed",
+            "TEXT",
+            "json_extract(analysis_json, '$.listing_extraction.pets_allowed')",
+        ),
+        (
+            "value_rating",
+            "TEXT",
+            "COALESCE(json_extract(analysis_json, '$.value.quality_adjusted_rating'),"
+            " json_extract(analysis_json, '$.value.rating'))",
+        ),
+        ("hob_type", "TEXT", "json_extract(analysis_json, '$.kitchen.hob_type')"),
+        ("floor_level", "TEXT", "json_extract(analysis_json, '$.light_space.floor_level')"),
+        (
+            "building_construction",
+            "TEXT",
+            "json_extract(analysis_json, '$.flooring_noise.building_construction')",
+        ),
+        ("office_separation", "TEXT", "json_extract(analysis_json, '$.bedroom.office_separation')"),
+        ("hosting_layout", "TEXT", "json_extract(analysis_json, '$.space.hosting_layout')"),
+        (
+            "hosting_noise_risk",
+            "TEXT",
+            "json_extract(analysis_json, '$.flooring_noise.hosting_noise_risk')",
+        ),
+        (
+            "broadband_type",
+            "TEXT",
+            "json_extract(analysis_json, '$.listing_extraction.broadband_type')",
+        ),
+        (
+            "living_room_sqm",
+            "REAL",
+            "CAST(json_extract(analysis_json, '$.space.living_room_sqm') AS REAL)",
+        ),
+        (
+            "total_area_sqm",
+            "REAL",
+            "CAST(json_extract(analysis_json, '$.space.total_area_sqm') AS REAL)",
+        ),
+        ("one_line", "TEXT", "json_extract(analysis_json, '$.one_line')"),
+    ]
+    for column, col_type, _ in columns:
+        try:
+            await conn.execute(f"ALTER TABLE quality_analyses ADD COLUMN {column} {col_type}")
+        except aiosqlite.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+
+    assignments = ",\n".join(f"{column} = {expr}" for column, _, expr in columns)
+    await conn.execute(f"UPDATE quality_analyses SET {assignments} WHERE json_valid(analysis_json)")
+
+    for column in (
+        "property_type",
+        "pets_allowed",
+        "hob_type",
+        "floor_level",
+        "building_construction",
+        "broadband_type",
+        "living_room_sqm",
+    ):
+        await conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_quality_{column} "
+            f"ON quality_analyses({column}) WHERE {column} IS NOT NULL"
+        )
+
+
+async def migrate_009_card_denormalization(conn: aiosqlite.Connection) -> None:
+    """Denormalize the card query's per-row subqueries onto properties.
+
+    first_gallery_url (first non-EPC gallery image) and the latest
+    price_history change/timestamp are maintained on write by
+    save_property_images and detect_and_record_price_change; this backfills
+    existing rows.
+    """
+    for column, col_type in [
+        ("first_gallery_url", "TEXT"),
+        ("last_price_change", "INTEGER"),
+        ("price_changed_at", "TEXT"),
+    ]:
+        try:
+            await conn.execute(f"ALTER TABLE properties ADD COLUMN {column} {col_type}")
+        except aiosqlite.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+
+    await conn.execute("""
+        UPDATE properties SET first_gallery_url = (
+            SELECT pi.url FROM property_images pi
+            WHERE pi.property_unique_id = properties.unique_id
+            AND pi.image_type = 'gallery'
+            AND LOWER(pi.url) NOT LIKE '%epc%'
+            AND LOWER(pi.url) NOT LIKE '%energy-performance%'
+            AND LOWER(pi.url) NOT LIKE '%energy_performance%'
+            ORDER BY pi.id LIMIT 1
+        )
+    """)
+    await conn.execute("""
+        UPDATE properties SET
+            last_price_change = (
+                SELECT ph.change_amount FROM price_history ph
+                WHERE ph.property_unique_id = properties.unique_id
+                ORDER BY ph.detected_at DESC LIMIT 1
+            ),
+            price_changed_at = (
+                SELECT ph.detected_at FROM price_history ph
+                WHERE ph.property_unique_id = properties.unique_id
+                ORDER BY ph.detected_at DESC LIMIT 1
+            )
+        WHERE unique_id IN (SELECT property_unique_id FROM price_history)
+    """)
+
+
+async def migrate_010_data_version_and_sort_indexes(conn: aiosqlite.Connection) -> None:
+    """Add a data-version marker and indexes for keyset pagination.
+
+    ``data_version.version`` is bumped by triggers on every write to the
+    tables the dashboard filters read, so cached filter counts can be
+    invalidated with one cheap lookup. The composite indexes let the
+    newest/price sorts walk the index from a keyset cursor instead of
+    sorting and skipping the whole filtered set.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    """)
+    await conn.execute("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)")
+
+    for table in ("properties", "quality_analyses", "property_images"):
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            await conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{op.lower()}_data_version
+                AFTER {op} ON {table}
+                BEGIN
+                    UPDATE data_version SET version = version + 1 WHERE id = 1;
+                END
+            """)
+
+    await conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_properties_first_seen_uid
+        ON properties(first_seen, unique_id)
+    """)
+    await conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_properties_price_uid
+        ON properties(price_pcm, unique_id)
+    """)
+
+
+async def migrate_011_property_rtree(conn: aiosqlite.Connection) -> None:
+    """Add an R*Tree spatial index over property coordinates.
+
+    ``property_rtree`` holds one zero-area box per located property, keyed by
+    ``properties.rowid``, so map viewport queries are a bounding-box lookup
+    instead of a scan. Triggers keep it in step with every write path.
+    """
+    await conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS property_rtree USING rtree(
+            id, min_lat, max_lat, min_lon, max_lon
+        )
+    """)
+    await conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_properties_insert_rtree
+        AFTER INSERT ON properties
+        WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO property_rtree
+            VALUES (NEW.rowid, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+        END
+    """)
+    await conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_properties_update_rtree
+        AFTER UPDATE OF latitude, longitude ON properties
+        BEGIN
+            DELETE FROM property_rtree WHERE id = OLD.rowid;
+            INSERT INTO property_rtree
+            SELECT NEW.rowid, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+            WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+        END
+    """)
+    await conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_properties_delete_rtree
+        AFTER DELETE ON properties
+        BEGIN
+            DELETE FROM property_rtree WHERE id = OLD.rowid;
+        END
+    """)
+    await conn.execute("""
+        INSERT OR REPLACE INTO property_rtree
+        SELECT rowid, latitude, latitude, longitude, longitude
+        FROM properties
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    """)
+
+
+async def migrate_012_telegram_file_ids(conn: aiosqlite.Connection) -> None:
+    """Add a table remembering Telegram file_ids for uploaded cache images.
+
+    Keyed by the image's path relative to the data directory; ``file_size``
+    guards against the cached file being replaced under the same name.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS telegram_file_ids (
+            cache_path TEXT PRIMARY KEY,
+            file_size INTEGER NOT NULL,
+            file_id TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+
+
+async def migrate_013_job_checkpoints(conn: aiosqlite.Connection) -> None:
+    """Add a table recording how far a resumable maintenance job has got.
+
+    One row per job; ``position`` is the job's own resume key (e.g. the last
+    dedup block committed). The row is removed when the job completes.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_checkpoints (
+            job TEXT PRIMARY KEY,
+            position TEXT NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+
+
+async def migrate_014_commute_caches(conn: aiosqlite.Connection) -> None:
+    """Add persistent geocoding and commute-time caches.
+
+    ``geocode_cache`` maps a normalised postcode to coordinates.
+    ``commute_cache`` maps coordinates rounded to 4 dp (stored as integer
+    1e-4 degrees, ~11 m) plus transport mode and destination to minutes;
+    ``minutes`` is NULL when the location was unreachable within
+    ``max_minutes``. Both carry ``fetched_at`` for TTL checks.
+
+    Also adds commute stage timing and cache hit/miss columns to pipeline_runs.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS geocode_cache (
+            postcode TEXT PRIMARY KEY,
+            latitude REAL NOT NULL,
+            longitude REAL NOT NULL,
+            fetched_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS commute_cache (
+            lat_e4 INTEGER NOT NULL,
+            lon_e4 INTEGER NOT NULL,
+            transport_mode TEXT NOT NULL,
+            destination TEXT NOT NULL,
+            minutes INTEGER,
+            max_minutes INTEGER NOT NULL,
+            fetched_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (transport_mode, destination, lat_e4, lon_e4)
+        )
+    """)
+
+    for column, col_type in [
+        ("commute_seconds", "REAL"),
+        ("geocode_cache_hits", "INTEGER"),
+        ("geocode_cache_misses", "INTEGER"),
+        ("commute_cache_hits", "INTEGER"),
+        ("commute_cache_misses", "INTEGER"),
+    ]:
+        try:
+            await conn.execute(f"ALTER TABLE pipeline_runs ADD COLUMN {column} {col_type}")
+        except aiosqlite.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+
+
+async def migrate_015_commute_isochrones(conn: aiosqlite.Connection) -> None:
+    """Add stored isochrones for offline commute classification.
+
+    One row per (transport mode, destination, travel-time limit). ``rings``
+    is a JSON list of polygon rings (shells and holes alike), each a list of
+    ``[lat, lng]`` pairs; a point is inside when it falls inside an odd
+    number of them.
+
+    Also adds a pipeline_runs column counting properties answered offline.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS commute_isochrones (
+            transport_mode TEXT NOT NULL,
+            destination TEXT NOT NULL,
+            max_minutes INTEGER NOT NULL,
+            rings TEXT NOT NULL,
+            fetched_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (transport_mode, destination, max_minutes)
+        )
+    """)
+    try:
+        await conn.execute("ALTER TABLE pipeline_runs ADD COLUMN commute_isochrone_hits INTEGER")
+    except aiosqlite.OperationalError as e:
+        if "duplicate column" not in str(e).lower():
+            raise
+
+
+async def migrate_016_postcode_wards(conn: aiosqlite.Connection) -> None:
+    """Add a permanent postcode -> ward cache for postcodes.io forward lookups.
+
+    ``ward`` is NULL for postcodes postcodes.io doesn't recognise, so they
+    aren't asked about again either.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS postcode_wards (
+            postcode TEXT PRIMARY KEY,
+            ward TEXT,
+            fetched_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+
+
+async def migrate_017_image_features(conn: aiosqlite.Connection) -> None:
+    """Store per-image features next to the pHash in ``image_hashes``.
+
+    Enrichment extracts dimensions and the floorplan/EPC heuristic scores in
+    the same decode as the pHash. All four are NULL for rows hashed by dedup
+    alone (files that enrichment didn't see or couldn't decode).
+    """
+    for column, col_type in [
+        ("width", "INTEGER"),
+        ("height", "INTEGER"),
+        ("floorplan_score", "REAL"),
+        ("epc_score", "REAL"),
+    ]:
+        try:
+            await conn.execute(f"ALTER TABLE image_hashes ADD COLUMN {column} {col_type}")
+        except aiosqlite.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+
+
+async def migrate_018_scraper_loop_lag(conn: aiosqlite.Connection) -> None:
+    """Record event-loop lag sampled while each scraper ran.
+
+    NULL for runs recorded before lag was sampled.
+    """
+    for column in ("loop_lag_max_ms", "loop_lag_p95_ms"):
+        try:
+            await conn.execute(f"ALTER TABLE scraper_runs ADD COLUMN {column} REAL")
+        except aiosqlite.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+
+
+async def migrate_019_rightmove_outcodes(conn: aiosqlite.Connection) -> None:
+    """Persist Rightmove typeahead identifiers for outcodes.
+
+    Only outcodes missing from ``RIGHTMOVE_OUTCODES`` are stored;
+    ``location_id`` is the raw identifier (e.g. ``OUTCODE^707``). The table
+    is deliberately not seeded from that map: it stays the source of truth
+    for the outcodes it covers, so edits to it ship with the code and never
+    compete with a stale DB copy or expire with the lookup TTL.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS rightmove_outcodes (
+            outcode TEXT PRIMARY KEY,
+            location_id TEXT NOT NULL,
+            fetched_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+
+
+async def migrate_020_scrape_watermarks(conn: aiosqlite.Connection) -> None:
+    """Add per-(platform, area) scrape watermarks.
+
+    ``newest_id`` is the highest listing ID seen in the area's newest-first
+    results, sorted by ``sort_order`` and filtered by ``search_key``; a
+    watermark only applies while both are unchanged. Also counts areas that
+    stopped at their watermark on ``scraper_runs``.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_watermarks (
+            source TEXT NOT NULL,
+            area TEXT NOT NULL,
+            sort_order TEXT NOT NULL,
+            search_key TEXT NOT NULL,
+            newest_id INTEGER NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (source, area)
+        )
+    """)
+    try:
+        await conn.execute("ALTER TABLE scraper_runs ADD COLUMN watermark_stops INTEGER")
+    except aiosqlite.OperationalError as e:
+        if "duplicate column" not in str(e).lower():
+            raise
+
+
+async def migrate_021_property_rtree_stable_ids(conn: aiosqlite.Connection) -> None:
+    """Key ``property_rtree`` on a stable id instead of ``properties.rowid``.
+
+    ``properties`` has a TEXT primary key, so its implicit rowids may be
+    renumbered by ``VACUUM``, silently breaking the R*Tree join.
+    ``property_spatial_ids`` gives each property an INTEGER PRIMARY KEY,
+    which ``VACUUM`` preserves, and the R*Tree is rebuilt on those ids.
+
+    The triggers avoid ``OR IGNORE``/``OR REPLACE``: an upsert on
+    ``properties`` would override those conflict clauses.
+    """
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS property_spatial_ids (
+            id INTEGER PRIMARY KEY,
+            unique_id TEXT NOT NULL UNIQUE
+        )
+    """)
+    for trigger in (
+        "trg_properties_insert_rtree",
+        "trg_properties_update_rtree",
+        "trg_properties_delete_rtree",
+    ):
+        await conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    await conn.execute("""
+        CREATE TRIGGER trg_properties_insert_rtree
+        AFTER INSERT ON properties
+        WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+        BEGIN
+            INSERT INTO property_spatial_ids (unique_id)
+            SELECT NEW.unique_id
+            WHERE NOT EXISTS (
+                SELECT 1 FROM property_spatial_ids WHERE unique_id = NEW.unique_id
+            );
+            DELETE FROM property_rtree WHERE id = (
+                SELECT id FROM property_spatial_ids WHERE unique_id = NEW.unique_id
+            );
+            INSERT INTO property_rtree
+            SELECT id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+            FROM property_spatial_ids WHERE unique_id = NEW.unique_id;
+        END
+    """)
+    await conn.execute("""
+        CREATE TRIGGER trg_properties_update_rtree
+        AFTER UPDATE OF latitude, longitude ON properties
+        BEGIN
+            DELETE FROM property_rtree WHERE id = (
+                SELECT id FROM property_spatial_ids WHERE unique_id = OLD.unique_id
+            );
+            INSERT INTO property_spatial_ids (unique_id)
+            SELECT NEW.unique_id
+            WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM property_spatial_ids WHERE unique_id = NEW.unique_id
+              );
+            INSERT INTO property_rtree
+            SELECT id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+            FROM property_spatial_ids
+            WHERE unique_id = NEW.unique_id
+              AND NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+        END
+    """)
+    await conn.execute("""
+        CREATE TRIGGER trg_properties_delete_rtree
+        AFTER DELETE ON properties
+        BEGIN
+            DELETE FROM property_rtree WHERE id = (
+                SELECT id FROM property_spatial_ids WHERE unique_id = OLD.unique_id
+            );
+            DELETE FROM property_spatial_ids WHERE unique_id = OLD.unique_id;
+        END
+    """)
+    await conn.execute("DELETE FROM property_rtree")
+    await conn.execute("""
+        INSERT OR IGNORE INTO property_spatial_ids (unique_id)
+        SELECT unique_id FROM properties
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    """)
+    await conn.execute("""
+        INSERT INTO property_rtree
+        SELECT s.id, p.latitude, p.latitude, p.longitude, p.longitude
+        FROM properties p
+        JOIN property_spatial_ids s ON s.unique_id = p.unique_id
+        WHERE p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+    """)
+
+
 _MigrationFn = Callable[[aiosqlite.Connection], Coroutine[Any, Any, None]]
 
 MIGRATIONS: list[_MigrationFn] = [
@@ -725,6 +1238,21 @@ MIGRATIONS: list[_MigrationFn] = [
     migrate_004_source_listings,
     migrate_005_fix_source_listings_linkage,
     migrate_006_off_market_enhancements,
+    migrate_007_image_hashes,
+    migrate_008_quality_filter_columns,
+    migrate_009_card_denormalization,
+    migrate_010_data_version_and_sort_indexes,
+    migrate_011_property_rtree,
+    migrate_012_telegram_file_ids,
+    migrate_013_job_checkpoints,
+    migrate_014_commute_caches,
+    migrate_015_commute_isochrones,
+    migrate_016_postcode_wards,
+    migrate_017_image_features,
+    migrate_018_scraper_loop_lag,
+    migrate_019_rightmove_outcodes,
+    migrate_020_scrape_watermarks,
+    migrate_021_property_rtree_stable_ids,
 ]
 
 
@@ -0,0 +1,94 @@
+"""Pool of read-only SQLite connections for web dashboard queries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Final
+
+import aiosqlite
+
+from home_finder.logging import get_logger
+
+logger = get_logger(__name__)
+
+_READ_PRAGMAS: Final[tuple[str, ...]] = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA query_only=ON",
+    "PRAGMA cache_size=-32000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class ReadConnectionPool:
+    """Small pool of read-only connections to a WAL-mode database.
+
+    Each aiosqlite connection runs on its own worker thread, so readers
+    checked out of this pool never queue behind writes or long transactions
+    on the writer connection. Connections are opened lazily (up to ``size``)
+    and health-checked with the same throttled ``SELECT 1`` probe as
+    ``PropertyStorage._get_connection``.
+    """
+
+    # Interval between SELECT 1 health probes (seconds)
+    _HEALTH_CHECK_INTERVAL: Final = 30.0
+
+    def __init__(self, db_path: str, size: int) -> None:
+        """Initialize the pool.
+
+        Args:
+            db_path: Path to the SQLite database file (not ":memory:").
+            size: Maximum number of open read connections.
+        """
+        self.db_path = db_path
+        self.size = size
+        self._semaphore = asyncio.Semaphore(size)
+        # Idle connections with the monotonic time of their last health check
+        self._idle: list[tuple[aiosqlite.Connection, float]] = []
+        self._closed = False
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        for pragma in _READ_PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+
+    async def _checkout(self) -> tuple[aiosqlite.Connection, float]:
+        """Take a healthy idle connection, or open a new one."""
+        while self._idle:
+            conn, last_check = self._idle.pop()
+            if (time.monotonic() - last_check) <= self._HEALTH_CHECK_INTERVAL:
+                return conn, last_check
+            try:
+                await asyncio.wait_for(conn.execute("SELECT 1"), timeout=5.0)
+                return conn, time.monotonic()
+            except Exception:
+                logger.warning("db_read_connection_dead", db_path=self.db_path)
+                # Don't await close() — a hung worker thread would hang it too.
+        return await self._connect(), time.monotonic()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out a read connection for the duration of the block.
+
+        Waits when all ``size`` connections are in use.
+        """
+        async with self._semaphore:
+            conn, last_check = await self._checkout()
+            try:
+                yield conn
+            finally:
+                if self._closed:
+                    await conn.close()
+                else:
+                    self._idle.append((conn, last_check))
+
+    async def close(self) -> None:
+        """Close all idle connections; busy ones close when released."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            await conn.close()
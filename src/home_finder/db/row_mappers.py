@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from datetime import datetime
 from typing import Any, TypedDict
 
@@ -60,6 +60,8 @@ class PropertyListItem(TypedDict, total=False):
     epc_rating: str | None
     # Analysis JSON for fit_score computation in routes
     analysis_json: str | None
+    # Stored fit_score (or -1) for the fit_desc keyset cursor
+    fit_sort_key: int
     # User status (Ticket 7)
     user_status: str | None
     # Price history (Ticket 10)
@@ -148,6 +150,7 @@ async def row_to_merged_property(
     *,
     source_listings: list[Any] | None = None,
     load_images: bool = True,
+    images: Sequence[PropertyImage] | None = None,
     get_property_images: (Callable[[str], Coroutine[Any, Any, list[PropertyImage]]] | None) = None,
 ) -> MergedProperty:
     """Convert a database row to a MergedProperty.
@@ -161,6 +164,10 @@ async def row_to_merged_property(
       - ``PropertyStorage.get_recent_properties_for_dedup()`` — batch-loads
         source_listings and passes them per-property.
 
+    Bulk loaders pass pre-fetched *images* (see
+    ``image_ops.load_images_by_property``) instead of *get_property_images*,
+    which would cost one property_images query per row.
+
     Callers that rely on JSON fallback (backward compat):
       - ``PipelineRepo.get_unenriched_properties()``
       - ``PipelineRepo.get_pending_analysis_retries()``
@@ -177,7 +184,10 @@ async def row_to_merged_property(
             property (keyed by ``merged_id``).  When provided, overrides
             the JSON-based reconstruction.
         load_images: Whether to load images from property_images table.
-        get_property_images: Async callable to fetch images; required when load_images=True.
+        images: Pre-fetched images for this property. When given, used as-is
+            and *get_property_images* is not called.
+        get_property_images: Async callable to fetch images; required when
+            load_images=True and *images* is not given.
 
     Returns:
         Reconstructed MergedProperty.
@@ -226,10 +236,11 @@ async def row_to_merged_property(
     gallery: tuple[PropertyImage, ...] = ()
     floorplan_img: PropertyImage | None = None
     if load_images:
-        if get_property_images is None:
-            msg = "get_property_images is required when load_images=True"
-            raise ValueError(msg)
-        images = await get_property_images(prop.unique_id)
+        if images is None:
+            if get_property_images is None:
+                msg = "get_property_images is required when load_images=True"
+                raise ValueError(msg)
+            images = await get_property_images(prop.unique_id)
         gallery = tuple(img for img in images if img.image_type == "gallery")
         floorplan_img = next((img for img in images if img.image_type == "floorplan"), None)
 
@@ -6,17 +6,19 @@ import asyncio
 import contextlib
 import json
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Collection
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 
 import aiosqlite
 
 from home_finder.data.area_context import HOSTING_TOLERANCE
+from home_finder.db.image_ops import load_images_by_property, refresh_first_gallery_url
 from home_finder.db.migrations import run_migrations
 from home_finder.db.pipeline_repo import PipelineRepository
+from home_finder.db.read_pool import ReadConnectionPool
 from home_finder.db.row_mappers import (
     build_base_insert,
     build_merged_insert_columns,
@@ -38,6 +40,12 @@ from home_finder.models import (
     TransportMode,
     UserStatus,
 )
+from home_finder.utils.address import extract_outcode
+from home_finder.utils.postcode_lookup import normalize_postcode
+
+if TYPE_CHECKING:
+    from home_finder.utils.image_features import ImageFeatureRow
+    from home_finder.utils.image_hash import GalleryHashIndex, GalleryHashRow
 
 # Default lookback window for cross-platform dedup anchors
 _DEDUP_LOOKBACK_DAYS: Final = 30
@@ -62,6 +70,41 @@ _CLOSE_PRAGMAS: Final[tuple[str, ...]] = (
     "PRAGMA wal_checkpoint(PASSIVE)",
 )
 
+# Dashboard filter columns on quality_analyses (migration 008), mapped to
+# their (section, field) path in analysis_json.
+_QUALITY_FILTER_PATHS: Final[dict[str, tuple[str, str]]] = {
+    "property_type": ("listing_extraction", "property_type"),
+    "natural_light": ("light_space", "natural_light"),
+    "pets_allowed": ("listing_extraction", "pets_allowed"),
+    "hob_type": ("kitchen", "hob_type"),
+    "floor_level": ("light_space", "floor_level"),
+    "building_construction": ("flooring_noise", "building_construction"),
+    "office_separation": ("bedroom", "office_separation"),
+    "hosting_layout": ("space", "hosting_layout"),
+    "hosting_noise_risk": ("flooring_noise", "hosting_noise_risk"),
+    "broadband_type": ("listing_extraction", "broadband_type"),
+    "living_room_sqm": ("space", "living_room_sqm"),
+    "total_area_sqm": ("space", "total_area_sqm"),
+}
+_QUALITY_FILTER_COLUMNS: Final[tuple[str, ...]] = (
+    *_QUALITY_FILTER_PATHS,
+    "value_rating",
+    "one_line",
+)
+
+
+def _quality_filter_values(analysis: dict[str, Any]) -> tuple[Any, ...]:
+    """Values for _QUALITY_FILTER_COLUMNS extracted from an analysis dict."""
+    values: list[Any] = []
+    for section, field in _QUALITY_FILTER_PATHS.values():
+        section_dict = analysis.get(section)
+        values.append(section_dict.get(field) if isinstance(section_dict, dict) else None)
+    value = analysis.get("value") or {}
+    values.append(value.get("quality_adjusted_rating") or value.get("rating"))
+    one_line = analysis.get("one_line")
+    values.append(one_line if isinstance(one_line, str) else None)
+    return tuple(values)
+
 
 class PropertyStorage:
     """SQLite-based storage for tracked properties.
@@ -74,22 +117,32 @@ class PropertyStorage:
     # Interval between SELECT 1 health probes (seconds)
     _HEALTH_CHECK_INTERVAL: Final = 30.0
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, *, read_pool_size: int = 0) -> None:
         """Initialize storage with database path.
 
         Args:
             db_path: Path to SQLite database file, or ":memory:" for in-memory.
+            read_pool_size: Number of read-only connections for web dashboard
+                queries. 0 (or an in-memory database, which can't be shared
+                across connections) routes web reads through the writer.
         """
         self.db_path = db_path
         self._conn: aiosqlite.Connection | None = None
         self._last_health_check: float = 0.0
+        # One writer at a time on the shared connection: background tasks
+        # (notification delivery) must not commit inside another task's
+        # transaction, or BEGIN while another task's write is uncommitted.
+        self._write_lock = asyncio.Lock()
+        self._read_pool: ReadConnectionPool | None = None
+        if read_pool_size > 0 and db_path != ":memory:":
+            self._read_pool = ReadConnectionPool(db_path, read_pool_size)
         self._ensure_directory()
-        self._web = WebQueryService(self._get_connection, self.get_property_images)
+        self._web = WebQueryService(self._read_connection)
         self._pipeline = PipelineRepository(
             self._get_connection,
-            self.get_property_images,
             self.save_quality_analysis,
             self._transaction,
+            self._write,
         )
 
     @property
@@ -142,8 +195,24 @@ class PropertyStorage:
     async def __aexit__(self, *exc: object) -> None:
         await self.close()
 
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Connection for read-only web queries.
+
+        Checks out a pooled reader when a read pool is configured, so
+        dashboard queries don't wait on the pipeline's writer connection.
+        Falls back to the writer connection otherwise.
+        """
+        if self._read_pool is None:
+            yield await self._get_connection()
+            return
+        async with self._read_pool.acquire() as conn:
+            yield conn
+
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the writer connection and any pooled read connections."""
+        if self._read_pool is not None:
+            await self._read_pool.close()
         if self._conn is not None:
             try:
                 for pragma in _CLOSE_PRAGMAS:
@@ -163,14 +232,35 @@ class PropertyStorage:
                 await conn.execute(...)
             # Commits on clean exit, rolls back on exception
         """
-        conn = await self._get_connection()
-        await conn.execute("BEGIN IMMEDIATE")
-        try:
-            yield conn
-            await conn.commit()
-        except BaseException:
-            await conn.rollback()
-            raise
+        async with self._write_lock:
+            conn = await self._get_connection()
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+
+    @asynccontextmanager
+    async def _write(self, *, commit: bool = True) -> AsyncIterator[aiosqlite.Connection]:
+        """Scope for an auto-committing write, serialised with ``_transaction``.
+
+        Commits on clean exit and rolls back on exception. With
+        ``commit=False`` the caller is already inside ``_transaction`` (which
+        holds the write lock), so the connection is yielded as-is.
+        """
+        if not commit:
+            yield await self._get_connection()
+            return
+        async with self._write_lock:
+            conn = await self._get_connection()
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
 
     async def initialize(self) -> None:
         """Initialize the database schema via versioned migrations."""
@@ -242,32 +332,31 @@ class PropertyStorage:
             commute_minutes: Commute time in minutes (if calculated).
             transport_mode: Transport mode used for commute calculation.
         """
-        conn = await self._get_connection()
-        columns, values = build_base_insert(
-            prop,
-            commute_minutes=commute_minutes,
-            transport_mode=transport_mode,
-            notification_status=NotificationStatus.PENDING,
-        )
-        col_list = ", ".join(columns)
-        placeholders = ", ".join("?" for _ in columns)
-        await conn.execute(
-            f"""
-            INSERT INTO properties ({col_list})
-            VALUES ({placeholders})
-            ON CONFLICT(unique_id) DO UPDATE SET
-                price_pcm = excluded.price_pcm,
-                title = excluded.title,
-                description = excluded.description,
-                image_url = excluded.image_url,
-                commute_minutes = COALESCE(excluded.commute_minutes, commute_minutes),
-                transport_mode = COALESCE(excluded.transport_mode, transport_mode)
-        """,
-            values,
-        )
-        # Keep source_listings in sync
-        await self._upsert_source_listing(conn, prop, merged_id=prop.unique_id)
-        await conn.commit()
+        async with self._write() as conn:
+            columns, values = build_base_insert(
+                prop,
+                commute_minutes=commute_minutes,
+                transport_mode=transport_mode,
+                notification_status=NotificationStatus.PENDING,
+            )
+            col_list = ", ".join(columns)
+            placeholders = ", ".join("?" for _ in columns)
+            await conn.execute(
+                f"""
+                INSERT INTO properties ({col_list})
+                VALUES ({placeholders})
+                ON CONFLICT(unique_id) DO UPDATE SET
+                    price_pcm = excluded.price_pcm,
+                    title = excluded.title,
+                    description = excluded.description,
+                    image_url = excluded.image_url,
+                    commute_minutes = COALESCE(excluded.commute_minutes, commute_minutes),
+                    transport_mode = COALESCE(excluded.transport_mode, transport_mode)
+            """,
+                values,
+            )
+            # Keep source_listings in sync
+            await self._upsert_source_listing(conn, prop, merged_id=prop.unique_id)
 
         logger.debug("property_saved", unique_id=prop.unique_id)
 
@@ -359,20 +448,19 @@ class PropertyStorage:
         Args:
             unique_id: Unique property identifier.
         """
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            UPDATE properties
-            SET notification_status = ?, notified_at = ?
-            WHERE unique_id = ?
-        """,
-            (
-                NotificationStatus.SENT.value,
-                datetime.now(UTC).isoformat(),
-                unique_id,
-            ),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                """
+                UPDATE properties
+                SET notification_status = ?, notified_at = ?
+                WHERE unique_id = ?
+            """,
+                (
+                    NotificationStatus.SENT.value,
+                    datetime.now(UTC).isoformat(),
+                    unique_id,
+                ),
+            )
 
         logger.debug("property_marked_notified", unique_id=unique_id)
 
@@ -382,16 +470,15 @@ class PropertyStorage:
         Args:
             unique_id: Unique property identifier.
         """
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            UPDATE properties
-            SET notification_status = ?
-            WHERE unique_id = ?
-        """,
-            (NotificationStatus.FAILED.value, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                """
+                UPDATE properties
+                SET notification_status = ?
+                WHERE unique_id = ?
+            """,
+                (NotificationStatus.FAILED.value, unique_id),
+            )
 
         logger.debug("property_notification_failed", unique_id=unique_id)
 
@@ -463,23 +550,28 @@ class PropertyStorage:
         via the FK ``ON DELETE SET NULL``, so they can re-enter the pipeline.
         """
         async with self._transaction() as conn:
-            for table in (
-                "property_images",
-                "quality_analyses",
-                "status_events",
-                "viewing_messages",
-                "price_history",
-                "enquiry_log",
-            ):
-                await conn.execute(
-                    f"DELETE FROM {table} WHERE property_unique_id = ?",
-                    (unique_id,),
-                )
+            await self._delete_property_rows(conn, unique_id)
+        logger.debug("property_deleted", unique_id=unique_id)
+
+    @staticmethod
+    async def _delete_property_rows(conn: aiosqlite.Connection, unique_id: str) -> None:
+        for table in (
+            "property_images",
+            "quality_analyses",
+            "status_events",
+            "viewing_messages",
+            "price_history",
+            "enquiry_log",
+            "image_hashes",
+        ):
             await conn.execute(
-                "DELETE FROM properties WHERE unique_id = ?",
+                f"DELETE FROM {table} WHERE property_unique_id = ?",
                 (unique_id,),
             )
-        logger.debug("property_deleted", unique_id=unique_id)
+        await conn.execute(
+            "DELETE FROM properties WHERE unique_id = ?",
+            (unique_id,),
+        )
 
     async def get_recent_properties_for_dedup(
         self, days: int | None = _DEDUP_LOOKBACK_DAYS
@@ -490,6 +582,9 @@ class PropertyStorage:
         properties from platform B can be matched against existing DB records
         from platform A.
 
+        source_listings and property_images are batch-loaded in chunks, so
+        the whole window costs a handful of queries rather than one per row.
+
         Args:
             days: Lookback window in days (default 30). Pass None to load all.
 
@@ -518,9 +613,69 @@ class PropertyStorage:
                 """
             )
 
-        rows = await cursor.fetchall()
+        rows = list(await cursor.fetchall())
+        results = await self._rows_to_dedup_merged(conn, rows)
+        logger.debug(
+            "loaded_dedup_anchors",
+            count=len(results),
+            days=days,
+        )
+        return results
+
+    async def get_dedup_blocks(self) -> dict[str, list[str]]:
+        """Group stored properties into cross-platform dedup blocks.
+
+        Uses the deduplicator's blocking key (``"<outcode>:<bedrooms>"``) and
+        reads only ``unique_id``/``postcode``/``bedrooms``, so the whole table
+        can be partitioned without materialising any listings. Properties
+        without a recognisable outcode can never match and are left out.
+
+        Returns:
+            Dict mapping block key to the unique_ids in that block, in key order.
+        """
+        conn = await self._get_connection()
+        cursor = await conn.execute(
+            """
+            SELECT unique_id, postcode, bedrooms FROM properties
+            WHERE COALESCE(enrichment_status, 'enriched') != 'pending'
+            ORDER BY first_seen DESC
+            """
+        )
+        blocks: dict[str, list[str]] = {}
+        async for row in cursor:
+            outcode = extract_outcode(row["postcode"])
+            if outcode:
+                blocks.setdefault(f"{outcode}:{row['bedrooms']}", []).append(row["unique_id"])
+        return dict(sorted(blocks.items()))
+
+    async def get_properties_for_dedup(self, unique_ids: list[str]) -> list[MergedProperty]:
+        """Load specific properties as MergedProperty objects for dedup.
+
+        Same reconstruction as ``get_recent_properties_for_dedup``, for one
+        block of ids from ``get_dedup_blocks``.
+        """
+        if not unique_ids:
+            return []
+        conn = await self._get_connection()
+        rows: list[aiosqlite.Row] = []
+        chunk_size = 500
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await conn.execute(
+                f"""SELECT * FROM properties WHERE unique_id IN ({placeholders})
+                    ORDER BY first_seen DESC""",
+                chunk,
+            )
+            rows.extend(await cursor.fetchall())
+        return await self._rows_to_dedup_merged(conn, rows)
+
+    @staticmethod
+    async def _rows_to_dedup_merged(
+        conn: aiosqlite.Connection, rows: list[aiosqlite.Row]
+    ) -> list[MergedProperty]:
+        """Build MergedProperty objects, batch-loading source_listings and images."""
         if not rows:
-            logger.debug("loaded_dedup_anchors", count=0, days=days)
             return []
 
         # Batch-load source_listings for all properties
@@ -537,22 +692,17 @@ class PropertyStorage:
             for sl in await sl_cursor.fetchall():
                 sl_by_merged.setdefault(sl["merged_id"], []).append(sl)
 
-        results = [
+        images_by_id = await load_images_by_property(conn, unique_ids)
+
+        return [
             await row_to_merged_property(
                 row,
                 source_listings=sl_by_merged.get(row["unique_id"]),
-                get_property_images=self.get_property_images,
+                images=images_by_id.get(row["unique_id"], []),
             )
             for row in rows
         ]
 
-        logger.debug(
-            "loaded_dedup_anchors",
-            count=len(results),
-            days=days,
-        )
-        return results
-
     async def update_merged_sources(
         self,
         existing_unique_id: str,
@@ -574,60 +724,73 @@ class PropertyStorage:
                 ``merged_id`` on matching source_listings rows.
         """
         async with self._transaction() as conn:
-            # Link absorbed source listings to this golden record
-            if absorbed_ids:
-                await conn.executemany(
-                    "UPDATE source_listings SET merged_id = ? WHERE unique_id = ?",
-                    [(existing_unique_id, uid) for uid in absorbed_ids],
-                )
+            await self._update_merged_sources_in(
+                conn, existing_unique_id, merged, absorbed_ids=absorbed_ids
+            )
 
-            # Rebuild denormalized caches from source_listings
-            cursor = await conn.execute(
-                """SELECT source, url, description, price_pcm
-                   FROM source_listings WHERE merged_id = ?
-                   ORDER BY last_seen ASC""",
-                (existing_unique_id,),
+    async def _update_merged_sources_in(
+        self,
+        conn: aiosqlite.Connection,
+        existing_unique_id: str,
+        merged: MergedProperty,
+        *,
+        absorbed_ids: list[str] | None = None,
+    ) -> None:
+        """``update_merged_sources`` inside the caller's transaction."""
+        # Link absorbed source listings to this golden record
+        if absorbed_ids:
+            await conn.executemany(
+                "UPDATE source_listings SET merged_id = ? WHERE unique_id = ?",
+                [(existing_unique_id, uid) for uid in absorbed_ids],
             )
-            rows = await cursor.fetchall()
-            if not rows:
-                logger.warning("update_merged_sources_no_listings", unique_id=existing_unique_id)
-                return
 
-            # Deduplicate sources (same platform may appear via multiple listings)
-            # ORDER BY last_seen ASC ensures last-write-wins for URLs/descriptions
-            sources = list(dict.fromkeys(r["source"] for r in rows))
-            source_urls = {r["source"]: r["url"] for r in rows}
-            descriptions = {r["source"]: r["description"] for r in rows if r["description"]}
-            prices = [r["price_pcm"] for r in rows]
+        # Rebuild denormalized caches from source_listings
+        cursor = await conn.execute(
+            """SELECT source, url, description, price_pcm
+               FROM source_listings WHERE merged_id = ?
+               ORDER BY last_seen ASC""",
+            (existing_unique_id,),
+        )
+        rows = await cursor.fetchall()
+        if not rows:
+            logger.warning("update_merged_sources_no_listings", unique_id=existing_unique_id)
+            return
 
-            await conn.execute(
-                """
-                UPDATE properties SET
-                    sources = ?,
-                    source_urls = ?,
-                    descriptions_json = ?,
-                    min_price = ?,
-                    max_price = ?,
-                    sources_updated_at = ?
-                WHERE unique_id = ?
-                """,
-                (
-                    json.dumps(sources),
-                    json.dumps(source_urls),
-                    json.dumps(descriptions) if descriptions else None,
-                    min(prices),
-                    max(prices),
-                    datetime.now(UTC).isoformat(),
-                    existing_unique_id,
-                ),
-            )
+        # Deduplicate sources (same platform may appear via multiple listings)
+        # ORDER BY last_seen ASC ensures last-write-wins for URLs/descriptions
+        sources = list(dict.fromkeys(r["source"] for r in rows))
+        source_urls = {r["source"]: r["url"] for r in rows}
+        descriptions = {r["source"]: r["description"] for r in rows if r["description"]}
+        prices = [r["price_pcm"] for r in rows]
+
+        await conn.execute(
+            """
+            UPDATE properties SET
+                sources = ?,
+                source_urls = ?,
+                descriptions_json = ?,
+                min_price = ?,
+                max_price = ?,
+                sources_updated_at = ?
+            WHERE unique_id = ?
+            """,
+            (
+                json.dumps(sources),
+                json.dumps(source_urls),
+                json.dumps(descriptions) if descriptions else None,
+                min(prices),
+                max(prices),
+                datetime.now(UTC).isoformat(),
+                existing_unique_id,
+            ),
+        )
 
-            # Save any new images from the merged property
-            new_images = list(merged.images)
-            if merged.floorplan:
-                new_images.append(merged.floorplan)
-            if new_images:
-                await self.save_property_images(existing_unique_id, new_images, _commit=False)
+        # Save any new images from the merged property
+        new_images = list(merged.images)
+        if merged.floorplan:
+            new_images.append(merged.floorplan)
+        if new_images:
+            await self.save_property_images(existing_unique_id, new_images, _commit=False)
 
         logger.info(
             "merged_sources_updated",
@@ -637,6 +800,53 @@ class PropertyStorage:
             max_price=max(prices),
         )
 
+    async def commit_dedup_block(
+        self,
+        merges: list[tuple[MergedProperty, list[str]]],
+        *,
+        job: str,
+        block_key: str,
+    ) -> None:
+        """Apply one dedup block's merges and advance the job checkpoint atomically.
+
+        For each ``(merged, absorbed_ids)`` the anchor (``merged``'s canonical
+        record) is rebuilt from its source listings and the absorbed rows are
+        deleted. Everything, including the ``job_checkpoints`` row, commits in
+        a single transaction, so an interrupted job resumes after the last
+        block that fully landed.
+
+        Args:
+            merges: Merged anchors paired with the unique_ids they absorbed.
+            job: Checkpoint name (see ``get_job_checkpoint``).
+            block_key: Block just processed; recorded as the resume position.
+        """
+        async with self._transaction() as conn:
+            for merged, absorbed_ids in merges:
+                await self._update_merged_sources_in(
+                    conn, merged.canonical.unique_id, merged, absorbed_ids=absorbed_ids
+                )
+                for absorbed_id in absorbed_ids:
+                    await self._delete_property_rows(conn, absorbed_id)
+            await conn.execute(
+                """INSERT INTO job_checkpoints (job, position) VALUES (?, ?)
+                   ON CONFLICT(job) DO UPDATE SET
+                       position = excluded.position,
+                       updated_at = datetime('now')""",
+                (job, block_key),
+            )
+
+    async def get_job_checkpoint(self, job: str) -> str | None:
+        """Return the resume position of an interrupted maintenance job, if any."""
+        conn = await self._get_connection()
+        cursor = await conn.execute("SELECT position FROM job_checkpoints WHERE job = ?", (job,))
+        row = await cursor.fetchone()
+        return row["position"] if row else None
+
+    async def clear_job_checkpoint(self, job: str) -> None:
+        """Forget a job's checkpoint once it has run to completion."""
+        async with self._write() as conn:
+            await conn.execute("DELETE FROM job_checkpoints WHERE job = ?", (job,))
+
     async def save_merged_property(
         self,
         merged: MergedProperty,
@@ -653,44 +863,43 @@ class PropertyStorage:
             transport_mode: Transport mode used for commute calculation.
             ward: Official ward name from postcodes.io lookup.
         """
-        conn = await self._get_connection()
-        columns, values = build_merged_insert_columns(
-            merged,
-            commute_minutes=commute_minutes,
-            transport_mode=transport_mode,
-            notification_status=NotificationStatus.PENDING,
-            extra={"ward": ward},
-        )
-        col_list = ", ".join(columns)
-        placeholders = ", ".join("?" for _ in columns)
+        async with self._write() as conn:
+            columns, values = build_merged_insert_columns(
+                merged,
+                commute_minutes=commute_minutes,
+                transport_mode=transport_mode,
+                notification_status=NotificationStatus.PENDING,
+                extra={"ward": ward},
+            )
+            col_list = ", ".join(columns)
+            placeholders = ", ".join("?" for _ in columns)
 
-        await conn.execute(
-            f"""
-            INSERT INTO properties ({col_list})
-            VALUES ({placeholders})
-            ON CONFLICT(unique_id) DO UPDATE SET
-                price_pcm = excluded.price_pcm,
-                title = excluded.title,
-                description = excluded.description,
-                image_url = excluded.image_url,
-                commute_minutes = COALESCE(excluded.commute_minutes, commute_minutes),
-                transport_mode = COALESCE(excluded.transport_mode, transport_mode),
-                sources = excluded.sources,
-                source_urls = excluded.source_urls,
-                min_price = excluded.min_price,
-                max_price = excluded.max_price,
-                descriptions_json = COALESCE(excluded.descriptions_json, descriptions_json),
-                ward = COALESCE(excluded.ward, ward)
-        """,
-            values,
-        )
-        # Keep source_listings in sync — write canonical source
-        await self._upsert_source_listing(
-            conn, merged.canonical, merged_id=merged.canonical.unique_id
-        )
-        # Link non-canonical source_listings by URL (in-run dedup absorbed sources)
-        await link_source_listings_by_url(conn, merged.canonical.unique_id, merged.source_urls)
-        await conn.commit()
+            await conn.execute(
+                f"""
+                INSERT INTO properties ({col_list})
+                VALUES ({placeholders})
+                ON CONFLICT(unique_id) DO UPDATE SET
+                    price_pcm = excluded.price_pcm,
+                    title = excluded.title,
+                    description = excluded.description,
+                    image_url = excluded.image_url,
+                    commute_minutes = COALESCE(excluded.commute_minutes, commute_minutes),
+                    transport_mode = COALESCE(excluded.transport_mode, transport_mode),
+                    sources = excluded.sources,
+                    source_urls = excluded.source_urls,
+                    min_price = excluded.min_price,
+                    max_price = excluded.max_price,
+                    descriptions_json = COALESCE(excluded.descriptions_json, descriptions_json),
+                    ward = COALESCE(excluded.ward, ward)
+            """,
+                values,
+            )
+            # Keep source_listings in sync — write canonical source
+            await self._upsert_source_listing(
+                conn, merged.canonical, merged_id=merged.canonical.unique_id
+            )
+            # Link non-canonical source_listings by URL (in-run dedup absorbed sources)
+            await link_source_listings_by_url(conn, merged.canonical.unique_id, merged.source_urls)
 
         logger.debug(
             "merged_property_saved",
@@ -709,12 +918,11 @@ class PropertyStorage:
         """
         if not ward_map:
             return 0
-        conn = await self._get_connection()
-        cursor = await conn.executemany(
-            "UPDATE properties SET ward = ? WHERE unique_id = ?",
-            [(ward, uid) for uid, ward in ward_map.items()],
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            cursor = await conn.executemany(
+                "UPDATE properties SET ward = ? WHERE unique_id = ?",
+                [(ward, uid) for uid, ward in ward_map.items()],
+            )
         return cursor.rowcount
 
     async def get_properties_without_ward(
@@ -722,18 +930,76 @@ class PropertyStorage:
     ) -> list[dict[str, Any]]:
         """Get properties that don't have a ward set yet.
 
-        Returns dicts with unique_id, postcode, latitude, longitude.
+        Properties whose postcode is already in ``postcode_wards`` get that
+        ward filled in first, so only those that still need a lookup are
+        returned. Postcodes are matched after ``normalize_postcode``, the
+        form they are cached under. Postcodes known to be invalid are left
+        out unless the property has coordinates to reverse-geocode instead;
+        those rows have ``postcode_invalid`` set.
+
+        Returns dicts with unique_id, postcode, latitude, longitude and
+        postcode_invalid.
         """
-        conn = await self._get_connection()
-        cursor = await conn.execute(
-            """
-            SELECT unique_id, postcode, latitude, longitude
-            FROM properties
-            WHERE ward IS NULL
-            """
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._transaction() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT unique_id, postcode, latitude, longitude
+                FROM properties
+                WHERE ward IS NULL
+                """
+            )
+            rows = [dict(row) for row in await cursor.fetchall()]
+
+            keys = sorted({normalize_postcode(r["postcode"]) for r in rows if r["postcode"]})
+            cached: dict[str, str | None] = {}
+            chunk_size = 500
+            for i in range(0, len(keys), chunk_size):
+                chunk = keys[i : i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"SELECT postcode, ward FROM postcode_wards WHERE postcode IN ({placeholders})",
+                    chunk,
+                )
+                cached.update((row["postcode"], row["ward"]) for row in await cursor.fetchall())
+
+            known: list[tuple[str, str]] = []
+            pending: list[dict[str, Any]] = []
+            for r in rows:
+                key = normalize_postcode(r["postcode"]) if r["postcode"] else None
+                r["postcode_invalid"] = False
+                if key is not None and key in cached:
+                    ward = cached[key]
+                    if ward is not None:
+                        known.append((ward, r["unique_id"]))
+                        continue
+                    if r["latitude"] is None or r["longitude"] is None:
+                        continue
+                    r["postcode_invalid"] = True
+                pending.append(r)
+
+            if known:
+                await conn.executemany(
+                    "UPDATE properties SET ward = ? WHERE unique_id = ?",
+                    known,
+                )
+        return pending
+
+    async def save_postcode_wards(self, wards: dict[str, str | None]) -> None:
+        """Remember forward-lookup results (None = unknown postcode).
+
+        Args:
+            wards: Mapping of normalised postcode (``normalize_postcode``) -> ward name.
+        """
+        if not wards:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO postcode_wards (postcode, ward) VALUES (?, ?)
+                   ON CONFLICT(postcode) DO UPDATE SET
+                       ward = excluded.ward,
+                       fetched_at = datetime('now')""",
+                list(wards.items()),
+            )
 
     async def save_property_images(
         self, unique_id: str, images: list[PropertyImage], *, _commit: bool = True
@@ -749,19 +1015,17 @@ class PropertyStorage:
         if not images:
             return
 
-        conn = await self._get_connection()
-
-        rows = [(unique_id, img.source.value, str(img.url), img.image_type) for img in images]
-        await conn.executemany(
-            """
-            INSERT OR IGNORE INTO property_images
-            (property_unique_id, source, url, image_type)
-            VALUES (?, ?, ?, ?)
-            """,
-            rows,
-        )
-        if _commit:
-            await conn.commit()
+        async with self._write(commit=_commit) as conn:
+            rows = [(unique_id, img.source.value, str(img.url), img.image_type) for img in images]
+            await conn.executemany(
+                """
+                INSERT OR IGNORE INTO property_images
+                (property_unique_id, source, url, image_type)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+            )
+            await refresh_first_gallery_url(conn, unique_id)
 
         logger.debug(
             "property_images_saved",
@@ -801,34 +1065,174 @@ class PropertyStorage:
             )
         return images
 
-    async def get_property_images_and_row(
-        self, unique_id: str
-    ) -> tuple[list[PropertyImage], Property | None]:
-        """Load property images and the property row in a single call.
-
-        Combines get_property_images() and row_to_property() to avoid two
-        separate round-trips when both are needed (e.g. cache loading).
+    async def get_gallery_hashes(self, unique_ids: list[str]) -> GalleryHashIndex:
+        """Load persisted gallery pHashes for the given properties.
 
         Args:
-            unique_id: Property unique ID.
+            unique_ids: Property unique IDs to look up.
 
         Returns:
-            Tuple of (images, property_or_none).
+            Dict mapping unique_id to {cached filename: (file size, phash)}.
         """
+        if not unique_ids:
+            return {}
         conn = await self._get_connection()
+        index: GalleryHashIndex = {}
+        chunk_size = 500
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await conn.execute(
+                f"SELECT property_unique_id, filename, file_size, phash FROM image_hashes"
+                f" WHERE property_unique_id IN ({placeholders})",
+                chunk,
+            )
+            for row in await cursor.fetchall():
+                index.setdefault(row["property_unique_id"], {})[row["filename"]] = (
+                    row["file_size"],
+                    row["phash"],
+                )
+        return index
 
-        # Images
-        img_cursor = await conn.execute(
-            """
-            SELECT source, url, image_type
-            FROM property_images
-            WHERE property_unique_id = ?
-            ORDER BY image_type, id
-            """,
-            (unique_id,),
-        )
-        img_rows = await img_cursor.fetchall()
-        images = [
+    async def save_gallery_hashes(self, rows: list[GalleryHashRow]) -> None:
+        """Upsert gallery pHashes computed from the image cache.
+
+        Args:
+            rows: (unique_id, filename, file size, phash) tuples.
+        """
+        if not rows:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO image_hashes (property_unique_id, filename, file_size, phash)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(property_unique_id, filename) DO UPDATE SET
+                    file_size = excluded.file_size,
+                    phash = excluded.phash,
+                    width = NULL,
+                    height = NULL,
+                    floorplan_score = NULL,
+                    epc_score = NULL,
+                    hashed_at = CURRENT_TIMESTAMP
+                """,
+                rows,
+            )
+
+    async def save_image_features(self, rows: list[ImageFeatureRow]) -> None:
+        """Upsert features extracted from cached images during enrichment.
+
+        Rows land in the pHash index, so dedup finds their hashes there.
+
+        Args:
+            rows: (unique_id, filename, file size, phash, width, height,
+                floorplan score, EPC score) tuples.
+        """
+        if not rows:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO image_hashes (
+                    property_unique_id, filename, file_size, phash,
+                    width, height, floorplan_score, epc_score
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(property_unique_id, filename) DO UPDATE SET
+                    file_size = excluded.file_size,
+                    phash = excluded.phash,
+                    width = excluded.width,
+                    height = excluded.height,
+                    floorplan_score = excluded.floorplan_score,
+                    epc_score = excluded.epc_score,
+                    hashed_at = CURRENT_TIMESTAMP
+                """,
+                rows,
+            )
+
+    async def get_telegram_file_ids(self, cache_paths: list[str]) -> dict[str, tuple[str, int]]:
+        """Look up Telegram file_ids recorded for uploaded cache images.
+
+        Args:
+            cache_paths: Image paths relative to the data directory.
+
+        Returns:
+            Dict mapping cache_path to (file_id, file_size at upload time).
+        """
+        if not cache_paths:
+            return {}
+        conn = await self._get_connection()
+        result: dict[str, tuple[str, int]] = {}
+        chunk_size = 500
+        for i in range(0, len(cache_paths), chunk_size):
+            chunk = cache_paths[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await conn.execute(
+                f"""SELECT cache_path, file_id, file_size FROM telegram_file_ids
+                    WHERE cache_path IN ({placeholders})""",
+                chunk,
+            )
+            for row in await cursor.fetchall():
+                result[row["cache_path"]] = (row["file_id"], row["file_size"])
+        return result
+
+    async def save_telegram_file_ids(self, file_ids: dict[str, tuple[str, int]]) -> None:
+        """Record the Telegram file_id returned for each uploaded cache image.
+
+        Args:
+            file_ids: Dict mapping cache_path to (file_id, file_size).
+        """
+        if not file_ids:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO telegram_file_ids (cache_path, file_id, file_size)
+                   VALUES (?, ?, ?)
+                   ON CONFLICT(cache_path) DO UPDATE SET
+                       file_id = excluded.file_id,
+                       file_size = excluded.file_size,
+                       created_at = datetime('now')""",
+                [(path, file_id, size) for path, (file_id, size) in file_ids.items()],
+            )
+
+    async def delete_telegram_file_ids(self, cache_paths: list[str]) -> None:
+        """Forget file_ids Telegram no longer accepts, so the images are re-uploaded."""
+        if not cache_paths:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                "DELETE FROM telegram_file_ids WHERE cache_path = ?",
+                [(path,) for path in cache_paths],
+            )
+
+    async def get_property_images_and_row(
+        self, unique_id: str
+    ) -> tuple[list[PropertyImage], Property | None]:
+        """Load property images and the property row in a single call.
+
+        Combines get_property_images() and row_to_property() to avoid two
+        separate round-trips when both are needed (e.g. cache loading).
+
+        Args:
+            unique_id: Property unique ID.
+
+        Returns:
+            Tuple of (images, property_or_none).
+        """
+        conn = await self._get_connection()
+
+        # Images
+        img_cursor = await conn.execute(
+            """
+            SELECT source, url, image_type
+            FROM property_images
+            WHERE property_unique_id = ?
+            ORDER BY image_type, id
+            """,
+            (unique_id,),
+        )
+        img_rows = await img_cursor.fetchall()
+        images = [
             PropertyImage(
                 source=PropertySource(r["source"]),
                 url=r["url"],
@@ -881,20 +1285,222 @@ class PropertyStorage:
         """
         if not commute_lookup:
             return 0
+        async with self._write() as conn:
+            await conn.executemany(
+                """
+                UPDATE properties
+                SET commute_minutes = ?, transport_mode = ?
+                WHERE unique_id = ?
+                """,
+                [
+                    (minutes, mode.value, unique_id)
+                    for unique_id, (minutes, mode) in commute_lookup.items()
+                ],
+            )
+        return len(commute_lookup)
+
+    async def get_cached_geocodes(
+        self, postcodes: list[str], *, max_age_days: int
+    ) -> dict[str, tuple[float, float]]:
+        """Look up cached postcode coordinates no older than ``max_age_days``.
+
+        Args:
+            postcodes: Normalised postcodes (upper case, single spaces).
+            max_age_days: Entries fetched longer ago than this are ignored.
+
+        Returns:
+            Dict mapping postcode to (latitude, longitude) for cache hits.
+        """
+        if not postcodes:
+            return {}
         conn = await self._get_connection()
-        await conn.executemany(
-            """
-            UPDATE properties
-            SET commute_minutes = ?, transport_mode = ?
-            WHERE unique_id = ?
-            """,
-            [
-                (minutes, mode.value, unique_id)
-                for unique_id, (minutes, mode) in commute_lookup.items()
-            ],
+        result: dict[str, tuple[float, float]] = {}
+        chunk_size = 500
+        for i in range(0, len(postcodes), chunk_size):
+            chunk = postcodes[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await conn.execute(
+                f"""SELECT postcode, latitude, longitude FROM geocode_cache
+                    WHERE postcode IN ({placeholders})
+                      AND fetched_at >= datetime('now', ?)""",
+                [*chunk, f"-{max_age_days} days"],
+            )
+            for row in await cursor.fetchall():
+                result[row["postcode"]] = (row["latitude"], row["longitude"])
+        return result
+
+    async def save_geocodes(self, geocodes: dict[str, tuple[float, float]]) -> None:
+        """Cache postcode coordinates returned by the geocoding API."""
+        if not geocodes:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO geocode_cache (postcode, latitude, longitude) VALUES (?, ?, ?)
+                   ON CONFLICT(postcode) DO UPDATE SET
+                       latitude = excluded.latitude,
+                       longitude = excluded.longitude,
+                       fetched_at = datetime('now')""",
+                [(postcode, lat, lon) for postcode, (lat, lon) in geocodes.items()],
+            )
+
+    async def get_rightmove_outcodes(
+        self, outcodes: list[str], *, max_age_days: int
+    ) -> dict[str, str]:
+        """Look up stored Rightmove outcode identifiers no older than ``max_age_days``.
+
+        Args:
+            outcodes: Upper-case outcodes.
+            max_age_days: Entries fetched longer ago than this are ignored.
+
+        Returns:
+            Dict mapping outcode to location identifier for cache hits.
+        """
+        if not outcodes:
+            return {}
+        conn = await self._get_connection()
+        placeholders = ",".join("?" * len(outcodes))
+        cursor = await conn.execute(
+            f"""SELECT outcode, location_id FROM rightmove_outcodes
+                WHERE outcode IN ({placeholders})
+                  AND fetched_at >= datetime('now', ?)""",
+            [*outcodes, f"-{max_age_days} days"],
         )
-        await conn.commit()
-        return len(commute_lookup)
+        return {row["outcode"]: row["location_id"] for row in await cursor.fetchall()}
+
+    async def save_rightmove_outcodes(self, identifiers: dict[str, str]) -> None:
+        """Store Rightmove outcode identifiers resolved via the typeahead API."""
+        if not identifiers:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO rightmove_outcodes (outcode, location_id) VALUES (?, ?)
+                   ON CONFLICT(outcode) DO UPDATE SET
+                       location_id = excluded.location_id,
+                       fetched_at = datetime('now')""",
+                list(identifiers.items()),
+            )
+
+    async def get_cached_commutes(
+        self,
+        coords: list[tuple[int, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+        max_age_days: int,
+    ) -> dict[tuple[int, int], tuple[int | None, int]]:
+        """Look up cached commute times for rounded coordinates.
+
+        Args:
+            coords: (lat_e4, lon_e4) pairs — coordinates in 1e-4 degrees.
+            transport_mode: TransportMode value.
+            destination: Normalised destination postcode.
+            max_age_days: Entries fetched longer ago than this are ignored.
+
+        Returns:
+            Dict mapping (lat_e4, lon_e4) to (minutes or None if unreachable,
+            max_minutes the lookup was made with).
+        """
+        if not coords:
+            return {}
+        wanted = set(coords)
+        lats = sorted({lat for lat, _ in wanted})
+        conn = await self._get_connection()
+        result: dict[tuple[int, int], tuple[int | None, int]] = {}
+        chunk_size = 500
+        for i in range(0, len(lats), chunk_size):
+            chunk = lats[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await conn.execute(
+                f"""SELECT lat_e4, lon_e4, minutes, max_minutes FROM commute_cache
+                    WHERE transport_mode = ? AND destination = ?
+                      AND lat_e4 IN ({placeholders})
+                      AND fetched_at >= datetime('now', ?)""",
+                [transport_mode, destination, *chunk, f"-{max_age_days} days"],
+            )
+            for row in await cursor.fetchall():
+                key = (row["lat_e4"], row["lon_e4"])
+                if key in wanted:
+                    result[key] = (row["minutes"], row["max_minutes"])
+        return result
+
+    async def save_commutes(
+        self,
+        commutes: dict[tuple[int, int], tuple[int | None, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+    ) -> None:
+        """Cache commute lookups keyed like ``get_cached_commutes``."""
+        if not commutes:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO commute_cache
+                       (lat_e4, lon_e4, transport_mode, destination, minutes, max_minutes)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(transport_mode, destination, lat_e4, lon_e4) DO UPDATE SET
+                       minutes = excluded.minutes,
+                       max_minutes = excluded.max_minutes,
+                       fetched_at = datetime('now')""",
+                [
+                    (lat, lon, transport_mode, destination, minutes, max_minutes)
+                    for (lat, lon), (minutes, max_minutes) in commutes.items()
+                ],
+            )
+
+    async def get_isochrones(
+        self,
+        *,
+        transport_mode: str,
+        destination: str,
+        limits: list[int],
+        max_age_days: int,
+    ) -> dict[int, list[list[tuple[float, float]]]]:
+        """Load stored isochrone rings no older than ``max_age_days``.
+
+        Returns:
+            Dict mapping travel-time limit (minutes) to its polygon rings.
+        """
+        if not limits:
+            return {}
+        conn = await self._get_connection()
+        placeholders = ",".join("?" * len(limits))
+        cursor = await conn.execute(
+            f"""SELECT max_minutes, rings FROM commute_isochrones
+                WHERE transport_mode = ? AND destination = ?
+                  AND max_minutes IN ({placeholders})
+                  AND fetched_at >= datetime('now', ?)""",
+            [transport_mode, destination, *limits, f"-{max_age_days} days"],
+        )
+        return {
+            row["max_minutes"]: [
+                [(lat, lng) for lat, lng in ring] for ring in json.loads(row["rings"])
+            ]
+            for row in await cursor.fetchall()
+        }
+
+    async def save_isochrones(
+        self,
+        isochrones: dict[int, list[list[tuple[float, float]]]],
+        *,
+        transport_mode: str,
+        destination: str,
+    ) -> None:
+        """Store isochrone rings keyed by travel-time limit (minutes)."""
+        if not isochrones:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO commute_isochrones (transport_mode, destination, max_minutes, rings)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(transport_mode, destination, max_minutes) DO UPDATE SET
+                       rings = excluded.rings,
+                       fetched_at = datetime('now')""",
+                [
+                    (transport_mode, destination, limit, json.dumps(rings))
+                    for limit, rings in isochrones.items()
+                ],
+            )
 
     # ------------------------------------------------------------------
     # Source listings (Layer 1 of golden record pattern)
@@ -968,49 +1574,48 @@ class PropertyStorage:
         """
         if not properties:
             return 0
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
-        rows = [
-            (
-                p.unique_id,
-                p.source.value,
-                p.source_id,
-                str(p.url),
-                p.title,
-                p.price_pcm,
-                p.bedrooms,
-                p.address,
-                p.postcode,
-                p.latitude,
-                p.longitude,
-                p.description,
-                str(p.image_url) if p.image_url else None,
-                p.available_from.isoformat() if p.available_from else None,
-                p.first_seen.isoformat(),
-                now,
-            )
-            for p in properties
-        ]
-        await conn.executemany(
-            """
-            INSERT INTO source_listings (
-                unique_id, source, source_id, url, title, price_pcm,
-                bedrooms, address, postcode, latitude, longitude,
-                description, image_url, available_from, first_seen, last_seen
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(unique_id) DO UPDATE SET
-                price_pcm = excluded.price_pcm,
-                title = excluded.title,
-                description = excluded.description,
-                image_url = excluded.image_url,
-                last_seen = excluded.last_seen,
-                latitude = COALESCE(excluded.latitude, latitude),
-                longitude = COALESCE(excluded.longitude, longitude),
-                postcode = COALESCE(excluded.postcode, postcode)
-            """,
-            rows,
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
+            rows = [
+                (
+                    p.unique_id,
+                    p.source.value,
+                    p.source_id,
+                    str(p.url),
+                    p.title,
+                    p.price_pcm,
+                    p.bedrooms,
+                    p.address,
+                    p.postcode,
+                    p.latitude,
+                    p.longitude,
+                    p.description,
+                    str(p.image_url) if p.image_url else None,
+                    p.available_from.isoformat() if p.available_from else None,
+                    p.first_seen.isoformat(),
+                    now,
+                )
+                for p in properties
+            ]
+            await conn.executemany(
+                """
+                INSERT INTO source_listings (
+                    unique_id, source, source_id, url, title, price_pcm,
+                    bedrooms, address, postcode, latitude, longitude,
+                    description, image_url, available_from, first_seen, last_seen
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(unique_id) DO UPDATE SET
+                    price_pcm = excluded.price_pcm,
+                    title = excluded.title,
+                    description = excluded.description,
+                    image_url = excluded.image_url,
+                    last_seen = excluded.last_seen,
+                    latitude = COALESCE(excluded.latitude, latitude),
+                    longitude = COALESCE(excluded.longitude, longitude),
+                    postcode = COALESCE(excluded.postcode, postcode)
+                """,
+                rows,
+            )
         return len(rows)
 
     async def link_source_listings(self, links: list[tuple[str, str]]) -> None:
@@ -1020,31 +1625,94 @@ class PropertyStorage:
         """
         if not links:
             return
-        conn = await self._get_connection()
-        await conn.executemany(
-            "UPDATE source_listings SET merged_id = ? WHERE unique_id = ?",
-            [(merged_id, uid) for uid, merged_id in links],
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.executemany(
+                "UPDATE source_listings SET merged_id = ? WHERE unique_id = ?",
+                [(merged_id, uid) for uid, merged_id in links],
+            )
 
-    async def get_all_known_source_ids(self) -> dict[str, set[str]]:
+    async def get_all_known_source_ids(
+        self, sources: Collection[str] | None = None
+    ) -> dict[str, set[str]]:
         """Get all source_ids grouped by property source.
 
         Queries ``source_listings`` — the single authority for every
         source ID ever seen — so scraper early-stop correctly skips
         previously-seen listings.
 
+        Args:
+            sources: If set, only load IDs for these sources.
+
         Returns:
             Dict mapping source name to set of source_ids.
         """
         conn = await self._get_connection()
-        cursor = await conn.execute("SELECT source, source_id FROM source_listings")
+        if sources is None:
+            cursor = await conn.execute("SELECT source, source_id FROM source_listings")
+        else:
+            sources = list(sources)
+            if not sources:
+                return {}
+            placeholders = ",".join("?" * len(sources))
+            cursor = await conn.execute(
+                f"SELECT source, source_id FROM source_listings WHERE source IN ({placeholders})",
+                sources,
+            )
         rows = await cursor.fetchall()
         result: dict[str, set[str]] = {}
         for source, source_id in rows:
             result.setdefault(source, set()).add(source_id)
         return result
 
+    async def get_scrape_watermarks(
+        self, search_key: str
+    ) -> dict[tuple[str, str], tuple[str, int]]:
+        """Load scrape watermarks recorded under the given search filters.
+
+        Args:
+            search_key: Identifies the search filters in use; watermarks
+                recorded under other filters are left out.
+
+        Returns:
+            Dict mapping (source, area) to (sort_order, newest_id).
+        """
+        conn = await self._get_connection()
+        cursor = await conn.execute(
+            """SELECT source, area, sort_order, newest_id FROM scrape_watermarks
+               WHERE search_key = ?""",
+            (search_key,),
+        )
+        return {
+            (row["source"], row["area"]): (row["sort_order"], row["newest_id"])
+            for row in await cursor.fetchall()
+        }
+
+    async def save_scrape_watermarks(
+        self, search_key: str, watermarks: dict[tuple[str, str], tuple[str, int]]
+    ) -> None:
+        """Record scrape watermarks, replacing any earlier ones for the same area.
+
+        Args:
+            search_key: Identifies the search filters the scrape used.
+            watermarks: Mapping of (source, area) to (sort_order, newest_id).
+        """
+        if not watermarks:
+            return
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO scrape_watermarks
+                       (source, area, sort_order, search_key, newest_id) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(source, area) DO UPDATE SET
+                       sort_order = excluded.sort_order,
+                       search_key = excluded.search_key,
+                       newest_id = excluded.newest_id,
+                       updated_at = datetime('now')""",
+                [
+                    (source, area, sort_order, search_key, newest_id)
+                    for (source, area), (sort_order, newest_id) in watermarks.items()
+                ],
+            )
+
     async def save_quality_analysis(
         self, unique_id: str, analysis: PropertyQualityAnalysis, *, _commit: bool = True
     ) -> None:
@@ -1056,97 +1724,102 @@ class PropertyStorage:
             _commit: Whether to commit the transaction. Pass False when
                 called from a parent operation that manages its own commit.
         """
-        conn = await self._get_connection()
-
-        # Use model_dump(mode="json") + json.dumps() instead of model_dump_json()
-        # to guarantee valid JSON. Pydantic's Rust serializer can produce invalid
-        # JSON for edge cases (e.g. NaN floats), while json.dumps() is strict.
-        try:
-            analysis_json = json.dumps(analysis.model_dump(mode="json"))
-        except (ValueError, TypeError) as e:
-            logger.error(
-                "analysis_json_serialization_failed",
-                unique_id=unique_id,
-                error=str(e),
-                exc_info=True,
-            )
-            return
-
-        # Denormalize key fields for SQL filtering
-        overall_rating = analysis.overall_rating
-        condition_concerns = analysis.condition_concerns
-        concern_severity = analysis.concern_severity
+        async with self._write(commit=_commit) as conn:
+            # Use model_dump(mode="json") + json.dumps() instead of model_dump_json()
+            # to guarantee valid JSON. Pydantic's Rust serializer can produce invalid
+            # JSON for edge cases (e.g. NaN floats), while json.dumps() is strict.
+            try:
+                analysis_data = analysis.model_dump(mode="json")
+                analysis_json = json.dumps(analysis_data)
+            except (ValueError, TypeError) as e:
+                logger.error(
+                    "analysis_json_serialization_failed",
+                    unique_id=unique_id,
+                    error=str(e),
+                    exc_info=True,
+                )
+                return
 
-        # Extract denormalized fields from new analysis dimensions
-        epc_rating = analysis.listing_extraction.epc_rating if analysis.listing_extraction else None
-        has_outdoor_space = None
-        if analysis.outdoor_space:
-            has_outdoor_space = any(
-                [
-                    analysis.outdoor_space.has_balcony,
-                    analysis.outdoor_space.has_garden,
-                    analysis.outdoor_space.has_terrace,
-                    analysis.outdoor_space.has_shared_garden,
-                ]
-            )
-        red_flag_count = (
-            analysis.listing_red_flags.red_flag_count if analysis.listing_red_flags else None
-        )
+            # Denormalize key fields for SQL filtering
+            overall_rating = analysis.overall_rating
+            condition_concerns = analysis.condition_concerns
+            concern_severity = analysis.concern_severity
 
-        # Compute fit_score for SQL-based sorting
-        fit_score_val: int | None = None
-        prop_cursor = await conn.execute(
-            "SELECT bedrooms, postcode FROM properties WHERE unique_id = ?",
-            (unique_id,),
-        )
-        prop_row = await prop_cursor.fetchone()
-        if prop_row:
-            analysis_dict = json.loads(analysis_json)
-            postcode = prop_row["postcode"] or ""
-            outcode = postcode.split()[0] if postcode else None
-            if outcode:
-                ht = HOSTING_TOLERANCE.get(outcode)
-                if ht:
-                    analysis_dict["_area_hosting_tolerance"] = ht.get("rating")
-            fit_score_val = compute_fit_score(analysis_dict, prop_row["bedrooms"] or 0)
-
-        from home_finder.filters.fit_score import FIT_SCORE_VERSION
+            # Extract denormalized fields from new analysis dimensions
+            epc_rating = (
+                analysis.listing_extraction.epc_rating if analysis.listing_extraction else None
+            )
+            has_outdoor_space = None
+            if analysis.outdoor_space:
+                has_outdoor_space = any(
+                    [
+                        analysis.outdoor_space.has_balcony,
+                        analysis.outdoor_space.has_garden,
+                        analysis.outdoor_space.has_terrace,
+                        analysis.outdoor_space.has_shared_garden,
+                    ]
+                )
+            red_flag_count = (
+                analysis.listing_red_flags.red_flag_count if analysis.listing_red_flags else None
+            )
 
-        await conn.execute(
-            """
-            INSERT INTO quality_analyses (
-                property_unique_id, analysis_json, overall_rating,
-                condition_concerns, concern_severity, epc_rating,
-                has_outdoor_space, red_flag_count, fit_score,
-                fit_score_version, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(property_unique_id) DO UPDATE SET
-                analysis_json = excluded.analysis_json,
-                overall_rating = excluded.overall_rating,
-                condition_concerns = excluded.condition_concerns,
-                concern_severity = excluded.concern_severity,
-                epc_rating = excluded.epc_rating,
-                has_outdoor_space = excluded.has_outdoor_space,
-                red_flag_count = excluded.red_flag_count,
-                fit_score = excluded.fit_score,
-                fit_score_version = excluded.fit_score_version
-            """,
-            (
-                unique_id,
-                analysis_json,
-                overall_rating,
-                condition_concerns,
-                concern_severity,
-                epc_rating,
-                has_outdoor_space,
-                red_flag_count,
-                fit_score_val,
-                FIT_SCORE_VERSION,
-                datetime.now(UTC).isoformat(),
-            ),
-        )
-        if _commit:
-            await conn.commit()
+            # Compute fit_score for SQL-based sorting
+            fit_score_val: int | None = None
+            prop_cursor = await conn.execute(
+                "SELECT bedrooms, postcode FROM properties WHERE unique_id = ?",
+                (unique_id,),
+            )
+            prop_row = await prop_cursor.fetchone()
+            if prop_row:
+                analysis_dict = json.loads(analysis_json)
+                postcode = prop_row["postcode"] or ""
+                outcode = postcode.split()[0] if postcode else None
+                if outcode:
+                    ht = HOSTING_TOLERANCE.get(outcode)
+                    if ht:
+                        analysis_dict["_area_hosting_tolerance"] = ht.get("rating")
+                fit_score_val = compute_fit_score(analysis_dict, prop_row["bedrooms"] or 0)
+
+            from home_finder.filters.fit_score import FIT_SCORE_VERSION
+
+            filter_columns = ", ".join(_QUALITY_FILTER_COLUMNS)
+            filter_placeholders = ", ".join("?" * len(_QUALITY_FILTER_COLUMNS))
+            filter_updates = ", ".join(f"{c} = excluded.{c}" for c in _QUALITY_FILTER_COLUMNS)
+            await conn.execute(
+                f"""
+                INSERT INTO quality_analyses (
+                    property_unique_id, analysis_json, overall_rating,
+                    condition_concerns, concern_severity, epc_rating,
+                    has_outdoor_space, red_flag_count, fit_score,
+                    fit_score_version, created_at, {filter_columns}
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {filter_placeholders})
+                ON CONFLICT(property_unique_id) DO UPDATE SET
+                    analysis_json = excluded.analysis_json,
+                    overall_rating = excluded.overall_rating,
+                    condition_concerns = excluded.condition_concerns,
+                    concern_severity = excluded.concern_severity,
+                    epc_rating = excluded.epc_rating,
+                    has_outdoor_space = excluded.has_outdoor_space,
+                    red_flag_count = excluded.red_flag_count,
+                    fit_score = excluded.fit_score,
+                    fit_score_version = excluded.fit_score_version,
+                    {filter_updates}
+                """,
+                (
+                    unique_id,
+                    analysis_json,
+                    overall_rating,
+                    condition_concerns,
+                    concern_severity,
+                    epc_rating,
+                    has_outdoor_space,
+                    red_flag_count,
+                    fit_score_val,
+                    FIT_SCORE_VERSION,
+                    datetime.now(UTC).isoformat(),
+                    *_quality_filter_values(analysis_data),
+                ),
+            )
         logger.debug("quality_analysis_saved", unique_id=unique_id)
 
     async def get_quality_analysis(self, unique_id: str) -> PropertyQualityAnalysis | None:
@@ -1172,16 +1845,15 @@ class PropertyStorage:
         self, unique_id: str, floor_area_sqm: float, floor_area_source: str
     ) -> None:
         """Update floor area for a property (only if not already set)."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            UPDATE properties
-            SET floor_area_sqm = ?, floor_area_source = ?
-            WHERE unique_id = ? AND floor_area_sqm IS NULL
-            """,
-            (floor_area_sqm, floor_area_source, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                """
+                UPDATE properties
+                SET floor_area_sqm = ?, floor_area_source = ?
+                WHERE unique_id = ? AND floor_area_sqm IS NULL
+                """,
+                (floor_area_sqm, floor_area_source, unique_id),
+            )
 
     # ------------------------------------------------------------------
     # User status tracking (Ticket 7)
@@ -1230,16 +1902,16 @@ class PropertyStorage:
 
     async def get_status_history(self, unique_id: str) -> list[dict[str, Any]]:
         """Get status change history for a property, ordered chronologically."""
-        conn = await self._get_connection()
-        cursor = await conn.execute(
-            """SELECT from_status, to_status, note, source, created_at
-               FROM status_events
-               WHERE property_unique_id = ?
-               ORDER BY created_at ASC""",
-            (unique_id,),
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                """SELECT from_status, to_status, note, source, created_at
+                   FROM status_events
+                   WHERE property_unique_id = ?
+                   ORDER BY created_at ASC""",
+                (unique_id,),
+            )
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
 
     # ------------------------------------------------------------------
     # Viewing messages (Ticket 8)
@@ -1257,25 +1929,23 @@ class PropertyStorage:
 
     async def save_viewing_message(self, unique_id: str, message: str) -> None:
         """Save or replace a viewing message for a property."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """INSERT INTO viewing_messages (property_unique_id, message)
-               VALUES (?, ?)
-               ON CONFLICT(property_unique_id) DO UPDATE SET
-                   message = excluded.message,
-                   created_at = CURRENT_TIMESTAMP""",
-            (unique_id, message),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                """INSERT INTO viewing_messages (property_unique_id, message)
+                   VALUES (?, ?)
+                   ON CONFLICT(property_unique_id) DO UPDATE SET
+                       message = excluded.message,
+                       created_at = CURRENT_TIMESTAMP""",
+                (unique_id, message),
+            )
 
     async def delete_viewing_message(self, unique_id: str) -> None:
         """Delete cached viewing message (for regeneration)."""
-        conn = await self._get_connection()
-        await conn.execute(
-            "DELETE FROM viewing_messages WHERE property_unique_id = ?",
-            (unique_id,),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                "DELETE FROM viewing_messages WHERE property_unique_id = ?",
+                (unique_id,),
+            )
 
     # ------------------------------------------------------------------
     # Price history (Ticket 10)
@@ -1309,15 +1979,19 @@ class PropertyStorage:
                 return None
 
             change_amount = new_price - old_price
-            await conn.execute(
+            ph_cursor = await conn.execute(
                 """INSERT INTO price_history
                    (property_unique_id, old_price, new_price, change_amount, source)
                    VALUES (?, ?, ?, ?, ?)""",
                 (unique_id, old_price, new_price, change_amount, source),
             )
             await conn.execute(
-                "UPDATE properties SET price_pcm = ?, price_drop_notified = 0 WHERE unique_id = ?",
-                (new_price, unique_id),
+                """UPDATE properties
+                   SET price_pcm = ?, price_drop_notified = 0,
+                       last_price_change = ?,
+                       price_changed_at = (SELECT detected_at FROM price_history WHERE id = ?)
+                   WHERE unique_id = ?""",
+                (new_price, change_amount, ph_cursor.lastrowid, unique_id),
             )
 
             # Recompute value rating and fit_score for the new price
@@ -1362,9 +2036,10 @@ class PropertyStorage:
 
                     await conn.execute(
                         "UPDATE quality_analyses "
-                        "SET analysis_json = ?, fit_score = ?, fit_score_version = ? "
+                        "SET analysis_json = ?, value_rating = ?, "
+                        "fit_score = ?, fit_score_version = ? "
                         "WHERE property_unique_id = ?",
-                        (updated_json, fit, FIT_SCORE_VERSION, unique_id),
+                        (updated_json, new_value.rating, fit, FIT_SCORE_VERSION, unique_id),
                     )
                 except (json.JSONDecodeError, TypeError, ImportError):
                     logger.debug(
@@ -1384,16 +2059,16 @@ class PropertyStorage:
 
     async def get_price_history(self, unique_id: str) -> list[dict[str, Any]]:
         """Get price change history for a property, newest first."""
-        conn = await self._get_connection()
-        cursor = await conn.execute(
-            """SELECT old_price, new_price, change_amount, source, detected_at
-               FROM price_history
-               WHERE property_unique_id = ?
-               ORDER BY detected_at DESC""",
-            (unique_id,),
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                """SELECT old_price, new_price, change_amount, source, detected_at
+                   FROM price_history
+                   WHERE property_unique_id = ?
+                   ORDER BY detected_at DESC""",
+                (unique_id,),
+            )
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
 
     async def get_unsent_price_drops(self) -> list[dict[str, Any]]:
         """Get properties with unnotified price drops for Telegram alerts."""
@@ -1421,12 +2096,11 @@ class PropertyStorage:
 
     async def mark_price_drop_notified(self, unique_id: str) -> None:
         """Mark a property's price drop as notified."""
-        conn = await self._get_connection()
-        await conn.execute(
-            "UPDATE properties SET price_drop_notified = 1 WHERE unique_id = ?",
-            (unique_id,),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                "UPDATE properties SET price_drop_notified = 1 WHERE unique_id = ?",
+                (unique_id,),
+            )
 
     # ------------------------------------------------------------------
     # Enquiry log (Ticket 9)
@@ -1434,27 +2108,27 @@ class PropertyStorage:
 
     async def log_enquiry(self, result: dict[str, Any]) -> None:
         """Record an enquiry attempt (INSERT or UPDATE on conflict)."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """INSERT INTO enquiry_log
-               (property_unique_id, portal, message, status, submitted_at, error, screenshot_path)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(property_unique_id, portal) DO UPDATE SET
-                   status = excluded.status,
-                   submitted_at = excluded.submitted_at,
-                   error = excluded.error,
-                   screenshot_path = excluded.screenshot_path""",
-            (
-                result["property_unique_id"],
-                result["portal"],
-                result["message"],
-                result["status"],
-                result.get("submitted_at"),
-                result.get("error"),
-                result.get("screenshot_path"),
-            ),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            await conn.execute(
+                """INSERT INTO enquiry_log
+                   (property_unique_id, portal, message, status, submitted_at, error,
+                    screenshot_path)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(property_unique_id, portal) DO UPDATE SET
+                       status = excluded.status,
+                       submitted_at = excluded.submitted_at,
+                       error = excluded.error,
+                       screenshot_path = excluded.screenshot_path""",
+                (
+                    result["property_unique_id"],
+                    result["portal"],
+                    result["message"],
+                    result["status"],
+                    result.get("submitted_at"),
+                    result.get("error"),
+                    result.get("screenshot_path"),
+                ),
+            )
 
     async def get_enquiries_for_property(self, unique_id: str) -> list[dict[str, Any]]:
         """Get all enquiry attempts for a property."""
@@ -1485,19 +2159,18 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if property not found.
         """
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
-        cursor = await conn.execute(
-            """
-            UPDATE properties
-            SET is_off_market = 1,
-                off_market_since = COALESCE(off_market_since, ?),
-                off_market_reason = COALESCE(off_market_reason, ?)
-            WHERE unique_id = ?
-            """,
-            (now, reason, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
+            cursor = await conn.execute(
+                """
+                UPDATE properties
+                SET is_off_market = 1,
+                    off_market_since = COALESCE(off_market_since, ?),
+                    off_market_reason = COALESCE(off_market_reason, ?)
+                WHERE unique_id = ?
+                """,
+                (now, reason, unique_id),
+            )
         updated = cursor.rowcount > 0
         if updated:
             logger.info(
@@ -1516,45 +2189,44 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if property not found.
         """
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
 
-        # Read current off-market state for history
-        cursor = await conn.execute(
-            "SELECT off_market_since, off_market_reason, off_market_history "
-            "FROM properties WHERE unique_id = ?",
-            (unique_id,),
-        )
-        row = await cursor.fetchone()
-        if row is None:
-            return False
-
-        # Build history entry
-        history: list[dict[str, str | None]] = []
-        if row["off_market_history"]:
-            with contextlib.suppress(json.JSONDecodeError, TypeError):
-                history = json.loads(row["off_market_history"])
-        if row["off_market_since"]:
-            history.append(
-                {
-                    "off": row["off_market_since"],
-                    "back": now,
-                    "reason": row["off_market_reason"],
-                }
+            # Read current off-market state for history
+            cursor = await conn.execute(
+                "SELECT off_market_since, off_market_reason, off_market_history "
+                "FROM properties WHERE unique_id = ?",
+                (unique_id,),
             )
+            row = await cursor.fetchone()
+            if row is None:
+                return False
+
+            # Build history entry
+            history: list[dict[str, str | None]] = []
+            if row["off_market_history"]:
+                with contextlib.suppress(json.JSONDecodeError, TypeError):
+                    history = json.loads(row["off_market_history"])
+            if row["off_market_since"]:
+                history.append(
+                    {
+                        "off": row["off_market_since"],
+                        "back": now,
+                        "reason": row["off_market_reason"],
+                    }
+                )
 
-        cursor = await conn.execute(
-            """
-            UPDATE properties
-            SET is_off_market = 0,
-                off_market_since = NULL,
-                off_market_reason = NULL,
-                off_market_history = ?
-            WHERE unique_id = ?
-            """,
-            (json.dumps(history) if history else None, unique_id),
-        )
-        await conn.commit()
+            cursor = await conn.execute(
+                """
+                UPDATE properties
+                SET is_off_market = 0,
+                    off_market_since = NULL,
+                    off_market_reason = NULL,
+                    off_market_history = ?
+                WHERE unique_id = ?
+                """,
+                (json.dumps(history) if history else None, unique_id),
+            )
         updated = cursor.rowcount > 0
         if updated:
             logger.info("property_returned_to_market", unique_id=unique_id)
@@ -1569,6 +2241,11 @@ class PropertyStorage:
         linked rows exist, falling back to properties.source_urls JSON for
         legacy records without linkage.
 
+        Records come back most-likely-to-have-changed first, so a checker
+        with a time budget spends it where churn is expected: never-checked
+        records, then by days since the last check, plus a quarter of the
+        days listed, plus a fixed boost for a price drop in the last two weeks.
+
         Returns list of dicts with keys:
             unique_id, url, source, source_urls, is_off_market,
             source_listings (list of dicts with unique_id, source, url,
@@ -1576,14 +2253,23 @@ class PropertyStorage:
         """
         conn = await self._get_connection()
 
-        # Step 1: Get eligible golden records
+        # Step 1: Get eligible golden records, highest churn priority first
         cursor = await conn.execute(
             """
             SELECT unique_id, url, source, source_urls, is_off_market
             FROM properties
             WHERE COALESCE(enrichment_status, 'enriched') != 'pending'
               AND notification_status NOT IN ('pending_enrichment', 'pending_analysis', 'dropped')
-            ORDER BY first_seen DESC
+            ORDER BY
+                last_checked_at IS NOT NULL,
+                julianday('now') - julianday(COALESCE(last_checked_at, first_seen))
+                    + (julianday('now') - julianday(first_seen)) / 4.0
+                    + CASE
+                        WHEN last_price_change < 0
+                             AND julianday(price_changed_at) >= julianday('now', '-14 days')
+                        THEN 14.0 ELSE 0.0
+                      END DESC,
+                first_seen ASC
             """
         )
         rows = await cursor.fetchall()
@@ -1653,19 +2339,18 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if not found.
         """
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
-        cursor = await conn.execute(
-            """
-            UPDATE source_listings
-            SET is_off_market = 1,
-                off_market_since = COALESCE(off_market_since, ?),
-                off_market_reason = ?
-            WHERE unique_id = ?
-            """,
-            (now, reason, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
+            cursor = await conn.execute(
+                """
+                UPDATE source_listings
+                SET is_off_market = 1,
+                    off_market_since = COALESCE(off_market_since, ?),
+                    off_market_reason = ?
+                WHERE unique_id = ?
+                """,
+                (now, reason, unique_id),
+            )
         return cursor.rowcount > 0
 
     async def mark_source_listing_active(self, unique_id: str) -> bool:
@@ -1673,16 +2358,15 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if not found.
         """
-        conn = await self._get_connection()
-        cursor = await conn.execute(
-            """
-            UPDATE source_listings
-            SET is_off_market = 0, off_market_since = NULL, off_market_reason = NULL
-            WHERE unique_id = ?
-            """,
-            (unique_id,),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE source_listings
+                SET is_off_market = 0, off_market_since = NULL, off_market_reason = NULL
+                WHERE unique_id = ?
+                """,
+                (unique_id,),
+            )
         return cursor.rowcount > 0
 
     async def update_source_listing_last_checked(self, unique_id: str) -> bool:
@@ -1690,13 +2374,12 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if not found.
         """
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
-        cursor = await conn.execute(
-            "UPDATE source_listings SET last_checked_at = ? WHERE unique_id = ?",
-            (now, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
+            cursor = await conn.execute(
+                "UPDATE source_listings SET last_checked_at = ? WHERE unique_id = ?",
+                (now, unique_id),
+            )
         return cursor.rowcount > 0
 
     async def update_property_last_checked(self, unique_id: str) -> bool:
@@ -1704,13 +2387,12 @@ class PropertyStorage:
 
         Returns True if the row was updated, False if not found.
         """
-        conn = await self._get_connection()
-        now = datetime.now(UTC).isoformat()
-        cursor = await conn.execute(
-            "UPDATE properties SET last_checked_at = ? WHERE unique_id = ?",
-            (now, unique_id),
-        )
-        await conn.commit()
+        async with self._write() as conn:
+            now = datetime.now(UTC).isoformat()
+            cursor = await conn.execute(
+                "UPDATE properties SET last_checked_at = ? WHERE unique_id = ?",
+                (now, unique_id),
+            )
         return cursor.rowcount > 0
 
     # ------------------------------------------------------------------
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import base64
 import json
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 import aiosqlite
 
+from home_finder.db.image_ops import load_images_by_property
 from home_finder.db.row_mappers import (
     PropertyDetailItem,
     PropertyListItem,
     parse_json_fields,
 )
 from home_finder.logging import get_logger
-from home_finder.models import PropertyImage, PropertyQualityAnalysis
+from home_finder.models import PropertyQualityAnalysis
 from home_finder.web.filters import ADDED_OPTIONS
 
 if TYPE_CHECKING:
@@ -30,19 +33,7 @@ _CARD_COLUMNS = """
     q.condition_concerns as quality_concerns,
     q.concern_severity as quality_severity,
     q.analysis_json,
-    (SELECT pi.url FROM property_images pi
-     WHERE pi.property_unique_id = p.unique_id
-     AND pi.image_type = 'gallery'
-     AND LOWER(pi.url) NOT LIKE '%epc%'
-     AND LOWER(pi.url) NOT LIKE '%energy-performance%'
-     AND LOWER(pi.url) NOT LIKE '%energy_performance%'
-     ORDER BY pi.id LIMIT 1) as first_gallery_url,
-    (SELECT ph.change_amount FROM price_history ph
-     WHERE ph.property_unique_id = p.unique_id
-     ORDER BY ph.detected_at DESC LIMIT 1) as last_price_change,
-    (SELECT ph.detected_at FROM price_history ph
-     WHERE ph.property_unique_id = p.unique_id
-     ORDER BY ph.detected_at DESC LIMIT 1) as price_changed_at
+    COALESCE(q.fit_score, -1) as fit_sort_key
 """
 
 _CARD_JOINS = """
@@ -50,6 +41,99 @@ _CARD_JOINS = """
     LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
 """
 
+# Map viewport as (south, west, north, east) in degrees
+MapBounds = tuple[float, float, float, float]
+
+# Viewport filter answered from the property_rtree spatial index, keyed by
+# property_spatial_ids (properties.rowid isn't stable across VACUUM)
+_BOUNDS_SQL: Final = """p.unique_id IN (
+    SELECT s.unique_id FROM property_rtree r
+    JOIN property_spatial_ids s ON s.id = r.id
+    WHERE r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?)"""
+
+_MARKER_COLUMNS: Final = """p.unique_id, p.latitude, p.longitude, p.price_pcm,
+    p.bedrooms, p.title, p.postcode, p.commute_minutes,
+    p.first_gallery_url IS NOT NULL OR p.image_url IS NOT NULL as has_image,
+    p.is_off_market,
+    q.overall_rating as quality_rating,
+    q.fit_score,
+    q.value_rating,
+    q.one_line"""
+
+
+def _bounds_params(bounds: MapBounds) -> list[float]:
+    south, west, north, east = bounds
+    return [south, north, west, east]
+
+
+def _row_to_marker(row: aiosqlite.Row) -> dict[str, Any]:
+    """Convert a row of _MARKER_COLUMNS into a map marker dict.
+
+    ``image_url`` points at the thumbnail endpoint, so the cached-file lookup
+    only happens when a popup actually shows the image.
+    """
+    unique_id = row["unique_id"]
+    return {
+        "id": unique_id,
+        "lat": row["latitude"],
+        "lon": row["longitude"],
+        "price": row["price_pcm"],
+        "bedrooms": row["bedrooms"],
+        "rating": row["quality_rating"],
+        "fit_score": row["fit_score"],
+        "title": row["title"],
+        "url": f"/property/{unique_id}",
+        "image_url": f"/property/{unique_id}/thumbnail" if row["has_image"] else None,
+        "postcode": row["postcode"],
+        "commute_minutes": row["commute_minutes"],
+        "value_rating": row["value_rating"],
+        "one_line": row["one_line"],
+        "is_off_market": bool(row["is_off_market"]),
+    }
+
+
+# Sort options for get_properties_paginated: direction plus the ordered sort
+# keys as (SQL expression, card-dict key). Every sort ends in p.unique_id so
+# each row has a distinct position and can serve as a keyset cursor.
+_SORT_KEYS: Final[dict[str, tuple[str, tuple[tuple[str, str], ...]]]] = {
+    "newest": ("DESC", (("p.first_seen", "first_seen"), ("p.unique_id", "unique_id"))),
+    "price_asc": ("ASC", (("p.price_pcm", "price_pcm"), ("p.unique_id", "unique_id"))),
+    "price_desc": ("DESC", (("p.price_pcm", "price_pcm"), ("p.unique_id", "unique_id"))),
+    "fit_desc": (
+        "DESC",
+        (
+            ("COALESCE(q.fit_score, -1)", "fit_sort_key"),
+            ("p.first_seen", "first_seen"),
+            ("p.unique_id", "unique_id"),
+        ),
+    ),
+    "longest_listed": ("ASC", (("p.first_seen", "first_seen"), ("p.unique_id", "unique_id"))),
+}
+
+
+def encode_page_cursor(item: PropertyListItem, sort: str) -> str:
+    """Opaque keyset cursor for the position of *item* under *sort*."""
+    _, keys = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])
+    values = [item.get(key) for _, key in keys]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _decode_page_cursor(cursor: str, sort: str) -> list[Any] | None:
+    """Sort-key values from a cursor, or None if it is malformed for *sort*."""
+    _, keys = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(keys)
+        or not all(isinstance(v, (str, int, float)) for v in values)
+    ):
+        return None
+    return values
+
+
 _QUALITY_FIELD_DEFAULTS: dict[str, Any] = {
     "quality_summary": "",
     "value_rating": None,
@@ -160,72 +244,53 @@ def build_filter_clauses(
         days = days_map.get(filters.added)
         if days is not None:
             where_clauses.append("p.first_seen >= ?")
-            cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
-            params.append(cutoff)
+            # Minute granularity keeps the params stable enough to hit the count cache
+            cutoff = datetime.now(UTC).replace(second=0, microsecond=0) - timedelta(days=days)
+            params.append(cutoff.isoformat())
     if filters.status:
         where_clauses.append("COALESCE(p.user_status, 'new') = ?")
         params.append(filters.status)
     if filters.property_type:
-        where_clauses.append(
-            "json_extract(q.analysis_json, '$.listing_extraction.property_type') = ?"
-        )
+        where_clauses.append("q.property_type = ?")
         params.append(filters.property_type)
     if filters.outdoor_space == "yes":
         where_clauses.append("q.has_outdoor_space = 1")
     elif filters.outdoor_space == "no":
         where_clauses.append("(q.has_outdoor_space = 0 OR q.has_outdoor_space IS NULL)")
     if filters.natural_light:
-        where_clauses.append("json_extract(q.analysis_json, '$.light_space.natural_light') = ?")
+        where_clauses.append("q.natural_light = ?")
         params.append(filters.natural_light)
     if filters.pets == "yes":
-        where_clauses.append(
-            "json_extract(q.analysis_json, '$.listing_extraction.pets_allowed') = 'yes'"
-        )
+        where_clauses.append("q.pets_allowed = 'yes'")
     if filters.value_rating:
-        where_clauses.append(
-            "(json_extract(q.analysis_json, '$.value.quality_adjusted_rating') = ?"
-            " OR json_extract(q.analysis_json, '$.value.rating') = ?)"
-        )
-        params.extend([filters.value_rating, filters.value_rating])
+        where_clauses.append("q.value_rating = ?")
+        params.append(filters.value_rating)
     if filters.hob_type:
-        where_clauses.append("json_extract(q.analysis_json, '$.kitchen.hob_type') = ?")
+        where_clauses.append("q.hob_type = ?")
         params.append(filters.hob_type)
     if filters.floor_level:
-        where_clauses.append("json_extract(q.analysis_json, '$.light_space.floor_level') = ?")
+        where_clauses.append("q.floor_level = ?")
         params.append(filters.floor_level)
     if filters.building_construction:
-        where_clauses.append(
-            "json_extract(q.analysis_json, '$.flooring_noise.building_construction') = ?"
-        )
+        where_clauses.append("q.building_construction = ?")
         params.append(filters.building_construction)
     if filters.office_separation:
-        where_clauses.append("json_extract(q.analysis_json, '$.bedroom.office_separation') = ?")
+        where_clauses.append("q.office_separation = ?")
         params.append(filters.office_separation)
     if filters.hosting_layout:
-        where_clauses.append("json_extract(q.analysis_json, '$.space.hosting_layout') = ?")
+        where_clauses.append("q.hosting_layout = ?")
         params.append(filters.hosting_layout)
     if filters.hosting_noise_risk:
-        where_clauses.append(
-            "json_extract(q.analysis_json, '$.flooring_noise.hosting_noise_risk') = ?"
-        )
+        where_clauses.append("q.hosting_noise_risk = ?")
         params.append(filters.hosting_noise_risk)
     if filters.broadband_type:
-        where_clauses.append(
-            "json_extract(q.analysis_json, '$.listing_extraction.broadband_type') = ?"
-        )
+        where_clauses.append("q.broadband_type = ?")
         params.append(filters.broadband_type)
     if filters.min_living_room_sqm is not None:
-        where_clauses.append(
-            "CAST(json_extract(q.analysis_json, '$.space.living_room_sqm') AS REAL) >= ?"
-        )
+        where_clauses.append("q.living_room_sqm >= ?")
         params.append(filters.min_living_room_sqm)
     if filters.min_floor_area_sqm is not None:
-        where_clauses.append(
-            "COALESCE("
-            "    p.floor_area_sqm,"
-            "    CAST(json_extract(q.analysis_json, '$.space.total_area_sqm') AS REAL)"
-            ") >= ?"
-        )
+        where_clauses.append("COALESCE(p.floor_area_sqm, q.total_area_sqm) >= ?")
         params.append(filters.min_floor_area_sqm)
     if filters.tags:
         for t in filters.tags:
@@ -250,28 +315,38 @@ def build_filter_clauses(
 class WebQueryService:
     """Read-only query service for the web dashboard."""
 
+    # Max distinct filter combinations kept in the count cache
+    _COUNT_CACHE_SIZE: Final = 256
+
     def __init__(
         self,
-        get_connection: Callable[[], Coroutine[Any, Any, aiosqlite.Connection]],
-        get_property_images: Callable[[str], Coroutine[Any, Any, list[PropertyImage]]],
+        read_connection: Callable[[], AbstractAsyncContextManager[aiosqlite.Connection]],
     ) -> None:
-        self._get_connection = get_connection
-        self._get_property_images = get_property_images
+        self._read_connection = read_connection
+        # Filter counts keyed by (where_sql, params), valid for one data_version
+        self._count_cache: dict[tuple[str, tuple[Any, ...]], int] = {}
+        self._count_cache_version: int | None = None
 
-    async def get_filter_count(
-        self,
-        filters: PropertyFilter,
+    async def _count_matching(
+        self, conn: aiosqlite.Connection, where_sql: str, params: list[Any]
     ) -> int:
-        """Get count of properties matching filters (no data fetch).
+        """COUNT(*) of properties matching a filter, cached until the next write.
 
-        Args:
-            filters: Validated filter parameters.
-
-        Returns:
-            Total count of matching properties.
+        The cache is dropped whenever ``data_version.version`` (bumped by
+        triggers on properties, quality_analyses and property_images) moves.
         """
-        conn = await self._get_connection()
-        where_sql, params = build_filter_clauses(filters)
+        cursor = await conn.execute("SELECT version FROM data_version WHERE id = 1")
+        row = await cursor.fetchone()
+        version = row[0] if row else None
+        if version != self._count_cache_version:
+            self._count_cache.clear()
+            self._count_cache_version = version
+
+        key = (where_sql, tuple(params))
+        cached = self._count_cache.get(key)
+        if cached is not None:
+            return cached
+
         cursor = await conn.execute(
             f"""
             SELECT COUNT(*) FROM properties p
@@ -281,63 +356,190 @@ class WebQueryService:
             params,
         )
         row = await cursor.fetchone()
-        return row[0] if row else 0
+        total: int = row[0] if row else 0
+
+        if len(self._count_cache) >= self._COUNT_CACHE_SIZE:
+            self._count_cache.clear()
+        self._count_cache[key] = total
+        return total
+
+    async def get_filter_count(
+        self,
+        filters: PropertyFilter,
+    ) -> int:
+        """Get count of properties matching filters (no data fetch).
+
+        Args:
+            filters: Validated filter parameters.
+
+        Returns:
+            Total count of matching properties.
+        """
+        async with self._read_connection() as conn:
+            where_sql, params = build_filter_clauses(filters)
+            return await self._count_matching(conn, where_sql, params)
 
     async def get_map_markers(
         self,
         filters: PropertyFilter,
+        *,
+        bounds: MapBounds | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Get lightweight map marker data for all matching properties with coordinates.
+        """Get lightweight map marker data for matching properties with coordinates.
 
         Same filters as get_properties_paginated but no pagination and only
         map-relevant columns. Returns only properties that have lat/lon.
 
         Args:
             filters: Validated filter parameters.
+            bounds: Optional viewport; only markers inside it are returned.
+            limit: Optional cap on the number of markers.
 
         Returns:
             List of dicts with map marker fields.
         """
-        conn = await self._get_connection()
         where_sql, params = build_filter_clauses(filters)
-        cursor = await conn.execute(
-            f"""
-            SELECT p.unique_id, p.latitude, p.longitude, p.price_pcm,
-                   p.bedrooms, p.title, p.postcode,
-                   p.commute_minutes, p.image_url,
-                   p.is_off_market,
-                   q.overall_rating as quality_rating,
-                   q.fit_score,
-                   json_extract(q.analysis_json, '$.value.quality_adjusted_rating') as value_rating,
-                   json_extract(q.analysis_json, '$.one_line') as one_line
-            FROM properties p
-            LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
-            WHERE {where_sql}
-              AND p.latitude IS NOT NULL AND p.longitude IS NOT NULL
-            """,
-            params,
-        )
-        rows = await cursor.fetchall()
-        return [
-            {
-                "id": row["unique_id"],
-                "lat": row["latitude"],
-                "lon": row["longitude"],
-                "price": row["price_pcm"],
-                "bedrooms": row["bedrooms"],
-                "rating": row["quality_rating"],
-                "fit_score": row["fit_score"],
-                "title": row["title"],
-                "url": f"/property/{row['unique_id']}",
-                "image_url": row["image_url"],
-                "postcode": row["postcode"],
-                "commute_minutes": row["commute_minutes"],
-                "value_rating": row["value_rating"],
-                "one_line": row["one_line"],
-                "is_off_market": bool(row["is_off_market"]),
-            }
-            for row in rows
-        ]
+        if bounds is not None:
+            where_sql = f"{where_sql} AND {_BOUNDS_SQL}"
+            params.extend(_bounds_params(bounds))
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT ?"
+            params.append(limit)
+
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT {_MARKER_COLUMNS}
+                FROM properties p
+                LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
+                WHERE {where_sql}
+                  AND p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+                {limit_sql}
+                """,
+                params,
+            )
+            rows = await cursor.fetchall()
+        return [_row_to_marker(row) for row in rows]
+
+    async def get_map_clusters(
+        self,
+        filters: PropertyFilter,
+        bounds: MapBounds,
+        cell_degrees: float,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Grid-cluster matching properties inside a viewport.
+
+        Properties are bucketed into square cells of ``cell_degrees`` in SQL,
+        so only one row per occupied cell leaves the database. Cells holding
+        a single property are returned as full markers instead.
+
+        Args:
+            filters: Validated filter parameters.
+            bounds: Viewport to cluster within.
+            cell_degrees: Cell edge length in degrees.
+
+        Returns:
+            Tuple of (clusters, markers). Each cluster has its centroid,
+            count, cheapest price and the bounds of its members.
+        """
+        where_sql, params = build_filter_clauses(filters)
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as n,
+                       AVG(p.latitude) as lat, AVG(p.longitude) as lon,
+                       MIN(p.latitude) as south, MIN(p.longitude) as west,
+                       MAX(p.latitude) as north, MAX(p.longitude) as east,
+                       MIN(p.price_pcm) as min_price,
+                       MIN(p.unique_id) as sample_id
+                FROM properties p
+                LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
+                WHERE {where_sql} AND {_BOUNDS_SQL}
+                  AND p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+                GROUP BY CAST((p.latitude + 90) / ? AS INTEGER),
+                         CAST((p.longitude + 180) / ? AS INTEGER)
+                """,
+                [*params, *_bounds_params(bounds), cell_degrees, cell_degrees],
+            )
+            cells = await cursor.fetchall()
+
+            clusters: list[dict[str, Any]] = []
+            single_ids: list[str] = []
+            for cell in cells:
+                if cell["n"] == 1:
+                    single_ids.append(cell["sample_id"])
+                    continue
+                clusters.append(
+                    {
+                        "lat": cell["lat"],
+                        "lon": cell["lon"],
+                        "count": cell["n"],
+                        "min_price": cell["min_price"],
+                        "bounds": [[cell["south"], cell["west"]], [cell["north"], cell["east"]]],
+                    }
+                )
+
+            markers: list[dict[str, Any]] = []
+            chunk_size = 500
+            for i in range(0, len(single_ids), chunk_size):
+                chunk = single_ids[i : i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"""
+                    SELECT {_MARKER_COLUMNS}
+                    FROM properties p
+                    LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
+                    WHERE p.unique_id IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                markers.extend(_row_to_marker(row) for row in await cursor.fetchall())
+
+        return clusters, markers
+
+    async def get_map_extent(self, filters: PropertyFilter) -> dict[str, Any] | None:
+        """Count and bounding box of matching properties with coordinates.
+
+        Lets the dashboard frame the map without shipping every marker; the
+        markers themselves are fetched per viewport.
+
+        Returns:
+            Dict with ``count`` and ``bounds`` ([[south, west], [north, east]]),
+            or None if no matching property has coordinates.
+        """
+        where_sql, params = build_filter_clauses(filters)
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as n,
+                       MIN(p.latitude) as south, MIN(p.longitude) as west,
+                       MAX(p.latitude) as north, MAX(p.longitude) as east
+                FROM properties p
+                LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
+                WHERE {where_sql}
+                  AND p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+                """,
+                params,
+            )
+            row = await cursor.fetchone()
+        if not row or not row["n"]:
+            return None
+        return {
+            "count": row["n"],
+            "bounds": [[row["south"], row["west"]], [row["north"], row["east"]]],
+        }
+
+    async def get_thumbnail_source(self, unique_id: str) -> str | None:
+        """Card thumbnail URL for a property (first gallery image, else scraper image)."""
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT COALESCE(first_gallery_url, image_url) FROM properties WHERE unique_id = ?",
+                (unique_id,),
+            )
+            row = await cursor.fetchone()
+        return row[0] if row else None
 
     async def get_properties_paginated(
         self,
@@ -346,51 +548,66 @@ class WebQueryService:
         sort: str = "newest",
         page: int = 1,
         per_page: int = 24,
+        after: str | None = None,
+        before: str | None = None,
     ) -> tuple[list[PropertyListItem], int]:
         """Get paginated properties with optional filters.
 
+        Pages are fetched by keyset when a cursor from ``encode_page_cursor``
+        is given: *after* returns the page following that item, *before* the
+        page preceding it. Without a (valid) cursor, falls back to *page*
+        with LIMIT/OFFSET.
+
         Args:
             filters: Validated filter parameters.
             sort: Sort order key.
-            page: Page number (1-indexed).
+            page: Page number (1-indexed), used when no cursor is given.
             per_page: Items per page.
+            after: Cursor of the last item on the previous page.
+            before: Cursor of the first item on the next page.
 
         Returns:
             Tuple of (property dicts, total count).
         """
-        conn = await self._get_connection()
-
-        where_sql, params = build_filter_clauses(filters)
-
-        order_map = {
-            "newest": "p.first_seen DESC",
-            "price_asc": "p.price_pcm ASC",
-            "price_desc": "p.price_pcm DESC",
-            "fit_desc": "COALESCE(q.fit_score, -1) DESC, p.first_seen DESC",
-            "longest_listed": "p.first_seen ASC",
-        }
-        order_sql = order_map.get(sort, "p.first_seen DESC")
-
-        # Count total
-        count_cursor = await conn.execute(
-            f"""
-            SELECT COUNT(*) FROM properties p
-            LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
-            WHERE {where_sql}
-            """,
-            params,
-        )
-        count_row = await count_cursor.fetchone()
-        total = count_row[0] if count_row else 0
-
-        offset = (page - 1) * per_page
-        cursor = await conn.execute(
-            f"SELECT {_CARD_COLUMNS} {_CARD_JOINS}"
-            f" WHERE {where_sql} ORDER BY {order_sql} LIMIT ? OFFSET ?",
-            [*params, per_page, offset],
-        )
-        rows = await cursor.fetchall()
-
+        async with self._read_connection() as conn:
+            where_sql, params = build_filter_clauses(filters)
+            total = await self._count_matching(conn, where_sql, params)
+
+            direction, keys = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])
+            exprs = [expr for expr, _ in keys]
+
+            cursor_values: list[Any] | None = None
+            backwards = False
+            if after:
+                cursor_values = _decode_page_cursor(after, sort)
+            elif before:
+                cursor_values = _decode_page_cursor(before, sort)
+                backwards = cursor_values is not None
+
+            if backwards:
+                direction = "ASC" if direction == "DESC" else "DESC"
+            order_sql = ", ".join(f"{expr} {direction}" for expr in exprs)
+
+            if cursor_values is not None:
+                op = "<" if direction == "DESC" else ">"
+                placeholders = ", ".join("?" * len(exprs))
+                cursor = await conn.execute(
+                    f"SELECT {_CARD_COLUMNS} {_CARD_JOINS}"
+                    f" WHERE {where_sql} AND ({', '.join(exprs)}) {op} ({placeholders})"
+                    f" ORDER BY {order_sql} LIMIT ?",
+                    [*params, *cursor_values, per_page],
+                )
+            else:
+                offset = (page - 1) * per_page
+                cursor = await conn.execute(
+                    f"SELECT {_CARD_COLUMNS} {_CARD_JOINS}"
+                    f" WHERE {where_sql} ORDER BY {order_sql} LIMIT ? OFFSET ?",
+                    [*params, per_page, offset],
+                )
+            rows = list(await cursor.fetchall())
+
+        if backwards:
+            rows.reverse()
         return [_row_to_card_dict(row) for row in rows], total
 
     async def get_property_card(self, unique_id: str) -> PropertyListItem | None:
@@ -399,13 +616,13 @@ class WebQueryService:
         Used by the card endpoint to render a single property card partial
         when the card isn't on the current paginated page.
         """
-        conn = await self._get_connection()
-        cursor = await conn.execute(
-            f"SELECT {_CARD_COLUMNS} {_CARD_JOINS} WHERE p.unique_id = ? LIMIT 1",
-            [unique_id],
-        )
-        row = await cursor.fetchone()
-        return _row_to_card_dict(row) if row else None
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                f"SELECT {_CARD_COLUMNS} {_CARD_JOINS} WHERE p.unique_id = ? LIMIT 1",
+                [unique_id],
+            )
+            row = await cursor.fetchone()
+            return _row_to_card_dict(row) if row else None
 
     async def get_property_detail(self, unique_id: str) -> PropertyDetailItem | None:
         """Get full property detail including quality analysis and images.
@@ -416,38 +633,37 @@ class WebQueryService:
         Returns:
             Dict with property data, quality analysis, and images, or None.
         """
-        conn = await self._get_connection()
-
-        cursor = await conn.execute(
-            """
-            SELECT p.*, q.analysis_json, q.overall_rating as quality_rating
-            FROM properties p
-            LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
-            WHERE p.unique_id = ?
-            """,
-            (unique_id,),
-        )
-        row = await cursor.fetchone()
-        if row is None:
-            return None
+        async with self._read_connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT p.*, q.analysis_json, q.overall_rating as quality_rating
+                FROM properties p
+                LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id
+                WHERE p.unique_id = ?
+                """,
+                (unique_id,),
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                return None
 
-        prop_dict = dict(row)
-        parse_json_fields(prop_dict)
+            prop_dict = dict(row)
+            parse_json_fields(prop_dict)
 
-        # Parse quality analysis
-        if prop_dict.get("analysis_json"):
-            prop_dict["quality_analysis"] = PropertyQualityAnalysis.model_validate_json(
-                prop_dict["analysis_json"]
-            )
-        else:
-            prop_dict["quality_analysis"] = None
+            # Parse quality analysis
+            if prop_dict.get("analysis_json"):
+                prop_dict["quality_analysis"] = PropertyQualityAnalysis.model_validate_json(
+                    prop_dict["analysis_json"]
+                )
+            else:
+                prop_dict["quality_analysis"] = None
 
-        # Get images
-        images = await self._get_property_images(unique_id)
-        prop_dict["gallery_images"] = [img for img in images if img.image_type == "gallery"]
-        prop_dict["floorplan_images"] = [img for img in images if img.image_type == "floorplan"]
+            # Get images
+            images = (await load_images_by_property(conn, [unique_id])).get(unique_id, [])
+            prop_dict["gallery_images"] = [img for img in images if img.image_type == "gallery"]
+            prop_dict["floorplan_images"] = [img for img in images if img.image_type == "floorplan"]
 
-        return cast(PropertyDetailItem, prop_dict)
+            return cast(PropertyDetailItem, prop_dict)
 
     async def get_property_count(self) -> int:
         """Get total number of tracked properties.
@@ -455,7 +671,7 @@ class WebQueryService:
         Returns:
             Count of properties in database.
         """
-        conn = await self._get_connection()
-        cursor = await conn.execute("SELECT COUNT(*) FROM properties")
-        row = await cursor.fetchone()
-        return row[0] if row else 0
+        async with self._read_connection() as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM properties")
+            row = await cursor.fetchone()
+            return row[0] if row else 0
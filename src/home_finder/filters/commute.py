@@ -2,20 +2,110 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, ClassVar, assert_never
+from typing import TYPE_CHECKING, ClassVar, Final, Protocol, assert_never
 
 from pydantic import BaseModel, ConfigDict
 
+from home_finder.filters.isochrone import (
+    MAX_SEARCHES_PER_REQUEST,
+    IsochroneIndex,
+    IsochroneStore,
+    Ring,
+    band_limits,
+)
 from home_finder.logging import get_logger
 from home_finder.models import MergedProperty, Property, TransportMode
 from home_finder.utils.address import is_outcode
 
 if TYPE_CHECKING:
     from traveltimepy import AsyncClient
+    from traveltimepy.requests.transportation import Cycling, Driving, PublicTransport, Walking
+    from traveltimepy.responses.time_filter import TimeFilterResponse
 
 logger = get_logger(__name__)
 
+# How long persisted lookups stay valid. Postcodes barely move; journey
+# times drift with timetables and roadworks, so they expire sooner.
+GEOCODE_CACHE_TTL_DAYS: Final = 180
+COMMUTE_CACHE_TTL_DAYS: Final = 30
+
+# TravelTime time-filter limit on departure locations per search. A request
+# may hold up to 10 searches, comfortably more than there are transport modes.
+MAX_LOCATIONS_PER_SEARCH: Final = 2000
+
+
+class CommuteCache(Protocol):
+    """Persistent geocoding/commute-time cache. Implemented by ``PropertyStorage``."""
+
+    async def get_cached_geocodes(
+        self, postcodes: list[str], *, max_age_days: int
+    ) -> dict[str, tuple[float, float]]: ...
+
+    async def save_geocodes(self, geocodes: dict[str, tuple[float, float]]) -> None: ...
+
+    async def get_cached_commutes(
+        self,
+        coords: list[tuple[int, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+        max_age_days: int,
+    ) -> dict[tuple[int, int], tuple[int | None, int]]: ...
+
+    async def save_commutes(
+        self,
+        commutes: dict[tuple[int, int], tuple[int | None, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+    ) -> None: ...
+
+
+@dataclass
+class CommuteCacheStats:
+    """Cache hit/miss and offline-classification counters; keys match pipeline_runs columns."""
+
+    geocode_cache_hits: int = 0
+    geocode_cache_misses: int = 0
+    commute_cache_hits: int = 0
+    commute_cache_misses: int = 0
+    commute_isochrone_hits: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _normalize_postcode(postcode: str) -> str:
+    return " ".join(postcode.upper().split())
+
+
+def _coord_key(lat: float, lon: float) -> tuple[int, int]:
+    """Round coordinates to 4 dp (~11 m), as integers for exact matching."""
+    return round(lat * 10_000), round(lon * 10_000)
+
+
+def _transportation(mode: TransportMode) -> PublicTransport | Cycling | Driving | Walking:
+    from traveltimepy.requests.transportation import (
+        Cycling,
+        Driving,
+        PublicTransport,
+        Walking,
+    )
+
+    if mode == TransportMode.PUBLIC_TRANSPORT:
+        return PublicTransport()
+    if mode == TransportMode.CYCLING:
+        return Cycling()
+    if mode == TransportMode.DRIVING:
+        return Driving()
+    if mode == TransportMode.WALKING:
+        return Walking()
+    assert_never(mode)
+
 
 class CommuteResult(BaseModel):
     """Result of a commute time calculation."""
@@ -29,6 +119,22 @@ class CommuteResult(BaseModel):
     within_limit: bool
 
 
+def best_commutes(results: Iterable[CommuteResult]) -> dict[str, tuple[int, TransportMode]]:
+    """Pick the fastest within-limit mode per property.
+
+    Returns:
+        Mapping of property_id -> (minutes, transport_mode), reachable properties only.
+    """
+    best: dict[str, tuple[int, TransportMode]] = {}
+    for result in results:
+        if result.within_limit and (
+            result.property_id not in best
+            or result.travel_time_minutes < best[result.property_id][0]
+        ):
+            best[result.property_id] = (result.travel_time_minutes, result.transport_mode)
+    return best
+
+
 class CommuteFilter:
     """Filter properties by commute time using TravelTime API."""
 
@@ -41,6 +147,8 @@ class CommuteFilter:
         app_id: str,
         api_key: str,
         destination_postcode: str,
+        cache: CommuteCache | None = None,
+        isochrones: IsochroneStore | None = None,
     ) -> None:
         """Initialize the commute filter.
 
@@ -48,10 +156,17 @@ class CommuteFilter:
             app_id: TravelTime API application ID.
             api_key: TravelTime API key.
             destination_postcode: Destination postcode for commute calculations.
+            cache: Persistent geocode/commute cache; only misses hit the API.
+            isochrones: Isochrone store. When given, uncached properties are
+                classified offline against stored isochrones and only those
+                near the commute limit's boundary are sent to the API.
         """
         self.app_id = app_id
         self.api_key = api_key
         self.destination_postcode = destination_postcode
+        self.cache = cache
+        self.isochrones = isochrones
+        self.cache_stats = CommuteCacheStats()
 
     async def filter_properties(
         self,
@@ -70,10 +185,40 @@ class CommuteFilter:
         Returns:
             List of CommuteResult objects for reachable properties.
         """
+        return await self.filter_properties_by_modes(
+            properties, max_minutes=max_minutes, transport_modes=[transport_mode]
+        )
+
+    async def filter_properties_by_modes(
+        self,
+        properties: list[Property],
+        *,
+        max_minutes: int,
+        transport_modes: Sequence[TransportMode],
+    ) -> list[CommuteResult]:
+        """Filter properties by commute time for several transport modes at once.
+
+        Each time-filter request carries one arrival search per mode over a
+        shared location list, so adding a mode doesn't add a round trip.
+        Locations are split into chunks of ``MAX_LOCATIONS_PER_SEARCH``, and
+        the chunks are sent concurrently. With an isochrone store, properties
+        decided offline report the smallest isochrone band containing them
+        rather than an exact journey time.
+
+        Args:
+            properties: List of properties to filter.
+            max_minutes: Maximum commute time in minutes.
+            transport_modes: Modes of transport for commute calculation.
+
+        Returns:
+            CommuteResult objects for reachable properties, one per property
+            and mode. Use ``best_commutes`` to pick the fastest mode.
+        """
+        modes = list(dict.fromkeys(transport_modes))
         # Filter to only properties with coordinates
         props_with_coords = [p for p in properties if p.latitude and p.longitude]
 
-        if not props_with_coords:
+        if not props_with_coords or not modes:
             logger.info("no_properties_with_coordinates")
             return []
 
@@ -82,9 +227,74 @@ class CommuteFilter:
             total_properties=len(properties),
             with_coordinates=len(props_with_coords),
             max_minutes=max_minutes,
-            transport_mode=transport_mode.value,
+            transport_modes=[m.value for m in modes],
         )
 
+        results: list[CommuteResult] = []
+
+        # One lookup per rounded coordinate; co-located listings share it
+        props_by_key: dict[tuple[int, int], list[Property]] = {}
+        for prop in props_with_coords:
+            assert prop.latitude is not None and prop.longitude is not None
+            props_by_key.setdefault(_coord_key(prop.latitude, prop.longitude), []).append(prop)
+
+        destination = _normalize_postcode(self.destination_postcode)
+        misses_by_mode: dict[TransportMode, set[tuple[int, int]]] = {}
+        # Property ids with a definite answer per mode (cached or fetched)
+        resolved: dict[TransportMode, set[str]] = {mode: set() for mode in modes}
+        for mode in modes:
+            cached: dict[tuple[int, int], tuple[int | None, int]] = {}
+            if self.cache is not None:
+                try:
+                    cached = await self.cache.get_cached_commutes(
+                        list(props_by_key),
+                        transport_mode=mode.value,
+                        destination=destination,
+                        max_age_days=COMMUTE_CACHE_TTL_DAYS,
+                    )
+                except Exception:
+                    logger.warning("commute_cache_lookup_failed", exc_info=True)
+
+            for key, key_props in props_by_key.items():
+                hit = cached.get(key)
+                # An "unreachable" entry only answers limits up to the one it was made with
+                if hit is None or (hit[0] is None and hit[1] < max_minutes):
+                    misses_by_mode.setdefault(mode, set()).add(key)
+                    self.cache_stats.commute_cache_misses += len(key_props)
+                    continue
+                self.cache_stats.commute_cache_hits += len(key_props)
+                resolved[mode].update(p.unique_id for p in key_props)
+                minutes = hit[0]
+                if minutes is not None:
+                    results.extend(
+                        self._result(p.unique_id, minutes, mode, max_minutes) for p in key_props
+                    )
+
+        if self.isochrones is not None and misses_by_mode:
+            offline = await self._classify_offline(
+                props_by_key, misses_by_mode, max_minutes, destination
+            )
+            for mode, estimates in offline.items():
+                for key, minutes in estimates.items():
+                    key_props = props_by_key[key]
+                    misses_by_mode[mode].discard(key)
+                    resolved[mode].update(p.unique_id for p in key_props)
+                    self.cache_stats.commute_isochrone_hits += len(key_props)
+                    if minutes is not None:
+                        results.extend(
+                            self._result(p.unique_id, minutes, mode, max_minutes) for p in key_props
+                        )
+            misses_by_mode = {mode: keys for mode, keys in misses_by_mode.items() if keys}
+
+        if not misses_by_mode:
+            logger.info(
+                "commute_filter_complete",
+                total_results=len(results),
+                within_limit=sum(1 for r in results if r.within_limit),
+                cache_hits=self.cache_stats.commute_cache_hits,
+            )
+            return results
+
         # Import required types
         from traveltimepy import AsyncClient
         from traveltimepy.requests.common import (
@@ -95,37 +305,26 @@ class CommuteFilter:
             Property as TravelTimeProperty,
         )
         from traveltimepy.requests.time_filter import TimeFilterArrivalSearch
-        from traveltimepy.requests.transportation import (
-            Cycling,
-            Driving,
-            PublicTransport,
-            Walking,
-        )
 
-        # Create departure locations (all the properties we're commuting FROM)
-        departure_locations = []
-        for prop in props_with_coords:
+        # Create departure locations (the properties we're commuting FROM),
+        # one per uncached coordinate, identified by its first property
+        miss_keys = [key for key in props_by_key if any(key in m for m in misses_by_mode.values())]
+        location_by_key: dict[tuple[int, int], Location] = {}
+        key_by_location_id: dict[str, tuple[int, int]] = {}
+        for key in miss_keys:
+            prop = props_by_key[key][0]
             # Already filtered above, but assert for type checker
             assert prop.latitude is not None and prop.longitude is not None
-            departure_locations.append(
-                Location(
-                    id=prop.unique_id,
-                    coords=Coordinates(lat=prop.latitude, lng=prop.longitude),
-                )
+            location_by_key[key] = Location(
+                id=prop.unique_id,
+                coords=Coordinates(lat=prop.latitude, lng=prop.longitude),
             )
+            key_by_location_id[prop.unique_id] = key
 
-        # Configure transportation
-        transportation: PublicTransport | Cycling | Driving | Walking
-        if transport_mode == TransportMode.PUBLIC_TRANSPORT:
-            transportation = PublicTransport()
-        elif transport_mode == TransportMode.CYCLING:
-            transportation = Cycling()
-        elif transport_mode == TransportMode.DRIVING:
-            transportation = Driving()
-        elif transport_mode == TransportMode.WALKING:
-            transportation = Walking()
-        else:
-            assert_never(transport_mode)
+        chunks = [
+            miss_keys[i : i + MAX_LOCATIONS_PER_SEARCH]
+            for i in range(0, len(miss_keys), MAX_LOCATIONS_PER_SEARCH)
+        ]
 
         try:
             # Create fresh client for this operation - don't cache because
@@ -140,88 +339,285 @@ class CommuteFilter:
                 # Geocode destination within the same context manager
                 dest_coords = await self._geocode_with_client(client, self.destination_postcode)
                 if not dest_coords:
-                    logger.error(
-                        "failed_to_geocode_destination",
-                        postcode=self.destination_postcode,
-                    )
-                    return []
+                    # Handled like an API failure below: cached and isochrone
+                    # results stand, only the misses pass through unfiltered.
+                    raise LookupError(f"failed to geocode destination {self.destination_postcode}")
 
                 # Create arrival location (the destination we're commuting TO)
                 arrival_location = Location(
                     id="destination",
                     coords=Coordinates(lat=dest_coords[0], lng=dest_coords[1]),
                 )
+                arrival_time = datetime.now(UTC)
+
+                async def _request(
+                    chunk: list[tuple[int, int]],
+                ) -> tuple[list[TransportMode], TimeFilterResponse]:
+                    # Many-to-one searches (properties -> destination), one per mode
+                    searches: list[TransportMode] = []
+                    arrival_searches = []
+                    for mode in modes:
+                        ids = [
+                            location_by_key[k].id
+                            for k in chunk
+                            if k in misses_by_mode.get(mode, ())
+                        ]
+                        if not ids:
+                            continue
+                        searches.append(mode)
+                        arrival_searches.append(
+                            TimeFilterArrivalSearch(
+                                id=mode.value,
+                                arrival_location_id="destination",
+                                departure_location_ids=ids,
+                                arrival_time=arrival_time,
+                                travel_time=max_minutes * 60,  # Convert to seconds
+                                transportation=_transportation(mode),
+                                properties=[TravelTimeProperty.TRAVEL_TIME],
+                            )
+                        )
+                    response = await client.time_filter(
+                        locations=[arrival_location, *(location_by_key[k] for k in chunk)],
+                        departure_searches=[],
+                        arrival_searches=arrival_searches,
+                    )
+                    return searches, response
 
-                # Create search request (many-to-one: from properties to destination)
-                arrival_search = TimeFilterArrivalSearch(
-                    id="property-search",
-                    arrival_location_id="destination",
-                    departure_location_ids=[loc.id for loc in departure_locations],
-                    arrival_time=datetime.now(UTC),
-                    travel_time=max_minutes * 60,  # Convert to seconds
-                    transportation=transportation,
-                    properties=[TravelTimeProperty.TRAVEL_TIME],
-                )
-
-                response = await client.time_filter(
-                    locations=[arrival_location, *departure_locations],
-                    departure_searches=[],
-                    arrival_searches=[arrival_search],
+                responses = await asyncio.gather(
+                    *(_request(chunk) for chunk in chunks), return_exceptions=True
                 )
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate limit" in error_str or "429" in error_str:
-                logger.warning("rate_limit_hit", error=str(e), exc_info=True)
-            else:
-                logger.error("traveltime_api_error", error=str(e), exc_info=True)
-            # Graceful degradation: skip commute filtering rather than dropping all properties
+            responses = [e] * len(chunks)
+
+        fetched: dict[TransportMode, dict[tuple[int, int], tuple[int | None, int]]] = {}
+        failed_modes: set[TransportMode] = set()
+        for chunk, outcome in zip(chunks, responses, strict=True):
+            chunk_modes = [m for m in modes if any(k in misses_by_mode.get(m, ()) for k in chunk)]
+            if isinstance(outcome, BaseException):
+                self._log_api_error(outcome)
+                failed_modes.update(chunk_modes)
+                continue
+
+            searches, response = outcome
+            # Locations missing from the response were unreachable within
+            # max_minutes; cache that too so they aren't re-queried.
+            for mode in searches:
+                sent = [k for k in chunk if k in misses_by_mode[mode]]
+                fetched.setdefault(mode, {}).update(dict.fromkeys(sent, (None, max_minutes)))
+                resolved[mode].update(p.unique_id for k in sent for p in props_by_key[k])
+
+            modes_by_search_id = {m.value: m for m in searches}
+            for search_result in response.results:
+                mode_for_result = modes_by_search_id.get(search_result.search_id)
+                if mode_for_result is None:
+                    if len(searches) != 1:
+                        logger.warning("unknown_search_id", search_id=search_result.search_id)
+                        continue
+                    mode_for_result = searches[0]
+                for location in search_result.locations:
+                    travel_time_seconds = location.properties[0].travel_time
+                    travel_time_minutes = travel_time_seconds // 60
+
+                    location_key = key_by_location_id.get(location.id)
+                    if location_key is None:
+                        continue
+                    fetched[mode_for_result][location_key] = (travel_time_minutes, max_minutes)
+                    results.extend(
+                        self._result(p.unique_id, travel_time_minutes, mode_for_result, max_minutes)
+                        for p in props_by_key[location_key]
+                    )
+
+        if self.cache is not None:
+            for mode, mode_fetched in fetched.items():
+                try:
+                    await self.cache.save_commutes(
+                        mode_fetched, transport_mode=mode.value, destination=destination
+                    )
+                except Exception:
+                    logger.warning("commute_cache_save_failed", exc_info=True)
+
+        if failed_modes:
+            # Graceful degradation: skip commute filtering rather than dropping all
+            # properties. Cached and fetched results are still real.
             logger.warning(
                 "commute_filter_skipped",
                 reason="api_failure",
                 property_count=len(properties),
+                transport_modes=[m.value for m in failed_modes],
             )
-            return [
-                CommuteResult(
-                    property_id=p.unique_id,
-                    destination_postcode=self.destination_postcode,
-                    travel_time_minutes=0,
-                    transport_mode=transport_mode,
-                    within_limit=True,
-                )
-                for p in properties
-            ]
-
-        # Process results
-        results: list[CommuteResult] = []
-
-        for search_result in response.results:
-            for location in search_result.locations:
-                travel_time_seconds = location.properties[0].travel_time
-                travel_time_minutes = travel_time_seconds // 60
-
-                results.append(
-                    CommuteResult(
-                        property_id=location.id,
-                        destination_postcode=self.destination_postcode,
-                        travel_time_minutes=travel_time_minutes,
-                        transport_mode=transport_mode,
-                        within_limit=travel_time_minutes <= max_minutes,
+            for mode in modes:
+                if mode in failed_modes:
+                    results.extend(
+                        CommuteResult(
+                            property_id=p.unique_id,
+                            destination_postcode=self.destination_postcode,
+                            travel_time_minutes=0,
+                            transport_mode=mode,
+                            within_limit=True,
+                        )
+                        for p in properties
+                        if p.unique_id not in resolved[mode]
                     )
-                )
 
         logger.info(
             "commute_filter_complete",
             total_results=len(results),
             within_limit=sum(1 for r in results if r.within_limit),
+            cache_hits=self.cache_stats.commute_cache_hits,
+            api_locations=len(miss_keys),
+            api_requests=len(chunks),
         )
 
         return results
 
+    async def _classify_offline(
+        self,
+        props_by_key: dict[tuple[int, int], list[Property]],
+        misses_by_mode: dict[TransportMode, set[tuple[int, int]]],
+        max_minutes: int,
+        destination: str,
+    ) -> dict[TransportMode, dict[tuple[int, int], int | None]]:
+        """Classify uncached coordinates against stored isochrone bands.
+
+        Fetches and stores the bands for modes that have none yet. A decided
+        coordinate maps to the smallest band containing it (an upper bound on
+        the commute) or to None when it is outside the commute limit;
+        coordinates near the limit's boundary are left out for the API.
+        """
+        assert self.isochrones is not None
+        limits = band_limits(max_minutes)
+        bands_by_mode: dict[TransportMode, dict[int, list[Ring]]] = {}
+        for mode in misses_by_mode:
+            try:
+                bands_by_mode[mode] = await self.isochrones.get_isochrones(
+                    transport_mode=mode.value,
+                    destination=destination,
+                    limits=limits,
+                    max_age_days=COMMUTE_CACHE_TTL_DAYS,
+                )
+            except Exception:
+                logger.warning("isochrone_lookup_failed", exc_info=True)
+                bands_by_mode[mode] = {}
+
+        missing = [mode for mode, bands in bands_by_mode.items() if len(bands) < len(limits)]
+        if missing:
+            fetched = await self._fetch_isochrones(missing, limits)
+            for mode, bands in fetched.items():
+                bands_by_mode[mode] = bands
+                try:
+                    await self.isochrones.save_isochrones(
+                        bands, transport_mode=mode.value, destination=destination
+                    )
+                except Exception:
+                    logger.warning("isochrone_save_failed", exc_info=True)
+
+        decided: dict[TransportMode, dict[tuple[int, int], int | None]] = {}
+        for mode, bands in bands_by_mode.items():
+            if len(bands) < len(limits):
+                continue
+            indexes = [(limit, IsochroneIndex(bands[limit])) for limit in limits]
+            outer = indexes[-1][1]
+            estimates = decided[mode] = {}
+            for key in misses_by_mode[mode]:
+                prop = props_by_key[key][0]
+                assert prop.latitude is not None and prop.longitude is not None
+                lat, lng = prop.latitude, prop.longitude
+                within = outer.classify(lat, lng)
+                if within is None:
+                    continue
+                estimates[key] = (
+                    next(limit for limit, index in indexes if index.classify(lat, lng))
+                    if within
+                    else None
+                )
+        return decided
+
+    async def _fetch_isochrones(
+        self, modes: list[TransportMode], limits: list[int]
+    ) -> dict[TransportMode, dict[int, list[Ring]]]:
+        """Fetch isochrone bands for each mode from the time-map API."""
+        from traveltimepy import AsyncClient
+        from traveltimepy.requests.common import Coordinates
+        from traveltimepy.requests.time_map import TimeMapArrivalSearch
+
+        search_keys = [(mode, limit) for mode in modes for limit in limits]
+        fetched: dict[TransportMode, dict[int, list[Ring]]] = {}
+        try:
+            async with AsyncClient(
+                app_id=self.app_id,
+                api_key=self.api_key,
+                max_rpm=50,
+                retry_attempts=3,
+                timeout=60,
+            ) as client:
+                dest_coords = await self._geocode_with_client(client, self.destination_postcode)
+                if not dest_coords:
+                    logger.error(
+                        "failed_to_geocode_destination", postcode=self.destination_postcode
+                    )
+                    return {}
+                arrival_time = datetime.now(UTC)
+                searches = [
+                    TimeMapArrivalSearch(
+                        id=f"{mode.value}:{limit}",
+                        coords=Coordinates(lat=dest_coords[0], lng=dest_coords[1]),
+                        arrival_time=arrival_time,
+                        travel_time=limit * 60,
+                        transportation=_transportation(mode),
+                    )
+                    for mode, limit in search_keys
+                ]
+                responses = await asyncio.gather(
+                    *(
+                        client.time_map(
+                            arrival_searches=searches[i : i + MAX_SEARCHES_PER_REQUEST],
+                            departure_searches=[],
+                        )
+                        for i in range(0, len(searches), MAX_SEARCHES_PER_REQUEST)
+                    )
+                )
+        except Exception as e:
+            logger.warning("isochrone_fetch_failed", error=str(e), exc_info=True)
+            return {}
+
+        modes_by_value = {mode.value: mode for mode in modes}
+        for response in responses:
+            for result in response.results:
+                mode_value, _, limit = result.search_id.partition(":")
+                rings: list[Ring] = []
+                for shape in result.shapes:
+                    rings.append([(c.lat, c.lng) for c in shape.shell])
+                    rings.extend([(c.lat, c.lng) for c in hole] for hole in shape.holes)
+                fetched.setdefault(modes_by_value[mode_value], {})[int(limit)] = rings
+
+        logger.info("isochrones_fetched", modes=[m.value for m in fetched], limits=limits)
+        return fetched
+
+    @staticmethod
+    def _log_api_error(e: BaseException) -> None:
+        error_str = str(e).lower()
+        if "rate limit" in error_str or "429" in error_str:
+            logger.warning("rate_limit_hit", error=str(e), exc_info=e)
+        else:
+            logger.error("traveltime_api_error", error=str(e), exc_info=e)
+
+    def _result(
+        self, property_id: str, minutes: int, transport_mode: TransportMode, max_minutes: int
+    ) -> CommuteResult:
+        return CommuteResult(
+            property_id=property_id,
+            destination_postcode=self.destination_postcode,
+            travel_time_minutes=minutes,
+            transport_mode=transport_mode,
+            within_limit=minutes <= max_minutes,
+        )
+
     async def geocode_properties(self, properties: list[MergedProperty]) -> list[MergedProperty]:
         """Geocode merged properties that have a postcode but no coordinates.
 
         Properties that already have coordinates are returned unchanged.
-        Uses the class-level geocoding cache to avoid redundant API calls.
+        Postcodes are resolved from the class-level cache and the persistent
+        cache first; only the rest are sent to the geocoding API.
 
         Args:
             properties: Merged properties, some possibly missing coordinates.
@@ -259,24 +655,27 @@ class CommuteFilter:
         logger.info("geocoding_properties", count=len(needs_geocoding))
 
         geocoded_count = 0
-        try:
-            async with AsyncClient(
-                app_id=self.app_id,
-                api_key=self.api_key,
-                max_rpm=50,
-                retry_attempts=3,
-                timeout=60,
-            ) as client:
-                # Build a lookup of postcode -> coords (batch unique postcodes)
-                postcodes = {m.canonical.postcode for m in needs_geocoding if m.canonical.postcode}
-                coords_lookup: dict[str, tuple[float, float]] = {}
-                for postcode in postcodes:
-                    coords = await self._geocode_with_client(client, postcode)
-                    if coords:
-                        coords_lookup[postcode] = coords
-        except Exception as e:
-            logger.warning("geocoding_batch_failed", error=str(e), exc_info=True)
-            return properties
+        # Build a lookup of postcode -> coords (batch unique postcodes)
+        postcodes = {m.canonical.postcode for m in needs_geocoding if m.canonical.postcode}
+        coords_lookup = await self._cached_geocodes(postcodes)
+        uncached = postcodes - coords_lookup.keys()
+        if uncached:
+            try:
+                async with AsyncClient(
+                    app_id=self.app_id,
+                    api_key=self.api_key,
+                    max_rpm=50,
+                    retry_attempts=3,
+                    timeout=60,
+                ) as client:
+                    for postcode in uncached:
+                        coords = await self._geocode_with_client(client, postcode)
+                        if coords:
+                            coords_lookup[postcode] = coords
+            except Exception as e:
+                logger.warning("geocoding_batch_failed", error=str(e), exc_info=True)
+                if not coords_lookup:
+                    return properties
 
         # Build updated list, replacing properties that got coordinates
         result: list[MergedProperty] = []
@@ -312,10 +711,12 @@ class CommuteFilter:
             Tuple of (latitude, longitude) or None if geocoding fails.
         """
         # Check cache first
-        if postcode in self._geocoding_cache:
+        cached = await self._cached_geocodes({postcode})
+        if postcode in cached:
             logger.debug("geocoding_cache_hit", postcode=postcode)
-            return self._geocoding_cache[postcode]
+            return cached[postcode]
 
+        self.cache_stats.geocode_cache_misses += 1
         try:
             response = await client.geocoding(query=postcode, limit=1)
             if response.features:
@@ -323,8 +724,35 @@ class CommuteFilter:
                 # GeoJSON uses [longitude, latitude] order
                 result = (coords[1], coords[0])
                 self._geocoding_cache[postcode] = result
+                if self.cache is not None:
+                    try:
+                        await self.cache.save_geocodes({_normalize_postcode(postcode): result})
+                    except Exception:
+                        logger.warning("geocode_cache_save_failed", exc_info=True)
                 return result
         except Exception as e:
             logger.warning("geocoding_failed", postcode=postcode, error=str(e), exc_info=True)
 
         return None
+
+    async def _cached_geocodes(self, postcodes: set[str]) -> dict[str, tuple[float, float]]:
+        """Resolve postcodes from the in-process cache, then the persistent one.
+
+        Counts hits; misses are counted when the API is actually asked.
+        """
+        found = {pc: self._geocoding_cache[pc] for pc in postcodes if pc in self._geocoding_cache}
+        remaining = {_normalize_postcode(pc): pc for pc in postcodes if pc not in found}
+        if remaining and self.cache is not None:
+            try:
+                stored = await self.cache.get_cached_geocodes(
+                    list(remaining), max_age_days=GEOCODE_CACHE_TTL_DAYS
+                )
+            except Exception:
+                logger.warning("geocode_cache_lookup_failed", exc_info=True)
+                stored = {}
+            for normalized, coords in stored.items():
+                postcode = remaining[normalized]
+                self._geocoding_cache[postcode] = coords
+                found[postcode] = coords
+        self.cache_stats.geocode_cache_hits += len(found)
+        return found
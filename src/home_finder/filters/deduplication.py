@@ -3,7 +3,7 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from home_finder.filters.scoring import MatchScore, calculate_match_score, is_full_postcode
 from home_finder.logging import get_logger
@@ -11,12 +11,18 @@ from home_finder.models import MergedProperty, Property, PropertyImage, Property
 from home_finder.utils.address import extract_outcode
 from home_finder.utils.image_cache import copy_cached_images, find_cached_file
 from home_finder.utils.image_hash import (
+    PackedGalleryHashes,
     fetch_image_hashes_batch,
-    hash_cached_gallery,
+    gallery_hash_lists,
+    hash_cached_gallery_files,
     hash_from_disk,
-    hashes_match,
+    hash_match_matrix,
+    pack_hashes,
 )
 
+if TYPE_CHECKING:
+    from home_finder.db import PropertyStorage
+
 logger = get_logger(__name__)
 
 # Source priority for image quality (higher = better).
@@ -109,6 +115,7 @@ class Deduplicator:
         enable_cross_platform: bool = False,
         enable_image_hashing: bool = False,
         data_dir: str = "",
+        storage: "PropertyStorage | None" = None,
     ) -> None:
         """Initialize the deduplicator.
 
@@ -120,10 +127,13 @@ class Deduplicator:
             data_dir: Base data directory for reading cached gallery images.
                 When set, gallery images are hashed from disk instead of
                 fetching hero thumbnails from the network.
+            storage: Storage holding the persisted gallery pHash index. When
+                set, cached gallery hashes are looked up rather than recomputed.
         """
         self.enable_cross_platform = enable_cross_platform
         self.enable_image_hashing = enable_image_hashing
         self.data_dir = data_dir
+        self.storage = storage
 
     async def deduplicate_and_merge_async(
         self,
@@ -245,6 +255,7 @@ class Deduplicator:
 
         # Build gallery image hashes for dedup comparison
         image_hashes: dict[str, list[str]] = {}
+        file_hashes: dict[Path, str | None] = {}
         if self.enable_image_hashing:
             candidate_ids = [
                 mp.canonical.unique_id
@@ -253,9 +264,13 @@ class Deduplicator:
                 for mp in candidates
             ]
 
-            # Primary: hash cached gallery images from disk (no network)
+            # Primary: cached gallery hashes from the index / disk (no network)
             if self.data_dir and candidate_ids:
-                image_hashes = await hash_cached_gallery(candidate_ids, self.data_dir)
+                gallery_files = await hash_cached_gallery_files(
+                    candidate_ids, self.data_dir, storage=self.storage
+                )
+                image_hashes = gallery_hash_lists(gallery_files)
+                file_hashes = {p: h for files in gallery_files.values() for p, h in files.items()}
 
             # Fallback: fetch hero thumbnails for properties without cached galleries
             ids_without_gallery = {uid for uid in candidate_ids if uid not in image_hashes}
@@ -283,7 +298,7 @@ class Deduplicator:
                 if len(group) == 1:
                     results.append(group[0])
                 else:
-                    results.append(self._merge_merged_properties(group))
+                    results.append(self._merge_merged_properties(group, file_hashes=file_hashes))
                     group_ids = [mp.canonical.unique_id for mp in group]
                     # Find match decisions involving any ID in this group
                     group_id_set = set(group_ids)
@@ -311,7 +326,12 @@ class Deduplicator:
 
         return results
 
-    def _merge_merged_properties(self, merged_list: list[MergedProperty]) -> MergedProperty:
+    def _merge_merged_properties(
+        self,
+        merged_list: list[MergedProperty],
+        *,
+        file_hashes: dict[Path, str | None] | None = None,
+    ) -> MergedProperty:
         """Combine multiple enriched MergedProperty objects into one.
 
         Merges sources, URLs, images, floorplans, and descriptions from
@@ -319,6 +339,8 @@ class Deduplicator:
 
         Args:
             merged_list: MergedProperties to combine.
+            file_hashes: Gallery hashes already loaded for dedup scoring,
+                keyed by cached file path, reused for perceptual image dedup.
 
         Returns:
             Single MergedProperty with combined data from all inputs.
@@ -357,7 +379,9 @@ class Deduplicator:
         # Pass all unique_ids so images cached under any source's directory are found.
         if self.data_dir and len(all_images) > 1:
             all_unique_ids = [mp.canonical.unique_id for mp in sorted_mps]
-            all_images = _perceptual_dedup_images(all_images, self.data_dir, all_unique_ids)
+            all_images = _perceptual_dedup_images(
+                all_images, self.data_dir, all_unique_ids, file_hashes=file_hashes
+            )
 
         # Pick best floorplan by source priority
         floorplan = _select_best_floorplan(sorted_mps)
@@ -500,6 +524,8 @@ def _perceptual_dedup_images(
     images: list[PropertyImage],
     data_dir: str,
     all_unique_ids: list[str],
+    *,
+    file_hashes: dict[Path, str | None] | None = None,
 ) -> list[PropertyImage]:
     """Remove visually identical photos served from different CDN URLs.
 
@@ -511,6 +537,8 @@ def _perceptual_dedup_images(
         data_dir: Base data directory for image cache.
         all_unique_ids: All unique_ids in the merge group, so images cached
             under any source's directory can be found.
+        file_hashes: Already-known hashes keyed by cached file path; files
+            not present are hashed from disk.
 
     Returns:
         Deduplicated image list.
@@ -523,12 +551,17 @@ def _perceptual_dedup_images(
     for img in images:
         cached = _find_cached_across_ids(data_dir, all_unique_ids, str(img.url), "gallery")
         if cached is not None:
-            h = hash_from_disk(cached)
+            if file_hashes is not None and cached in file_hashes:
+                h = file_hashes[cached]
+            else:
+                h = hash_from_disk(cached)
             hashed.append((img, h))
         else:
             hashed.append((img, None))
 
-    # Find duplicates by comparing hashes
+    # Find duplicates by comparing hashes (one vectorized match matrix)
+    packed, valid = pack_hashes([h or "" for _, h in hashed])
+    matches = hash_match_matrix(packed, valid, packed, valid)
     keep: list[bool] = [True] * len(hashed)
     for i in range(len(hashed)):
         if not keep[i]:
@@ -542,7 +575,7 @@ def _perceptual_dedup_images(
             img_j, hash_j = hashed[j]
             if hash_j is None:
                 continue
-            if hashes_match(hash_i, hash_j):
+            if matches[i, j]:
                 # Keep the one from the higher-priority source
                 pri_i = SOURCE_IMAGE_PRIORITY.get(img_i.source, 0)
                 pri_j = SOURCE_IMAGE_PRIORITY.get(img_j.source, 0)
@@ -599,6 +632,16 @@ def _group_items_greedy(
     if len(items) <= 1:
         return [items] if items else []
 
+    # Pack the block's gallery hashes once so every pair's image signal is a
+    # slice of a single vectorized match matrix.
+    block_hashes = PackedGalleryHashes(
+        {
+            mp.canonical.unique_id: image_hashes[mp.canonical.unique_id]
+            for mp in items
+            if mp.canonical.unique_id in image_hashes
+        }
+    )
+
     # Score all cross-source pairs and collect qualifying ones
     scored_pairs: list[_ScoredPair] = []
     for i in range(len(items)):
@@ -613,7 +656,7 @@ def _group_items_greedy(
             if set(items[i].sources) & set(items[j].sources):
                 continue
 
-            score = calculate_match_score(prop_i, prop_j, image_hashes)
+            score = calculate_match_score(prop_i, prop_j, block_hashes)
 
             if score.total >= 40:
                 logger.debug(
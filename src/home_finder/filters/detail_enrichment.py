@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import shutil
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Final
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, TypeAlias
 
 from pydantic import HttpUrl
 
@@ -12,19 +14,22 @@ from home_finder.logging import get_logger
 from home_finder.models import MergedProperty, Property, PropertyImage, PropertySource
 from home_finder.scrapers.detail_fetcher import DetailFetcher
 from home_finder.utils.address import is_outcode
-from home_finder.utils.epc_detector import detect_epc
-from home_finder.utils.floorplan_detector import detect_floorplan
 from home_finder.utils.image_cache import (
     clear_image_cache,
     find_cached_file,
     find_thumbnail,
-    generate_thumbnail,
     get_cached_image_path,
     is_property_cached,
     is_valid_image_url,
-    read_image_bytes,
     save_image_bytes,
 )
+from home_finder.utils.image_features import (
+    ImageFeatureRow,
+    ImageFeatures,
+    extract_image_features,
+)
+from home_finder.utils.image_hash import hash_cached_gallery_files
+from home_finder.utils.image_pool import run_image_task
 
 if TYPE_CHECKING:
     from home_finder.db import PropertyStorage
@@ -42,43 +47,74 @@ class EnrichmentResult:
 
 _ENRICHMENT_CONCURRENCY: Final = 5
 
+# Gallery image URL -> (cached file, features extracted from it). Images that
+# aren't cached or can't be decoded have no entry.
+GalleryFeatures: TypeAlias = dict[str, tuple[Path, ImageFeatures]]
+
+
+def _extract_gallery_features(
+    images: list[PropertyImage],
+    unique_id: str,
+    data_dir: str,
+    *,
+    thumbnails: bool = True,
+) -> GalleryFeatures:
+    """Decode each cached gallery image once and extract its features.
+
+    With ``thumbnails``, the same decode also writes each image's thumbnail
+    (except for EPC charts, which are about to leave the gallery).
+    """
+    features: GalleryFeatures = {}
+    for img in images:
+        url = str(img.url)
+        cache_path = find_cached_file(data_dir, unique_id, url, "gallery")
+        if cache_path is None:
+            continue
+        extracted = extract_image_features(cache_path, thumbnail=thumbnails)
+        if extracted is not None:
+            features[url] = (cache_path, extracted)
+    return features
+
 
 def _detect_floorplan_in_gallery(
     images: list[PropertyImage],
     unique_id: str,
     data_dir: str,
+    features: GalleryFeatures | None = None,
 ) -> tuple[PropertyImage | None, list[PropertyImage], int]:
     """Try to detect a floorplan among gallery images using PIL heuristics.
 
-    Iterates gallery images in reverse order (floorplans are often last),
-    reads cached bytes from disk, and runs the floorplan detector.
+    Iterates gallery images in reverse order (floorplans are often last)
+    and checks each one's floorplan score.
 
     Args:
         images: Gallery images to check.
         unique_id: Property unique ID for cache path lookup.
         data_dir: Data directory for image cache.
+        features: Already-extracted gallery features; extracted from the
+            cached files when omitted.
 
     Returns:
         Tuple of (detected_floorplan_image or None, remaining_gallery_images,
         original_gallery_index). Index is -1 when no floorplan was detected.
     """
+    if features is None:
+        features = _extract_gallery_features(images, unique_id, data_dir, thumbnails=False)
+
     # Iterate in reverse — floorplans are commonly placed at the end
     for idx in range(len(images) - 1, -1, -1):
         img = images[idx]
-        cache_path = find_cached_file(data_dir, unique_id, str(img.url), "gallery")
-        if cache_path is None:
-            continue
-        img_bytes = read_image_bytes(cache_path)
-        if img_bytes is None:
+        entry = features.get(str(img.url))
+        if entry is None:
             continue
 
-        is_floorplan, confidence = detect_floorplan(img_bytes)
-        if is_floorplan:
+        image_features = entry[1]
+        if image_features.is_floorplan:
             logger.info(
                 "floorplan_detected_by_heuristic",
                 property_id=unique_id,
                 image_index=idx,
-                confidence=confidence,
+                confidence=image_features.floorplan_score,
             )
             floorplan = PropertyImage(
                 url=img.url,
@@ -91,82 +127,101 @@ def _detect_floorplan_in_gallery(
     return None, images, -1
 
 
-def _generate_gallery_thumbnails(
-    images: list[PropertyImage],
-    unique_id: str,
-    data_dir: str,
-) -> int:
-    """Generate thumbnails for gallery images that don't have one yet.
-
-    Called after EPC/floorplan detection so only surviving gallery images
-    are thumbnailed (no orphaned thumb_ files for reclassified EPCs).
-    """
-    count = 0
-    for img in images:
-        cached_path = find_cached_file(data_dir, unique_id, str(img.url), "gallery")
-        if (
-            cached_path
-            and not find_thumbnail(cached_path)
-            and generate_thumbnail(cached_path) is not None
-        ):
-            count += 1
-    return count
-
-
 def _detect_epc_in_gallery(
     images: list[PropertyImage],
     unique_id: str,
     data_dir: str,
+    features: GalleryFeatures | None = None,
 ) -> list[PropertyImage]:
     """Detect and remove EPC charts from gallery images using PIL heuristics.
 
-    Iterates gallery images in forward order (EPCs are often first),
-    reads cached bytes from disk, and runs the EPC detector.
-    Removes **all** detected EPCs (there may be both energy efficiency
-    and environmental impact charts).
+    Checks each gallery image's EPC score in forward order (EPCs are often
+    first). Removes **all** detected EPCs (there may be both energy
+    efficiency and environmental impact charts).
 
     Args:
         images: Gallery images to check.
         unique_id: Property unique ID for cache path lookup.
         data_dir: Data directory for image cache.
+        features: Already-extracted gallery features; extracted from the
+            cached files when omitted. Entries for detected EPCs are updated
+            to point at the renamed file.
 
     Returns:
         Gallery images with EPC charts removed.
     """
+    if features is None:
+        features = _extract_gallery_features(images, unique_id, data_dir, thumbnails=False)
+
     epc_indices: set[int] = set()
 
     for idx, img in enumerate(images):
-        cache_path = find_cached_file(data_dir, unique_id, str(img.url), "gallery")
-        if cache_path is None:
-            continue
-        img_bytes = read_image_bytes(cache_path)
-        if img_bytes is None:
+        entry = features.get(str(img.url))
+        if entry is None:
             continue
 
-        is_epc, confidence = detect_epc(img_bytes)
-        if is_epc:
+        cache_path, image_features = entry
+        if image_features.is_epc:
             # Rename on disk so thumbnail fallback skips it
             epc_name = cache_path.name.replace("gallery_", "epc_", 1)
             epc_path = cache_path.parent / epc_name
             cache_path.rename(epc_path)
+            features[str(img.url)] = (epc_path, image_features)
             logger.info(
                 "epc_detected_by_heuristic",
                 property_id=unique_id,
                 image_index=idx,
-                confidence=confidence,
+                confidence=image_features.epc_score,
             )
             epc_indices.add(idx)
 
     return [im for j, im in enumerate(images) if j not in epc_indices]
 
 
+async def _cache_image(
+    detail_fetcher: DetailFetcher,
+    data_dir: str | None,
+    unique_id: str,
+    url: str,
+    image_type: str,
+    index: int,
+) -> bool:
+    """Download an image into the cache unless it's already there.
+
+    Returns True if the image is on disk (or caching is disabled) and False
+    if the download failed. The file is written in a worker thread.
+    """
+    if not data_dir:
+        return True
+    cache_path = get_cached_image_path(data_dir, unique_id, str(HttpUrl(url)), image_type, index)
+    if cache_path.is_file():
+        return True
+    img_bytes = await detail_fetcher.download_image_bytes(url)
+    if not img_bytes:
+        logger.warning(
+            "image_download_skipped",
+            property_id=unique_id,
+            url=url,
+            image_type=image_type,
+            index=index,
+        )
+        return False
+    await asyncio.to_thread(save_image_bytes, cache_path, img_bytes)
+    return True
+
+
 async def _enrich_single(
     merged: MergedProperty,
     detail_fetcher: DetailFetcher,
     semaphore: asyncio.Semaphore,
     data_dir: str | None = None,
+    feature_rows: list[ImageFeatureRow] | None = None,
 ) -> MergedProperty:
-    """Enrich a single merged property with detail page data."""
+    """Enrich a single merged property with detail page data.
+
+    Image features extracted from the gallery are appended to
+    ``feature_rows`` for the caller to persist.
+    """
     async with semaphore:
         prop = merged.canonical
         all_images: list[PropertyImage] = []
@@ -194,72 +249,10 @@ async def _enrich_single(
             detail_data = await detail_fetcher.fetch_detail_page(temp_prop)
 
             if detail_data:
-                if detail_data.gallery_urls:
-                    for idx, img_url in enumerate(detail_data.gallery_urls):
-                        normalized_url = str(HttpUrl(img_url))
-                        # Download and cache image bytes first
-                        cached = True  # default when caching disabled (data_dir=None)
-                        if data_dir:
-                            cache_path = get_cached_image_path(
-                                data_dir, merged.unique_id, normalized_url, "gallery", idx
-                            )
-                            if not cache_path.is_file():
-                                img_bytes = await detail_fetcher.download_image_bytes(img_url)
-                                if img_bytes:
-                                    save_image_bytes(cache_path, img_bytes)
-                                else:
-                                    cached = False
-                                    logger.warning(
-                                        "image_download_skipped",
-                                        property_id=merged.unique_id,
-                                        url=img_url,
-                                        image_type="gallery",
-                                        index=idx,
-                                    )
-                        # Only create PropertyImage if file exists on disk
-                        # (or caching disabled — data_dir=None)
-                        if cached:
-                            all_images.append(
-                                PropertyImage(
-                                    url=HttpUrl(normalized_url),
-                                    source=source,
-                                    image_type="gallery",
-                                )
-                            )
-
+                floorplan_url: str | None = None
                 if detail_data.floorplan_url and not floorplan_image:
                     if is_valid_image_url(detail_data.floorplan_url):
-                        normalized_fp_url = str(HttpUrl(detail_data.floorplan_url))
-                        fp_cached = True
-                        if data_dir:
-                            cache_path = get_cached_image_path(
-                                data_dir,
-                                merged.unique_id,
-                                normalized_fp_url,
-                                "floorplan",
-                                0,
-                            )
-                            if not cache_path.is_file():
-                                fp_bytes = await detail_fetcher.download_image_bytes(
-                                    detail_data.floorplan_url
-                                )
-                                if fp_bytes:
-                                    save_image_bytes(cache_path, fp_bytes)
-                                else:
-                                    fp_cached = False
-                                    logger.warning(
-                                        "image_download_skipped",
-                                        property_id=merged.unique_id,
-                                        url=detail_data.floorplan_url,
-                                        image_type="floorplan",
-                                        index=0,
-                                    )
-                        if fp_cached:
-                            floorplan_image = PropertyImage(
-                                url=HttpUrl(normalized_fp_url),
-                                source=source,
-                                image_type="floorplan",
-                            )
+                        floorplan_url = detail_data.floorplan_url
                     else:
                         logger.warning(
                             "floorplan_url_rejected",
@@ -268,6 +261,39 @@ async def _enrich_single(
                             reason="failed_image_url_validation",
                         )
 
+                # Download this source's images concurrently; the fetcher
+                # bounds downloads per host behind its CDN throttles/breakers
+                gallery_urls = detail_data.gallery_urls or []
+                downloads = [
+                    _cache_image(detail_fetcher, data_dir, merged.unique_id, u, "gallery", i)
+                    for i, u in enumerate(gallery_urls)
+                ]
+                if floorplan_url:
+                    downloads.append(
+                        _cache_image(
+                            detail_fetcher,
+                            data_dir,
+                            merged.unique_id,
+                            floorplan_url,
+                            "floorplan",
+                            0,
+                        )
+                    )
+                cached = await asyncio.gather(*downloads)
+
+                # Only keep images cached on disk (or all, with caching disabled)
+                all_images.extend(
+                    PropertyImage(url=HttpUrl(img_url), source=source, image_type="gallery")
+                    for img_url, ok in zip(gallery_urls, cached, strict=False)
+                    if ok
+                )
+                if floorplan_url and cached[-1]:
+                    floorplan_image = PropertyImage(
+                        url=HttpUrl(floorplan_url),
+                        source=source,
+                        image_type="floorplan",
+                    )
+
                 if detail_data.description and (
                     not best_description or len(detail_data.description) > len(best_description)
                 ):
@@ -297,16 +323,24 @@ async def _enrich_single(
                     floor_area_sqm = detail_data.floor_area_sqm
                     floor_area_source = detail_data.floor_area_source
 
+        # Decode each gallery image once: EPC/floorplan scores, pHash and
+        # thumbnail all come from the same pass
+        features: GalleryFeatures = {}
+        if data_dir and all_images:
+            features = await run_image_task(
+                _extract_gallery_features, all_images, merged.unique_id, data_dir
+            )
+
         # Detect and remove EPC charts from gallery before floorplan detection
         if data_dir and all_images:
             all_images = await asyncio.to_thread(
-                _detect_epc_in_gallery, all_images, merged.unique_id, data_dir
+                _detect_epc_in_gallery, all_images, merged.unique_id, data_dir, features
             )
 
         # If no floorplan found by structural extraction, try PIL heuristic on gallery images
         if floorplan_image is None and data_dir and all_images:
-            floorplan_image, all_images, detected_idx = await asyncio.to_thread(
-                _detect_floorplan_in_gallery, all_images, merged.unique_id, data_dir
+            floorplan_image, all_images, detected_idx = _detect_floorplan_in_gallery(
+                all_images, merged.unique_id, data_dir, features
             )
             # Copy the cached image to the floorplan cache path so quality analysis finds it
             if floorplan_image is not None and detected_idx >= 0:
@@ -320,12 +354,17 @@ async def _enrich_single(
                     data_dir, merged.unique_id, str(floorplan_image.url), "floorplan", 0
                 )
                 if old_path is not None and old_path.is_file() and not new_path.is_file():
-                    save_image_bytes(new_path, old_path.read_bytes())
-
-        # Generate thumbnails for surviving gallery images (after EPC/floorplan detection)
-        if data_dir and all_images:
-            await asyncio.to_thread(
-                _generate_gallery_thumbnails, all_images, merged.unique_id, data_dir
+                    await asyncio.to_thread(shutil.copyfile, old_path, new_path)
+                # The feature pass thumbnailed it as a gallery image; it has
+                # left the gallery, so that thumb_gallery_* file is an orphan
+                thumb_path = find_thumbnail(old_path) if old_path is not None else None
+                if thumb_path is not None:
+                    thumb_path.unlink(missing_ok=True)
+
+        if feature_rows is not None:
+            feature_rows.extend(
+                image_features.row(merged.unique_id, path.name)
+                for path, image_features in features.values()
             )
 
         canonical = prop.model_copy(update=canon_updates) if canon_updates else prop
@@ -451,8 +490,13 @@ async def enrich_merged_properties(
             to_enrich.append(merged)
 
     semaphore = asyncio.Semaphore(_ENRICHMENT_CONCURRENCY)
-    tasks = [_enrich_single(merged, detail_fetcher, semaphore, data_dir) for merged in to_enrich]
+    feature_rows: list[ImageFeatureRow] = []
+    tasks = [
+        _enrich_single(merged, detail_fetcher, semaphore, data_dir, feature_rows)
+        for merged in to_enrich
+    ]
     enriched_list = list(await asyncio.gather(*tasks, return_exceptions=True))
+    newly_cached: list[str] = []
 
     for i, item in enumerate(enriched_list):
         if isinstance(item, BaseException):
@@ -466,9 +510,21 @@ async def enrich_merged_properties(
             result.failed.append(to_enrich[i])
         elif item.images or item.floorplan:
             result.enriched.append(item)
+            if item.images:
+                newly_cached.append(item.unique_id)
         else:
             result.failed.append(item)
 
+    # Persist extracted features (pHash included) and index whatever extraction
+    # couldn't decode, so dedup reads every gallery hash from the DB
+    if data_dir and storage and newly_cached:
+        try:
+            await storage.save_image_features(feature_rows)
+            await hash_cached_gallery_files(newly_cached, data_dir, storage=storage)
+        except Exception:
+            # Best effort: dedup hashes (and indexes) anything missing later
+            logger.warning("gallery_hash_index_failed", count=len(newly_cached), exc_info=True)
+
     return result
 
 
@@ -0,0 +1,196 @@
+"""Offline commute classification against stored TravelTime isochrones.
+
+An isochrone is the area from which the destination can be reached within a
+travel-time limit. Once fetched (one time-map request per mode) and stored,
+it answers "is this flat within N minutes?" without a network call; only
+points too close to a polygon edge to trust are sent to the time-filter API.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Final, Protocol, TypeAlias
+
+# One polygon ring of (lat, lng) vertices. Shells and holes are both rings:
+# a point is inside the isochrone when it is inside an odd number of them.
+Ring: TypeAlias = list[tuple[float, float]]
+
+# Points nearer than this to an isochrone edge are left to the API: the
+# returned polygons are simplified, so edges are only accurate to ~100 m.
+BOUNDARY_MARGIN_M: Final = 150.0
+
+# Bands fetched below the commute limit. A property's estimated commute is
+# the smallest band that certainly contains it.
+BAND_STEP_MINUTES: Final = 10
+
+# TravelTime time-map limit on searches per request.
+MAX_SEARCHES_PER_REQUEST: Final = 10
+
+_M_PER_DEG_LAT: Final = 110_574.0
+_M_PER_DEG_LNG_AT_EQUATOR: Final = 111_320.0
+
+
+def band_limits(max_minutes: int) -> list[int]:
+    """Travel-time limits (minutes) to fetch for a commute limit, ascending."""
+    return [*range(BAND_STEP_MINUTES, max_minutes, BAND_STEP_MINUTES), max_minutes]
+
+
+class IsochroneStore(Protocol):
+    """Persistent isochrone storage. Implemented by ``PropertyStorage``."""
+
+    async def get_isochrones(
+        self,
+        *,
+        transport_mode: str,
+        destination: str,
+        limits: list[int],
+        max_age_days: int,
+    ) -> dict[int, list[Ring]]: ...
+
+    async def save_isochrones(
+        self,
+        isochrones: dict[int, list[Ring]],
+        *,
+        transport_mode: str,
+        destination: str,
+    ) -> None: ...
+
+
+def _segments_cross(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float
+) -> bool:
+    """Whether segment AB properly crosses segment CD."""
+    d1 = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+    d2 = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+    d3 = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    d4 = (bx - ax) * (dy - ay) - (by - ay) * (dx - ax)
+    return (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
+
+
+def _distance_sq_to_segment(
+    px: float, py: float, x1: float, y1: float, x2: float, y2: float
+) -> float:
+    vx, vy = x2 - x1, y2 - y1
+    length_sq = vx * vx + vy * vy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((px - x1) * vx + (py - y1) * vy) / length_sq))
+    ex, ey = x1 + t * vx - px, y1 + t * vy - py
+    return ex * ex + ey * ey
+
+
+class IsochroneIndex:
+    """Grid-accelerated point-in-polygon test over isochrone rings.
+
+    Vertices are projected onto a local plane in metres and bucketed into a
+    square grid; each cell lists the edges that pass within ``margin_m`` of
+    it, and the inside/outside state of every cell centre is precomputed
+    with one scanline per grid row. A point in an edge-free cell takes its
+    cell's state. Otherwise it is ambiguous (``None``) when within the margin
+    of one of the cell's edges, or else the centre's state flipped once per
+    cell edge crossed on the way from the centre to the point.
+    """
+
+    __slots__ = (
+        "_cell_h",
+        "_cell_w",
+        "_cells",
+        "_edges",
+        "_inside",
+        "_kx",
+        "_margin_sq",
+        "_max_x",
+        "_max_y",
+        "_min_x",
+        "_min_y",
+        "_n",
+    )
+
+    def __init__(
+        self,
+        rings: Sequence[Sequence[tuple[float, float]]],
+        *,
+        margin_m: float = BOUNDARY_MARGIN_M,
+        grid_size: int | None = None,
+    ) -> None:
+        points = [p for ring in rings for p in ring]
+        lat0 = sum(lat for lat, _ in points) / len(points) if points else 51.5
+        self._kx = _M_PER_DEG_LNG_AT_EQUATOR * math.cos(math.radians(lat0))
+        self._margin_sq = margin_m * margin_m
+
+        edges: list[tuple[float, float, float, float]] = []
+        for ring in rings:
+            xy = [(lng * self._kx, lat * _M_PER_DEG_LAT) for lat, lng in ring]
+            if len(xy) > 1 and xy[0] == xy[-1]:
+                xy.pop()
+            if len(xy) < 3:
+                continue
+            edges.extend((*xy[i - 1], *xy[i]) for i in range(len(xy)))
+        self._edges = edges
+
+        self._n = grid_size or max(8, min(256, 2 * math.isqrt(len(edges))))
+        n = self._n
+        self._cells: list[list[int]] = [[] for _ in range(n * n)]
+        self._inside = [False] * (n * n)
+        if not edges:
+            self._min_x = self._min_y = self._max_x = self._max_y = 0.0
+            self._cell_w = self._cell_h = 1.0
+            return
+
+        self._min_x = min(min(e[0], e[2]) for e in edges) - margin_m
+        self._max_x = max(max(e[0], e[2]) for e in edges) + margin_m
+        self._min_y = min(min(e[1], e[3]) for e in edges) - margin_m
+        self._max_y = max(max(e[1], e[3]) for e in edges) + margin_m
+        self._cell_w = (self._max_x - self._min_x) / n
+        self._cell_h = (self._max_y - self._min_y) / n
+
+        for i, (x1, y1, x2, y2) in enumerate(edges):
+            c0, r0 = self._cell_of(min(x1, x2) - margin_m, min(y1, y2) - margin_m)
+            c1, r1 = self._cell_of(max(x1, x2) + margin_m, max(y1, y2) + margin_m)
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    self._cells[row * n + col].append(i)
+
+        # Even-odd state of each cell centre, one horizontal scanline per row
+        for row in range(n):
+            cy = self._min_y + (row + 0.5) * self._cell_h
+            crossings = sorted(
+                x1 + (cy - y1) * (x2 - x1) / (y2 - y1)
+                for x1, y1, x2, y2 in edges
+                if (y1 > cy) != (y2 > cy)
+            )
+            k = 0
+            for col in range(n):
+                cx = self._min_x + (col + 0.5) * self._cell_w
+                while k < len(crossings) and crossings[k] < cx:
+                    k += 1
+                self._inside[row * n + col] = k % 2 == 1
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        col = min(self._n - 1, max(0, int((x - self._min_x) / self._cell_w)))
+        row = min(self._n - 1, max(0, int((y - self._min_y) / self._cell_h)))
+        return col, row
+
+    def classify(self, lat: float, lng: float) -> bool | None:
+        """Whether the point is inside the isochrone; ``None`` near an edge."""
+        x, y = lng * self._kx, lat * _M_PER_DEG_LAT
+        if not self._edges or not (
+            self._min_x <= x <= self._max_x and self._min_y <= y <= self._max_y
+        ):
+            return False
+
+        col, row = self._cell_of(x, y)
+        cell = row * self._n + col
+        inside = self._inside[cell]
+        cell_edges = self._cells[cell]
+        if not cell_edges:
+            return inside
+
+        cx = self._min_x + (col + 0.5) * self._cell_w
+        cy = self._min_y + (row + 0.5) * self._cell_h
+        for i in cell_edges:
+            x1, y1, x2, y2 = self._edges[i]
+            if _distance_sq_to_segment(x, y, x1, y1, x2, y2) < self._margin_sq:
+                return None
+            if _segments_cross(cx, cy, x, y, x1, y1, x2, y2):
+                inside = not inside
+        return inside
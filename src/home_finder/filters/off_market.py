@@ -52,7 +52,7 @@ class ListingStatus(Enum):
     UNKNOWN = "unknown"
 
 
-# Per-source rate limiting (seconds between requests)
+# Per-source rate limiting (starting seconds between request starts)
 _SOURCE_DELAYS: Final[dict[str, float]] = {
     "zoopla": 2.0,
     "onthemarket": 1.0,
@@ -60,6 +60,21 @@ _SOURCE_DELAYS: Final[dict[str, float]] = {
     "rightmove": 0.5,
 }
 
+# Requests in flight per source. Starts are still spaced by the pacer, so
+# this only overlaps response latency with the next request's delay.
+_SOURCE_CONCURRENCY: Final[dict[str, int]] = {
+    "zoopla": 2,
+    "onthemarket": 2,
+    "openrent": 3,
+    "rightmove": 4,
+}
+
+# Adaptive pacing bounds: clean responses shrink the delay towards
+# _MIN_DELAY_FACTOR x the base delay; throttling doubles it up to the cap.
+_MIN_DELAY_FACTOR: Final = 0.5
+_DELAY_STEP_FACTOR: Final = 0.05
+_MAX_SOURCE_DELAY: Final = 60.0
+
 # Circuit breaker: abort source after this many consecutive UNKNOWN results
 _CIRCUIT_BREAKER_THRESHOLD: Final = 5
 
@@ -131,6 +146,47 @@ def _is_cloudflare_challenge(html: str, headers: Mapping[str, str] | None = None
     return any(p in lower for p in _CLOUDFLARE_PATTERNS)
 
 
+def _retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Parse a numeric Retry-After header (HTTP-date values are ignored)."""
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _SourcePacer:
+    """Spaces request starts for one source, adapting to throttling (AIMD).
+
+    Each clean response trims the delay by a small step down to a floor of
+    half the base delay; a 429 or Cloudflare challenge doubles it (or jumps
+    to Retry-After) up to ``_MAX_SOURCE_DELAY`` and pushes back the next start.
+    """
+
+    def __init__(self, base_delay: float) -> None:
+        self.base_delay = base_delay
+        self.delay = base_delay
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait for this source's next request slot."""
+        async with self._lock:
+            while (remaining := self._next_start - time.monotonic()) > 0:
+                await asyncio.sleep(remaining)
+            self._next_start = time.monotonic() + self.delay
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        self.delay = min(_MAX_SOURCE_DELAY, max(self.delay * 2, retry_after or 0.0))
+        self._next_start = max(self._next_start, time.monotonic() + self.delay)
+
+    def succeeded(self) -> None:
+        floor = self.base_delay * _MIN_DELAY_FACTOR
+        self.delay = max(floor, self.delay - self.base_delay * _DELAY_STEP_FACTOR)
+
+
 def _check_let_agreed(source: str, html: str) -> bool:
     """Check if the page body contains let-agreed signals for the given source."""
     patterns = _LET_AGREED_PATTERNS.get(source)
@@ -267,11 +323,18 @@ class CheckResult:
 
 @dataclass
 class BatchResult:
-    """Aggregated result of check_batch() with per-source metadata."""
+    """Aggregated result of check_batch() with per-source metadata.
+
+    ``unchecked`` holds the (property_id, source, url) checks left out of
+    ``results`` because the time budget ran out or the source's circuit
+    breaker tripped; they keep their old ``last_checked_at`` and so lead
+    the next run.
+    """
 
     results: list[CheckResult]
     by_source: dict[str, dict[str, int]]
     circuit_breakers_tripped: list[str]
+    unchecked: list[tuple[str, str, str]] = field(default_factory=list)
 
 
 @dataclass
@@ -284,6 +347,13 @@ class OffMarketChecker:
 
     proxy_url: str = ""
     _httpx_client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _pacers: dict[str, _SourcePacer] = field(default_factory=dict, init=False, repr=False)
+
+    def _pacer(self, source: str) -> _SourcePacer:
+        pacer = self._pacers.get(source)
+        if pacer is None:
+            pacer = self._pacers[source] = _SourcePacer(_SOURCE_DELAYS.get(source, 1.0))
+        return pacer
 
     async def _get_httpx_client(self) -> httpx.AsyncClient:
         if self._httpx_client is None:
@@ -362,6 +432,17 @@ class OffMarketChecker:
 
         if status == ListingStatus.UNKNOWN:
             headers = dict(response.headers)
+            if response.status_code in (429, 503) or _is_cloudflare_challenge(
+                response.text, response.headers
+            ):
+                pacer = self._pacer(source)
+                pacer.throttled(_retry_after_seconds(response.headers))
+                logger.info(
+                    "off_market_pacing_backoff",
+                    source=source,
+                    status_code=response.status_code,
+                    delay_s=round(pacer.delay, 2),
+                )
             logger.warning(
                 "off_market_unknown_response",
                 source=source,
@@ -378,19 +459,30 @@ class OffMarketChecker:
     async def check_batch(
         self,
         checks: list[tuple[str, str, str]],
+        *,
+        time_budget: float | None = None,
     ) -> BatchResult:
-        """Check multiple listing URLs with rate limiting and circuit breaker.
+        """Check multiple listing URLs with adaptive pacing and circuit breaker.
 
-        Different sources run concurrently; within each source, requests are
-        sequential with per-source rate-limiting delays.
+        Different sources run concurrently. Within a source, a few requests
+        are in flight at once (``_SOURCE_CONCURRENCY``) while a shared
+        ``_SourcePacer`` spaces their starts, backing off on 429s and
+        Cloudflare challenges. URLs are taken in the order given, so callers
+        should pass the highest-priority checks first.
 
         Args:
-            checks: List of (property_id, source, url) tuples.
+            checks: List of (property_id, source, url) tuples, in priority order.
+            time_budget: Seconds after which no new requests are started
+                (None = check everything). Unstarted URLs, including those
+                skipped by a tripped circuit breaker, are omitted from the
+                results and listed in ``BatchResult.unchecked``.
 
         Returns:
             BatchResult containing all CheckResults and per-source metadata.
         """
-        # Group by source for rate limiting and circuit breaker
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+
+        # Group by source for pacing and circuit breaker
         by_source: dict[str, list[tuple[str, str]]] = {}
         for prop_id, source, url in checks:
             by_source.setdefault(source, []).append((prop_id, url))
@@ -399,108 +491,139 @@ class OffMarketChecker:
 
         async def _check_source(
             source: str, items: list[tuple[str, str]]
-        ) -> tuple[list[CheckResult], dict[str, int]]:
-            source_results: list[CheckResult] = []
+        ) -> tuple[list[CheckResult], dict[str, int], list[tuple[str, str, str]]]:
             breaker = ConsecutiveFailureBreaker(threshold=_CIRCUIT_BREAKER_THRESHOLD, name=source)
-            delay = _SOURCE_DELAYS.get(source, 1.0)
+            pacer = self._pacer(source)
+            concurrency = min(_SOURCE_CONCURRENCY.get(source, 2), len(items))
+            statuses: list[ListingStatus | None] = [None] * len(items)
             counts: dict[str, int] = {s.value: 0 for s in ListingStatus}
             source_t0 = time.monotonic()
+            checked = 0
 
             logger.info(
                 "off_market_source_started",
                 source=source,
                 urls=len(items),
-                delay_s=delay,
+                delay_s=pacer.delay,
+                concurrency=concurrency,
             )
 
-            for i, (prop_id, url) in enumerate(items):
-                if breaker.is_tripped:
-                    tripped_breakers.append(source)
-                    logger.warning(
-                        "off_market_circuit_breaker",
-                        source=source,
-                        skipped=len(items) - i,
-                        threshold=_CIRCUIT_BREAKER_THRESHOLD,
-                    )
-                    for remaining_id, remaining_url in items[i:]:
-                        source_results.append(
-                            CheckResult(
-                                source=source,
-                                url=remaining_url,
-                                status=ListingStatus.UNKNOWN,
-                                property_id=remaining_id,
-                            )
+            def _should_stop() -> bool:
+                return breaker.is_tripped or (deadline is not None and time.monotonic() >= deadline)
+
+            pending = iter(enumerate(items))
+
+            async def _worker() -> None:
+                nonlocal checked
+                # Workers share one iterator, so each URL is taken exactly once
+                for i, (_prop_id, url) in pending:
+                    if _should_stop():
+                        return
+                    await pacer.wait()
+                    if _should_stop():
+                        return
+
+                    status = await self.check_url(source, url)
+                    statuses[i] = status
+                    counts[status.value] += 1
+                    checked += 1
+
+                    if status == ListingStatus.UNKNOWN:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                        pacer.succeeded()
+
+                    # Progress log every 50 items
+                    if checked % 50 == 0:
+                        elapsed = time.monotonic() - source_t0
+                        logger.info(
+                            "off_market_progress",
+                            source=source,
+                            checked=checked,
+                            total=len(items),
+                            active=counts["active"],
+                            removed=counts["removed"],
+                            let_agreed=counts["let_agreed"],
+                            unknown=counts["unknown"],
+                            delay_s=round(pacer.delay, 2),
+                            elapsed_s=round(elapsed, 1),
+                            rate=round(checked / elapsed, 1) if elapsed > 0 else 0,
                         )
-                        counts["unknown"] += 1
-                    break
 
-                status = await self.check_url(source, url)
+            await asyncio.gather(*(_worker() for _ in range(concurrency)))
+
+            skipped = len(items) - checked
+            if skipped and breaker.is_tripped:
+                tripped_breakers.append(source)
+                logger.warning(
+                    "off_market_circuit_breaker",
+                    source=source,
+                    skipped=skipped,
+                    threshold=_CIRCUIT_BREAKER_THRESHOLD,
+                )
+
+            source_results: list[CheckResult] = []
+            unchecked: list[tuple[str, str, str]] = []
+            for (prop_id, url), checked_status in zip(items, statuses, strict=True):
+                if checked_status is None:
+                    # Never requested (time budget or tripped breaker): leave
+                    # for the next run, which keeps its queue position
+                    unchecked.append((prop_id, source, url))
+                    continue
                 source_results.append(
                     CheckResult(
                         source=source,
                         url=url,
-                        status=status,
+                        status=checked_status,
                         property_id=prop_id,
                     )
                 )
-                counts[status.value] += 1
-
-                if status == ListingStatus.UNKNOWN:
-                    breaker.record_failure()
-                else:
-                    breaker.record_success()
-
-                # Progress log every 50 items
-                checked = i + 1
-                if checked % 50 == 0:
-                    elapsed = time.monotonic() - source_t0
-                    logger.info(
-                        "off_market_progress",
-                        source=source,
-                        checked=checked,
-                        total=len(items),
-                        active=counts["active"],
-                        removed=counts["removed"],
-                        let_agreed=counts["let_agreed"],
-                        unknown=counts["unknown"],
-                        elapsed_s=round(elapsed, 1),
-                        rate=round(checked / elapsed, 1) if elapsed > 0 else 0,
-                    )
-
-                if i < len(items) - 1:
-                    await asyncio.sleep(delay)
 
             source_elapsed = round(time.monotonic() - source_t0, 1)
             logger.info(
                 "off_market_source_complete",
                 source=source,
-                checked=len(source_results),
+                checked=checked,
                 active=counts["active"],
                 removed=counts["removed"],
                 let_agreed=counts["let_agreed"],
                 unknown=counts["unknown"],
+                unchecked=len(unchecked),
+                final_delay_s=round(pacer.delay, 2),
                 elapsed_s=source_elapsed,
             )
 
-            return source_results, counts
+            return source_results, counts, unchecked
 
-        # Run all sources concurrently (rate limiting is per-source)
+        # Run all sources concurrently (pacing is per-source)
         source_names = list(by_source.keys())
         source_tasks = [_check_source(source, items) for source, items in by_source.items()]
         all_source_outputs = await asyncio.gather(*source_tasks)
 
         results: list[CheckResult] = []
         source_breakdown: dict[str, dict[str, int]] = {}
-        for source, (source_results, source_counts) in zip(
+        all_unchecked: list[tuple[str, str, str]] = []
+        for source, (source_results, source_counts, unchecked) in zip(
             source_names, all_source_outputs, strict=True
         ):
             results.extend(source_results)
             source_breakdown[source] = source_counts
+            all_unchecked.extend(unchecked)
+
+        if all_unchecked:
+            logger.info(
+                "off_market_urls_unchecked",
+                time_budget_s=time_budget,
+                circuit_breakers_tripped=tripped_breakers,
+                unchecked=len(all_unchecked),
+            )
 
         return BatchResult(
             results=results,
             by_source=source_breakdown,
             circuit_breakers_tripped=tripped_breakers,
+            unchecked=all_unchecked,
         )
 
     async def __aenter__(self) -> OffMarketChecker:
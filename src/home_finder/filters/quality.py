@@ -40,12 +40,13 @@ from home_finder.models import (
 )
 from home_finder.models.quality import _QUALITY_SUB_MODEL_FIELDS
 from home_finder.utils.image_cache import find_cached_file, is_valid_image_url, read_image_bytes
+from home_finder.utils.image_pool import run_image_task
 from home_finder.utils.image_processing import (
     ImageMediaType,
     detect_media_type_from_bytes,
 )
 from home_finder.utils.image_processing import (
-    resize_image_bytes as _resize_image_bytes,
+    prepare_image_bytes as _prepare_image_bytes,
 )
 
 if TYPE_CHECKING:
@@ -842,16 +843,9 @@ class PropertyQualityFilter:
             media_type=media_type,
         )
 
-        # Validate image is decodable before sending to API
-        try:
-            from io import BytesIO
-
-            from PIL import Image
-
-            img = Image.open(BytesIO(data))
-            img.load()  # Force full pixel decode
-            img.close()
-        except Exception:
+        # One decode validates the pixels and downscales oversized images
+        prepared = await run_image_task(_prepare_image_bytes, data)
+        if prepared is None:
             logger.warning(
                 "cached_image_corrupt",
                 url=url,
@@ -859,8 +853,7 @@ class PropertyQualityFilter:
             )
             return None
 
-        data = await asyncio.to_thread(_resize_image_bytes, data)
-        image_data = base64.standard_b64encode(data).decode("utf-8")
+        image_data = base64.standard_b64encode(prepared).decode("utf-8")
         return ImageBlockParam(
             type="image",
             source=Base64ImageSourceParam(
@@ -2,13 +2,14 @@
 
 import math
 import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Final
 
 from home_finder.models import Property
 from home_finder.utils.address import extract_outcode, normalize_street_name
-from home_finder.utils.image_hash import count_gallery_hash_matches
+from home_finder.utils.image_hash import PackedGalleryHashes, count_gallery_hash_matches
 
 # Price tolerance for fuzzy matching (3% - tighter than before)
 PRICE_TOLERANCE: Final = 0.03
@@ -264,7 +265,7 @@ def graduated_price_score(price1: int, price2: int, tolerance: float = PRICE_TOL
 def calculate_match_score(
     prop1: Property,
     prop2: Property,
-    image_hashes: dict[str, list[str]] | None = None,
+    image_hashes: Mapping[str, Sequence[str]] | PackedGalleryHashes | None = None,
 ) -> MatchScore:
     """Calculate weighted match score between two properties.
 
@@ -273,7 +274,8 @@ def calculate_match_score(
     Args:
         prop1: First property.
         prop2: Second property.
-        image_hashes: Optional dict mapping unique_id to list of gallery hash strings.
+        image_hashes: Optional dict mapping unique_id to list of gallery hash strings,
+            or a PackedGalleryHashes for batched block scoring.
 
     Returns:
         MatchScore with breakdown of all signals.
@@ -289,7 +291,10 @@ def calculate_match_score(
     if image_hashes:
         hashes1 = image_hashes.get(prop1.unique_id)
         hashes2 = image_hashes.get(prop2.unique_id)
-        match_count = count_gallery_hash_matches(hashes1, hashes2)
+        if isinstance(image_hashes, PackedGalleryHashes):
+            match_count = image_hashes.count_matches(prop1.unique_id, prop2.unique_id)
+        else:
+            match_count = count_gallery_hash_matches(hashes1, hashes2)
         if hashes1 is not None and hashes2 is not None:
             score.image_match_count = match_count
             score.image_compared = (len(hashes1), len(hashes2))
@@ -18,6 +18,7 @@ from home_finder.models import (
     PropertySource,
 )
 from home_finder.notifiers import TelegramNotifier
+from home_finder.notifiers.rate_limit import TelegramRateLimiter
 from home_finder.pipeline.analysis import (
     _CommInfo,
     _drain_reanalysis_queue,
@@ -26,11 +27,13 @@ from home_finder.pipeline.analysis import (
     run_reanalysis,
 )
 from home_finder.pipeline.commands import (
+    check_off_market,
     run_backfill_commute,
     run_check_off_market,
     run_dedup_existing,
 )
-from home_finder.pipeline.event_recorder import EventRecorder, PropertyEvent
+from home_finder.pipeline.event_recorder import EventRecorder
+from home_finder.pipeline.notifications import NotificationDispatcher
 from home_finder.pipeline.scraping import (
     scrape_all_platforms,
 )
@@ -39,18 +42,21 @@ from home_finder.pipeline.stages import (
     _run_pre_analysis_pipeline,
 )
 from home_finder.utils.image_cache import backfill_thumbnails
+from home_finder.utils.image_pool import image_pool
 
 logger = get_logger(__name__)
 
 
 def _make_notify_callback(
-    notifier: TelegramNotifier,
+    dispatcher: NotificationDispatcher,
     storage: PropertyStorage,
-    counter: list[int],
-    *,
-    recorder: EventRecorder | None = None,
 ) -> _OnResult:
-    """Build the on_result callback for live pipeline runs (sends Telegram)."""
+    """Build the on_result callback for live pipeline runs (queues Telegram delivery).
+
+    The property is already saved with notification_status 'pending' when this
+    runs, so queuing is all that's needed; the dispatcher delivers in the
+    background and the analysis loop moves straight on to the next result.
+    """
 
     async def _notify(
         merged: MergedProperty,
@@ -62,29 +68,7 @@ def _make_notify_callback(
             await storage.mark_notified(merged.unique_id)
             return
 
-        commute_minutes = commute_info[0] if commute_info else None
-        transport_mode = commute_info[1] if commute_info else None
-
-        success = await notifier.send_merged_property_notification(
-            merged,
-            commute_minutes=commute_minutes,
-            transport_mode=transport_mode,
-            quality_analysis=quality_analysis,
-        )
-
-        uid = merged.canonical.unique_id
-        src = merged.canonical.source.value
-        if success:
-            await storage.mark_notified(uid)
-            counter[0] += 1
-            if recorder is not None:
-                recorder.record(PropertyEvent(uid, src, "notified", "notification"))
-        else:
-            await storage.mark_notification_failed(uid)
-            if recorder is not None:
-                recorder.record(PropertyEvent(uid, src, "notification_failed", "notification"))
-
-        await asyncio.sleep(1)  # Telegram rate limit
+        dispatcher.submit(merged, commute_info, quality_analysis)
 
     return _notify
 
@@ -206,48 +190,52 @@ async def _run_pipeline_with_storage(
 
     # Notifier context — real TelegramNotifier in live mode, nullcontext for dry run
     notifier_cm: contextlib.AbstractAsyncContextManager[TelegramNotifier | None]
+    live_notifier: TelegramNotifier | None = None
     if dry_run:
         notifier_cm = contextlib.nullcontext(None)
     else:
-        notifier_cm = TelegramNotifier(
+        live_notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token.get_secret_value(),
             chat_id=settings.telegram_chat_id,
             web_base_url=settings.web_base_url,
             data_dir=settings.data_dir,
+            rate_limiter=TelegramRateLimiter(),
+            file_id_store=storage,
         )
+        notifier_cm = live_notifier
 
     # T4: EventRecorder for property audit trail
     recorder_cm: contextlib.AbstractAsyncContextManager[EventRecorder | None]
+    live_recorder: EventRecorder | None = None
     if run_id is not None:
-        recorder_cm = EventRecorder(storage, run_id)
+        live_recorder = EventRecorder(storage, run_id)
+        recorder_cm = live_recorder
     else:
         recorder_cm = contextlib.nullcontext(None)
 
-    async with notifier_cm as notifier, recorder_cm as recorder:
+    # Telegram delivery runs in the background for the whole run; entered
+    # last so it drains before the recorder flushes and the notifier closes.
+    dispatcher_cm: contextlib.AbstractAsyncContextManager[NotificationDispatcher | None]
+    if live_notifier is not None:
+        dispatcher_cm = NotificationDispatcher(live_notifier, storage, recorder=live_recorder)
+    else:
+        dispatcher_cm = contextlib.nullcontext(None)
+
+    async with (
+        image_pool(settings.image_workers),
+        notifier_cm as notifier,
+        recorder_cm as recorder,
+        dispatcher_cm as dispatcher,
+    ):
         try:
-            # Step 0: Retry unsent notifications (live mode only)
-            if not dry_run and notifier is not None:
+            # Step 0: Re-queue unsent notifications (live mode only); they are
+            # delivered in the background while scraping runs.
+            if not dry_run and dispatcher is not None:
                 unsent = await storage.get_unsent_notifications()
                 if unsent:
                     logger.info("retrying_unsent_notifications", count=len(unsent))
                     for tracked in unsent:
-                        success = await notifier.send_property_notification(
-                            tracked.property,
-                            commute_minutes=tracked.commute_minutes,
-                            transport_mode=tracked.transport_mode,
-                        )
-                        if success:
-                            await storage.mark_notified(tracked.property.unique_id)
-                            logger.info(
-                                "retry_notification_sent",
-                                unique_id=tracked.property.unique_id,
-                            )
-                        else:
-                            logger.warning(
-                                "retry_notification_failed",
-                                unique_id=tracked.property.unique_id,
-                            )
-                        await asyncio.sleep(1)
+                        dispatcher.submit_unsent(tracked)
 
             pre = await _run_pre_analysis_pipeline(
                 settings,
@@ -292,7 +280,6 @@ async def _run_pipeline_with_storage(
             )
 
             # Build callback
-            notified_counter = [0]  # mutable counter for live mode
             dry_run_results: list[
                 tuple[MergedProperty, _CommInfo, PropertyQualityAnalysis | None]
             ] = []
@@ -300,10 +287,8 @@ async def _run_pipeline_with_storage(
             if dry_run:
                 on_result = _make_accumulate_callback(dry_run_results)
             else:
-                assert notifier is not None
-                on_result = _make_notify_callback(
-                    notifier, storage, notified_counter, recorder=recorder
-                )
+                assert dispatcher is not None
+                on_result = _make_notify_callback(dispatcher, storage)
 
             t_analysis = time.monotonic()
             analyzed_count, token_usage = await _run_quality_and_save(
@@ -323,11 +308,15 @@ async def _run_pipeline_with_storage(
                 )
             else:
                 assert notifier is not None
+                assert dispatcher is not None
                 assert run_id is not None
-                notified_count = notified_counter[0]
 
-                # Send price drop notifications
+                # Wait for queued deliveries still in flight after analysis
                 t_notify = time.monotonic()
+                await dispatcher.drain()
+                notified_count = dispatcher.sent_count
+
+                # Send price drop notifications
                 price_drops = await storage.get_unsent_price_drops()
                 price_drop_count = 0
                 for drop in price_drops:
@@ -342,7 +331,6 @@ async def _run_pipeline_with_storage(
                     if success:
                         await storage.mark_price_drop_notified(drop["unique_id"])
                         price_drop_count += 1
-                        await asyncio.sleep(1)  # Telegram rate limit
                 if price_drop_count:
                     logger.info("price_drop_notifications_sent", count=price_drop_count)
                 notification_seconds = time.monotonic() - t_notify
@@ -369,6 +357,15 @@ async def _run_pipeline_with_storage(
                 # T4: prune old property events
                 await storage.pipeline.cleanup_old_events(settings.event_retention_runs)
 
+                # Spend a bounded slice of the run on the stalest/churniest listings
+                if settings.off_market_check_seconds:
+                    try:
+                        await check_off_market(
+                            storage, settings, time_budget=settings.off_market_check_seconds
+                        )
+                    except Exception:
+                        logger.warning("off_market_check_failed", exc_info=True)
+
                 logger.info(
                     "pipeline_complete",
                     notified=notified_count,
@@ -430,6 +427,7 @@ async def run_scrape_only(
         proxy_url=settings.proxy_url,
         only_scrapers=only_scrapers,
         zoopla_max_areas=settings.zoopla_max_areas_per_run,
+        concurrent=settings.concurrent_scraping,
     )
 
     logger.info("scrape_only_complete", count=len(all_properties))
@@ -517,6 +515,13 @@ def main() -> None:
         action="store_true",
         help="Check active properties for off-market removal signals via URL spot-check",
     )
+    parser.add_argument(
+        "--off-market-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="With --check-off-market: stop starting new checks after this many seconds",
+    )
     parser.add_argument(
         "--serve",
         action="store_true",
@@ -605,7 +610,11 @@ def main() -> None:
             )
         )
     elif args.check_off_market:
-        asyncio.run(run_check_off_market(settings, only_scrapers=only_scrapers))
+        asyncio.run(
+            run_check_off_market(
+                settings, only_scrapers=only_scrapers, time_budget=args.off_market_budget
+            )
+        )
     elif args.serve:
         import uvicorn
 
@@ -0,0 +1,102 @@
+"""Token-bucket rate limiting for Telegram Bot API calls.
+
+Telegram's documented limits are roughly 30 messages per second across all
+chats and one message per second within a single chat (short bursts are
+tolerated). Exceeding them earns a ``TelegramRetryAfter`` (HTTP 429) that
+pauses the whole bot, so the limiter also exposes ``backoff()`` to hold
+every sender until the flood-control window has passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Final
+
+from home_finder.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Telegram Bot API limits (https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this)
+GLOBAL_MESSAGES_PER_SECOND: Final = 30.0
+CHAT_MESSAGES_PER_SECOND: Final = 1.0
+CHAT_BURST: Final = 3
+
+
+class _TokenBucket:
+    """Classic token bucket: ``rate`` tokens/second, holding at most ``capacity``."""
+
+    __slots__ = ("_capacity", "_rate", "_tokens", "_updated")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate: Final = rate
+        self._capacity: Final = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+class TelegramRateLimiter:
+    """Paces Bot API calls against the global and per-chat limits.
+
+    ``acquire(chat_id)`` waits until both the global bucket and the chat's
+    bucket have a token. Acquisition is serialised with a lock, so waiters
+    are served in FIFO order. Designed for single-threaded asyncio.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_rate: float = GLOBAL_MESSAGES_PER_SECOND,
+        chat_rate: float = CHAT_MESSAGES_PER_SECOND,
+        chat_burst: int = CHAT_BURST,
+    ) -> None:
+        self._global = _TokenBucket(global_rate, global_rate)
+        self._chat_rate: Final = chat_rate
+        self._chat_burst: Final = chat_burst
+        self._chats: dict[int | str, _TokenBucket] = {}
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _chat_bucket(self, chat_id: int | str) -> _TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = self._chats[chat_id] = _TokenBucket(self._chat_rate, self._chat_burst)
+        return bucket
+
+    async def acquire(self, chat_id: int | str) -> None:
+        """Wait for permission to make one API call to ``chat_id``."""
+        async with self._lock:
+            chat = self._chat_bucket(chat_id)
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    self._blocked_until - now,
+                    self._global.wait_time(now),
+                    chat.wait_time(now),
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._global.take()
+            chat.take()
+
+    def backoff(self, seconds: float) -> None:
+        """Hold all callers for ``seconds`` (Telegram flood control)."""
+        until = time.monotonic() + seconds
+        if until > self._blocked_until:
+            self._blocked_until = until
+            logger.info("telegram_rate_limiter_backoff", seconds=seconds)
@@ -4,7 +4,8 @@ import asyncio
 import html
 import random
 import urllib.parse
-from typing import TYPE_CHECKING, Final
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol
 
 from aiogram.exceptions import (
     TelegramBadRequest,
@@ -25,10 +26,11 @@ from home_finder.models import (
     PropertyQualityAnalysis,
     TransportMode,
 )
+from home_finder.notifiers.rate_limit import TelegramRateLimiter
 
 if TYPE_CHECKING:
     from aiogram import Bot
-    from aiogram.types import FSInputFile, InlineKeyboardMarkup
+    from aiogram.types import FSInputFile, InlineKeyboardMarkup, Message
 
 logger = get_logger(__name__)
 
@@ -42,8 +44,15 @@ def _telegram_retry_wait(retry_state: RetryCallState) -> float:
 
 
 def _telegram_retry_log(retry_state: RetryCallState) -> None:
-    """Log flood control retry before sleeping."""
+    """Log flood control retry before sleeping, and pause the shared rate limiter."""
     exc = retry_state.outcome.exception() if retry_state.outcome else None
+    notifier = retry_state.args[0] if retry_state.args else None
+    if (
+        isinstance(exc, TelegramRetryAfter)
+        and isinstance(notifier, TelegramNotifier)
+        and notifier.rate_limiter is not None
+    ):
+        notifier.rate_limiter.backoff(exc.retry_after)
     logger.info(
         "flood_control_retry",
         retry_after=getattr(exc, "retry_after", None),
@@ -771,11 +780,39 @@ def _resolve_gallery_photos(
     return photos
 
 
+class TelegramFileIdStore(Protocol):
+    """Persistence for Telegram file_ids of uploaded cache images.
+
+    Implemented by ``PropertyStorage``. Paths are relative to the data
+    directory; sizes detect a cache file replaced under the same name.
+    Saves and deletes run on the background notification worker, so an
+    implementation sharing a connection must serialise them with its other
+    writes (``PropertyStorage`` takes its write lock).
+    """
+
+    async def get_telegram_file_ids(self, cache_paths: list[str]) -> dict[str, tuple[str, int]]: ...
+
+    async def save_telegram_file_ids(self, file_ids: dict[str, tuple[str, int]]) -> None: ...
+
+    async def delete_telegram_file_ids(self, cache_paths: list[str]) -> None: ...
+
+
+# index in the photo list -> (cache_path, file_size) for images being uploaded
+_Uploads = dict[int, tuple[str, int]]
+
+
 class TelegramNotifier:
     """Send property notifications via Telegram."""
 
     def __init__(
-        self, *, bot_token: str, chat_id: int, web_base_url: str = "", data_dir: str = ""
+        self,
+        *,
+        bot_token: str,
+        chat_id: int,
+        web_base_url: str = "",
+        data_dir: str = "",
+        rate_limiter: TelegramRateLimiter | None = None,
+        file_id_store: TelegramFileIdStore | None = None,
     ) -> None:
         """Initialize the notifier.
 
@@ -784,13 +821,98 @@ class TelegramNotifier:
             chat_id: Chat ID to send notifications to.
             web_base_url: Base URL for web dashboard (optional).
             data_dir: Base data directory for image cache (optional).
+            rate_limiter: Paces every Bot API call (optional; unpaced if None).
+            file_id_store: Remembers file_ids of uploaded cache images so
+                later sends reuse them instead of re-uploading (optional).
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.web_base_url = web_base_url.rstrip("/") if web_base_url else ""
         self.data_dir = data_dir
+        self.rate_limiter = rate_limiter
+        self.file_id_store = file_id_store
         self._bot: Bot | None = None
 
+    async def _throttle(self) -> None:
+        """Wait for the rate limiter before a Bot API call."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.chat_id)
+
+    def _cache_key(self, photo: "FSInputFile") -> tuple[str, int] | None:
+        """(path relative to data_dir, size) identifying a cached image file."""
+        try:
+            path = Path(photo.path)
+            return path.relative_to(self.data_dir).as_posix(), path.stat().st_size
+        except (ValueError, OSError):
+            return None
+
+    async def _reuse_file_ids(
+        self, photos: "list[FSInputFile | str]"
+    ) -> "tuple[list[FSInputFile | str], _Uploads, list[str]]":
+        """Replace cached-image uploads with file_ids Telegram already has.
+
+        Returns:
+            Tuple of (photos to send, uploads still needed, cache paths that
+            were swapped for a stored file_id).
+        """
+        if self.file_id_store is None:
+            return photos, {}, []
+
+        from aiogram.types import FSInputFile
+
+        keys: _Uploads = {}
+        for i, photo in enumerate(photos):
+            if isinstance(photo, FSInputFile) and (key := self._cache_key(photo)):
+                keys[i] = key
+        if not keys:
+            return photos, {}, []
+
+        try:
+            known = await self.file_id_store.get_telegram_file_ids(
+                [path for path, _ in keys.values()]
+            )
+        except Exception:
+            logger.warning("telegram_file_id_lookup_failed", exc_info=True)
+            known = {}
+
+        resolved = list(photos)
+        uploads: _Uploads = {}
+        reused: list[str] = []
+        for i, (path, size) in keys.items():
+            hit = known.get(path)
+            if hit is not None and hit[1] == size:
+                resolved[i] = hit[0]
+                reused.append(path)
+            else:
+                uploads[i] = (path, size)
+        if reused:
+            logger.debug("telegram_file_ids_reused", reused=len(reused), uploads=len(uploads))
+        return resolved, uploads, reused
+
+    async def _remember_file_ids(self, uploads: _Uploads, messages: "list[Message]") -> None:
+        """Store the file_id Telegram assigned to each uploaded image."""
+        if self.file_id_store is None or not uploads:
+            return
+        file_ids: dict[str, tuple[str, int]] = {}
+        for i, (path, size) in uploads.items():
+            sizes = messages[i].photo if i < len(messages) else None
+            if sizes:
+                # Largest size last; its file_id re-sends the full image
+                file_ids[path] = (sizes[-1].file_id, size)
+        try:
+            await self.file_id_store.save_telegram_file_ids(file_ids)
+        except Exception:
+            logger.warning("telegram_file_id_save_failed", exc_info=True)
+
+    async def _forget_file_ids(self, cache_paths: list[str]) -> None:
+        """Drop file_ids after Telegram rejected a send that used them."""
+        if self.file_id_store is None or not cache_paths:
+            return
+        try:
+            await self.file_id_store.delete_telegram_file_ids(cache_paths)
+        except Exception:
+            logger.warning("telegram_file_id_delete_failed", exc_info=True)
+
     def _get_bot(self) -> "Bot":
         """Get or create the bot instance."""
         if self._bot is None:
@@ -845,6 +967,7 @@ class TelegramNotifier:
 
             from aiogram.types import LinkPreviewOptions
 
+            await self._throttle()
             await bot.send_message(
                 chat_id=self.chat_id,
                 text=message,
@@ -932,6 +1055,7 @@ class TelegramNotifier:
             gallery_urls = _get_gallery_urls(merged)
 
             sent_photo = False
+            reused_file_ids: list[str] = []
             if gallery_urls:
                 caption = format_merged_property_caption(
                     merged,
@@ -948,6 +1072,7 @@ class TelegramNotifier:
                             self.data_dir,
                             prefer_thumbnail=False,
                         )
+                        photos, uploads, reused_file_ids = await self._reuse_file_ids(photos)
                         followup_text = _format_followup_detail(
                             quality_analysis=quality_analysis,
                         )
@@ -956,6 +1081,7 @@ class TelegramNotifier:
                             caption=caption,
                             keyboard=keyboard,
                             followup_text=followup_text,
+                            uploads=uploads,
                         )
                     else:
                         # Single hero image — thumbnail is fine (faster upload)
@@ -969,16 +1095,22 @@ class TelegramNotifier:
                             if self.data_dir
                             else gallery_urls[0]
                         )
-                        await bot.send_photo(
+                        (photo,), uploads, reused_file_ids = await self._reuse_file_ids([photo])
+                        await self._throttle()
+                        sent = await bot.send_photo(
                             chat_id=self.chat_id,
                             photo=photo,
                             caption=caption,
                             reply_markup=keyboard,
                         )
+                        await self._remember_file_ids(uploads, [sent])
                         sent_photo = True
                 except TelegramRetryAfter:
                     raise  # Let the outer handler retry the whole notification
                 except Exception as photo_err:
+                    if reused_file_ids and isinstance(photo_err, TelegramBadRequest):
+                        # Stale file_id: forget it so the next attempt re-uploads
+                        await self._forget_file_ids(reused_file_ids)
                     logger.warning(
                         "send_photo_failed_falling_back_to_text",
                         property_id=merged.unique_id,
@@ -994,6 +1126,7 @@ class TelegramNotifier:
                     transport_mode=transport_mode,
                     quality_analysis=quality_analysis,
                 )
+                await self._throttle()
                 await bot.send_message(
                     chat_id=self.chat_id,
                     text=message,
@@ -1003,6 +1136,7 @@ class TelegramNotifier:
             # Venue pin only for high-rated properties (reduces message sprawl)
             prop = merged.canonical
             if is_high_rated and prop.latitude is not None and prop.longitude is not None:
+                await self._throttle()
                 await bot.send_venue(
                     chat_id=self.chat_id,
                     latitude=prop.latitude,
@@ -1063,6 +1197,7 @@ class TelegramNotifier:
         caption: str,
         keyboard: "InlineKeyboardMarkup",
         followup_text: str = "",
+        uploads: _Uploads | None = None,
     ) -> bool:
         """Send a media group (album) of images with caption on the first photo.
 
@@ -1075,6 +1210,7 @@ class TelegramNotifier:
             caption: Caption for the first photo.
             keyboard: Inline keyboard to send in follow-up message.
             followup_text: Full analysis text for follow-up (up to 4096 chars).
+            uploads: Cached images being uploaded, whose file_ids to remember.
 
         Returns:
             True if the media group was sent successfully.
@@ -1089,11 +1225,15 @@ class TelegramNotifier:
                 builder.add_photo(media=item)
 
         bot = self._get_bot()
-        await bot.send_media_group(chat_id=self.chat_id, media=builder.build())
+        await self._throttle()
+        messages = await bot.send_media_group(chat_id=self.chat_id, media=builder.build())
+        if uploads:
+            await self._remember_file_ids(uploads, messages)
 
         # Media groups don't support inline keyboards, so send a follow-up
         # message with full analysis + buttons
         text = followup_text if followup_text else "Tap Details for full analysis 👆"
+        await self._throttle()
         await bot.send_message(
             chat_id=self.chat_id,
             text=text,
@@ -1136,6 +1276,7 @@ class TelegramNotifier:
         """
         try:
             bot = self._get_bot()
+            await self._throttle()
             await bot.send_message(
                 chat_id=self.chat_id,
                 text=html.escape(message),
@@ -1210,6 +1351,7 @@ class TelegramNotifier:
 
         try:
             bot = self._get_bot()
+            await self._throttle()
             await bot.send_message(
                 chat_id=self.chat_id,
                 text="\n".join(lines),
@@ -14,6 +14,7 @@ from home_finder.pipeline.analysis import (
     run_reanalysis,
 )
 from home_finder.pipeline.commands import (
+    check_off_market,
     run_backfill_commute,
     run_check_off_market,
     run_dedup_existing,
@@ -66,6 +67,7 @@ __all__ = [
     "_run_scrape",
     "_save_one",
     "_source_counts",
+    "check_off_market",
     "run_backfill_commute",
     "run_check_off_market",
     "run_dedup_existing",
@@ -123,49 +123,78 @@ async def _save_one(
 
 
 async def _lookup_wards(storage: PropertyStorage) -> None:
-    """Look up ward names via postcodes.io for properties missing them."""
+    """Look up ward names via postcodes.io for properties missing them.
+
+    Wards already known for a postcode come from ``postcode_wards`` without
+    a request. Full postcodes are then looked up forward in bulk (and
+    remembered), concurrently with a bulk reverse geocode for properties
+    that only have coordinates or whose postcode is cached as unknown.
+    """
     from home_finder.utils.postcode_lookup import (
+        bulk_lookup_wards,
         bulk_reverse_lookup_wards,
-        lookup_ward,
+        normalize_postcode,
     )
 
     props = await storage.get_properties_without_ward()
     if not props:
         return
 
-    # Split into coordinate-based (reverse geocode) and full-postcode (forward)
+    # Split into full-postcode (forward, cacheable) and coordinate-only (reverse)
     coord_props: list[dict[str, object]] = []
     postcode_props: list[dict[str, object]] = []
     for p in props:
-        if p.get("latitude") and p.get("longitude"):
+        if p.get("postcode_invalid"):
+            # Cached as unknown to postcodes.io: go straight to coordinates
             coord_props.append(p)
-        elif p.get("postcode") and " " in str(p["postcode"]):
+        elif p.get("postcode") and " " in str(p["postcode"]).strip():
             # Full postcode has a space (e.g. "E8 3RH")
             postcode_props.append(p)
+        elif p.get("latitude") and p.get("longitude"):
+            coord_props.append(p)
 
     ward_map: dict[str, str] = {}
 
+    def _coords(rows: list[dict[str, object]]) -> list[tuple[float, float]]:
+        return [
+            (float(p["latitude"]), float(p["longitude"]))  # type: ignore[arg-type]
+            for p in rows
+        ]
+
     async with httpx.AsyncClient(timeout=30) as client:
-        # Bulk reverse geocode for properties with coordinates
-        if coord_props:
-            coords = [
-                (float(p["latitude"]), float(p["longitude"]))  # type: ignore[arg-type]
-                for p in coord_props
-            ]
-            wards = await bulk_reverse_lookup_wards(coords, client=client)
-            for p, ward in zip(coord_props, wards, strict=True):
-                if ward:
-                    ward_map[str(p["unique_id"])] = ward
+        postcodes = [str(p["postcode"]) for p in postcode_props]
+        reverse_wards, forward_wards = await asyncio.gather(
+            bulk_reverse_lookup_wards(_coords(coord_props), client=client),
+            bulk_lookup_wards(postcodes, client=client),
+        )
+        for p, ward in zip(coord_props, reverse_wards, strict=True):
+            if ward:
+                ward_map[str(p["unique_id"])] = ward
 
-        # Forward lookup for properties with full postcodes (no coordinates)
+        # Unknown or failed postcodes fall back to coordinates where available
+        retry: list[dict[str, object]] = []
         for p in postcode_props:
-            ward = await lookup_ward(str(p["postcode"]), client=client)
+            ward = forward_wards.get(normalize_postcode(str(p["postcode"])))
             if ward:
                 ward_map[str(p["unique_id"])] = ward
+            elif p.get("latitude") and p.get("longitude"):
+                retry.append(p)
+        if retry:
+            wards = await bulk_reverse_lookup_wards(_coords(retry), client=client)
+            for p, ward in zip(retry, wards, strict=True):
+                if ward:
+                    ward_map[str(p["unique_id"])] = ward
 
+    await storage.save_postcode_wards(forward_wards)
     if ward_map:
         updated = await storage.update_wards(ward_map)
-        logger.info("ward_lookup_complete", updated=updated, total=len(props))
+        logger.info(
+            "ward_lookup_complete",
+            updated=updated,
+            total=len(props),
+            postcodes_looked_up=len(forward_wards),
+            reverse_geocoded=len(coord_props) + len(retry),
+        )
 
 
 async def _run_concurrent_analysis(
@@ -3,16 +3,22 @@
 import contextlib
 import json
 import time
+from typing import Final
 
 from home_finder.config import Settings
 from home_finder.db import PropertyStorage
 from home_finder.filters import CommuteFilter, Deduplicator
+from home_finder.filters.commute import best_commutes
 from home_finder.logging import get_logger
-from home_finder.models import TransportMode
+from home_finder.models import MergedProperty
 from home_finder.utils.image_cache import clear_image_cache, copy_cached_images
+from home_finder.utils.image_pool import image_pool
 
 logger = get_logger(__name__)
 
+# job_checkpoints key for run_dedup_existing's resume position
+_DEDUP_EXISTING_JOB: Final = "dedup_existing"
+
 
 async def run_backfill_commute(settings: Settings) -> None:
     """Backfill commute data for properties that have coordinates but no commute_minutes.
@@ -40,24 +46,16 @@ async def run_backfill_commute(settings: Settings) -> None:
             app_id=settings.traveltime_app_id,
             api_key=settings.traveltime_api_key.get_secret_value(),
             destination_postcode=criteria.destination_postcode,
+            cache=storage,
+            isochrones=storage if settings.commute_isochrones else None,
         )
 
-        commute_lookup: dict[str, tuple[int, TransportMode]] = {}
-        for mode in criteria.transport_modes:
-            results = await commute_filter.filter_properties(
-                properties,
-                max_minutes=criteria.max_commute_minutes,
-                transport_mode=mode,
-            )
-            for result in results:
-                if result.within_limit and (
-                    result.property_id not in commute_lookup
-                    or result.travel_time_minutes < commute_lookup[result.property_id][0]
-                ):
-                    commute_lookup[result.property_id] = (
-                        result.travel_time_minutes,
-                        result.transport_mode,
-                    )
+        results = await commute_filter.filter_properties_by_modes(
+            properties,
+            max_minutes=criteria.max_commute_minutes,
+            transport_modes=criteria.transport_modes,
+        )
+        commute_lookup = best_commutes(results)
 
         if not commute_lookup:
             logger.info("no_properties_within_commute_limit")
@@ -71,6 +69,29 @@ async def run_check_off_market(
     settings: Settings,
     *,
     only_scrapers: set[str] | None = None,
+    time_budget: float | None = None,
+) -> None:
+    """Check active properties for off-market removal/let-agreed signals.
+
+    Opens its own storage; see ``check_off_market`` for the behaviour.
+
+    Args:
+        settings: Application settings.
+        only_scrapers: If set, only check URLs for these platforms.
+        time_budget: Stop starting new checks after this many seconds.
+    """
+    async with PropertyStorage(settings.database_path) as storage:
+        await check_off_market(
+            storage, settings, only_scrapers=only_scrapers, time_budget=time_budget
+        )
+
+
+async def check_off_market(
+    storage: PropertyStorage,
+    settings: Settings,
+    *,
+    only_scrapers: set[str] | None = None,
+    time_budget: float | None = None,
 ) -> None:
     """Check active properties for off-market removal/let-agreed signals.
 
@@ -80,251 +101,320 @@ async def run_check_off_market(
     For legacy golden records without source_listings linkage, falls back to
     aggregating check results directly (the previous behaviour).
 
+    Properties are checked in churn-priority order (see
+    ``get_properties_for_off_market_check``). With a ``time_budget`` the
+    remainder is left unstamped, so it leads the next run's queue. URLs skipped
+    by a tripped circuit breaker are treated the same way. A property with any
+    unchecked source keeps its golden status until all of its sources have
+    been checked.
+
     Args:
+        storage: Open property storage.
         settings: Application settings.
         only_scrapers: If set, only check URLs for these platforms.
+        time_budget: Stop starting new checks after this many seconds.
     """
     from home_finder.filters.off_market import ListingStatus, OffMarketChecker
 
-    async with PropertyStorage(settings.database_path) as storage:
-        db_props = await storage.get_properties_for_off_market_check(
-            sources=only_scrapers,
-        )
-        if not db_props:
-            logger.info("no_properties_for_off_market_check")
-            return
+    db_props = await storage.get_properties_for_off_market_check(
+        sources=only_scrapers,
+    )
+    if not db_props:
+        logger.info("no_properties_for_off_market_check")
+        return
 
-        logger.info("off_market_check_started", count=len(db_props))
-
-        # Build check list — prefer source_listings, fall back to source_urls JSON
-        # Each check: (property_id, source, url)
-        # Also track which checks map to a source_listing unique_id
-        checks: list[tuple[str, str, str]] = []
-        # Map (property_id, source, url) -> source_listing unique_id (if linked)
-        sl_lookup: dict[tuple[str, str, str], str] = {}
-
-        for prop in db_props:
-            linked_sls: list[dict[str, object]] = prop.get("source_listings", [])
-            covered_urls: set[str] = set()
-
-            if linked_sls:
-                # Source_listings-first path
-                for sl in linked_sls:
-                    source = str(sl["source"])
-                    url = str(sl["url"])
-                    sl_uid = str(sl["unique_id"])
-                    covered_urls.add(url)
-                    if only_scrapers and source not in only_scrapers:
-                        continue
-                    key = (prop["unique_id"], source, url)
-                    checks.append(key)
-                    sl_lookup[key] = sl_uid
-
-            # Also check source_urls JSON for any URLs not covered by linked rows.
-            # This handles partial linkage — e.g. property merged from OpenRent +
-            # Zoopla where only OpenRent has a source_listings row.
-            source_urls: dict[str, str] = {}
-            if prop.get("source_urls"):
-                with contextlib.suppress(json.JSONDecodeError, TypeError):
-                    source_urls = json.loads(prop["source_urls"])
-
-            if source_urls:
-                for source, url in source_urls.items():
-                    if url in covered_urls:
-                        continue
-                    if only_scrapers and source not in only_scrapers:
-                        continue
-                    checks.append((prop["unique_id"], source, url))
-            elif not linked_sls:
-                # No source_listings and no source_urls — use primary source/url
-                source = prop["source"]
+    logger.info("off_market_check_started", count=len(db_props), time_budget_s=time_budget)
+
+    # Build check list — prefer source_listings, fall back to source_urls JSON
+    # Each check: (property_id, source, url)
+    # Also track which checks map to a source_listing unique_id
+    checks: list[tuple[str, str, str]] = []
+    # Map (property_id, source, url) -> source_listing unique_id (if linked)
+    sl_lookup: dict[tuple[str, str, str], str] = {}
+
+    for prop in db_props:
+        linked_sls: list[dict[str, object]] = prop.get("source_listings", [])
+        covered_urls: set[str] = set()
+
+        if linked_sls:
+            # Source_listings-first path
+            for sl in linked_sls:
+                source = str(sl["source"])
+                url = str(sl["url"])
+                sl_uid = str(sl["unique_id"])
+                covered_urls.add(url)
                 if only_scrapers and source not in only_scrapers:
                     continue
-                checks.append((prop["unique_id"], source, prop["url"]))
-
-        if not checks:
-            logger.info("no_urls_to_check", reason="source filter may have excluded all")
-            return
-
-        logger.info("off_market_checking_urls", urls=len(checks), properties=len(db_props))
-
-        check_t0 = time.monotonic()
-        async with OffMarketChecker(proxy_url=settings.proxy_url) as checker:
-            batch = await checker.check_batch(checks)
-        check_elapsed = round(time.monotonic() - check_t0, 1)
-
-        results = batch.results
-
-        # --- Persist per-source results on source_listings ---
-        for r in results:
-            key = (r.property_id, r.source, r.url)
-            checked_sl_uid = sl_lookup.get(key)
-            if checked_sl_uid:
-                # Stamp last_checked_at regardless of result
-                await storage.update_source_listing_last_checked(checked_sl_uid)
-
-                if r.status == ListingStatus.REMOVED:
-                    await storage.mark_source_listing_off_market(checked_sl_uid, "removed")
-                elif r.status == ListingStatus.LET_AGREED:
-                    await storage.mark_source_listing_off_market(checked_sl_uid, "let_agreed")
-                elif r.status == ListingStatus.ACTIVE:
-                    await storage.mark_source_listing_active(checked_sl_uid)
-                # UNKNOWN: no change to off-market flags
-
-        # --- Derive golden record status ---
-        # "Not active" means REMOVED or LET_AGREED
-        def _is_inactive(s: ListingStatus) -> bool:
-            return s in (ListingStatus.REMOVED, ListingStatus.LET_AGREED)
-
-        per_property: dict[str, dict[str, ListingStatus]] = {}
-        for r in results:
-            per_property.setdefault(r.property_id, {})[r.source] = r.status
-
-        marked_off = 0
-        marked_returned = 0
-        for prop in db_props:
-            uid = prop["unique_id"]
-            source_statuses = per_property.get(uid, {})
-            if not source_statuses:
+                key = (prop["unique_id"], source, url)
+                checks.append(key)
+                sl_lookup[key] = sl_uid
+
+        # Also check source_urls JSON for any URLs not covered by linked rows.
+        # This handles partial linkage — e.g. property merged from OpenRent +
+        # Zoopla where only OpenRent has a source_listings row.
+        source_urls: dict[str, str] = {}
+        if prop.get("source_urls"):
+            with contextlib.suppress(json.JSONDecodeError, TypeError):
+                source_urls = json.loads(prop["source_urls"])
+
+        if source_urls:
+            for source, url in source_urls.items():
+                if url in covered_urls:
+                    continue
+                if only_scrapers and source not in only_scrapers:
+                    continue
+                checks.append((prop["unique_id"], source, url))
+        elif not linked_sls:
+            # No source_listings and no source_urls — use primary source/url
+            source = prop["source"]
+            if only_scrapers and source not in only_scrapers:
                 continue
+            checks.append((prop["unique_id"], source, prop["url"]))
 
-            has_active = any(s == ListingStatus.ACTIVE for s in source_statuses.values())
-            all_inactive = all(_is_inactive(s) for s in source_statuses.values())
-            was_off_market = bool(prop.get("is_off_market"))
-
-            # Determine reason from the first inactive source
-            reason: str | None = None
-            if all_inactive:
-                for _s, st in source_statuses.items():
-                    if st == ListingStatus.LET_AGREED:
-                        reason = "let_agreed"
-                        break
-                    if st == ListingStatus.REMOVED:
-                        reason = "removed"
-                        break
-
-            if all_inactive:
-                if not was_off_market:
-                    await storage.mark_off_market(uid, reason=reason)
-                    marked_off += 1
-                    logger.info(
-                        "property_confirmed_off_market",
-                        unique_id=uid,
-                        reason=reason,
-                        sources=list(source_statuses.keys()),
-                    )
-            elif has_active and was_off_market:
-                await storage.mark_returned_to_market(uid)
-                marked_returned += 1
+    if not checks:
+        logger.info("no_urls_to_check", reason="source filter may have excluded all")
+        return
+
+    logger.info("off_market_checking_urls", urls=len(checks), properties=len(db_props))
+
+    check_t0 = time.monotonic()
+    async with OffMarketChecker(proxy_url=settings.proxy_url) as checker:
+        batch = await checker.check_batch(checks, time_budget=time_budget)
+    check_elapsed = round(time.monotonic() - check_t0, 1)
+
+    results = batch.results
+
+    # --- Persist per-source results on source_listings ---
+    for r in results:
+        key = (r.property_id, r.source, r.url)
+        checked_sl_uid = sl_lookup.get(key)
+        if checked_sl_uid:
+            # Stamp last_checked_at regardless of result
+            await storage.update_source_listing_last_checked(checked_sl_uid)
+
+            if r.status == ListingStatus.REMOVED:
+                await storage.mark_source_listing_off_market(checked_sl_uid, "removed")
+            elif r.status == ListingStatus.LET_AGREED:
+                await storage.mark_source_listing_off_market(checked_sl_uid, "let_agreed")
+            elif r.status == ListingStatus.ACTIVE:
+                await storage.mark_source_listing_active(checked_sl_uid)
+            # UNKNOWN: no change to off-market flags
+
+    # --- Derive golden record status ---
+    # "Not active" means REMOVED or LET_AGREED
+    def _is_inactive(s: ListingStatus) -> bool:
+        return s in (ListingStatus.REMOVED, ListingStatus.LET_AGREED)
+
+    per_property: dict[str, dict[str, ListingStatus]] = {}
+    for r in results:
+        per_property.setdefault(r.property_id, {})[r.source] = r.status
+
+    # A property with a source never requested (time budget or tripped
+    # circuit breaker) is only partly checked: its golden status and
+    # last_checked_at wait for the next run.
+    partly_checked = {prop_id for prop_id, _source, _url in batch.unchecked}
+
+    marked_off = 0
+    marked_returned = 0
+    for prop in db_props:
+        uid = prop["unique_id"]
+        source_statuses = per_property.get(uid, {})
+        if not source_statuses or uid in partly_checked:
+            continue
+
+        has_active = any(s == ListingStatus.ACTIVE for s in source_statuses.values())
+        all_inactive = all(_is_inactive(s) for s in source_statuses.values())
+        was_off_market = bool(prop.get("is_off_market"))
+
+        # Determine reason from the first inactive source
+        reason: str | None = None
+        if all_inactive:
+            for _s, st in source_statuses.items():
+                if st == ListingStatus.LET_AGREED:
+                    reason = "let_agreed"
+                    break
+                if st == ListingStatus.REMOVED:
+                    reason = "removed"
+                    break
+
+        if all_inactive:
+            if not was_off_market:
+                await storage.mark_off_market(uid, reason=reason)
+                marked_off += 1
                 logger.info(
-                    "property_returned_to_market",
+                    "property_confirmed_off_market",
                     unique_id=uid,
-                    active_sources=[
-                        s for s, st in source_statuses.items() if st == ListingStatus.ACTIVE
-                    ],
+                    reason=reason,
+                    sources=list(source_statuses.keys()),
                 )
+        elif has_active and was_off_market:
+            await storage.mark_returned_to_market(uid)
+            marked_returned += 1
+            logger.info(
+                "property_returned_to_market",
+                unique_id=uid,
+                active_sources=[
+                    s for s, st in source_statuses.items() if st == ListingStatus.ACTIVE
+                ],
+            )
 
-            # Stamp last_checked_at on golden record
-            await storage.update_property_last_checked(uid)
-
-        # Summary
-        status_counts = {s.value: 0 for s in ListingStatus}
-        for r in results:
-            status_counts[r.status.value] += 1
-
-        logger.info(
-            "off_market_check_complete",
-            status_counts=status_counts,
-            marked_off=marked_off,
-            marked_returned=marked_returned,
-            by_source=batch.by_source,
-            elapsed_s=check_elapsed,
-            circuit_breakers_tripped=batch.circuit_breakers_tripped,
+        # Stamp last_checked_at on golden record
+        await storage.update_property_last_checked(uid)
+
+    # Summary
+    status_counts = {s.value: 0 for s in ListingStatus}
+    for r in results:
+        status_counts[r.status.value] += 1
+
+    logger.info(
+        "off_market_check_complete",
+        status_counts=status_counts,
+        marked_off=marked_off,
+        marked_returned=marked_returned,
+        by_source=batch.by_source,
+        elapsed_s=check_elapsed,
+        circuit_breakers_tripped=batch.circuit_breakers_tripped,
+        unchecked=len(batch.unchecked),
+        partly_checked=len(partly_checked),
+    )
+
+
+def _absorbed_by_anchor(
+    inputs: list[MergedProperty], results: list[MergedProperty]
+) -> list[tuple[MergedProperty, list[str]]]:
+    """Pair each merged result with the input unique_ids it absorbed.
+
+    Input source URLs are indexed once, so the mapping is linear in the
+    number of URLs rather than results x absorbed x inputs.
+    """
+    output_ids = {m.canonical.unique_id for m in results}
+    owner_by_url = {
+        str(url): mp.canonical.unique_id
+        for mp in inputs
+        if mp.canonical.unique_id not in output_ids
+        for url in mp.source_urls.values()
+    }
+    merges: list[tuple[MergedProperty, list[str]]] = []
+    for merged in results:
+        absorbed = list(
+            dict.fromkeys(
+                owner_by_url[url]
+                for url in map(str, merged.source_urls.values())
+                if url in owner_by_url
+            )
         )
+        if absorbed:
+            merges.append((merged, absorbed))
+    return merges
 
 
 async def run_dedup_existing(settings: Settings) -> None:
     """Retroactively merge duplicate properties already in the database.
 
-    Loads all stored properties, runs the deduplicator, and merges any
-    cross-platform duplicates that were ingested before image hashing was enabled.
+    Merges cross-platform duplicates that were ingested before image hashing
+    was enabled. Works one dedup block (outcode + bedrooms) at a time: each
+    block is loaded, deduplicated and written back in its own transaction, so
+    memory is bounded by the largest block rather than the whole table. The
+    last committed block is checkpointed, and an interrupted run resumes
+    after it.
     """
-    async with PropertyStorage(settings.database_path) as storage:
-        # Load all properties from DB
-        all_properties = await storage.get_recent_properties_for_dedup(days=None)
-        if not all_properties:
+    async with (
+        PropertyStorage(settings.database_path) as storage,
+        image_pool(settings.image_workers),
+    ):
+        blocks = await storage.get_dedup_blocks()
+        if not blocks:
             logger.info("dedup_no_properties_in_database")
             return
 
-        logger.info("dedup_started", count=len(all_properties))
-
-        # Build lookup of input IDs
-        input_ids = {m.canonical.unique_id for m in all_properties}
+        resume_after = await storage.get_job_checkpoint(_DEDUP_EXISTING_JOB)
+        # Single-listing blocks have nothing to merge with
+        pending = [
+            (block_key, unique_ids)
+            for block_key, unique_ids in blocks.items()
+            if len(unique_ids) > 1 and (resume_after is None or block_key > resume_after)
+        ]
+        total = sum(len(unique_ids) for unique_ids in blocks.values())
+        logger.info(
+            "dedup_started",
+            count=total,
+            blocks=len(pending),
+            resumed_after=resume_after,
+        )
 
-        # Run deduplication
         deduplicator = Deduplicator(
             enable_cross_platform=True,
             enable_image_hashing=settings.enable_image_hash_matching,
             data_dir=settings.data_dir,
+            storage=storage,
         )
-        dedup_results = await deduplicator.deduplicate_merged_async(all_properties)
 
-        # Determine which IDs survived and which were absorbed
-        output_ids = {m.canonical.unique_id for m in dedup_results}
-        absorbed_ids = input_ids - output_ids
-
-        if not absorbed_ids:
-            logger.info("dedup_no_duplicates_found")
-            return
-
-        # For each merged result that absorbed other properties, update the DB
         merged_count = 0
-        for merged in dedup_results:
-            # Find which input properties were absorbed into this result
-            merged_source_urls = {str(u) for u in merged.source_urls.values()}
-            absorbed_into_this: list[str] = []
-            for aid in absorbed_ids:
-                # Check if any of the absorbed property's URLs appear in this merged result
-                for orig in all_properties:
-                    if orig.canonical.unique_id == aid:
-                        orig_urls = {str(u) for u in orig.source_urls.values()}
-                        if orig_urls & merged_source_urls:
-                            absorbed_into_this.append(aid)
-                        break
-
-            if not absorbed_into_this:
-                continue
-
-            anchor_id = merged.canonical.unique_id
-            # Update DB anchor with merged sources
-            await storage.update_merged_sources(anchor_id, merged, absorbed_ids=absorbed_into_this)
-
-            # Copy cached images and delete absorbed properties
-            for absorbed_id in absorbed_into_this:
-                if settings.data_dir:
-                    copied = copy_cached_images(settings.data_dir, absorbed_id, anchor_id)
-                    if copied:
-                        logger.info(
-                            "dedup_images_copied",
-                            from_id=absorbed_id,
-                            to_id=anchor_id,
-                            count=copied,
+        absorbed_count = 0
+        scanned = 0
+        started = time.monotonic()
+        for block_key, unique_ids in pending:
+            block_started = time.monotonic()
+            block = await storage.get_properties_for_dedup(unique_ids)
+            dedup_results = await deduplicator.deduplicate_merged_async(block)
+            merges = _absorbed_by_anchor(block, dedup_results)
+
+            # Copy images before the commit so a crash never loses the only copy
+            if settings.data_dir:
+                for merged, absorbed_ids in merges:
+                    for absorbed_id in absorbed_ids:
+                        copied = copy_cached_images(
+                            settings.data_dir, absorbed_id, merged.canonical.unique_id
                         )
-                await storage.delete_property(absorbed_id)
-                if settings.data_dir:
-                    clear_image_cache(settings.data_dir, absorbed_id)
-                logger.info(
-                    "dedup_property_absorbed",
-                    absorbed_id=absorbed_id,
-                    anchor_id=anchor_id,
-                )
+                        if copied:
+                            logger.info(
+                                "dedup_images_copied",
+                                from_id=absorbed_id,
+                                to_id=merged.canonical.unique_id,
+                                count=copied,
+                            )
+
+            await storage.commit_dedup_block(merges, job=_DEDUP_EXISTING_JOB, block_key=block_key)
+
+            block_absorbed = 0
+            for merged, absorbed_ids in merges:
+                for absorbed_id in absorbed_ids:
+                    if settings.data_dir:
+                        clear_image_cache(settings.data_dir, absorbed_id)
+                    logger.info(
+                        "dedup_property_absorbed",
+                        absorbed_id=absorbed_id,
+                        anchor_id=merged.canonical.unique_id,
+                    )
+                block_absorbed += len(absorbed_ids)
+
+            merged_count += len(merges)
+            absorbed_count += block_absorbed
+            scanned += len(block)
+            elapsed = time.monotonic() - block_started
+            logger.info(
+                "dedup_block_complete",
+                block=block_key,
+                properties=len(block),
+                merged_groups=len(merges),
+                absorbed=block_absorbed,
+                elapsed_ms=round(elapsed * 1000),
+                properties_per_second=round(len(block) / elapsed, 1) if elapsed > 0 else None,
+            )
+
+        await storage.clear_job_checkpoint(_DEDUP_EXISTING_JOB)
 
-            merged_count += 1
+        if not absorbed_count:
+            logger.info("dedup_no_duplicates_found", blocks=len(pending), scanned=scanned)
+            return
 
-        remaining = len(all_properties) - len(absorbed_ids)
+        elapsed = time.monotonic() - started
         logger.info(
             "dedup_complete",
             merged_groups=merged_count,
-            absorbed=len(absorbed_ids),
-            remaining=remaining,
+            absorbed=absorbed_count,
+            remaining=total - absorbed_count,
+            blocks=len(pending),
+            elapsed_s=round(elapsed, 1),
+            properties_per_second=round(scanned / elapsed, 1) if elapsed > 0 else None,
         )
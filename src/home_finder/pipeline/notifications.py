@@ -0,0 +1,166 @@
+"""Background Telegram delivery for the live pipeline.
+
+Analysis results are persisted first (``notification_status = 'pending'``)
+and then handed to a ``NotificationDispatcher``, whose single worker drains
+an in-memory queue while analysis carries on. The ``notification_status``
+column is the durable record: anything still pending or failed when a run
+ends — including after a crash — is re-queued by the next run's step 0.
+Pacing is left to the notifier's ``TelegramRateLimiter``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from home_finder.logging import get_logger
+from home_finder.pipeline.event_recorder import EventRecorder, PropertyEvent
+
+if TYPE_CHECKING:
+    from home_finder.db import PropertyStorage
+    from home_finder.models import (
+        MergedProperty,
+        PropertyQualityAnalysis,
+        TrackedProperty,
+        TransportMode,
+    )
+    from home_finder.notifiers import TelegramNotifier
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Delivery:
+    """One queued notification: what to send and how to record the outcome."""
+
+    unique_id: str
+    source: str
+    send: Callable[[], Awaitable[bool]]
+    is_retry: bool = False
+
+
+class NotificationDispatcher:
+    """Delivers property notifications from a queue, off the analysis path.
+
+    Usage::
+
+        async with NotificationDispatcher(notifier, storage) as dispatcher:
+            dispatcher.submit(merged, commute_info, analysis)
+            ...
+        # exit waits for the queue to drain
+        dispatcher.sent_count
+    """
+
+    def __init__(
+        self,
+        notifier: TelegramNotifier,
+        storage: PropertyStorage,
+        *,
+        recorder: EventRecorder | None = None,
+    ) -> None:
+        self._notifier = notifier
+        self._storage = storage
+        self._recorder = recorder
+        self._queue: asyncio.Queue[_Delivery] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        self.sent_count = 0
+        self.failed_count = 0
+
+    def submit(
+        self,
+        merged: MergedProperty,
+        commute_info: tuple[int, TransportMode] | None,
+        quality_analysis: PropertyQualityAnalysis | None,
+    ) -> None:
+        """Queue a freshly analysed property. Returns immediately."""
+        commute_minutes = commute_info[0] if commute_info else None
+        transport_mode = commute_info[1] if commute_info else None
+
+        async def _send() -> bool:
+            return await self._notifier.send_merged_property_notification(
+                merged,
+                commute_minutes=commute_minutes,
+                transport_mode=transport_mode,
+                quality_analysis=quality_analysis,
+            )
+
+        self._queue.put_nowait(
+            _Delivery(merged.canonical.unique_id, merged.canonical.source.value, _send)
+        )
+
+    def submit_unsent(self, tracked: TrackedProperty) -> None:
+        """Queue a property left pending or failed by an earlier run."""
+        prop = tracked.property
+
+        async def _send() -> bool:
+            return await self._notifier.send_property_notification(
+                prop,
+                commute_minutes=tracked.commute_minutes,
+                transport_mode=tracked.transport_mode,
+            )
+
+        self._queue.put_nowait(_Delivery(prop.unique_id, prop.source.value, _send, is_retry=True))
+
+    async def _deliver(self, item: _Delivery) -> None:
+        try:
+            success = await item.send()
+        except Exception:
+            # Senders already classify Telegram errors; this guards the worker.
+            logger.error("notification_dispatch_error", unique_id=item.unique_id, exc_info=True)
+            success = False
+
+        if success:
+            await self._storage.mark_notified(item.unique_id)
+            self.sent_count += 1
+            event = "notified"
+            if item.is_retry:
+                logger.info("retry_notification_sent", unique_id=item.unique_id)
+        else:
+            # A failed retry keeps its status ('pending' or 'failed') for the
+            # next run, as before the queue existed
+            if not item.is_retry:
+                await self._storage.mark_notification_failed(item.unique_id)
+            self.failed_count += 1
+            event = "notification_failed"
+            if item.is_retry:
+                logger.warning("retry_notification_failed", unique_id=item.unique_id)
+
+        if self._recorder is not None:
+            metadata = {"retry": True} if item.is_retry else None
+            self._recorder.record(
+                PropertyEvent(item.unique_id, item.source, event, "notification", metadata)
+            )
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._deliver(item)
+            except Exception:
+                logger.error(
+                    "notification_status_update_failed", unique_id=item.unique_id, exc_info=True
+                )
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued notification has been delivered or failed."""
+        await self._queue.join()
+
+    async def __aenter__(self) -> NotificationDispatcher:
+        self._worker = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type: object, *exc: object) -> None:
+        try:
+            # On error/cancellation, don't hold shutdown hostage to the queue:
+            # undelivered rows stay 'pending' and the next run picks them up.
+            if exc_type is None:
+                await self.drain()
+        finally:
+            if self._worker is not None:
+                self._worker.cancel()
+                await asyncio.gather(self._worker, return_exceptions=True)
+                self._worker = None
@@ -1,9 +1,12 @@
 """Scraper orchestration — platform-level scraping and coordination."""
 
+import asyncio
 import random
 import time
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
 
 from home_finder.config import Settings
 from home_finder.db import PropertyStorage
@@ -12,17 +15,33 @@ from home_finder.models import (
     FurnishType,
     MergedProperty,
     Property,
+    PropertySource,
 )
 from home_finder.scrapers import (
+    BaseScraper,
     OnTheMarketScraper,
     OpenRentScraper,
     RightmoveScraper,
     ZooplaScraper,
 )
+from home_finder.scrapers.base import ScrapeWatermark
+from home_finder.scrapers.rightmove import (
+    OUTCODE_ID_TTL_DAYS,
+    resolve_rightmove_outcodes,
+    seed_outcode_ids,
+)
 from home_finder.utils.address import is_outcode
+from home_finder.utils.loop_lag import LoopLagMonitor
 
 logger = get_logger(__name__)
 
+# Log a warning when a platform's scrape held the event loop for this long
+_LOOP_LAG_WARN_MS = 250.0
+
+# Platforms whose results are recency-sorted but can't use a watermark
+# (WATERMARK_SORT is None); they stop at a page of already-stored listings
+KNOWN_ID_EARLY_STOP_SOURCES = frozenset({PropertySource.ONTHEMARKET.value})
+
 
 @dataclass
 class ScraperMetrics:
@@ -40,6 +59,10 @@ class ScraperMetrics:
     parse_errors: int = 0
     is_healthy: bool = True
     error_message: str | None = None
+    # Event-loop lag sampled while this platform scraped (parsing stalls show here)
+    loop_lag_max_ms: float = 0.0
+    loop_lag_p95_ms: float = 0.0
+    watermark_stops: int = 0
 
 
 def _source_counts(properties: list[Property] | list[MergedProperty]) -> dict[str, int]:
@@ -62,10 +85,12 @@ async def scrape_all_platforms(
     min_bathrooms: int = 0,
     include_let_agreed: bool = True,
     max_per_scraper: int | None = None,
+    watermarks: dict[tuple[str, str], ScrapeWatermark] | None = None,
     known_ids_by_source: dict[str, set[str]] | None = None,
     proxy_url: str = "",
     only_scrapers: set[str] | None = None,
     zoopla_max_areas: int | None = None,
+    concurrent: bool = False,
 ) -> tuple[list[Property], list[ScraperMetrics]]:
     """Scrape all platforms for matching properties.
 
@@ -79,9 +104,14 @@ async def scrape_all_platforms(
         min_bathrooms: Minimum number of bathrooms.
         include_let_agreed: Whether to include already-let properties.
         max_per_scraper: Maximum properties per scraper (None for unlimited).
-        known_ids_by_source: Known source IDs per platform for early-stop pagination.
+        watermarks: Watermarks by (source, area) for early-stop pagination. Updated
+            in place with the newest listing each complete area scrape saw; None
+            disables both.
+        known_ids_by_source: Known source IDs per platform for early-stop pagination
+            on platforms without a watermark.
         only_scrapers: If set, only run scrapers whose source value is in this set.
         zoopla_max_areas: Max areas for Zoopla scraper (None for unlimited).
+        concurrent: Run each platform as its own task instead of one after another.
 
     Returns:
         Tuple of (combined list of properties, list of per-scraper metrics).
@@ -92,7 +122,7 @@ async def scrape_all_platforms(
         return ([], [])
     # Shuffle so rate-limited scrapers (Zoopla) don't always block the same areas
     random.shuffle(areas)
-    scrapers = [
+    scrapers: list[BaseScraper] = [
         OpenRentScraper(proxy_url=proxy_url),
         RightmoveScraper(),
         ZooplaScraper(proxy_url=proxy_url, max_areas=zoopla_max_areas),
@@ -101,141 +131,249 @@ async def scrape_all_platforms(
     if only_scrapers:
         scrapers = [s for s in scrapers if s.source.value in only_scrapers]
 
+    scrape_kwargs: dict[str, Any] = {
+        "min_price": min_price,
+        "max_price": max_price,
+        "min_bedrooms": min_bedrooms,
+        "max_bedrooms": max_bedrooms,
+        "furnish_types": furnish_types,
+        "min_bathrooms": min_bathrooms,
+        "include_let_agreed": include_let_agreed,
+    }
+
+    def _platform_coro(
+        scraper: BaseScraper,
+    ) -> Coroutine[Any, Any, tuple[list[Property], ScraperMetrics]]:
+        return _scrape_platform(
+            scraper,
+            areas,
+            max_per_scraper=max_per_scraper,
+            watermarks=watermarks,
+            known_source_ids=(
+                known_ids_by_source.get(scraper.source.value) if known_ids_by_source else None
+            ),
+            scrape_kwargs=scrape_kwargs,
+        )
+
     all_properties: list[Property] = []
     all_metrics: list[ScraperMetrics] = []
 
     try:
+        if concurrent:
+            # Each platform paces itself (page/area delays, block back-off), so
+            # wall-clock becomes the slowest platform rather than the sum.
+            logger.info("scraping_concurrently", platforms=[s.source.value for s in scrapers])
+            results = await asyncio.gather(*(_platform_coro(s) for s in scrapers))
+        else:
+            results = [await _platform_coro(s) for s in scrapers]
+    finally:
         for scraper in scrapers:
-            scraper_known = (
-                known_ids_by_source.get(scraper.source.value) if known_ids_by_source else None
-            )
-            scraper_count = 0
-            scraper_seen_ids: set[str] = set()
+            await scraper.close()
+
+    # Results are in scraper order regardless of completion order
+    for properties, metrics in results:
+        all_properties.extend(properties)
+        all_metrics.append(metrics)
+
+    return all_properties, all_metrics
+
 
-            metrics = ScraperMetrics(
-                scraper_name=scraper.source.value,
-                started_at=datetime.now(UTC).isoformat(),
+async def _scrape_platform(
+    scraper: BaseScraper,
+    areas: list[str],
+    *,
+    max_per_scraper: int | None,
+    watermarks: dict[tuple[str, str], ScrapeWatermark] | None,
+    known_source_ids: set[str] | None,
+    scrape_kwargs: dict[str, Any],
+) -> tuple[list[Property], ScraperMetrics]:
+    """Scrape every area for a single platform, honouring its own pacing.
+
+    Per-area failures are logged and recorded on the metrics; they never
+    abort the other platforms.
+
+    Returns:
+        Tuple of (properties found by this scraper, its metrics).
+    """
+    scraper_properties: list[Property] = []
+    scraper_count = 0
+    scraper_seen_ids: set[str] = set()
+
+    metrics = ScraperMetrics(
+        scraper_name=scraper.source.value,
+        started_at=datetime.now(UTC).isoformat(),
+    )
+    t_scraper = time.monotonic()
+
+    # Apply per-scraper area limit (e.g. Zoopla rotates a subset)
+    scraper_areas = areas
+    if scraper.max_areas_per_run is not None:
+        scraper_areas = areas[: scraper.max_areas_per_run]
+        if len(scraper_areas) < len(areas):
+            logger.info(
+                "area_subset_applied",
+                platform=scraper.source.value,
+                total_areas=len(areas),
+                subset_size=len(scraper_areas),
             )
-            t_scraper = time.monotonic()
 
-            # Apply per-scraper area limit (e.g. Zoopla rotates a subset)
-            scraper_areas = areas
-            if scraper.max_areas_per_run is not None:
-                scraper_areas = areas[: scraper.max_areas_per_run]
-                if len(scraper_areas) < len(areas):
-                    logger.info(
-                        "area_subset_applied",
-                        platform=scraper.source.value,
-                        total_areas=len(areas),
-                        subset_size=len(scraper_areas),
-                    )
+    metrics.areas_attempted = len(scraper_areas)
 
-            metrics.areas_attempted = len(scraper_areas)
+    async with LoopLagMonitor() as lag:
+        for i, area in enumerate(scraper_areas):
+            if max_per_scraper is not None and scraper_count >= max_per_scraper:
+                break
 
-            for i, area in enumerate(scraper_areas):
-                if max_per_scraper is not None and scraper_count >= max_per_scraper:
-                    break
+            if scraper.should_skip_remaining_areas:
+                logger.warning(
+                    "skipping_remaining_areas",
+                    platform=scraper.source.value,
+                    skipped_from=area,
+                    areas_remaining=len(scraper_areas) - i,
+                )
+                break
 
-                if scraper.should_skip_remaining_areas:
-                    logger.warning(
-                        "skipping_remaining_areas",
-                        platform=scraper.source.value,
-                        skipped_from=area,
-                        areas_remaining=len(scraper_areas) - i,
-                    )
-                    break
+            try:
+                logger.info(
+                    "scraping_platform",
+                    platform=scraper.source.value,
+                    area=area,
+                )
+                remaining = max_per_scraper - scraper_count if max_per_scraper is not None else None
+                watermark_key = (scraper.source.value, area.lower())
+                watermark = watermarks.get(watermark_key) if watermarks is not None else None
+                result = await scraper.scrape(
+                    **scrape_kwargs,
+                    area=area,
+                    max_results=remaining,
+                    watermark=watermark,
+                    known_source_ids=known_source_ids,
+                )
+                properties = result.properties
 
-                try:
-                    logger.info(
-                        "scraping_platform",
-                        platform=scraper.source.value,
-                        area=area,
-                    )
-                    remaining = (
-                        max_per_scraper - scraper_count if max_per_scraper is not None else None
+                # Accumulate per-area metrics
+                metrics.pages_fetched += result.pages_fetched
+                metrics.pages_failed += result.pages_failed
+                metrics.parse_errors += result.parse_errors
+                metrics.areas_completed += 1
+                if result.stopped_at_watermark:
+                    metrics.watermark_stops += 1
+
+                # Advance the watermark only past a complete, cleanly parsed scrape
+                sort_order = scraper.WATERMARK_SORT
+                if (
+                    watermarks is not None
+                    and sort_order is not None
+                    and result.newest_id is not None
+                    and result.parse_errors == 0
+                ):
+                    previous = (
+                        watermark.newest_id
+                        if watermark is not None and watermark.sort_order == sort_order
+                        else 0
                     )
-                    result = await scraper.scrape(
-                        min_price=min_price,
-                        max_price=max_price,
-                        min_bedrooms=min_bedrooms,
-                        max_bedrooms=max_bedrooms,
-                        area=area,
-                        furnish_types=furnish_types,
-                        min_bathrooms=min_bathrooms,
-                        include_let_agreed=include_let_agreed,
-                        max_results=remaining,
-                        known_source_ids=scraper_known,
+                    watermarks[watermark_key] = ScrapeWatermark(
+                        max(previous, result.newest_id), sort_order
                     )
-                    properties = result.properties
-
-                    # Accumulate per-area metrics
-                    metrics.pages_fetched += result.pages_fetched
-                    metrics.pages_failed += result.pages_failed
-                    metrics.parse_errors += result.parse_errors
-                    metrics.areas_completed += 1
-
-                    if not result.is_healthy:
-                        logger.warning(
-                            "scraper_unhealthy",
-                            platform=scraper.source.value,
-                            area=area,
-                            pages_fetched=result.pages_fetched,
-                            pages_failed=result.pages_failed,
-                            parse_errors=result.parse_errors,
-                        )
-
-                    # Cross-area dedup: remove properties already seen in other areas
-                    before_dedup = len(properties)
-                    properties = [p for p in properties if p.source_id not in scraper_seen_ids]
-                    scraper_seen_ids.update(p.source_id for p in properties)
-                    if len(properties) < before_dedup:
-                        logger.info(
-                            "cross_area_dedup",
-                            platform=scraper.source.value,
-                            area=area,
-                            removed=before_dedup - len(properties),
-                        )
-                    # Backfill outcode for properties missing postcode
-                    if is_outcode(area):
-                        outcode = area.upper()
-                        properties = [
-                            p.model_copy(update={"postcode": outcode}) if p.postcode is None else p
-                            for p in properties
-                        ]
-                    scraper_count += len(properties)
-                    all_properties.extend(properties)
-                    logger.info(
-                        "scraping_complete",
+
+                if not result.is_healthy:
+                    logger.warning(
+                        "scraper_unhealthy",
                         platform=scraper.source.value,
                         area=area,
-                        count=len(properties),
                         pages_fetched=result.pages_fetched,
                         pages_failed=result.pages_failed,
+                        parse_errors=result.parse_errors,
                     )
-                except Exception as e:
-                    logger.error(
-                        "scraping_failed",
+
+                # Cross-area dedup: remove properties already seen in other areas
+                before_dedup = len(properties)
+                properties = [p for p in properties if p.source_id not in scraper_seen_ids]
+                scraper_seen_ids.update(p.source_id for p in properties)
+                if len(properties) < before_dedup:
+                    logger.info(
+                        "cross_area_dedup",
                         platform=scraper.source.value,
                         area=area,
-                        error=str(e),
-                        exc_info=True,
+                        removed=before_dedup - len(properties),
                     )
-                    metrics.error_message = str(e)
-                # Delegate inter-area delay to the scraper
-                if i < len(scraper_areas) - 1:
-                    await scraper.area_delay()
-
-            # Finalize scraper metrics
-            metrics.completed_at = datetime.now(UTC).isoformat()
-            metrics.duration_seconds = time.monotonic() - t_scraper
-            metrics.properties_found = scraper_count
-            metrics.is_healthy = metrics.pages_fetched > 0 and metrics.parse_errors == 0
-            all_metrics.append(metrics)
-    finally:
-        for scraper in scrapers:
-            await scraper.close()
+                # Backfill outcode for properties missing postcode
+                if is_outcode(area):
+                    outcode = area.upper()
+                    properties = [
+                        p.model_copy(update={"postcode": outcode}) if p.postcode is None else p
+                        for p in properties
+                    ]
+                scraper_count += len(properties)
+                scraper_properties.extend(properties)
+                logger.info(
+                    "scraping_complete",
+                    platform=scraper.source.value,
+                    area=area,
+                    count=len(properties),
+                    pages_fetched=result.pages_fetched,
+                    pages_failed=result.pages_failed,
+                )
+            except Exception as e:
+                logger.error(
+                    "scraping_failed",
+                    platform=scraper.source.value,
+                    area=area,
+                    error=str(e),
+                    exc_info=True,
+                )
+                metrics.error_message = str(e)
+            # Delegate inter-area delay to the scraper
+            if i < len(scraper_areas) - 1:
+                await scraper.area_delay()
 
-    return all_properties, all_metrics
+    # Finalize scraper metrics
+    metrics.completed_at = datetime.now(UTC).isoformat()
+    metrics.duration_seconds = time.monotonic() - t_scraper
+    metrics.properties_found = scraper_count
+    metrics.is_healthy = metrics.pages_fetched > 0 and metrics.parse_errors == 0
+    metrics.loop_lag_max_ms = round(lag.max_ms, 1)
+    metrics.loop_lag_p95_ms = round(lag.p95_ms, 1)
+    if metrics.loop_lag_max_ms >= _LOOP_LAG_WARN_MS:
+        logger.warning(
+            "scrape_loop_lag",
+            platform=scraper.source.value,
+            max_ms=metrics.loop_lag_max_ms,
+            p95_ms=metrics.loop_lag_p95_ms,
+        )
+    return scraper_properties, metrics
+
+
+async def _prime_rightmove_outcodes(storage: PropertyStorage, areas: list[str]) -> None:
+    """Load or resolve Rightmove identifiers for outcodes before scraping.
+
+    Outcodes without a hardcoded mapping come from ``rightmove_outcodes``;
+    the rest are resolved concurrently and stored for later runs. Outcodes
+    in ``RIGHTMOVE_OUTCODES`` need neither, so the table only holds misses.
+    """
+    outcodes = [area.upper() for area in areas if is_outcode(area)]
+    if not outcodes:
+        return
+    stored = await storage.get_rightmove_outcodes(outcodes, max_age_days=OUTCODE_ID_TTL_DAYS)
+    seed_outcode_ids(stored)
+    resolved = await resolve_rightmove_outcodes(outcodes)
+    await storage.save_rightmove_outcodes(resolved)
+
+
+def _watermark_search_key(settings: Settings) -> str:
+    """Identify the search filters that scrape watermarks were recorded under.
+
+    Listings outside earlier filters were never seen, so a watermark only
+    applies while the filters are unchanged.
+    """
+    criteria = settings.get_search_criteria()
+    furnish = ",".join(sorted(ft.value for ft in settings.get_furnish_types()))
+    return (
+        f"price={criteria.min_price}-{criteria.max_price};"
+        f"beds={criteria.min_bedrooms}-{criteria.max_bedrooms};"
+        f"furnish={furnish};baths={settings.min_bathrooms};"
+        f"let_agreed={int(settings.include_let_agreed)}"
+    )
 
 
 async def _run_scrape(
@@ -250,15 +388,31 @@ async def _run_scrape(
     criteria = settings.get_search_criteria()
     search_areas = settings.get_search_areas()
 
+    search_key = _watermark_search_key(settings)
     if full_scrape:
+        # Still record watermarks, so the next run can stop early again
+        loaded: dict[tuple[str, str], ScrapeWatermark] = {}
         known_ids_by_source = None
         logger.info("full_scrape_mode", msg="Early-stop disabled — scraping all pages")
     else:
-        known_ids_by_source = await storage.get_all_known_source_ids()
+        loaded = {
+            key: ScrapeWatermark(newest_id, sort_order)
+            for key, (sort_order, newest_id) in (
+                await storage.get_scrape_watermarks(search_key)
+            ).items()
+        }
+        logger.info("loaded_scrape_watermarks", count=len(loaded))
+        known_ids_by_source = await storage.get_all_known_source_ids(
+            sources=KNOWN_ID_EARLY_STOP_SOURCES
+        )
         logger.info(
             "loaded_known_ids",
             total=sum(len(v) for v in known_ids_by_source.values()),
         )
+    watermarks = dict(loaded)
+
+    if not only_scrapers or PropertySource.RIGHTMOVE.value in only_scrapers:
+        await _prime_rightmove_outcodes(storage, search_areas)
 
     logger.info("pipeline_started", phase="scraping")
     all_properties, scraper_metrics = await scrape_all_platforms(
@@ -271,15 +425,23 @@ async def _run_scrape(
         min_bathrooms=settings.min_bathrooms,
         include_let_agreed=settings.include_let_agreed,
         max_per_scraper=max_per_scraper,
+        watermarks=watermarks,
         known_ids_by_source=known_ids_by_source,
         proxy_url=settings.proxy_url,
         only_scrapers=only_scrapers,
         zoopla_max_areas=settings.zoopla_max_areas_per_run,
+        concurrent=settings.concurrent_scraping,
     )
     logger.info(
         "scraping_summary",
         total_found=len(all_properties),
         by_source=_source_counts(all_properties),
+        pages_fetched=sum(m.pages_fetched for m in scraper_metrics),
+        watermark_stops=sum(m.watermark_stops for m in scraper_metrics),
+    )
+    await storage.save_scrape_watermarks(
+        search_key,
+        {key: (w.sort_order, w.newest_id) for key, w in watermarks.items() if loaded.get(key) != w},
     )
 
     if not all_properties:
@@ -13,7 +13,9 @@ from home_finder.filters import (
     enrich_merged_properties,
     filter_by_floorplan,
 )
+from home_finder.filters.commute import CommuteCache, best_commutes
 from home_finder.filters.detail_enrichment import is_floorplan_exempt
+from home_finder.filters.isochrone import IsochroneStore
 from home_finder.logging import get_logger
 from home_finder.models import (
     MergedProperty,
@@ -442,6 +444,9 @@ async def _geocode_and_compute_commute(
     settings: Settings,
     *,
     recorder: EventRecorder | None = None,
+    cache: CommuteCache | None = None,
+    isochrones: IsochroneStore | None = None,
+    timings: dict[str, float] | None = None,
 ) -> tuple[list[MergedProperty], dict[str, tuple[int, TransportMode]], int]:
     """Geocode properties and compute commute times via TravelTime API.
 
@@ -452,6 +457,11 @@ async def _geocode_and_compute_commute(
     gate: if TravelTime is configured and zero properties are reachable, the
     caller can abort the pipeline.
 
+    Geocodes and journey times are served from ``cache`` where possible, and
+    from ``isochrones`` (offline classification) when given.
+    When ``timings`` is given, the stage's duration and cache hit/miss
+    counts are added to it.
+
     Returns:
         Tuple of (all properties with geocoded coordinates, commute lookup
         mapping unique_id -> (minutes, transport_mode) for reachable properties,
@@ -460,10 +470,13 @@ async def _geocode_and_compute_commute(
     commute_lookup: dict[str, tuple[int, TransportMode]] = {}
     if settings.traveltime_app_id and settings.traveltime_api_key:
         logger.info("pipeline_started", phase="commute_filtering")
+        t0 = time.monotonic()
         commute_filter = CommuteFilter(
             app_id=settings.traveltime_app_id,
             api_key=settings.traveltime_api_key.get_secret_value(),
             destination_postcode=criteria.destination_postcode,
+            cache=cache,
+            isochrones=isochrones,
         )
 
         merged = await commute_filter.geocode_properties(merged)
@@ -477,23 +490,17 @@ async def _geocode_and_compute_commute(
 
         commute_results = []
         if props_with_coords:
-            for mode in criteria.transport_modes:
-                results = await commute_filter.filter_properties(
-                    props_with_coords,
-                    max_minutes=criteria.max_commute_minutes,
-                    transport_mode=mode,
-                )
-                commute_results.extend(results)
-
-        for result in commute_results:
-            if result.within_limit and (
-                result.property_id not in commute_lookup
-                or result.travel_time_minutes < commute_lookup[result.property_id][0]
-            ):
-                commute_lookup[result.property_id] = (
-                    result.travel_time_minutes,
-                    result.transport_mode,
-                )
+            commute_results = await commute_filter.filter_properties_by_modes(
+                props_with_coords,
+                max_minutes=criteria.max_commute_minutes,
+                transport_modes=criteria.transport_modes,
+            )
+
+        if timings is not None:
+            timings["commute_seconds"] = time.monotonic() - t0
+            timings.update(commute_filter.cache_stats.as_dict())
+
+        commute_lookup = best_commutes(commute_results)
 
         within_limit = [m for m in merged_with_coords if m.canonical.unique_id in commute_lookup]
         notify_count = len(within_limit) + len(merged_without_coords)
@@ -643,6 +650,7 @@ async def _run_post_enrichment(
         enable_cross_platform=True,
         enable_image_hashing=True,
         data_dir=settings.data_dir,
+        storage=storage,
     )
     dedup_result = await _cross_run_deduplicate(
         cross_run_deduplicator,
@@ -880,7 +888,13 @@ async def _run_pre_analysis_pipeline(
 
     # Step 6: Geocode + commute (after enrichment so all properties have full coords)
     geocoded, commute_lookup, commute_within_limit_count = await _geocode_and_compute_commute(
-        enriched, criteria, settings, recorder=recorder
+        enriched,
+        criteria,
+        settings,
+        recorder=recorder,
+        cache=storage,
+        isochrones=storage if settings.commute_isochrones else None,
+        timings=timings,
     )
     if not geocoded:
         logger.info("no_properties_within_commute_limit")
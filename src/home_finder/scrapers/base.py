@@ -12,6 +12,14 @@ from home_finder.models import FurnishType, Property, PropertySource
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class ScrapeWatermark:
+    """Newest listing an earlier scrape saw in one area's newest-first results."""
+
+    newest_id: int
+    sort_order: str
+
+
 @dataclass
 class ScrapeResult:
     """Result of a scrape operation with metadata for distinguishing success from failure."""
@@ -20,6 +28,10 @@ class ScrapeResult:
     pages_fetched: int = 0
     pages_failed: int = 0
     parse_errors: int = 0
+    # Highest numeric source ID on the fetched pages; None unless every page
+    # up to the stopping point was fetched (safe to advance the watermark)
+    newest_id: int | None = None
+    stopped_at_watermark: bool = False
 
     @property
     def is_healthy(self) -> bool:
@@ -27,9 +39,19 @@ class ScrapeResult:
         return self.pages_fetched > 0 and self.parse_errors == 0
 
 
+def _numeric_id(source_id: str) -> int | None:
+    return int(source_id) if source_id.isdigit() else None
+
+
 class BaseScraper(ABC):
     """Abstract base class for property scrapers."""
 
+    # Newest-first sort the search URL requests, recorded with watermarks.
+    # Scrapers set it to their SEARCH_SORT, the parameter their URL builder
+    # sends, so the two can't drift apart. None when the platform can't sort
+    # by listing age (no watermark early-stop).
+    WATERMARK_SORT: str | None = None
+
     @property
     @abstractmethod
     def source(self) -> PropertySource:
@@ -49,6 +71,7 @@ class BaseScraper(ABC):
         min_bathrooms: int = 0,
         include_let_agreed: bool = True,
         max_results: int | None = None,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
     ) -> ScrapeResult:
         """Scrape properties matching the given criteria.
@@ -63,7 +86,10 @@ class BaseScraper(ABC):
             min_bathrooms: Minimum number of bathrooms (0 = no filter).
             include_let_agreed: Whether to include already-let properties.
             max_results: Maximum number of results to return (None for unlimited).
-            known_source_ids: Source IDs already in DB; enables early-stop pagination.
+            watermark: Newest listing seen by the last scrape of this area; enables
+                early-stop pagination.
+            known_source_ids: Source IDs already in DB; enables early-stop pagination
+                when no watermark applies.
 
         Returns:
             ScrapeResult with properties and scrape health metadata.
@@ -75,6 +101,7 @@ class BaseScraper(ABC):
         fetch_page: Callable[[int], Awaitable[list[Property] | None]],
         *,
         max_pages: int,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
         max_results: int | None = None,
         page_delay: Callable[[], Awaitable[None]] | None = None,
@@ -86,7 +113,13 @@ class BaseScraper(ABC):
                 properties for that page, empty list for end of results, or
                 None for fetch failure.
             max_pages: Maximum number of pages to fetch.
-            known_source_ids: Source IDs already in DB; enables early-stop.
+            watermark: Newest listing seen by the last scrape of this area.
+                Pagination stops after the first page made up mostly of
+                listings at or below it. Ignored unless it was recorded under
+                this scraper's ``WATERMARK_SORT``.
+            known_source_ids: Source IDs already in DB. Without an applicable
+                watermark, pagination stops at the first page whose listings
+                are all known (that page is dropped).
             max_results: Maximum total results to return (None = unlimited).
             page_delay: Optional async callable invoked between pages.
 
@@ -97,6 +130,13 @@ class BaseScraper(ABC):
         seen_ids: set[str] = set()
         pages_fetched = 0
         pages_failed = 0
+        newest_id: int | None = None
+        truncated = False
+        stopped_at_watermark = False
+        if watermark is not None and (
+            self.WATERMARK_SORT is None or watermark.sort_order != self.WATERMARK_SORT
+        ):
+            watermark = None
 
         for page_idx in range(max_pages):
             properties = await fetch_page(page_idx)
@@ -113,9 +153,11 @@ class BaseScraper(ABC):
             if not properties:
                 break
 
-            # Early-stop: all results on this page are already in DB
-            if known_source_ids is not None and all(
-                p.source_id in known_source_ids for p in properties
+            # Fallback early-stop: all results on this page are already in DB
+            if (
+                watermark is None
+                and known_source_ids is not None
+                and all(p.source_id in known_source_ids for p in properties)
             ):
                 logger.info(
                     "early_stop_all_known",
@@ -124,6 +166,18 @@ class BaseScraper(ABC):
                 )
                 break
 
+            page_ids = [n for p in properties if (n := _numeric_id(p.source_id)) is not None]
+            if page_ids:
+                newest_id = max(newest_id or 0, *page_ids)
+
+            # Early-stop: most of this page is at or below the watermark, so
+            # later pages hold older listings still. A single promoted listing
+            # pinned to the top of each page doesn't count as crossing it.
+            crossed = False
+            if watermark is not None:
+                older = sum(1 for n in page_ids if n <= watermark.newest_id)
+                crossed = older > len(properties) - older
+
             # Deduplicate across pages
             new_properties = [p for p in properties if p.source_id not in seen_ids]
             for p in new_properties:
@@ -135,9 +189,20 @@ class BaseScraper(ABC):
             all_properties.extend(new_properties)
 
             if max_results is not None and len(all_properties) >= max_results:
+                # Later pages went unseen, unless they're all older anyway
+                truncated = not crossed
                 all_properties = all_properties[:max_results]
                 break
 
+            if crossed:
+                logger.info(
+                    "early_stop_watermark",
+                    source=self.source.value,
+                    page=page_idx + 1,
+                )
+                stopped_at_watermark = True
+                break
+
             # Delay between pages (not after last page)
             if page_delay is not None and page_idx < max_pages - 1:
                 await page_delay()
@@ -146,6 +211,8 @@ class BaseScraper(ABC):
             properties=all_properties,
             pages_fetched=pages_fetched,
             pages_failed=pages_failed,
+            newest_id=newest_id if not pages_failed and not truncated else None,
+            stopped_at_watermark=stopped_at_watermark,
         )
 
     async def area_delay(self) -> None:
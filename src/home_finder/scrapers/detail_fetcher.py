@@ -1,16 +1,15 @@
 """Detail page fetcher for extracting gallery and floorplan URLs."""
 
 import asyncio
-import io
 import json
 import re
 from dataclasses import dataclass
 from typing import Any, NamedTuple, assert_never
+from urllib.parse import urlparse
 
 import httpx
 from curl_cffi import CurlError
 from curl_cffi.requests import AsyncSession
-from PIL import Image
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -22,9 +21,13 @@ from tenacity import (
 from home_finder.logging import get_logger
 from home_finder.models import SQM_PER_SQFT, Property, PropertySource
 from home_finder.scrapers.constants import BROWSER_HEADERS
+from home_finder.scrapers.parse_worker import parse_in_worker
 from home_finder.scrapers.retry import RetryableHttpError
+from home_finder.scrapers.zoopla_rsc import RscPage, parse_page
 from home_finder.utils.circuit_breaker import ConsecutiveFailureBreaker
 from home_finder.utils.image_cache import is_valid_image_bytes
+from home_finder.utils.image_pool import run_image_task
+from home_finder.utils.image_processing import is_decodable_image
 
 _MAX_RETRIES = 2  # cross-run retry handles persistent failures
 _FLOOR_AREA_MIN_SQFT = 100
@@ -54,6 +57,10 @@ _CDN_THROTTLE_CONFIG: dict[str, tuple[str, float]] = {
     "imagescdn.openrent.co.uk": ("img_openrent", _OPENRENT_IMAGE_MIN_INTERVAL),
 }
 
+# Image downloads in flight per host.  CDN hosts also keep their min-interval
+# throttle, so this mostly overlaps round-trips rather than raising the rate.
+_IMAGE_CONCURRENCY_PER_HOST = 4
+
 # curl error codes that indicate CDN-level blocking (timeouts / connection drops).
 _BREAKER_CURL_CODES = frozenset({7, 28, 55, 56})
 
@@ -78,25 +85,6 @@ def _is_video_url(url: str) -> bool:
     return any(marker in url_lower for marker in _VIDEO_URL_MARKERS)
 
 
-def _find_dict_with_key(data: Any, key: str, depth: int = 0) -> dict[str, Any] | None:
-    """Recursively find a dict containing the given key."""
-    if depth > 10:
-        return None
-    if isinstance(data, dict):
-        if key in data:
-            return data
-        for v in data.values():
-            r = _find_dict_with_key(v, key, depth + 1)
-            if r:
-                return r
-    elif isinstance(data, list):
-        for item in data:
-            r = _find_dict_with_key(item, key, depth + 1)
-            if r:
-                return r
-    return None
-
-
 # ---------------------------------------------------------------------------
 # Zoopla detail page extraction helpers (pure functions, no self dependency)
 # ---------------------------------------------------------------------------
@@ -155,38 +143,24 @@ def _zoopla_from_next_data(html: str, max_gallery_images: int) -> _NextDataResul
     return _NextDataResult(gallery_urls, floorplan_url, description, features)
 
 
-def _zoopla_desc_from_rsc(html: str) -> tuple[str | None, list[str]]:
-    """Extract description and features from RSC taxonomy payload.
+def _zoopla_desc_from_rsc(page: RscPage) -> tuple[str | None, list[str]]:
+    """Extract description and features from the RSC taxonomy record.
 
     Returns (description, features).
     """
-    rsc_pattern = r"self\.__next_f\.push\(\s*\[(.*?)\]\s*\)"
-    for m in re.finditer(rsc_pattern, html, re.DOTALL):
-        match_text = m.group(1)
-        if "epcRating" not in match_text or "numBaths" not in match_text:
-            continue
-        try:
-            arr = json.loads(f"[{match_text}]")
-            if len(arr) >= 2 and isinstance(arr[1], str):
-                payload = arr[1]
-                colon_idx = payload.find(":")
-                if colon_idx >= 0:
-                    parsed = json.loads(payload[colon_idx + 1 :])
-                    taxonomy = _find_dict_with_key(parsed, "epcRating")
-                    if taxonomy:
-                        desc = taxonomy.get("detailedDescription", "")
-                        description: str | None = None
-                        if desc and not desc.startswith("$"):
-                            desc = re.sub(r"<[^>]+>", " ", desc)
-                            description = re.sub(r"\s+", " ", desc).strip()
-                        kf = taxonomy.get("keyFeatures", [])
-                        features: list[str] = []
-                        if isinstance(kf, list) and kf:
-                            features = [f for f in kf if isinstance(f, str)]
-                        return description, features
-        except (json.JSONDecodeError, TypeError):
-            continue
-    return None, []
+    taxonomy = page.taxonomy
+    if taxonomy is None:
+        return None, []
+    description: str | None = None
+    desc = page.resolve(taxonomy.get("detailedDescription", ""))
+    if isinstance(desc, str) and desc and not desc.startswith("$"):
+        desc = re.sub(r"<[^>]+>", " ", desc)
+        description = re.sub(r"\s+", " ", desc).strip()
+    kf = taxonomy.get("keyFeatures", [])
+    features: list[str] = []
+    if isinstance(kf, list) and kf:
+        features = [f for f in kf if isinstance(f, str)]
+    return description, features
 
 
 def _zoopla_desc_from_html(html: str) -> str | None:
@@ -205,9 +179,9 @@ def _zoopla_desc_from_html(html: str) -> str | None:
 
 
 def _zoopla_images_from_rsc_captions(
-    html: str, max_gallery_images: int
+    page: RscPage, html: str, max_gallery_images: int
 ) -> tuple[list[str], set[str]]:
-    """Extract gallery URLs from RSC caption/filename pairs.
+    """Extract gallery URLs from RSC caption/filename records.
 
     Returns (gallery_urls, seen_hashes) where seen_hashes includes ALL
     encountered hashes, including EPC images that were filtered from the URL list.
@@ -226,22 +200,15 @@ def _zoopla_images_from_rsc_captions(
     for fp_filename in fp_hash_matches:
         seen_hashes.add(fp_filename.split(".")[0])
 
-    # Match both quoted captions and null captions:
-    #   \"caption\":\"Some text\",\"filename\":\"hash.jpg\"
-    #   \"caption\":null,\"filename\":\"hash.jpg\"
-    rsc_matches = re.findall(
-        r'\\"caption\\":(?:\\"([^\\]*)\\"|null),\\"filename\\":\\"([a-f0-9]+\.(?:jpg|jpeg|png|webp))\\"',
-        html,
-        re.IGNORECASE,
-    )
-    for caption, filename in rsc_matches:
+    for record in page.captions:
+        filename = record.filename
         hash_part = filename.split(".")[0]
         if hash_part in seen_hashes:
             continue
         seen_hashes.add(hash_part)
-        # null caption (group is empty string from non-matching group) = gallery photo
-        if caption is not None:
-            caption_lower = caption.lower()
+        # null caption = gallery photo
+        if record.caption is not None:
+            caption_lower = record.caption.lower()
             # Skip EPC rating graphs and floorplans — not gallery images
             if (
                 "epc" in caption_lower
@@ -290,33 +257,14 @@ def _zoopla_images_from_full_urls(
     return [url for _, url in sorted_imgs[:remaining]]
 
 
-def _zoopla_size_from_rsc(html: str) -> int | None:
-    """Extract sizeSqft from RSC taxonomy payload.
+def _zoopla_size_from_rsc(page: RscPage) -> int | None:
+    """Extract sizeSqft from the RSC payload.
 
     Returns floor area in sqft, or None if not found/invalid.
     """
-    rsc_pattern = r"self\.__next_f\.push\(\s*\[(.*?)\]\s*\)"
-    for m in re.finditer(rsc_pattern, html, re.DOTALL):
-        match_text = m.group(1)
-        if "sizeSqft" not in match_text:
-            continue
-        try:
-            arr = json.loads(f"[{match_text}]")
-            if len(arr) >= 2 and isinstance(arr[1], str):
-                payload = arr[1]
-                colon_idx = payload.find(":")
-                if colon_idx >= 0:
-                    parsed = json.loads(payload[colon_idx + 1 :])
-                    taxonomy = _find_dict_with_key(parsed, "sizeSqft")
-                    if taxonomy:
-                        raw = taxonomy.get("sizeSqft")
-                        if (
-                            isinstance(raw, (int, float))
-                            and _FLOOR_AREA_MIN_SQFT <= raw <= _FLOOR_AREA_MAX_SQFT
-                        ):
-                            return int(raw)
-        except (json.JSONDecodeError, TypeError):
-            continue
+    for raw in page.sizes_sqft:
+        if _FLOOR_AREA_MIN_SQFT <= raw <= _FLOOR_AREA_MAX_SQFT:
+            return int(raw)
     return None
 
 
@@ -354,6 +302,357 @@ class DetailPageData:
     floor_area_source: str | None = None  # "rightmove" | "zoopla" | "onthemarket"
 
 
+def _parse_rightmove_detail(html: str, max_gallery_images: int) -> DetailPageData | None:
+    """Parse a Rightmove detail page's PAGE_MODEL JSON; None if it has none."""
+    # Find PAGE_MODEL JSON start
+    start_match = re.search(r"window\.PAGE_MODEL\s*=\s*", html)
+    if not start_match:
+        return None
+
+    # Extract JSON using brace counting (handles nested objects)
+    start_idx = start_match.end()
+    depth = 0
+    end_idx = start_idx
+    for i, char in enumerate(html[start_idx:]):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                end_idx = start_idx + i + 1
+                break
+
+    json_str = html[start_idx:end_idx]
+    data = json.loads(json_str)
+    property_data = data.get("propertyData", {})
+
+    # Extract floorplan
+    floorplan_url: str | None = None
+    floorplans = property_data.get("floorplans", [])
+    if floorplans and floorplans[0].get("url"):
+        floorplan_url = floorplans[0]["url"]
+
+    # Extract gallery images
+    gallery_urls: list[str] = []
+    images = property_data.get("images", [])
+    for img in images[:max_gallery_images]:
+        url = img.get("url", "")
+        if url and not _is_epc_url(url):
+            gallery_urls.append(url)
+
+    # Extract description
+    description = property_data.get("text", {}).get("description")
+
+    # Extract key features
+    features: list[str] = []
+    key_features = property_data.get("keyFeatures", [])
+    if key_features:
+        features.extend(key_features)
+
+    # Extract location coordinates
+    latitude: float | None = None
+    longitude: float | None = None
+    location = property_data.get("location", {})
+    lat_raw = location.get("latitude")
+    lng_raw = location.get("longitude")
+    if lat_raw is not None and lng_raw is not None:
+        latitude = float(lat_raw)
+        longitude = float(lng_raw)
+
+    # Extract full postcode from address data
+    postcode: str | None = None
+    address_data = property_data.get("address", {})
+    outcode = address_data.get("outcode", "")
+    incode = address_data.get("incode", "")
+    if outcode and incode:
+        postcode = f"{outcode} {incode}"
+
+    # Extract floor area from sizings (validate in sqft, convert to sqm)
+    floor_area_sqm: float | None = None
+    sizings = property_data.get("sizings", [])
+    for sizing in sizings:
+        if sizing.get("unit") == "sqft":
+            raw = sizing.get("maximumSize") or sizing.get("minimumSize")
+            if (
+                isinstance(raw, (int, float))
+                and _FLOOR_AREA_MIN_SQFT <= raw <= _FLOOR_AREA_MAX_SQFT
+            ):
+                floor_area_sqm = round(raw * SQM_PER_SQFT, 1)
+                break
+
+    return DetailPageData(
+        floorplan_url=floorplan_url,
+        gallery_urls=gallery_urls if gallery_urls else None,
+        description=description,
+        features=features if features else None,
+        latitude=latitude,
+        longitude=longitude,
+        postcode=postcode,
+        floor_area_sqm=floor_area_sqm,
+        floor_area_source="rightmove" if floor_area_sqm else None,
+    )
+
+
+def _parse_zoopla_detail(html: str, max_imgs: int) -> DetailPageData:
+    """Parse a Zoopla detail page: __NEXT_DATA__, then the RSC payload, then HTML."""
+
+    floorplan_url: str | None = None
+    gallery_urls: list[str] = []
+    description: str | None = None
+    features: list[str] = []
+    seen_hashes: set[str] = set()
+
+    next_data = _zoopla_from_next_data(html, max_imgs)
+    if next_data:
+        gallery_urls, floorplan_url, description, features = next_data
+
+    rsc = parse_page(html)
+    if not description:
+        rsc_desc, rsc_feats = _zoopla_desc_from_rsc(rsc)
+        description = rsc_desc
+        if rsc_feats and not features:
+            features = rsc_feats
+
+    if not description:
+        description = _zoopla_desc_from_html(html)
+
+    if not gallery_urls:
+        gallery_urls, seen_hashes = _zoopla_images_from_rsc_captions(rsc, html, max_imgs)
+
+    if len(gallery_urls) < 3:
+        gallery_urls.extend(
+            _zoopla_images_from_full_urls(html, gallery_urls, seen_hashes, max_imgs)
+        )
+
+    if not floorplan_url:
+        floorplan_url = _zoopla_floorplan_from_html(html)
+
+    # Extract floor area from RSC payload (sqft), convert to sqm
+    raw_sqft = _zoopla_size_from_rsc(rsc)
+    floor_area_sqm = round(raw_sqft * SQM_PER_SQFT, 1) if raw_sqft else None
+
+    return DetailPageData(
+        floorplan_url=floorplan_url,
+        gallery_urls=gallery_urls if gallery_urls else None,
+        description=description,
+        features=features if features else None,
+        floor_area_sqm=floor_area_sqm,
+        floor_area_source="zoopla" if floor_area_sqm else None,
+    )
+
+
+def _parse_openrent_detail(html: str, max_gallery_images: int) -> DetailPageData:
+    """Parse an OpenRent detail page's carousel, description and feature list."""
+    # Extract floorplan - look for floorplan images in the carousel
+    floorplan_url: str | None = None
+    floorplan_match = re.search(
+        r'href="(//imagescdn\.openrent\.co\.uk/[^"]*floorplan[^"]*)"',
+        html,
+        re.IGNORECASE,
+    )
+    if floorplan_match:
+        url = floorplan_match.group(1)
+        floorplan_url = f"https:{url}" if url.startswith("//") else url
+
+    # Extract gallery images from PhotoSwipe lightbox (new structure)
+    # OpenRent now uses class="lightbox_item" with data-pswp-* attributes
+    gallery_urls: list[str] = []
+
+    # Pattern 1: PhotoSwipe lightbox items (current structure)
+    gallery_matches = re.findall(
+        r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*lightbox_item[^"]*"',
+        html,
+        re.IGNORECASE,
+    )
+    for url in gallery_matches[:max_gallery_images]:
+        if (
+            url
+            and "floorplan" not in url.lower()
+            and not _is_epc_url(url)
+            and not _is_video_url(url)
+        ):
+            full_url = f"https:{url}" if url.startswith("//") else url
+            gallery_urls.append(full_url)
+
+    # Pattern 2: Fallback - old data-lightbox="gallery" pattern
+    if not gallery_urls:
+        gallery_matches = re.findall(
+            r'<a[^>]*href="([^"]+)"[^>]*data-lightbox="gallery"',
+            html,
+            re.IGNORECASE,
+        )
+        for url in gallery_matches[:max_gallery_images]:
+            if (
+                url
+                and "floorplan" not in url.lower()
+                and not _is_epc_url(url)
+                and not _is_video_url(url)
+            ):
+                full_url = f"https:{url}" if url.startswith("//") else url
+                gallery_urls.append(full_url)
+
+    # Pattern 3: Fallback - look for property images by URL pattern
+    if not gallery_urls:
+        img_matches = re.findall(
+            r'(//imagescdn\.openrent\.co\.uk/listings/\d+/[^"]+\.(?:jpg|jpeg|png|webp))',
+            html,
+            re.IGNORECASE,
+        )
+        for url in img_matches[:max_gallery_images]:
+            if url and "floorplan" not in url.lower() and not _is_epc_url(url):
+                full_url = f"https:{url}"
+                if full_url not in gallery_urls:
+                    gallery_urls.append(full_url)
+
+    # Extract description - OpenRent uses a description div
+    description: str | None = None
+    desc_match = re.search(
+        r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>',
+        html,
+        re.DOTALL | re.IGNORECASE,
+    )
+    if desc_match:
+        # Strip HTML tags
+        desc_text = re.sub(r"<[^>]+>", " ", desc_match.group(1))
+        desc_text = re.sub(r"\s+", " ", desc_text).strip()
+        if desc_text:
+            description = desc_text
+
+    # Extract features - OpenRent lists features in a ul
+    features: list[str] = []
+    features_match = re.search(
+        r'<ul[^>]*class="[^"]*feature[^"]*"[^>]*>(.*?)</ul>',
+        html,
+        re.DOTALL | re.IGNORECASE,
+    )
+    if features_match:
+        feature_items = re.findall(r"<li[^>]*>(.*?)</li>", features_match.group(1))
+        for item in feature_items:
+            text = re.sub(r"<[^>]+>", "", item).strip()
+            if text:
+                features.append(text)
+
+    return DetailPageData(
+        floorplan_url=floorplan_url,
+        gallery_urls=gallery_urls if gallery_urls else None,
+        description=description,
+        features=features if features else None,
+    )
+
+
+def _parse_onthemarket_detail(html: str, max_gallery_images: int) -> DetailPageData | None:
+    """Parse an OnTheMarket detail page's Redux state; None without __NEXT_DATA__."""
+    # OnTheMarket uses Next.js with Redux state in __NEXT_DATA__
+    match = re.search(
+        r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
+        html,
+        re.DOTALL,
+    )
+    if not match:
+        return None
+
+    data = json.loads(match.group(1))
+    redux_state = data.get("props", {}).get("initialReduxState", {})
+    property_data = redux_state.get("property", {})
+
+    # Extract floorplan
+    floorplan_url: str | None = None
+    floorplans = property_data.get("floorplans", [])
+    if floorplans:
+        fp = floorplans[0]
+        floorplan_url = fp.get("original") or fp.get("largeUrl") or fp.get("url")
+
+    # Extract gallery images
+    # OnTheMarket uses 'largeUrl' or 'prefix' + geometry suffix
+    gallery_urls: list[str] = []
+    images = property_data.get("images", [])
+    for img in images[:max_gallery_images]:
+        if isinstance(img, dict):
+            # Try various URL fields
+            url = img.get("original") or img.get("largeUrl") or img.get("url")
+            # Fallback: construct from prefix if available
+            if not url and img.get("prefix"):
+                url = f"{img['prefix']}-1024x1024.jpg"
+        else:
+            url = img
+        if url and not _is_epc_url(url):
+            gallery_urls.append(url)
+
+    # Extract description
+    description = property_data.get("description")
+
+    # Extract features
+    features: list[str] = []
+    key_features = property_data.get("keyFeatures", [])
+    if key_features:
+        features.extend(key_features)
+    # Also check for bullet points
+    bullets = property_data.get("bullets", [])
+    if bullets:
+        features.extend(bullets)
+    # Features as array of objects {id, feature}
+    feature_objects = property_data.get("features", [])
+    for feat in feature_objects:
+        if isinstance(feat, dict) and feat.get("feature"):
+            features.append(feat["feature"])
+
+    # Extract floor area (validate in sqft, convert to sqm)
+    floor_area_sqm: float | None = None
+    raw_sqft = property_data.get("minimumAreaSqFt")
+    if (
+        isinstance(raw_sqft, (int, float))
+        and _FLOOR_AREA_MIN_SQFT <= raw_sqft <= _FLOOR_AREA_MAX_SQFT
+    ):
+        floor_area_sqm = round(raw_sqft * SQM_PER_SQFT, 1)
+
+    return DetailPageData(
+        floorplan_url=floorplan_url,
+        gallery_urls=gallery_urls if gallery_urls else None,
+        description=description,
+        features=features if features else None,
+        floor_area_sqm=floor_area_sqm,
+        floor_area_source="onthemarket" if floor_area_sqm else None,
+    )
+
+
+@dataclass
+class ImageDownloadStats:
+    """Image download counters for one host.
+
+    ``busy_seconds`` only counts time with at least one download in flight,
+    so gaps between properties don't dilute the throughput figures.
+    """
+
+    downloaded: int = 0
+    failed: int = 0
+    total_bytes: int = 0
+    busy_seconds: float = 0.0
+    _in_flight: int = 0
+    _busy_since: float = 0.0
+
+    def started(self, now: float) -> None:
+        """Record a download starting at loop time *now*."""
+        if self._in_flight == 0:
+            self._busy_since = now
+        self._in_flight += 1
+
+    def finished(self, now: float, data: bytes | None) -> None:
+        """Record a download ending at loop time *now* with its result."""
+        self._in_flight -= 1
+        if self._in_flight == 0:
+            self.busy_seconds += now - self._busy_since
+        if data is None:
+            self.failed += 1
+        else:
+            self.downloaded += 1
+            self.total_bytes += len(data)
+
+    @property
+    def images_per_second(self) -> float:
+        """Successful downloads per busy second (0 before any finish)."""
+        return self.downloaded / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+
 class DetailFetcher:
     """Fetches property detail pages and extracts floorplan/gallery URLs."""
 
@@ -386,6 +685,9 @@ class DetailFetcher:
         # Per-CDN circuit breakers (created lazily via _get_image_breaker)
         self._image_breakers: dict[str, ConsecutiveFailureBreaker] = {}
         self._image_skip_counts: dict[str, int] = {}
+        # Per-host download slots and counters (keyed by CDN key or hostname)
+        self._image_slots: dict[str, asyncio.Semaphore] = {}
+        self._image_stats: dict[str, ImageDownloadStats] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -546,94 +848,10 @@ class DetailFetcher:
             response = await self._httpx_get_with_retry(str(prop.url))
             html = response.text
 
-            # Find PAGE_MODEL JSON start
-            start_match = re.search(r"window\.PAGE_MODEL\s*=\s*", html)
-            if not start_match:
+            data = await parse_in_worker(_parse_rightmove_detail, html, self._max_gallery_images)
+            if data is None:
                 logger.debug("no_page_model", property_id=prop.unique_id)
-                return None
-
-            # Extract JSON using brace counting (handles nested objects)
-            start_idx = start_match.end()
-            depth = 0
-            end_idx = start_idx
-            for i, char in enumerate(html[start_idx:]):
-                if char == "{":
-                    depth += 1
-                elif char == "}":
-                    depth -= 1
-                    if depth == 0:
-                        end_idx = start_idx + i + 1
-                        break
-
-            json_str = html[start_idx:end_idx]
-            data = json.loads(json_str)
-            property_data = data.get("propertyData", {})
-
-            # Extract floorplan
-            floorplan_url: str | None = None
-            floorplans = property_data.get("floorplans", [])
-            if floorplans and floorplans[0].get("url"):
-                floorplan_url = floorplans[0]["url"]
-
-            # Extract gallery images
-            gallery_urls: list[str] = []
-            images = property_data.get("images", [])
-            for img in images[: self._max_gallery_images]:
-                url = img.get("url", "")
-                if url and not _is_epc_url(url):
-                    gallery_urls.append(url)
-
-            # Extract description
-            description = property_data.get("text", {}).get("description")
-
-            # Extract key features
-            features: list[str] = []
-            key_features = property_data.get("keyFeatures", [])
-            if key_features:
-                features.extend(key_features)
-
-            # Extract location coordinates
-            latitude: float | None = None
-            longitude: float | None = None
-            location = property_data.get("location", {})
-            lat_raw = location.get("latitude")
-            lng_raw = location.get("longitude")
-            if lat_raw is not None and lng_raw is not None:
-                latitude = float(lat_raw)
-                longitude = float(lng_raw)
-
-            # Extract full postcode from address data
-            postcode: str | None = None
-            address_data = property_data.get("address", {})
-            outcode = address_data.get("outcode", "")
-            incode = address_data.get("incode", "")
-            if outcode and incode:
-                postcode = f"{outcode} {incode}"
-
-            # Extract floor area from sizings (validate in sqft, convert to sqm)
-            floor_area_sqm: float | None = None
-            sizings = property_data.get("sizings", [])
-            for sizing in sizings:
-                if sizing.get("unit") == "sqft":
-                    raw = sizing.get("maximumSize") or sizing.get("minimumSize")
-                    if (
-                        isinstance(raw, (int, float))
-                        and _FLOOR_AREA_MIN_SQFT <= raw <= _FLOOR_AREA_MAX_SQFT
-                    ):
-                        floor_area_sqm = round(raw * SQM_PER_SQFT, 1)
-                        break
-
-            return DetailPageData(
-                floorplan_url=floorplan_url,
-                gallery_urls=gallery_urls if gallery_urls else None,
-                description=description,
-                features=features if features else None,
-                latitude=latitude,
-                longitude=longitude,
-                postcode=postcode,
-                floor_area_sqm=floor_area_sqm,
-                floor_area_source="rightmove" if floor_area_sqm else None,
-            )
+            return data
 
         except Exception as e:
             logger.warning(
@@ -659,50 +877,7 @@ class DetailFetcher:
                 )
                 return None
             html: str = response.text
-            max_imgs = self._max_gallery_images
-
-            floorplan_url: str | None = None
-            gallery_urls: list[str] = []
-            description: str | None = None
-            features: list[str] = []
-            seen_hashes: set[str] = set()
-
-            next_data = _zoopla_from_next_data(html, max_imgs)
-            if next_data:
-                gallery_urls, floorplan_url, description, features = next_data
-
-            if not description:
-                rsc_desc, rsc_feats = _zoopla_desc_from_rsc(html)
-                description = rsc_desc
-                if rsc_feats and not features:
-                    features = rsc_feats
-
-            if not description:
-                description = _zoopla_desc_from_html(html)
-
-            if not gallery_urls:
-                gallery_urls, seen_hashes = _zoopla_images_from_rsc_captions(html, max_imgs)
-
-            if len(gallery_urls) < 3:
-                gallery_urls.extend(
-                    _zoopla_images_from_full_urls(html, gallery_urls, seen_hashes, max_imgs)
-                )
-
-            if not floorplan_url:
-                floorplan_url = _zoopla_floorplan_from_html(html)
-
-            # Extract floor area from RSC payload (sqft), convert to sqm
-            raw_sqft = _zoopla_size_from_rsc(html)
-            floor_area_sqm = round(raw_sqft * SQM_PER_SQFT, 1) if raw_sqft else None
-
-            return DetailPageData(
-                floorplan_url=floorplan_url,
-                gallery_urls=gallery_urls if gallery_urls else None,
-                description=description,
-                features=features if features else None,
-                floor_area_sqm=floor_area_sqm,
-                floor_area_source="zoopla" if floor_area_sqm else None,
-            )
+            return await parse_in_worker(_parse_zoopla_detail, html, self._max_gallery_images)
 
         except Exception as e:
             logger.warning("zoopla_fetch_failed", property_id=prop.unique_id, error=str(e))
@@ -730,101 +905,7 @@ class DetailFetcher:
                 logger.debug("openrent_property_unavailable", property_id=prop.unique_id)
                 return None
 
-            # Extract floorplan - look for floorplan images in the carousel
-            floorplan_url: str | None = None
-            floorplan_match = re.search(
-                r'href="(//imagescdn\.openrent\.co\.uk/[^"]*floorplan[^"]*)"',
-                html,
-                re.IGNORECASE,
-            )
-            if floorplan_match:
-                url = floorplan_match.group(1)
-                floorplan_url = f"https:{url}" if url.startswith("//") else url
-
-            # Extract gallery images from PhotoSwipe lightbox (new structure)
-            # OpenRent now uses class="lightbox_item" with data-pswp-* attributes
-            gallery_urls: list[str] = []
-
-            # Pattern 1: PhotoSwipe lightbox items (current structure)
-            gallery_matches = re.findall(
-                r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*lightbox_item[^"]*"',
-                html,
-                re.IGNORECASE,
-            )
-            for url in gallery_matches[: self._max_gallery_images]:
-                if (
-                    url
-                    and "floorplan" not in url.lower()
-                    and not _is_epc_url(url)
-                    and not _is_video_url(url)
-                ):
-                    full_url = f"https:{url}" if url.startswith("//") else url
-                    gallery_urls.append(full_url)
-
-            # Pattern 2: Fallback - old data-lightbox="gallery" pattern
-            if not gallery_urls:
-                gallery_matches = re.findall(
-                    r'<a[^>]*href="([^"]+)"[^>]*data-lightbox="gallery"',
-                    html,
-                    re.IGNORECASE,
-                )
-                for url in gallery_matches[: self._max_gallery_images]:
-                    if (
-                        url
-                        and "floorplan" not in url.lower()
-                        and not _is_epc_url(url)
-                        and not _is_video_url(url)
-                    ):
-                        full_url = f"https:{url}" if url.startswith("//") else url
-                        gallery_urls.append(full_url)
-
-            # Pattern 3: Fallback - look for property images by URL pattern
-            if not gallery_urls:
-                img_matches = re.findall(
-                    r'(//imagescdn\.openrent\.co\.uk/listings/\d+/[^"]+\.(?:jpg|jpeg|png|webp))',
-                    html,
-                    re.IGNORECASE,
-                )
-                for url in img_matches[: self._max_gallery_images]:
-                    if url and "floorplan" not in url.lower() and not _is_epc_url(url):
-                        full_url = f"https:{url}"
-                        if full_url not in gallery_urls:
-                            gallery_urls.append(full_url)
-
-            # Extract description - OpenRent uses a description div
-            description: str | None = None
-            desc_match = re.search(
-                r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>',
-                html,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if desc_match:
-                # Strip HTML tags
-                desc_text = re.sub(r"<[^>]+>", " ", desc_match.group(1))
-                desc_text = re.sub(r"\s+", " ", desc_text).strip()
-                if desc_text:
-                    description = desc_text
-
-            # Extract features - OpenRent lists features in a ul
-            features: list[str] = []
-            features_match = re.search(
-                r'<ul[^>]*class="[^"]*feature[^"]*"[^>]*>(.*?)</ul>',
-                html,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if features_match:
-                feature_items = re.findall(r"<li[^>]*>(.*?)</li>", features_match.group(1))
-                for item in feature_items:
-                    text = re.sub(r"<[^>]+>", "", item).strip()
-                    if text:
-                        features.append(text)
-
-            return DetailPageData(
-                floorplan_url=floorplan_url,
-                gallery_urls=gallery_urls if gallery_urls else None,
-                description=description,
-                features=features if features else None,
-            )
+            return await parse_in_worker(_parse_openrent_detail, html, self._max_gallery_images)
 
         except Exception as e:
             logger.warning("openrent_fetch_failed", property_id=prop.unique_id, error=str(e))
@@ -849,77 +930,7 @@ class DetailFetcher:
                 return None
             html: str = response.text
 
-            # OnTheMarket uses Next.js with Redux state in __NEXT_DATA__
-            match = re.search(
-                r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
-                html,
-                re.DOTALL,
-            )
-            if not match:
-                return None
-
-            data = json.loads(match.group(1))
-            redux_state = data.get("props", {}).get("initialReduxState", {})
-            property_data = redux_state.get("property", {})
-
-            # Extract floorplan
-            floorplan_url: str | None = None
-            floorplans = property_data.get("floorplans", [])
-            if floorplans:
-                fp = floorplans[0]
-                floorplan_url = fp.get("original") or fp.get("largeUrl") or fp.get("url")
-
-            # Extract gallery images
-            # OnTheMarket uses 'largeUrl' or 'prefix' + geometry suffix
-            gallery_urls: list[str] = []
-            images = property_data.get("images", [])
-            for img in images[: self._max_gallery_images]:
-                if isinstance(img, dict):
-                    # Try various URL fields
-                    url = img.get("original") or img.get("largeUrl") or img.get("url")
-                    # Fallback: construct from prefix if available
-                    if not url and img.get("prefix"):
-                        url = f"{img['prefix']}-1024x1024.jpg"
-                else:
-                    url = img
-                if url and not _is_epc_url(url):
-                    gallery_urls.append(url)
-
-            # Extract description
-            description = property_data.get("description")
-
-            # Extract features
-            features: list[str] = []
-            key_features = property_data.get("keyFeatures", [])
-            if key_features:
-                features.extend(key_features)
-            # Also check for bullet points
-            bullets = property_data.get("bullets", [])
-            if bullets:
-                features.extend(bullets)
-            # Features as array of objects {id, feature}
-            feature_objects = property_data.get("features", [])
-            for feat in feature_objects:
-                if isinstance(feat, dict) and feat.get("feature"):
-                    features.append(feat["feature"])
-
-            # Extract floor area (validate in sqft, convert to sqm)
-            floor_area_sqm: float | None = None
-            raw_sqft = property_data.get("minimumAreaSqFt")
-            if (
-                isinstance(raw_sqft, (int, float))
-                and _FLOOR_AREA_MIN_SQFT <= raw_sqft <= _FLOOR_AREA_MAX_SQFT
-            ):
-                floor_area_sqm = round(raw_sqft * SQM_PER_SQFT, 1)
-
-            return DetailPageData(
-                floorplan_url=floorplan_url,
-                gallery_urls=gallery_urls if gallery_urls else None,
-                description=description,
-                features=features if features else None,
-                floor_area_sqm=floor_area_sqm,
-                floor_area_source="onthemarket" if floor_area_sqm else None,
-            )
+            return await parse_in_worker(_parse_onthemarket_detail, html, self._max_gallery_images)
 
         except Exception as e:
             logger.warning("onthemarket_fetch_failed", property_id=prop.unique_id, error=str(e))
@@ -944,9 +955,16 @@ class DetailFetcher:
             self._image_breakers[cdn_key] = breaker
         return breaker
 
+    def image_download_stats(self) -> dict[str, ImageDownloadStats]:
+        """Image download counters so far, keyed by CDN key or hostname."""
+        return dict(self._image_stats)
+
     async def download_image_bytes(self, url: str) -> bytes | None:
         """Download image bytes from a URL.
 
+        Safe to call concurrently: at most ``_IMAGE_CONCURRENCY_PER_HOST``
+        downloads run per host, on top of the per-CDN throttles.
+
         Uses curl_cffi with per-CDN throttling and circuit breakers for
         anti-bot CDNs (zoocdn.com, onthemarket.com, imagescdn.openrent.co.uk).
         Uses httpx for everything else.
@@ -958,15 +976,34 @@ class DetailFetcher:
             Raw image bytes, or None if download failed.
         """
         cdn_key = self._get_cdn_key(url)
-
-        if cdn_key is not None:
-            # curl_cffi path with per-CDN throttle + circuit breaker
-            breaker = self._get_image_breaker(cdn_key)
-            if breaker.is_tripped:
+        host = cdn_key or urlparse(url).hostname or ""
+        slot = self._image_slots.get(host)
+        if slot is None:
+            slot = self._image_slots[host] = asyncio.Semaphore(_IMAGE_CONCURRENCY_PER_HOST)
+
+        async with slot:
+            # Checked once a slot is free, so queued downloads see a breaker
+            # that tripped while they waited
+            if cdn_key is not None and self._get_image_breaker(cdn_key).is_tripped:
                 self._image_skip_counts[cdn_key] = self._image_skip_counts.get(cdn_key, 0) + 1
                 logger.debug("image_download_circuit_open", url=url, cdn=cdn_key)
                 return None
 
+            stats = self._image_stats.setdefault(host, ImageDownloadStats())
+            loop = asyncio.get_running_loop()
+            stats.started(loop.time())
+            data: bytes | None = None
+            try:
+                data = await self._download_image(url, cdn_key)
+            finally:
+                stats.finished(loop.time(), data)
+            return data
+
+    async def _download_image(self, url: str, cdn_key: str | None) -> bytes | None:
+        """Fetch and validate one image (see ``download_image_bytes``)."""
+        if cdn_key is not None:
+            # curl_cffi path with per-CDN throttle + circuit breaker
+            breaker = self._get_image_breaker(cdn_key)
             throttle_name, interval = _CDN_THROTTLE_CONFIG[cdn_key]
             try:
                 response = await self._curl_get_with_retry(
@@ -1007,9 +1044,7 @@ class DetailFetcher:
             logger.warning("image_download_not_image", url=url, prefix=data[:16])
             return None
         # Validate PIL can fully decode it (catches truncated/corrupt downloads)
-        try:
-            Image.open(io.BytesIO(data)).load()
-        except Exception:
+        if not await run_image_task(is_decodable_image, data):
             logger.warning("image_download_corrupt", url=url)
             return None
         return data
@@ -1029,6 +1064,16 @@ class DetailFetcher:
                 skipped=count,
                 threshold=_IMAGE_CB_THRESHOLD,
             )
+        for host, stats in self._image_stats.items():
+            logger.info(
+                "image_download_throughput",
+                host=host,
+                downloaded=stats.downloaded,
+                failed=stats.failed,
+                megabytes=round(stats.total_bytes / 1_000_000, 2),
+                busy_seconds=round(stats.busy_seconds, 1),
+                images_per_second=round(stats.images_per_second, 2),
+            )
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -11,8 +11,9 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from home_finder.logging import get_logger
 from home_finder.models import FurnishType, Property, PropertySource
-from home_finder.scrapers.base import BaseScraper, ScrapeResult
+from home_finder.scrapers.base import BaseScraper, ScrapeResult, ScrapeWatermark
 from home_finder.scrapers.constants import BROWSER_HEADERS
+from home_finder.scrapers.parse_worker import parse_in_worker, property_rows, validate_properties
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
 from home_finder.scrapers.retry import SCRAPER_WAIT, RetryableHttpError
 
@@ -27,6 +28,7 @@ class OnTheMarketScraper(BaseScraper):
     # Pagination constants
     MAX_PAGES = 20
     PAGE_DELAY_SECONDS = 0.5
+    SEARCH_SORT = "sort-field=update_date"  # "Recent": last updated first
 
     # Retry constants
     MAX_RETRIES = 4
@@ -65,6 +67,7 @@ class OnTheMarketScraper(BaseScraper):
         min_bathrooms: int = 0,
         include_let_agreed: bool = True,
         max_results: int | None = None,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
     ) -> ScrapeResult:
         """Scrape OnTheMarket for matching properties (all pages)."""
@@ -90,10 +93,11 @@ class OnTheMarketScraper(BaseScraper):
                 return None  # Signals fetch failure to _paginate
 
             # Parse __NEXT_DATA__ JSON
-            properties = self._parse_next_data(html)
-            if properties is None:
+            rows = await parse_in_worker(_parse_search_page, html)
+            if rows is None:
                 parse_errors += 1
                 return []
+            properties = validate_properties(rows)
             logger.info(
                 "scraped_onthemarket_page",
                 url=url,
@@ -105,6 +109,10 @@ class OnTheMarketScraper(BaseScraper):
         async def delay() -> None:
             await asyncio.sleep(self.PAGE_DELAY_SECONDS)
 
+        # Results are sorted by update date, not listing age, so a page of
+        # older listing IDs says nothing about later pages and the watermark
+        # isn't passed (WATERMARK_SORT stays None). Stop instead at the first
+        # page whose listings are all already stored.
         result = await self._paginate(
             fetch_page,
             max_pages=self.MAX_PAGES,
@@ -305,7 +313,7 @@ class OnTheMarketScraper(BaseScraper):
             "price-per=pcm",
             "shared=false",
             "let-length=long-term",
-            "sort-field=update_date",
+            self.SEARCH_SORT,
         ]
 
         if min_bedrooms > 0:
@@ -327,3 +335,9 @@ class OnTheMarketScraper(BaseScraper):
         # OnTheMarket has no bathroom count filter
 
         return f"{self.BASE_URL}/to-rent/property/{area_slug}/?{'&'.join(params)}"
+
+
+def _parse_search_page(html: str) -> list[dict[str, Any]] | None:
+    """Parse a search results page in a parse worker (see ``parse_in_worker``)."""
+    properties = OnTheMarketScraper()._parse_next_data(html)
+    return None if properties is None else property_rows(properties)
@@ -2,6 +2,7 @@
 
 import asyncio
 import re
+from typing import Any
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup, Tag
@@ -11,8 +12,9 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from home_finder.logging import get_logger
 from home_finder.models import FurnishType, Property, PropertySource
-from home_finder.scrapers.base import BaseScraper, ScrapeResult
+from home_finder.scrapers.base import BaseScraper, ScrapeResult, ScrapeWatermark
 from home_finder.scrapers.constants import BROWSER_HEADERS
+from home_finder.scrapers.parse_worker import parse_in_worker, property_rows, validate_properties
 from home_finder.scrapers.retry import SCRAPER_WAIT, RetryableHttpError
 
 logger = get_logger(__name__)
@@ -123,6 +125,7 @@ class OpenRentScraper(BaseScraper):
         min_bathrooms: int = 0,
         include_let_agreed: bool = True,
         max_results: int | None = None,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
     ) -> ScrapeResult:
         """Scrape OpenRent for matching properties (all pages)."""
@@ -148,11 +151,11 @@ class OpenRentScraper(BaseScraper):
             if html is None:
                 return None  # Signals fetch failure to _paginate
 
-            soup = BeautifulSoup(html, "html.parser")
-            page_properties = self._parse_search_results(soup, url)
-            if page_properties is None:
+            rows = await parse_in_worker(_parse_search_page, html, url)
+            if rows is None:
                 parse_errors += 1
                 return []
+            page_properties = validate_properties(rows)
 
             logger.info(
                 "scraped_openrent_page",
@@ -167,12 +170,12 @@ class OpenRentScraper(BaseScraper):
 
         # OpenRent has no "newest first" sort option (sortType only supports
         # 0=Distance, 1=Price↑, 2=Price↓). Results default to distance order,
-        # so the early-stop assumption (all-known page ⇒ everything after is
-        # older) doesn't hold. Disable early-stop by not passing known_source_ids.
+        # so the early-stop assumption (a page of older listings ⇒ everything
+        # after is older) doesn't hold. Disable early-stop by passing neither the
+        # watermark (WATERMARK_SORT stays None) nor known_source_ids.
         result = await self._paginate(
             fetch_page,
             max_pages=self.MAX_PAGES,
-            known_source_ids=None,
             max_results=max_results,
             page_delay=delay,
         )
@@ -485,3 +488,10 @@ class OpenRentScraper(BaseScraper):
             if match:
                 return int(match.group(1))
         return None
+
+
+def _parse_search_page(html: str, url: str) -> list[dict[str, Any]] | None:
+    """Parse a search results page in a parse worker (see ``parse_in_worker``)."""
+    soup = BeautifulSoup(html, "html.parser")
+    properties = OpenRentScraper()._parse_search_results(soup, url)
+    return None if properties is None else property_rows(properties)
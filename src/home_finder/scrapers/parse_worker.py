@@ -0,0 +1,47 @@
+"""Run page parsers off the event loop.
+
+Search and detail pages run to several megabytes, and BeautifulSoup, regex
+and JSON parsing all hold the GIL, so parsing on the event loop stalls every
+other coroutine — including dashboard requests in ``--serve`` mode.
+``parse_in_worker`` runs a parser in the shared worker pool that a pipeline
+run opens for image work (``image_pool``), or in a worker thread outside one.
+
+Parsers are module-level functions taking the page text and returning plain
+picklable values. Search parsers return ``property_rows``, which the scraper
+turns back into models with ``validate_properties`` on the event loop.
+"""
+
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+from pydantic import ValidationError
+
+from home_finder.logging import get_logger
+from home_finder.models import Property
+from home_finder.utils.image_pool import run_image_task
+
+logger = get_logger(__name__)
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+async def parse_in_worker(fn: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run the parser ``fn`` in the shared worker pool, or a thread without one."""
+    return await run_image_task(fn, *args, **kwargs)
+
+
+def property_rows(properties: list[Property]) -> list[dict[str, Any]]:
+    """Dump parsed properties to plain dicts for the trip back from a worker."""
+    return [p.model_dump(mode="json") for p in properties]
+
+
+def validate_properties(rows: list[dict[str, Any]]) -> list[Property]:
+    """Validate a worker's rows into properties, skipping any that don't validate."""
+    properties: list[Property] = []
+    for row in rows:
+        try:
+            properties.append(Property.model_validate(row))
+        except ValidationError as e:
+            logger.warning("parsed_property_invalid", source_id=row.get("source_id"), error=str(e))
+    return properties
@@ -1,27 +1,119 @@
 """Rightmove property scraper."""
 
 import asyncio
+import contextlib
 import re
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Final
 from urllib.parse import urljoin
 
 import httpx
 from bs4 import BeautifulSoup, Tag
-from crawlee.crawlers import BeautifulSoupCrawler, BeautifulSoupCrawlingContext
-from crawlee.storage_clients import MemoryStorageClient
 from pydantic import HttpUrl
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from home_finder.data.location_mappings import RIGHTMOVE_LOCATIONS, RIGHTMOVE_OUTCODES
 from home_finder.logging import get_logger
 from home_finder.models import FurnishType, Property, PropertySource
-from home_finder.scrapers.base import BaseScraper, ScrapeResult
+from home_finder.scrapers.base import BaseScraper, ScrapeResult, ScrapeWatermark
+from home_finder.scrapers.constants import BROWSER_HEADERS
+from home_finder.scrapers.parse_worker import parse_in_worker, property_rows, validate_properties
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
+from home_finder.scrapers.retry import SCRAPER_WAIT, RetryableHttpError
 from home_finder.utils.address import is_outcode
 
 logger = get_logger(__name__)
 
-# Cache for discovered outcode identifiers
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Long-lived client shared by every RightmoveScraper created inside
+# rightmove_session() (e.g. for the lifetime of the --serve web server).
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "rightmove_shared_client", default=None
+)
+
+
+def _new_client() -> httpx.AsyncClient:
+    """Create a keep-alive HTTP client for Rightmove search pages."""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        # httpx negotiates Accept-Encoding itself (brotli only when installed)
+        headers={
+            "User-Agent": _USER_AGENT,
+            "Accept": BROWSER_HEADERS["Accept"],
+            "Accept-Language": BROWSER_HEADERS["Accept-Language"],
+        },
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120.0),
+    )
+
+
+@asynccontextmanager
+async def rightmove_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Share one Rightmove HTTP session across scraper instances.
+
+    Scrapers created while the context is active (including in tasks spawned
+    from it) reuse this client instead of opening their own, so connections
+    stay warm across pipeline runs.
+    """
+    client = _new_client()
+    token = _shared_client.set(client)
+    try:
+        yield client
+    finally:
+        _shared_client.reset(token)
+        await client.aclose()
+
+
+# Cache for discovered outcode identifiers (seeded from the DB by the pipeline)
 _outcode_cache: dict[str, str] = {}
 
+# Resolved identifiers change rarely; the pipeline re-resolves them after this
+OUTCODE_ID_TTL_DAYS: Final = 180
+
+# Concurrent typeahead lookups in resolve_rightmove_outcodes
+_OUTCODE_LOOKUP_CONCURRENCY: Final = 4
+
+
+async def _lookup_outcode_id(client: httpx.AsyncClient, outcode: str) -> str | None:
+    """Query the typeahead API for an (upper-case) outcode's identifier."""
+    # Tokenize: split into 2-char chunks
+    tokens = [outcode[i : i + 2] for i in range(0, len(outcode), 2)]
+    tokenized = "/".join(tokens) + "/"
+
+    url = f"https://www.rightmove.co.uk/typeAhead/uknostreet/{tokenized}"
+
+    try:
+        resp = await client.get(url, timeout=10)
+        if resp.status_code == 200:
+            data = resp.json()
+            for loc in data.get("typeAheadLocations", []):
+                name = loc.get("displayName", "").upper()
+                # Match exact outcode or outcode followed by comma/space
+                if (
+                    name == outcode
+                    or name.startswith(f"{outcode},")
+                    or name.startswith(f"{outcode} ")
+                ):
+                    identifier = loc.get("locationIdentifier")
+                    if isinstance(identifier, str):
+                        _outcode_cache[outcode] = identifier
+                        logger.debug(
+                            "rightmove_outcode_resolved",
+                            outcode=outcode,
+                            identifier=identifier,
+                        )
+                        return identifier
+    except Exception as e:
+        logger.warning("rightmove_outcode_lookup_error", outcode=outcode, error=str(e))
+
+    return None
+
 
 async def get_rightmove_outcode_id(outcode: str) -> str | None:
     """Look up Rightmove location identifier for an outcode via typeahead API.
@@ -37,38 +129,59 @@ async def get_rightmove_outcode_id(outcode: str) -> str | None:
     if outcode in _outcode_cache:
         return _outcode_cache[outcode]
 
-    # Tokenize: split into 2-char chunks
-    tokens = [outcode[i : i + 2] for i in range(0, len(outcode), 2)]
-    tokenized = "/".join(tokens) + "/"
+    shared = _shared_client.get()
+    if shared is not None:
+        return await _lookup_outcode_id(shared, outcode)
+    async with httpx.AsyncClient() as client:
+        return await _lookup_outcode_id(client, outcode)
 
-    url = f"https://www.rightmove.co.uk/typeAhead/uknostreet/{tokenized}"
 
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                for loc in data.get("typeAheadLocations", []):
-                    name = loc.get("displayName", "").upper()
-                    # Match exact outcode or outcode followed by comma/space
-                    if (
-                        name == outcode
-                        or name.startswith(f"{outcode},")
-                        or name.startswith(f"{outcode} ")
-                    ):
-                        identifier = loc.get("locationIdentifier")
-                        if isinstance(identifier, str):
-                            _outcode_cache[outcode] = identifier
-                            logger.debug(
-                                "rightmove_outcode_resolved",
-                                outcode=outcode,
-                                identifier=identifier,
-                            )
-                            return identifier
-    except Exception as e:
-        logger.warning("rightmove_outcode_lookup_error", outcode=outcode, error=str(e))
+def seed_outcode_ids(identifiers: Mapping[str, str]) -> None:
+    """Add known outcode identifiers (e.g. from the DB) to the lookup cache."""
+    _outcode_cache.update({outcode.upper(): ident for outcode, ident in identifiers.items()})
 
-    return None
+
+async def resolve_rightmove_outcodes(outcodes: Iterable[str]) -> dict[str, str]:
+    """Resolve outcodes that aren't mapped or cached yet, concurrently.
+
+    Outcodes in ``RIGHTMOVE_OUTCODES`` or already in the cache are skipped;
+    the rest are looked up over one client, a few at a time, so searches
+    don't wait on them one by one. The static map is checked first in
+    ``_build_search_url`` too and is never copied into ``rightmove_outcodes``,
+    so it stays the single source of truth for the outcodes it covers.
+
+    Returns:
+        Newly resolved outcode -> identifier (e.g., "OUTCODE^707").
+    """
+    pending = sorted(
+        {
+            o.upper()
+            for o in outcodes
+            if o.upper() not in RIGHTMOVE_OUTCODES and o.upper() not in _outcode_cache
+        }
+    )
+    if not pending:
+        return {}
+
+    semaphore = asyncio.Semaphore(_OUTCODE_LOOKUP_CONCURRENCY)
+
+    async def _resolve(client: httpx.AsyncClient, outcode: str) -> str | None:
+        async with semaphore:
+            return await _lookup_outcode_id(client, outcode)
+
+    async with contextlib.AsyncExitStack() as stack:
+        client = _shared_client.get()
+        if client is None:
+            client = await stack.enter_async_context(_new_client())
+        identifiers = await asyncio.gather(*(_resolve(client, o) for o in pending))
+
+    resolved = {o: ident for o, ident in zip(pending, identifiers, strict=True) if ident}
+    logger.info(
+        "rightmove_outcodes_resolved",
+        requested=len(pending),
+        resolved=len(resolved),
+    )
+    return resolved
 
 
 class RightmoveScraper(BaseScraper):
@@ -84,6 +197,74 @@ class RightmoveScraper(BaseScraper):
     RESULTS_PER_PAGE = 24
     MAX_PAGES = 20
     PAGE_DELAY_SECONDS = 2.0
+    SEARCH_SORT = "sortType=6"  # Newest listed
+    WATERMARK_SORT = SEARCH_SORT
+
+    # 429/5xx retry constants
+    MAX_RETRIES = 3
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._owns_client = False
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared session client, or create one owned by this scraper."""
+        if self._client is None:
+            shared = _shared_client.get()
+            if shared is not None:
+                self._client = shared
+            else:
+                self._client = _new_client()
+                self._owns_client = True
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client if this scraper created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+        self._owns_client = False
+
+    async def _fetch_page(self, url: str) -> str | None:
+        """Fetch a search page over the persistent client with 429/5xx retry."""
+        client = await self._get_client()
+
+        @retry(
+            stop=stop_after_attempt(self.MAX_RETRIES),
+            wait=SCRAPER_WAIT,
+            retry=retry_if_exception_type(RetryableHttpError),
+            reraise=True,
+        )
+        async def _do_fetch() -> str:
+            response = await client.get(url)
+
+            if response.status_code == 200:
+                return response.text
+
+            if response.status_code == 429 or response.status_code >= 500:
+                raise RetryableHttpError(response.status_code, url)
+
+            logger.warning(
+                "rightmove_http_error",
+                status=response.status_code,
+                url=url,
+            )
+            return ""  # empty string signals non-retryable failure
+
+        try:
+            result = await _do_fetch()
+            return result if result else None
+        except RetryableHttpError as e:
+            logger.warning(
+                "rightmove_retries_exhausted",
+                url=url,
+                status=e.status_code,
+                attempts=self.MAX_RETRIES,
+            )
+            return None
+        except Exception as e:
+            logger.warning("rightmove_fetch_failed", url=url, error=str(e), exc_info=True)
+            return None
 
     async def scrape(
         self,
@@ -97,6 +278,7 @@ class RightmoveScraper(BaseScraper):
         min_bathrooms: int = 0,
         include_let_agreed: bool = True,
         max_results: int | None = None,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
     ) -> ScrapeResult:
         """Scrape Rightmove for matching properties (all pages)."""
@@ -120,38 +302,15 @@ class RightmoveScraper(BaseScraper):
             index = page_idx * self.RESULTS_PER_PAGE
             url = f"{search_url}&index={index}" if page_idx > 0 else search_url
 
-            page_properties: list[Property] = []
-            crawl_failed = False
-            page_parse_failed = [False]  # mutable container for nested closure
-
-            async def handle_page(
-                context: BeautifulSoupCrawlingContext,
-                _props: list[Property] = page_properties,
-            ) -> None:
-                soup = context.soup
-                parsed = self._parse_search_results(soup, str(context.request.url))
-                if parsed is None:
-                    page_parse_failed[0] = True
-                else:
-                    _props.extend(parsed)
-
-            crawler = BeautifulSoupCrawler(
-                max_requests_per_crawl=1,
-                storage_client=MemoryStorageClient(),
-            )
-            crawler.router.default_handler(handle_page)
-            try:
-                await crawler.run([url])
-            except Exception as e:
-                logger.warning("rightmove_crawl_failed", url=url, error=str(e), exc_info=True)
-                crawl_failed = True
+            html = await self._fetch_page(url)
+            if html is None:
+                return None  # Signals fetch failure to _paginate
 
-            if page_parse_failed[0]:
+            rows = await parse_in_worker(_parse_search_page, html, url)
+            if rows is None:
                 parse_errors += 1
                 return []
-
-            if crawl_failed and not page_properties:
-                return None  # Signals fetch failure to _paginate
+            page_properties = validate_properties(rows)
 
             logger.info(
                 "scraped_rightmove_page",
@@ -167,6 +326,7 @@ class RightmoveScraper(BaseScraper):
         result = await self._paginate(
             fetch_page,
             max_pages=self.MAX_PAGES,
+            watermark=watermark,
             known_source_ids=known_source_ids,
             max_results=max_results,
             page_delay=delay,
@@ -230,7 +390,7 @@ class RightmoveScraper(BaseScraper):
             f"maxPrice={max_price}",
             "dontShow=houseShare",
             "letType=longTerm",
-            "sortType=6",
+            self.SEARCH_SORT,
         ]
 
         if min_bedrooms > 0:
@@ -475,3 +635,10 @@ class RightmoveScraper(BaseScraper):
         """Extract property ID from URL."""
         match = re.search(r"/properties/(\d+)", url)
         return match.group(1) if match else None
+
+
+def _parse_search_page(html: str, url: str) -> list[dict[str, Any]] | None:
+    """Parse a search results page in a parse worker (see ``parse_in_worker``)."""
+    soup = BeautifulSoup(html, "html.parser")
+    properties = RightmoveScraper()._parse_search_results(soup, url)
+    return None if properties is None else property_rows(properties)
@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import random
 import re
 import urllib.parse
-from contextlib import suppress
 from typing import Any
 
 from bs4 import BeautifulSoup, Tag
@@ -18,10 +16,12 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 from home_finder.data.location_mappings import BOROUGH_AREAS
 from home_finder.logging import get_logger
 from home_finder.models import FurnishType, Property, PropertySource
-from home_finder.scrapers.base import BaseScraper, ScrapeResult
+from home_finder.scrapers.base import BaseScraper, ScrapeResult, ScrapeWatermark
 from home_finder.scrapers.constants import BROWSER_HEADERS
+from home_finder.scrapers.parse_worker import parse_in_worker, property_rows, validate_properties
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
 from home_finder.scrapers.retry import SCRAPER_WAIT, RetryableHttpError
+from home_finder.scrapers.zoopla_rsc import RscListing, iter_records
 from home_finder.utils.address import is_outcode
 
 logger = get_logger(__name__)
@@ -186,6 +186,8 @@ class ZooplaScraper(BaseScraper):
 
     # Pagination constants
     MAX_PAGES = 20
+    SEARCH_SORT = "results_sort=newest_listings"
+    WATERMARK_SORT = SEARCH_SORT
 
     # Cloudflare challenge markers in response body
     _CF_CHALLENGE_MARKERS = (
@@ -305,6 +307,7 @@ class ZooplaScraper(BaseScraper):
         min_bathrooms: int = 0,
         include_let_agreed: bool = True,
         max_results: int | None = None,
+        watermark: ScrapeWatermark | None = None,
         known_source_ids: set[str] | None = None,
     ) -> ScrapeResult:
         """Scrape Zoopla for matching properties (all pages)."""
@@ -335,30 +338,10 @@ class ZooplaScraper(BaseScraper):
             if html is None:
                 return None  # Signals fetch failure to _paginate
 
-            # Try RSC extraction first (primary method)
-            rsc_result = self._parse_rsc_properties(html)
-            rsc_failed = rsc_result is None
-
-            if rsc_result:
-                properties = rsc_result
-                method = "rsc"
-            else:
-                # RSC returned [] (no listings) or None (parse failure) — try HTML
-                soup = BeautifulSoup(html, "html.parser")
-                html_result = self._parse_search_results(soup, url)
-                html_failed = html_result is None
-
-                if html_result:
-                    properties = html_result
-                    method = "html"
-                elif rsc_failed and html_failed:
-                    # Both methods had structural markers but couldn't parse
-                    parse_errors += 1
-                    properties = []
-                    method = "failed"
-                else:
-                    properties = []
-                    method = "html"
+            rows, method = await parse_in_worker(_parse_search_page, html, url)
+            if method == "failed":
+                parse_errors += 1
+            properties = validate_properties(rows)
 
             logger.info(
                 "scraped_zoopla_page",
@@ -372,6 +355,7 @@ class ZooplaScraper(BaseScraper):
         result = await self._paginate(
             fetch_page,
             max_pages=self.MAX_PAGES,
+            watermark=watermark,
             known_source_ids=known_source_ids,
             max_results=max_results,
             page_delay=self._page_delay,
@@ -447,91 +431,23 @@ class ZooplaScraper(BaseScraper):
             return None
 
     def _extract_rsc_listings(self, html: str) -> list[ZooplaListing]:
-        """Extract listing data from React Server Components payload.
+        """Extract listing data from the React Server Components payload.
 
-        The RSC format is: self.__next_f.push([1, "id:json_content"])
-        The second element is a string containing an RSC line ID followed by
-        a colon and then JSON content.
+        See ``zoopla_rsc`` for the payload format. Listings that fail
+        validation are skipped; duplicates are dropped by listing_id.
         """
-        pattern = r"self\.__next_f\.push\(\s*\[(.*?)\]\s*\)"
-        matches = re.findall(pattern, html, re.DOTALL)
         listings: list[ZooplaListing] = []
-
-        for match in matches:
-            if "regularListingsFormatted" not in match and "listingId" not in match:
-                continue
-
-            # Parse the push call arguments as a JSON array: [1, "id:content"]
-            try:
-                arr = json.loads(f"[{match}]")
-            except json.JSONDecodeError:
-                continue
-
-            if len(arr) < 2 or not isinstance(arr[1], str):
-                continue
-
-            payload = arr[1]
-
-            # Split on first colon to separate RSC line ID from content
-            colon_idx = payload.find(":")
-            if colon_idx < 0:
+        seen: set[int] = set()
+        for record in iter_records(html):
+            if not isinstance(record, RscListing):
                 continue
-
-            rsc_content = payload[colon_idx + 1 :]
-
-            # The RSC content is a JSON array like ["$","$L7a",null,{props}]
             try:
-                parsed = json.loads(rsc_content)
-            except json.JSONDecodeError:
+                listing = ZooplaListing.model_validate(record.data)
+            except ValidationError:
                 continue
-
-            found = self._extract_listings_from_parsed(parsed)
-            listings.extend(found)
-
-        # Deduplicate by listing_id
-        seen: set[int] = set()
-        unique: list[ZooplaListing] = []
-        for listing in listings:
             if listing.listing_id not in seen:
                 seen.add(listing.listing_id)
-                unique.append(listing)
-
-        return unique
-
-    def _extract_listings_from_parsed(self, data: Any, depth: int = 0) -> list[ZooplaListing]:
-        """Recursively search a parsed JSON structure for listing data."""
-        if depth > 15:
-            return []
-
-        listings: list[ZooplaListing] = []
-
-        if isinstance(data, dict):
-            # Check for known container key
-            if "regularListingsFormatted" in data:
-                raw = data["regularListingsFormatted"]
-                if isinstance(raw, list):
-                    for item in raw:
-                        if isinstance(item, dict) and "listingId" in item:
-                            try:
-                                listings.append(ZooplaListing.model_validate(item))
-                            except ValidationError:
-                                continue
-
-            # Check if this dict is itself a listing
-            if "listingId" in data and not listings:
-                with suppress(ValidationError):
-                    listings.append(ZooplaListing.model_validate(data))
-
-            # Recurse into values
-            if not listings:
-                for value in data.values():
-                    if isinstance(value, (dict, list)):
-                        listings.extend(self._extract_listings_from_parsed(value, depth + 1))
-
-        elif isinstance(data, list):
-            for item in data:
-                listings.extend(self._extract_listings_from_parsed(item, depth + 1))
-
+                listings.append(listing)
         return listings
 
     def _parse_rsc_properties(self, html: str) -> list[Property] | None:
@@ -554,6 +470,27 @@ class ZooplaScraper(BaseScraper):
                 properties.append(prop)
         return properties
 
+    def _parse_page(self, html: str, url: str) -> tuple[list[Property], str]:
+        """Parse a search results page, trying RSC first and HTML cards second.
+
+        Returns the properties and the method that found them: "rsc", "html",
+        or "failed" when both found structural markers but couldn't parse.
+        """
+        # Try RSC extraction first (primary method)
+        rsc_result = self._parse_rsc_properties(html)
+        if rsc_result:
+            return rsc_result, "rsc"
+
+        # RSC returned [] (no listings) or None (parse failure) — try HTML
+        soup = BeautifulSoup(html, "html.parser")
+        html_result = self._parse_search_results(soup, url)
+        if html_result:
+            return html_result, "html"
+        if rsc_result is None and html_result is None:
+            # Both methods had structural markers but couldn't parse
+            return [], "failed"
+        return [], "html"
+
     def _listing_to_property(self, listing: ZooplaListing) -> Property | None:
         """Convert a validated ZooplaListing to a Property."""
         # Get detail URL
@@ -638,6 +575,7 @@ class ZooplaScraper(BaseScraper):
             path_seg = area_lower.replace(" ", "-")
             q_val = area
 
+        sort_key, sort_value = self.SEARCH_SORT.split("=", 1)
         params: dict[str, str] = {
             "q": q_val,
             "beds_max": str(max_bedrooms),
@@ -647,7 +585,7 @@ class ZooplaScraper(BaseScraper):
             "is_shared_accommodation": "false",
             "is_retirement_home": "false",
             "is_student_accommodation": "false",
-            "results_sort": "newest_listings",
+            sort_key: sort_value,
             "search_source": "to-rent",
         }
 
@@ -786,3 +724,9 @@ class ZooplaScraper(BaseScraper):
         # Zoopla URLs: /to-rent/details/66543210/
         match = re.search(r"/details/(\d+)", url)
         return match.group(1) if match else None
+
+
+def _parse_search_page(html: str, url: str) -> tuple[list[dict[str, Any]], str]:
+    """Parse a search results page in a parse worker (see ``parse_in_worker``)."""
+    properties, method = ZooplaScraper()._parse_page(html, url)
+    return property_rows(properties), method
@@ -0,0 +1,271 @@
+"""Single-pass decoder for the React Server Components payload on Zoopla pages.
+
+Zoopla's search and detail pages are Next.js App Router pages: the data behind
+them is a React "flight" stream, split into chunks and inlined as
+``<script>self.__next_f.push([1, "..."])</script>`` calls. Once concatenated,
+the stream is a sequence of rows:
+
+- ``<hex id>:<json>\\n`` — a model row (component tree, props);
+- ``<hex id>:T<hex byte length>,<text>`` — a text row, referenced from model
+  rows as ``"$<hex id>"`` (long descriptions end up here).
+
+A row may be split across chunks. ``iter_records`` walks the HTML once,
+decodes every push call a single time, reassembles the rows and only parses
+model rows that mention a field we extract. One walk over each parsed row
+yields the typed records both the search scraper and the detail fetcher need.
+"""
+
+import base64
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Final, TypeAlias
+
+from home_finder.logging import get_logger
+
+logger = get_logger(__name__)
+
+_PUSH_MARKER: Final = "self.__next_f.push("
+
+# Push call types: 0 bootstrap, 1 text chunk, 2 form state, 3 base64 binary chunk
+_PUSH_TEXT: Final = 1
+_PUSH_BINARY: Final = 3
+
+_ROW_HEADER = re.compile(rb"([0-9a-fA-F]*):")
+_ROW_START = re.compile(rb"[0-9a-fA-F]{1,8}:")
+
+# Rows are only JSON-decoded when they contain one of these field names
+_ROW_KEYWORDS: Final = (b"listingId", b"epcRating", b"sizeSqft", b"filename")
+
+# Gallery image filenames in detail page media lists
+_IMAGE_FILENAME = re.compile(r"[a-f0-9]+\.(?:jpg|jpeg|png|webp)", re.IGNORECASE)
+
+# Search results: a list of listing dicts under this key
+_LISTINGS_CONTAINER: Final = "regularListingsFormatted"
+
+_MAX_DEPTH: Final = 15
+
+_decoder = json.JSONDecoder()
+
+
+@dataclass(frozen=True, slots=True)
+class RscListing:
+    """A search result listing (raw dict, validated by the scraper)."""
+
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class RscTaxonomy:
+    """The detail page's listing taxonomy (EPC rating, description, features)."""
+
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class RscSize:
+    """A ``sizeSqft`` value, unvalidated."""
+
+    sqft: float
+
+
+@dataclass(frozen=True, slots=True)
+class RscCaption:
+    """A detail page gallery entry: image filename and its caption, if any."""
+
+    caption: str | None
+    filename: str
+
+
+@dataclass(frozen=True, slots=True)
+class RscText:
+    """A text row, referenced from model rows as ``"$<row_id>"``."""
+
+    row_id: str
+    text: str
+
+
+RscRecord: TypeAlias = RscListing | RscTaxonomy | RscSize | RscCaption | RscText
+
+
+@dataclass
+class RscPage:
+    """All records from one page, collected in stream order."""
+
+    listings: list[dict[str, Any]] = field(default_factory=list)
+    taxonomy: dict[str, Any] | None = None
+    sizes_sqft: list[float] = field(default_factory=list)
+    captions: list[RscCaption] = field(default_factory=list)
+    texts: dict[str, str] = field(default_factory=dict)
+
+    def resolve(self, value: Any) -> Any:
+        """Resolve a ``"$<row_id>"`` text reference; other values pass through."""
+        if isinstance(value, str) and value.startswith("$"):
+            return self.texts.get(value[1:], value)
+        return value
+
+
+class _FlightReader:
+    """Reassembles flight rows from the stream's chunks."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def feed(self, chunk: bytes) -> Iterator[tuple[str, bytes | str]]:
+        """Add a chunk; yields every row it completes as ``(row_id, payload)``.
+
+        Model row payloads are raw JSON bytes, text row payloads are decoded.
+        """
+        # Rows end with a newline, but a chunk boundary followed by a new row
+        # header also ends a (JSON-terminated) row
+        if self._buf.endswith((b"}", b"]")) and _ROW_START.match(chunk):
+            yield from self._rows(final=True)
+        self._buf += chunk
+        yield from self._rows(final=False)
+
+    def close(self) -> Iterator[tuple[str, bytes | str]]:
+        """Yield the trailing row, if the stream didn't end with a newline."""
+        yield from self._rows(final=True)
+
+    def _rows(self, *, final: bool) -> Iterator[tuple[str, bytes | str]]:
+        buf = self._buf
+        pos = 0
+        while pos < len(buf):
+            header = _ROW_HEADER.match(buf, pos)
+            if header is None:
+                # Not a row (or a partial header): skip to the next line
+                end = buf.find(b"\n", pos)
+                if end < 0:
+                    if final:
+                        pos = len(buf)
+                    break
+                pos = end + 1
+                continue
+            row_id = header.group(1).decode()
+            start = header.end()
+            if buf[start : start + 1] == b"T":
+                comma = buf.find(b",", start)
+                if comma < 0:
+                    break
+                try:
+                    length = int(buf[start + 1 : comma], 16)
+                except ValueError:
+                    length = -1
+                if length >= 0:
+                    end = comma + 1 + length
+                    if end > len(buf):
+                        break
+                    yield row_id, buf[comma + 1 : end].decode(errors="replace")
+                    pos = end
+                    continue
+            end = buf.find(b"\n", start)
+            if end < 0:
+                if final:
+                    yield row_id, bytes(buf[start:])
+                    pos = len(buf)
+                break
+            yield row_id, bytes(buf[start:end])
+            pos = end + 1
+        del buf[:pos]
+
+
+def _b64decode(data: str) -> bytes:
+    try:
+        return base64.b64decode(data)
+    except ValueError:
+        return b""
+
+
+def _push_chunks(html: str) -> Iterator[bytes]:
+    """Decode each ``self.__next_f.push([...])`` call's flight chunk, in order."""
+    pos = html.find(_PUSH_MARKER)
+    while pos >= 0:
+        start = pos + len(_PUSH_MARKER)
+        while html[start : start + 1].isspace():
+            start += 1
+        try:
+            args, end = _decoder.raw_decode(html, start)
+        except json.JSONDecodeError:
+            end = start
+        else:
+            if isinstance(args, list) and len(args) >= 2:
+                if args[0] == _PUSH_TEXT and isinstance(args[1], str):
+                    yield args[1].encode()
+                elif args[0] == _PUSH_BINARY and isinstance(args[1], str):
+                    yield _b64decode(args[1])
+        pos = html.find(_PUSH_MARKER, end)
+
+
+def _walk(data: Any, row: bytes, depth: int = 0) -> Iterator[RscRecord]:
+    """Yield the records in one parsed model row, depth-first."""
+    if depth > _MAX_DEPTH:
+        return
+    if isinstance(data, dict):
+        container = data.get(_LISTINGS_CONTAINER)
+        if isinstance(container, list):
+            for item in container:
+                if isinstance(item, dict) and "listingId" in item:
+                    yield RscListing(item)
+        elif "listingId" in data:
+            yield RscListing(data)
+        # Listing summaries elsewhere on detail pages carry an epcRating too;
+        # the page's own taxonomy is in the row with the bathroom count
+        if "epcRating" in data and b"numBaths" in row:
+            yield RscTaxonomy(data)
+        sqft = data.get("sizeSqft")
+        if isinstance(sqft, (int, float)) and not isinstance(sqft, bool):
+            yield RscSize(sqft)
+        filename = data.get("filename")
+        if "caption" in data and isinstance(filename, str) and _IMAGE_FILENAME.fullmatch(filename):
+            caption = data["caption"]
+            yield RscCaption(caption if isinstance(caption, str) else None, filename)
+        for key, value in data.items():
+            if key != _LISTINGS_CONTAINER and isinstance(value, (dict, list)):
+                yield from _walk(value, row, depth + 1)
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, (dict, list)):
+                yield from _walk(item, row, depth + 1)
+
+
+def iter_records(html: str) -> Iterator[RscRecord]:
+    """Yield the typed records in a page's RSC payload, in stream order."""
+    reader = _FlightReader()
+
+    def _decode(rows: Iterator[tuple[str, bytes | str]]) -> Iterator[RscRecord]:
+        for row_id, payload in rows:
+            if isinstance(payload, str):
+                yield RscText(row_id, payload)
+                continue
+            if not any(keyword in payload for keyword in _ROW_KEYWORDS):
+                continue
+            try:
+                parsed = json.loads(payload)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.debug("zoopla_rsc_row_undecodable", row_id=row_id, size=len(payload))
+                continue
+            yield from _walk(parsed, payload)
+
+    for chunk in _push_chunks(html):
+        yield from _decode(reader.feed(chunk))
+    yield from _decode(reader.close())
+
+
+def parse_page(html: str) -> RscPage:
+    """Collect every record on a page in one pass over its HTML."""
+    page = RscPage()
+    for record in iter_records(html):
+        match record:
+            case RscListing(data):
+                page.listings.append(data)
+            case RscTaxonomy(data):
+                if page.taxonomy is None:
+                    page.taxonomy = data
+            case RscSize(sqft):
+                page.sizes_sqft.append(sqft)
+            case RscCaption():
+                page.captions.append(record)
+            case RscText(row_id, text):
+                page.texts[row_id] = text
+    return page
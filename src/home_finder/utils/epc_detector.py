@@ -33,9 +33,13 @@ from __future__ import annotations
 
 import math
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 from home_finder.logging import get_logger
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = get_logger(__name__)
 
 # Score above this threshold -> classify as EPC chart
@@ -60,14 +64,26 @@ def detect_epc(image_bytes: bytes) -> tuple[bool, float]:
 
 def _analyze(image_bytes: bytes) -> tuple[bool, float]:
     """Core analysis — separated for cleaner error handling."""
-    from PIL import Image, ImageStat
+    from PIL import Image
 
     import home_finder.utils.image_processing  # noqa: F401  (sets MAX_IMAGE_PIXELS)
 
     img: Image.Image = Image.open(BytesIO(image_bytes))
     # Thumbnail to 256x256 for speed — we only need statistics
     img.thumbnail((256, 256))
-    img = img.convert("RGB")
+    return score_epc(img.convert("RGB"))
+
+
+def score_epc(img: Image.Image) -> tuple[bool, float]:
+    """Score an already-decoded working copy as an EPC chart.
+
+    Args:
+        img: RGB image, downscaled to at most 256x256.
+
+    Returns:
+        Tuple of (is_likely_epc, confidence_score 0.0-1.0).
+    """
+    from PIL import ImageStat
 
     width, height = img.size
     total_pixels = width * height
@@ -5,10 +5,13 @@ import re
 import shutil
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from home_finder.logging import get_logger
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = get_logger(__name__)
 
 _IMAGE_CACHE_DIR: Final = "image_cache"
@@ -206,6 +209,29 @@ def read_image_bytes(path: Path) -> bytes | None:
     return None
 
 
+def _thumbnail_path(original_path: Path) -> Path:
+    return original_path.parent / f"{THUMBNAIL_PREFIX}{original_path.stem}.jpg"
+
+
+def save_thumbnail(
+    img: "Image.Image", original_path: Path, max_dim: int = THUMBNAIL_MAX_DIM
+) -> Path | None:
+    """Save a JPEG thumbnail of an already-decoded image next to its original.
+
+    Returns None without writing when the image is already <= max_dim on its
+    longest edge. Doesn't modify ``img``.
+    """
+    from PIL import Image
+
+    if max(img.size) <= max_dim:
+        return None
+    thumb_path = _thumbnail_path(original_path)
+    rgb = img.convert("RGB") if img.mode in ("RGBA", "P", "CMYK") else img.copy()
+    rgb.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+    rgb.save(thumb_path, "JPEG", quality=80)
+    return thumb_path
+
+
 def generate_thumbnail(original_path: Path, max_dim: int = THUMBNAIL_MAX_DIM) -> Path | None:
     """Generate a JPEG thumbnail from an image file on disk.
 
@@ -217,20 +243,13 @@ def generate_thumbnail(original_path: Path, max_dim: int = THUMBNAIL_MAX_DIM) ->
 
     Image.MAX_IMAGE_PIXELS = 50_000_000  # Guard against decompression bombs
 
-    thumb_path = original_path.parent / f"{THUMBNAIL_PREFIX}{original_path.stem}.jpg"
+    thumb_path = _thumbnail_path(original_path)
     if thumb_path.is_file():
         return thumb_path
 
     try:
         with Image.open(original_path) as img:
-            if max(img.size) <= max_dim:
-                return None
-
-            rgb = img.convert("RGB") if img.mode in ("RGBA", "P", "CMYK") else img
-
-            rgb.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
-            rgb.save(thumb_path, "JPEG", quality=80)
-            return thumb_path
+            return save_thumbnail(img, original_path, max_dim)
     except Exception:
         logger.warning(
             "thumbnail_generation_failed",
@@ -242,7 +261,7 @@ def generate_thumbnail(original_path: Path, max_dim: int = THUMBNAIL_MAX_DIM) ->
 
 def find_thumbnail(original_path: Path) -> Path | None:
     """Return the thumbnail path if it exists, else None."""
-    thumb_path = original_path.parent / f"{THUMBNAIL_PREFIX}{original_path.stem}.jpg"
+    thumb_path = _thumbnail_path(original_path)
     return thumb_path if thumb_path.is_file() else None
 
 
@@ -0,0 +1,121 @@
+"""Single-decode feature extraction for cached gallery images.
+
+Enrichment needs several things from every downloaded gallery image: its
+dimensions, the EPC and floorplan heuristic scores, a perceptual hash for
+dedup and a card thumbnail. ``extract_image_features`` derives all of them
+from one decode of the file. The results are written to the ``image_hashes``
+index, so dedup reads the pHash from the DB instead of re-opening the file.
+
+``extract_image_features`` takes and returns plain picklable values so it can
+run in a worker thread or process.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, TypeAlias
+
+import imagehash
+from PIL import Image
+
+import home_finder.utils.image_processing  # noqa: F401  (sets MAX_IMAGE_PIXELS)
+from home_finder.logging import get_logger
+from home_finder.utils import epc_detector, floorplan_detector
+from home_finder.utils.image_cache import find_thumbnail, save_thumbnail
+
+logger = get_logger(__name__)
+
+# Longest edge of the working copy the EPC/floorplan heuristics run on
+WORKING_SIZE: Final = 256
+
+_SVG_CONTENT_PREFIXES: Final = (b"<?xml", b"<svg")
+
+# Rows written to the image_hashes index: (unique_id, filename, file size,
+# phash, width, height, floorplan score, EPC score).
+ImageFeatureRow: TypeAlias = tuple[str, str, int, str | None, int, int, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class ImageFeatures:
+    """Everything enrichment and dedup need from one cached image."""
+
+    file_size: int
+    width: int
+    height: int
+    phash: str
+    floorplan_score: float
+    epc_score: float
+
+    @property
+    def is_floorplan(self) -> bool:
+        return self.floorplan_score >= floorplan_detector.CONFIDENCE_THRESHOLD
+
+    @property
+    def is_epc(self) -> bool:
+        return self.epc_score >= epc_detector.CONFIDENCE_THRESHOLD
+
+    def row(self, unique_id: str, filename: str) -> ImageFeatureRow:
+        """The ``image_hashes`` row for this image."""
+        return (
+            unique_id,
+            filename,
+            self.file_size,
+            self.phash,
+            self.width,
+            self.height,
+            self.floorplan_score,
+            self.epc_score,
+        )
+
+
+def extract_image_features(path: Path, *, thumbnail: bool = True) -> ImageFeatures | None:
+    """Decode a cached image once and derive every per-image feature from it.
+
+    The full-resolution decode is pHashed exactly as ``hash_from_disk`` does,
+    so an image gets the same hash whichever path indexed it. The same pixels
+    feed the thumbnail (when ``thumbnail`` is set, the image isn't an EPC
+    chart and none exists yet) and a 256px working copy, which is scored by
+    the EPC and floorplan detectors.
+
+    Args:
+        path: Cached image file.
+        thumbnail: Whether to write a ``thumb_`` file next to it.
+
+    Returns:
+        The image's features, or None if it can't be decoded (SVG, truncated,
+        not an image).
+    """
+    try:
+        file_size = path.stat().st_size
+        with path.open("rb") as f:
+            if f.read(64).lstrip().startswith(_SVG_CONTENT_PREFIXES):
+                return None
+        with Image.open(path) as img:
+            width, height = img.size
+            # No JPEG draft decode: a DCT-scaled image hashes slightly
+            # differently, which can flip matches at HASH_DISTANCE_THRESHOLD
+            img.load()
+            phash = str(imagehash.phash(img))
+            decoded = img.convert("RGB")
+    except Exception:
+        logger.debug("image_feature_extraction_failed", path=str(path), exc_info=True)
+        return None
+
+    working = decoded.copy()
+    working.thumbnail((WORKING_SIZE, WORKING_SIZE))
+    features = ImageFeatures(
+        file_size=file_size,
+        width=width,
+        height=height,
+        phash=phash,
+        floorplan_score=floorplan_detector.score_floorplan(working)[1],
+        epc_score=epc_detector.score_epc(working)[1],
+    )
+
+    # EPC charts are renamed out of the gallery, so a thumb_gallery_* file
+    # for one would be orphaned
+    if thumbnail and not features.is_epc and find_thumbnail(path) is None:
+        try:
+            save_thumbnail(decoded, path)
+        except Exception:
+            logger.warning("thumbnail_generation_failed", original=str(path), exc_info=True)
+    return features
@@ -2,17 +2,22 @@
 
 import asyncio
 import io
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeAlias
 
 import httpx
 import imagehash
+import numpy as np
+import numpy.typing as npt
 from PIL import Image
 
 import home_finder.utils.image_processing  # noqa: F401  (sets MAX_IMAGE_PIXELS)
 from home_finder.logging import get_logger
+from home_finder.utils.image_pool import run_image_task
 
 if TYPE_CHECKING:
+    from home_finder.db import PropertyStorage
     from home_finder.models import Property
 
 logger = get_logger(__name__)
@@ -27,6 +32,20 @@ HASH_DISTANCE_THRESHOLD = 8
 _SVG_EXTENSIONS = (".svg",)
 _SVG_CONTENT_PREFIXES = (b"<?xml", b"<svg")
 
+# Hex length of a 64-bit pHash (imagehash default hash_size=8)
+_HASH_HEX_LEN = 16
+
+# Raster extensions that purge_corrupt_cached_images checks with PIL
+_PURGEABLE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Persisted pHash index: unique_id -> {cached filename: (file size, phash)}.
+# A None phash records a file that can't be hashed (SVG, undecodable) so it
+# isn't re-read on every lookup either.
+GalleryHashIndex: TypeAlias = dict[str, dict[str, tuple[int, str | None]]]
+
+# Rows written back to the index: (unique_id, filename, file size, phash).
+GalleryHashRow: TypeAlias = tuple[str, str, int, str | None]
+
 
 async def fetch_and_hash_image(
     url: str, timeout: float = 10.0, *, client: httpx.AsyncClient | None = None
@@ -54,21 +73,22 @@ async def fetch_and_hash_image(
 
         response.raise_for_status()
 
-        def _compute_hash(data: bytes) -> str | None:
-            # Detect SVGs before PIL tries to open them
-            content_start = data[:64].lstrip()
-            if content_start.startswith(_SVG_CONTENT_PREFIXES):
-                return None
-            image = Image.open(io.BytesIO(data))
-            return str(imagehash.phash(image))
-
-        return await asyncio.to_thread(_compute_hash, response.content)
+        return await run_image_task(_hash_image_bytes, response.content)
 
     except Exception as e:
         logger.debug("image_hash_failed", url=url, error=str(e))
         return None
 
 
+def _hash_image_bytes(data: bytes) -> str | None:
+    # Detect SVGs before PIL tries to open them
+    content_start = data[:64].lstrip()
+    if content_start.startswith(_SVG_CONTENT_PREFIXES):
+        return None
+    image = Image.open(io.BytesIO(data))
+    return str(imagehash.phash(image))
+
+
 def hashes_match(hash1: str | None, hash2: str | None) -> bool:
     """Check if two image hashes are similar enough to be the same image.
 
@@ -165,6 +185,26 @@ def hash_from_disk(path: Path) -> str | None:
         return None
 
 
+def _purge_if_corrupt(img_path: Path) -> bool:
+    """Delete a cached raster image that PIL cannot open. Returns True if removed."""
+    if img_path.suffix.lower() not in _PURGEABLE_EXTENSIONS:
+        return False
+    try:
+        data = img_path.read_bytes()
+        if not data:
+            img_path.unlink()
+            return True
+        Image.open(io.BytesIO(data))
+    except Exception:
+        try:
+            img_path.unlink()
+            logger.info("corrupt_cached_image_removed", path=str(img_path))
+            return True
+        except OSError:
+            pass
+    return False
+
+
 def purge_corrupt_cached_images(data_dir: str, unique_ids: list[str]) -> int:
     """Remove cached gallery images that PIL cannot open.
 
@@ -178,66 +218,182 @@ def purge_corrupt_cached_images(data_dir: str, unique_ids: list[str]) -> int:
         if not cache_dir.is_dir():
             continue
         for img_path in cache_dir.glob("gallery_*"):
-            if img_path.suffix.lower() not in (".jpg", ".jpeg", ".png", ".webp"):
-                continue
-            try:
-                data = img_path.read_bytes()
-                if not data:
-                    img_path.unlink()
-                    removed += 1
-                    continue
-                Image.open(io.BytesIO(data))
-            except Exception:
-                try:
-                    img_path.unlink()
-                    logger.info("corrupt_cached_image_removed", path=str(img_path))
-                    removed += 1
-                except OSError:
-                    pass
+            if _purge_if_corrupt(img_path):
+                removed += 1
     return removed
 
 
+def hash_gallery_files(
+    unique_ids: list[str],
+    data_dir: str,
+    index: GalleryHashIndex | None = None,
+) -> tuple[dict[str, dict[Path, str | None]], list[GalleryHashRow]]:
+    """Hash cached gallery files, reusing indexed hashes where still valid.
+
+    A file's indexed hash is reused when its size on disk still matches the
+    indexed size. Everything else is checked for corruption (corrupt files
+    are purged, as in purge_corrupt_cached_images) and pHashed from disk.
+
+    Args:
+        unique_ids: Property unique_ids whose gallery_* files to hash.
+        data_dir: Base data directory containing image_cache/.
+        index: Previously persisted hashes, or None to hash everything.
+
+    Returns:
+        Tuple of (unique_id -> {path: phash} in filename order, newly
+        computed rows to write back to the index).
+    """
+    from home_finder.utils.image_cache import get_cache_dir
+
+    index = index or {}
+    files: dict[str, dict[Path, str | None]] = {}
+    new_rows: list[GalleryHashRow] = []
+    for uid in unique_ids:
+        cache_dir = get_cache_dir(data_dir, uid)
+        if not cache_dir.is_dir():
+            continue
+        indexed = index.get(uid, {})
+        hashes: dict[Path, str | None] = {}
+        for img_path in sorted(cache_dir.glob("gallery_*")):
+            try:
+                size = img_path.stat().st_size
+            except OSError:
+                continue
+            entry = indexed.get(img_path.name)
+            if entry is not None and entry[0] == size:
+                hashes[img_path] = entry[1]
+                continue
+            if _purge_if_corrupt(img_path):
+                continue
+            h = hash_from_disk(img_path)
+            hashes[img_path] = h
+            new_rows.append((uid, img_path.name, size, h))
+        if hashes:
+            files[uid] = hashes
+    return files, new_rows
+
+
+async def hash_cached_gallery_files(
+    unique_ids: list[str],
+    data_dir: str,
+    *,
+    storage: "PropertyStorage | None" = None,
+) -> dict[str, dict[Path, str | None]]:
+    """Per-file gallery hashes, served from the persisted index when available.
+
+    With ``storage``, hashes are looked up in the ``image_hashes`` table and
+    only files missing from it (or changed on disk) are decoded; their
+    hashes are written back so the next run is a pure DB lookup.
+
+    Returns:
+        Dict mapping unique_id to {cached file path: phash or None}.
+    """
+    index = await storage.get_gallery_hashes(unique_ids) if storage is not None else None
+    files, new_rows = await run_image_task(hash_gallery_files, unique_ids, data_dir, index)
+    if storage is not None and new_rows:
+        await storage.save_gallery_hashes(new_rows)
+    logger.debug(
+        "gallery_hashes_loaded",
+        properties=len(unique_ids),
+        files=sum(len(v) for v in files.values()),
+        computed=len(new_rows),
+    )
+    return files
+
+
 async def hash_cached_gallery(
     unique_ids: list[str],
     data_dir: str,
+    *,
+    storage: "PropertyStorage | None" = None,
 ) -> dict[str, list[str]]:
     """Hash all cached gallery images for the given property IDs.
 
     Reads gallery_* files from the image cache directory for each property
-    and computes perceptual hashes. Runs in a thread pool since pHash
-    computation is CPU-bound and file I/O is blocking.
+    and computes perceptual hashes. Runs on the shared image pool since pHash
+    computation is CPU-bound and file I/O is blocking. When ``storage`` is
+    given, previously indexed hashes are reused instead of re-decoding.
 
     Args:
         unique_ids: Property unique_ids to hash galleries for.
         data_dir: Base data directory containing image_cache/.
+        storage: Optional storage holding the persisted pHash index.
 
     Returns:
         Dict mapping unique_id to list of hash hex strings.
     """
-    from home_finder.utils.image_cache import get_cache_dir
+    files = await hash_cached_gallery_files(unique_ids, data_dir, storage=storage)
+    return gallery_hash_lists(files)
 
-    def _hash_all() -> dict[str, list[str]]:
-        purge_corrupt_cached_images(data_dir, unique_ids)
-        result: dict[str, list[str]] = {}
-        for uid in unique_ids:
-            cache_dir = get_cache_dir(data_dir, uid)
-            if not cache_dir.is_dir():
-                continue
-            hashes: list[str] = []
-            for img_path in sorted(cache_dir.glob("gallery_*")):
-                h = hash_from_disk(img_path)
-                if h is not None:
-                    hashes.append(h)
-            if hashes:
-                result[uid] = hashes
-        return result
 
-    return await asyncio.to_thread(_hash_all)
+def gallery_hash_lists(files: dict[str, dict[Path, str | None]]) -> dict[str, list[str]]:
+    """Collapse per-file hashes to the per-property hash lists used for scoring."""
+    result: dict[str, list[str]] = {}
+    for uid, hashes in files.items():
+        valid = [h for h in hashes.values() if h is not None]
+        if valid:
+            result[uid] = valid
+    return result
+
+
+def pack_hashes(hashes: Sequence[str]) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.bool_]]:
+    """Pack 64-bit pHash hex strings into a uint64 array.
+
+    Returns:
+        Tuple of (packed hashes, validity mask). Strings that aren't 16 hex
+        digits are packed as 0 and marked invalid so they never match,
+        mirroring hashes_match's handling of unparsable hashes.
+    """
+    packed = np.zeros(len(hashes), dtype=np.uint64)
+    valid = np.zeros(len(hashes), dtype=np.bool_)
+    for i, h in enumerate(hashes):
+        if len(h) != _HASH_HEX_LEN:
+            continue
+        try:
+            packed[i] = int(h, 16)
+        except ValueError:
+            continue
+        valid[i] = True
+    return packed, valid
+
+
+def hash_match_matrix(
+    a: npt.NDArray[np.uint64],
+    a_valid: npt.NDArray[np.bool_],
+    b: npt.NDArray[np.uint64],
+    b_valid: npt.NDArray[np.bool_],
+) -> npt.NDArray[np.bool_]:
+    """Boolean matrix of which hashes in ``a`` match which in ``b``.
+
+    Hamming distances for every pair come from one XOR + popcount over the
+    broadcast arrays; an entry is True when the distance is within
+    HASH_DISTANCE_THRESHOLD and both hashes are valid.
+    """
+    distances = np.bitwise_count(a[:, None] ^ b[None, :])
+    matches: npt.NDArray[np.bool_] = distances <= HASH_DISTANCE_THRESHOLD
+    matches &= a_valid[:, None] & b_valid[None, :]
+    return matches
+
+
+def _greedy_match_count(matches: npt.NDArray[np.bool_]) -> int:
+    """Count one-to-one matches, pairing each row with its first free column.
+
+    Same semantics as the original nested loop: rows are taken in order and
+    each column can be consumed only once.
+    """
+    used = np.zeros(matches.shape[1], dtype=np.bool_)
+    count = 0
+    for i in np.flatnonzero(matches.any(axis=1)):
+        free = np.flatnonzero(matches[i] & ~used)
+        if free.size:
+            used[free[0]] = True
+            count += 1
+    return count
 
 
 def count_gallery_hash_matches(
-    hashes1: list[str] | None,
-    hashes2: list[str] | None,
+    hashes1: Sequence[str] | None,
+    hashes2: Sequence[str] | None,
 ) -> int:
     """Count how many images from gallery 1 match images from gallery 2.
 
@@ -255,14 +411,46 @@ def count_gallery_hash_matches(
     if not hashes1 or not hashes2:
         return 0
 
-    matched_indices: set[int] = set()
-    count = 0
+    a, a_valid = pack_hashes(hashes1)
+    b, b_valid = pack_hashes(hashes2)
+    return _greedy_match_count(hash_match_matrix(a, a_valid, b, b_valid))
 
-    for h1 in hashes1:
-        for j, h2 in enumerate(hashes2):
-            if j not in matched_indices and hashes_match(h1, h2):
-                count += 1
-                matched_indices.add(j)
-                break
 
-    return count
+class PackedGalleryHashes:
+    """Gallery hashes for a set of properties, packed for batched matching.
+
+    All hashes are packed into one uint64 array up front, so scoring all
+    pairs in a dedup block never re-parses hex strings. Match matrices are
+    computed per property pair from slices of that array: a block-wide
+    matrix would be quadratic in the block's image count (hundreds of MB
+    for a few hundred listings), most of it same-property pairs.
+    """
+
+    def __init__(self, image_hashes: Mapping[str, Sequence[str]]) -> None:
+        self._hashes = dict(image_hashes)
+        self._slices: dict[str, slice] = {}
+        flat: list[str] = []
+        for uid, hashes in self._hashes.items():
+            self._slices[uid] = slice(len(flat), len(flat) + len(hashes))
+            flat.extend(hashes)
+        self._packed, self._valid = pack_hashes(flat)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._hashes
+
+    def __bool__(self) -> bool:
+        return bool(self._hashes)
+
+    def get(self, unique_id: str) -> Sequence[str] | None:
+        """Return the hash strings for a property, or None if it has none."""
+        return self._hashes.get(unique_id)
+
+    def count_matches(self, unique_id1: str, unique_id2: str) -> int:
+        """Same result as count_gallery_hash_matches on the two galleries."""
+        s1 = self._slices.get(unique_id1)
+        s2 = self._slices.get(unique_id2)
+        if s1 is None or s2 is None or s1.start == s1.stop or s2.start == s2.stop:
+            return 0
+        return _greedy_match_count(
+            hash_match_matrix(self._packed[s1], self._valid[s1], self._packed[s2], self._valid[s2])
+        )
@@ -0,0 +1,70 @@
+"""Shared process pool for CPU-bound image work.
+
+Decoding, pHashing, thumbnailing and resizing images hold the GIL, so on the
+default thread pool they still stall the event loop — and with it the web
+dashboard in ``--serve`` mode. A pipeline run opens ``image_pool`` once and
+every image task goes through ``run_image_task``; scrapers parse pages on the
+same pool (``scrapers.parse_worker``). When no pool is open (tests,
+one-off CLI commands, ``image_workers = 0``) or the pool has broken, tasks
+fall back to a worker thread.
+
+Tasks must be module-level functions taking and returning picklable values.
+"""
+
+import asyncio
+import contextlib
+import functools
+import multiprocessing
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import ParamSpec, TypeVar
+
+from home_finder.logging import get_logger
+
+logger = get_logger(__name__)
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+_pool: ProcessPoolExecutor | None = None
+
+
+@contextlib.asynccontextmanager
+async def image_pool(workers: int) -> AsyncIterator[None]:
+    """Open the shared image pool for the duration of the block.
+
+    Does nothing when ``workers`` is 0 or a pool is already open, so nested
+    callers share the outer one.
+
+    Args:
+        workers: Number of worker processes.
+    """
+    global _pool
+    if workers <= 0 or _pool is not None:
+        yield
+        return
+
+    # spawn, not fork: the parent has aiosqlite and executor threads running
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    _pool = pool
+    logger.debug("image_pool_started", workers=workers)
+    try:
+        yield
+    finally:
+        _pool = None
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
+async def run_image_task(fn: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run ``fn`` in the shared image pool, or a worker thread without one."""
+    pool = _pool
+    if pool is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+    except BrokenProcessPool:
+        # A worker died (OOM on a huge image, killed): finish the run on threads
+        logger.warning("image_pool_broken", task=getattr(fn, "__name__", repr(fn)))
+        return await asyncio.to_thread(fn, *args, **kwargs)
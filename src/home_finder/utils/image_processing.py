@@ -42,6 +42,22 @@ def is_valid_media_type(value: str) -> TypeGuard[ImageMediaType]:
     return value in VALID_MEDIA_TYPES
 
 
+def _resize_decoded(img: Image.Image, max_dim: int) -> bytes:
+    """Downscale an opened image so longest edge == max_dim and re-encode it."""
+    w, h = img.size
+    scale = max_dim / max(w, h)
+    new_size = (int(w * scale), int(h * scale))
+    # Preserve format before resize (resize clears it)
+    fmt = img.format or "JPEG"
+    resized: Image.Image = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    # JPEG cannot encode RGBA/P/CMYK — convert to RGB
+    if fmt == "JPEG" and resized.mode not in ("RGB", "L"):
+        resized = resized.convert("RGB")
+    buf = BytesIO()
+    resized.save(buf, format=fmt, quality=85)
+    return buf.getvalue()
+
+
 def resize_image_bytes(data: bytes, max_dim: int = MAX_IMAGE_DIMENSION) -> bytes:
     """Downscale image so longest edge <= max_dim. Returns original bytes if already small."""
     try:
@@ -49,17 +65,34 @@ def resize_image_bytes(data: bytes, max_dim: int = MAX_IMAGE_DIMENSION) -> bytes
         w, h = img.size
         if w <= max_dim and h <= max_dim:
             return data
-        scale = max_dim / max(w, h)
-        new_size = (int(w * scale), int(h * scale))
-        # Preserve format before resize (resize clears it)
-        fmt = img.format or "JPEG"
-        resized: Image.Image = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
-        # JPEG cannot encode RGBA/P/CMYK — convert to RGB
-        if fmt == "JPEG" and resized.mode not in ("RGB", "L"):
-            resized = resized.convert("RGB")
-        buf = BytesIO()
-        resized.save(buf, format=fmt, quality=85)
-        return buf.getvalue()
+        return _resize_decoded(img, max_dim)
     except Exception:
         logger.debug("image_resize_failed", exc_info=True)
         return data
+
+
+def is_decodable_image(data: bytes) -> bool:
+    """Whether PIL can fully decode the bytes (catches truncated/corrupt files)."""
+    try:
+        Image.open(BytesIO(data)).load()
+    except Exception:
+        return False
+    return True
+
+
+def prepare_image_bytes(data: bytes, max_dim: int = MAX_IMAGE_DIMENSION) -> bytes | None:
+    """Validate and downscale image bytes for the vision API with a single decode.
+
+    Returns the original bytes when the image already fits, re-encoded bytes
+    when it had to be shrunk, or None when the pixels can't be decoded.
+    """
+    try:
+        img = Image.open(BytesIO(data))
+        w, h = img.size
+        if w <= max_dim and h <= max_dim:
+            img.load()  # Force full pixel decode
+            return data
+        return _resize_decoded(img, max_dim)
+    except Exception:
+        logger.debug("image_prepare_failed", exc_info=True)
+        return None
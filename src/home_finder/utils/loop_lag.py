@@ -0,0 +1,58 @@
+"""Event-loop lag sampling.
+
+Anything that holds the event loop (a synchronous parse, a long JSON decode)
+delays every other coroutine, including dashboard requests in ``--serve``
+mode. ``LoopLagMonitor`` measures that directly: a background task sleeps for
+a fixed interval and records how late it wakes up.
+"""
+
+import asyncio
+import statistics
+import time
+from types import TracebackType
+from typing import Self
+
+# Seconds between samples
+_DEFAULT_INTERVAL = 0.05
+
+
+class LoopLagMonitor:
+    """Sample event-loop lag while the ``async with`` block runs."""
+
+    def __init__(self, interval: float = _DEFAULT_INTERVAL) -> None:
+        self._interval = interval
+        self._lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _sample(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self._lags.append(max(0.0, time.perf_counter() - started - self._interval))
+
+    @property
+    def max_ms(self) -> float:
+        """Worst lag seen, in milliseconds (0 with no samples)."""
+        return max(self._lags, default=0.0) * 1000
+
+    @property
+    def p95_ms(self) -> float:
+        """95th-percentile lag, in milliseconds (0 with fewer than two samples)."""
+        if len(self._lags) < 2:
+            return self.max_ms
+        return statistics.quantiles(self._lags, n=20, method="inclusive")[-1] * 1000
@@ -4,6 +4,8 @@ Provides forward and reverse geocoding to map postcodes/coordinates to
 official ward names, which are then used to identify micro-areas.
 """
 
+import asyncio
+
 import httpx
 
 from home_finder.logging import get_logger
@@ -12,6 +14,15 @@ logger = get_logger(__name__)
 
 _BASE_URL = "https://api.postcodes.io"
 _TIMEOUT = 10.0
+# postcodes.io accepts up to 100 postcodes or geolocations per bulk request
+_BULK_BATCH_SIZE = 100
+# Bulk requests in flight at once
+_BULK_CONCURRENCY = 4
+
+
+def normalize_postcode(postcode: str) -> str:
+    """Upper-case with single spaces, as stored in ``postcode_wards``."""
+    return " ".join(postcode.upper().split())
 
 
 async def lookup_ward(postcode: str, *, client: httpx.AsyncClient | None = None) -> str | None:
@@ -103,8 +114,8 @@ async def _bulk_reverse_with_client(
     results: list[str | None] = [None] * len(coords)
 
     # Process in batches of 100 (API limit)
-    for batch_start in range(0, len(coords), 100):
-        batch = coords[batch_start : batch_start + 100]
+    for batch_start in range(0, len(coords), _BULK_BATCH_SIZE):
+        batch = coords[batch_start : batch_start + _BULK_BATCH_SIZE]
         geolocations = [{"latitude": lat, "longitude": lon} for lat, lon in batch]
 
         try:
@@ -134,3 +145,62 @@ async def _bulk_reverse_with_client(
             )
 
     return results
+
+
+async def bulk_lookup_wards(
+    postcodes: list[str],
+    *,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, str | None]:
+    """Bulk forward lookup: full postcodes → admin ward names.
+
+    Batches of 100 are posted concurrently. Returns a mapping for every
+    postcode postcodes.io answered for, keyed by normalised postcode; the
+    value is None when the postcode is unknown. Postcodes in failed batches
+    are absent, so they can be retried.
+    """
+    if not postcodes:
+        return {}
+
+    if client is not None:
+        return await _bulk_lookup_with_client(client, postcodes)
+
+    async with httpx.AsyncClient(timeout=_TIMEOUT * 3) as c:
+        return await _bulk_lookup_with_client(c, postcodes)
+
+
+async def _bulk_lookup_with_client(
+    client: httpx.AsyncClient, postcodes: list[str]
+) -> dict[str, str | None]:
+    unique = list(dict.fromkeys(normalize_postcode(pc) for pc in postcodes))
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+    async def _batch(batch_start: int) -> dict[str, str | None]:
+        batch = unique[batch_start : batch_start + _BULK_BATCH_SIZE]
+        async with semaphore:
+            try:
+                resp = await client.post(f"{_BASE_URL}/postcodes", json={"postcodes": batch})
+            except httpx.HTTPError:
+                logger.warning(
+                    "bulk_postcode_lookup_failed", batch_start=batch_start, exc_info=True
+                )
+                return {}
+        if resp.status_code != 200:
+            logger.warning(
+                "bulk_postcode_lookup_failed", status=resp.status_code, batch_start=batch_start
+            )
+            return {}
+        wards: dict[str, str | None] = {}
+        for item in resp.json().get("result", []):
+            if not item or not item.get("query"):
+                continue
+            result = item.get("result")
+            wards[normalize_postcode(item["query"])] = result.get("admin_ward") if result else None
+        return wards
+
+    results: dict[str, str | None] = {}
+    for batch_wards in await asyncio.gather(
+        *(_batch(start) for start in range(0, len(unique), _BULK_BATCH_SIZE))
+    ):
+        results.update(batch_wards)
+    return results
@@ -147,7 +147,9 @@ def create_app(settings: Settings | None = None, *, run_pipeline: bool = True) -
 
     configure_logging(json_output=False)
 
-    storage = PropertyStorage(settings.database_path)
+    # Dashboard reads use their own WAL readers so they don't queue behind
+    # pipeline writes on the shared writer connection.
+    storage = PropertyStorage(settings.database_path, read_pool_size=settings.web_read_connections)
     pipeline_task: asyncio.Task[None] | None = None
 
     @asynccontextmanager
@@ -166,25 +168,31 @@ def create_app(settings: Settings | None = None, *, run_pipeline: bool = True) -
         ):
             await _register_telegram_webhook(settings)
 
-        if run_pipeline:
-            # Start background pipeline scheduler (shares web server's storage)
-            pipeline_task = asyncio.create_task(
-                _pipeline_loop(settings, settings.pipeline_interval_minutes, storage)
-            )
-            logger.info(
-                "web_server_started",
-                pipeline_interval=settings.pipeline_interval_minutes,
-            )
-        else:
-            logger.info("web_server_started", pipeline="disabled")
-
-        yield
-
-        # Shutdown
-        if pipeline_task:
-            pipeline_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await pipeline_task
+        async with contextlib.AsyncExitStack() as stack:
+            if run_pipeline:
+                from home_finder.scrapers.rightmove import rightmove_session
+
+                # Keep one Rightmove HTTP session warm across scheduled runs;
+                # the pipeline task inherits it via its copied context.
+                await stack.enter_async_context(rightmove_session())
+                # Start background pipeline scheduler (shares web server's storage)
+                pipeline_task = asyncio.create_task(
+                    _pipeline_loop(settings, settings.pipeline_interval_minutes, storage)
+                )
+                logger.info(
+                    "web_server_started",
+                    pipeline_interval=settings.pipeline_interval_minutes,
+                )
+            else:
+                logger.info("web_server_started", pipeline="disabled")
+
+            yield
+
+            # Shutdown
+            if pipeline_task:
+                pipeline_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pipeline_task
         await storage.close()
         logger.info("web_server_stopped")
 
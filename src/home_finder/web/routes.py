@@ -7,8 +7,8 @@ from html import escape as html_escape
 from pathlib import Path
 from typing import Annotated, Any, Final, cast
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
@@ -24,6 +24,7 @@ from home_finder.data.area_context import (
     match_micro_area,
 )
 from home_finder.db import PropertyStorage
+from home_finder.db.web_queries import encode_page_cursor
 from home_finder.filters.fit_score import (
     FIT_TIERS,
     compute_fit_score_and_breakdown,
@@ -63,6 +64,13 @@ logger = get_logger(__name__)
 router = APIRouter()
 templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
 
+# Below this zoom /map/markers returns grid clusters instead of raw markers
+_MAP_CLUSTER_MAX_ZOOM: Final = 15
+# Approximate on-screen size of a server-side cluster cell
+_MAP_CLUSTER_CELL_PX: Final = 60
+# Cap on raw markers per viewport response
+_MAP_MARKER_LIMIT: Final = 1000
+
 TAG_CATEGORIES: Final[dict[str, list[str]]] = {
     "Workspace": [
         PropertyHighlight.ULTRAFAST_BROADBAND.value,
@@ -258,6 +266,27 @@ async def filter_count(storage: StorageDep, filters: FilterDep) -> Response:
     return Response(str(total), media_type="text/plain")
 
 
+@router.get("/map/markers")
+async def map_markers(
+    storage: StorageDep,
+    filters: FilterDep,
+    south: Annotated[float, Query(ge=-90, le=90)],
+    west: Annotated[float, Query(ge=-180, le=180)],
+    north: Annotated[float, Query(ge=-90, le=90)],
+    east: Annotated[float, Query(ge=-180, le=180)],
+    zoom: Annotated[int, Query(ge=0, le=22)],
+) -> JSONResponse:
+    """Map markers inside a viewport, clustered server-side when zoomed out."""
+    bounds = (south, west, north, east)
+    if zoom < _MAP_CLUSTER_MAX_ZOOM:
+        # Cell edge ~= _MAP_CLUSTER_CELL_PX screen pixels at this zoom (256px tiles)
+        cell_degrees = 360 / 2**zoom * _MAP_CLUSTER_CELL_PX / 256
+        clusters, markers = await storage.web.get_map_clusters(filters, bounds, cell_degrees)
+        return JSONResponse({"clustered": True, "clusters": clusters, "markers": markers})
+    markers = await storage.web.get_map_markers(filters, bounds=bounds, limit=_MAP_MARKER_LIMIT)
+    return JSONResponse({"clustered": False, "clusters": [], "markers": markers})
+
+
 @router.get("/health")
 async def health_check(request: Request) -> JSONResponse:
     """Health check endpoint for Fly.io with pipeline status."""
@@ -317,6 +346,8 @@ async def dashboard(
     filters: FilterDep,
     sort: str = "newest",
     page: str | None = None,
+    after: str | None = None,
+    before: str | None = None,
 ) -> HTMLResponse:
     """Dashboard page with property card grid."""
     page_val = _parse_optional_int(page) or 1
@@ -327,8 +358,11 @@ async def dashboard(
 
     try:
         properties, total = await storage.web.get_properties_paginated(
-            filters, sort=sort, page=page_val, per_page=per_page
+            filters, sort=sort, page=page_val, per_page=per_page, after=after, before=before
         )
+        # Keyset cursors for prev/next links (before fit enrichment mutates items)
+        first_cursor = encode_page_cursor(properties[0], sort) if properties else None
+        last_cursor = encode_page_cursor(properties[-1], sort) if properties else None
         _enrich_fit_scores(properties)
 
         # Rewrite external CDN thumbnail URLs to locally cached images.
@@ -350,21 +384,15 @@ async def dashboard(
     total_pages = math.ceil(total / per_page) if total > 0 else 1
     page_val = min(page_val, total_pages)
 
-    # Build properties JSON for map view — all matching properties with coords,
-    # not just the current page.
+    # The map only needs to know where to frame itself; markers are fetched
+    # per viewport from /map/markers as the user pans and zooms.
     try:
-        map_markers = await storage.web.get_map_markers(filters)
+        map_extent = await storage.web.get_map_extent(filters)
     except Exception:
-        logger.error("map_markers_query_failed", exc_info=True)
-        map_markers = []
-
-    # Rewrite external CDN URLs in map markers too
-    for marker in map_markers:
-        resolved = _resolve_cached_thumbnail(marker["id"], marker.get("image_url"), data_dir)
-        if resolved:
-            marker["image_url"] = resolved
+        logger.error("map_extent_query_failed", exc_info=True)
+        map_extent = None
 
-    properties_json = json.dumps(map_markers)
+    map_extent_json = json.dumps(map_extent)
 
     highlight_values = {h.value for h in PropertyHighlight}
 
@@ -374,10 +402,12 @@ async def dashboard(
         "total": total,
         "page": page_val,
         "total_pages": total_pages,
+        "prev_cursor": first_cursor if page_val > 1 else None,
+        "next_cursor": last_cursor if page_val < total_pages else None,
         "sort": sort,
         "source_names": SOURCE_NAMES,
         "source_badges": SOURCE_BADGES,
-        "properties_json": properties_json,
+        "map_extent_json": map_extent_json,
         "search_areas": search_areas,
         "active_filters": filters.active_filter_chips(),
         "any_quality_filter_active": filters.quality_fields_active,
@@ -439,6 +469,21 @@ async def serve_cached_image(unique_id: str, filename: str, data_dir: DataDirDep
     )
 
 
+@router.get("/property/{unique_id}/thumbnail")
+async def property_thumbnail(unique_id: str, storage: StorageDep, data_dir: DataDirDep) -> Response:
+    """Redirect to a property's thumbnail, preferring the local image cache.
+
+    Map popups point here so the cache lookup happens only for the popups
+    that are actually opened.
+    """
+    source = await storage.web.get_thumbnail_source(unique_id)
+    resolved = _resolve_cached_thumbnail(unique_id, source, data_dir)
+    target = resolved or source
+    if not target:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    return RedirectResponse(target, headers={"Cache-Control": "public, max-age=3600"})
+
+
 @router.get("/property/{unique_id}/card", response_class=HTMLResponse)
 async def property_card(
     request: Request,
@@ -1,4 +1,4 @@
-// Dashboard map with MarkerCluster + grid/split/map toggle + hover sync
+// Dashboard map with viewport-loaded markers + grid/split/map toggle + hover sync
 
 const mapEl = document.getElementById("dashboard-map");
 const resultsEl = document.getElementById("results");
@@ -8,8 +8,11 @@ if (mapEl && resultsEl) {
   let dashMap = null;
   let cluster = null;
   let mapInitialized = false;
+  let serverClusters = null;
   let markersByPropertyId = {};
   let pinnedCardRequestId = 0;
+  let viewportController = null;
+  let viewportTimer = null;
 
   // Fit tier thresholds (single source of truth in Python, injected via dashboard template)
   var fitTiers = (function () {
@@ -18,11 +21,12 @@ if (mapEl && resultsEl) {
     try { return JSON.parse(el.textContent); } catch { return []; }
   })();
 
-  function readMapData() {
+  // {count, bounds: [[s, w], [n, e]]} for the current filters, or null
+  function readMapExtent() {
     const el = document.getElementById("properties-map-data");
-    if (!el) return [];
+    if (!el) return null;
     try { return JSON.parse(el.textContent); }
-    catch { return []; }
+    catch { return null; }
   }
 
   function buildPinnedSkeleton() {
@@ -224,33 +228,99 @@ if (mapEl && resultsEl) {
     });
   }
 
-  function buildMarkers(data) {
-    if (cluster) dashMap.removeLayer(cluster);
-    cluster = L.markerClusterGroup({ maxClusterRadius: 40 });
+  function createServerClusterIcon(count) {
+    // Same classes as MarkerCluster's own icons so both kinds look alike
+    const size = count < 10 ? "small" : count < 100 ? "medium" : "large";
+    return L.divIcon({
+      className: "marker-cluster marker-cluster-" + size,
+      html: "<div><span>" + count + "</span></div>",
+      iconSize: L.point(40, 40),
+    });
+  }
+
+  function addMarker(p) {
+    const icon = createPricePillIcon(p.price, p.id, p.is_off_market);
+    const marker = L.marker([p.lat, p.lon], { icon: icon });
+    // Built on open so popup thumbnails are only fetched when shown
+    marker.bindPopup(function () { return buildRichPopup(p); }, { maxWidth: 280, minWidth: 220 });
+    attachMarkerEvents(marker, p);
+    markersByPropertyId[p.id] = marker;
+    return marker;
+  }
+
+  function clearMarkers() {
+    cluster.clearLayers();
+    serverClusters.clearLayers();
     markersByPropertyId = {};
+  }
 
-    for (let i = 0; i < data.length; i++) {
-      const p = data[i];
-      const icon = createPricePillIcon(p.price, p.id, p.is_off_market);
-      const marker = L.marker([p.lat, p.lon], { icon: icon });
-      marker.bindPopup(buildRichPopup(p), { maxWidth: 280, minWidth: 220 });
-      attachMarkerEvents(marker, p);
-      cluster.addLayer(marker);
-      markersByPropertyId[p.id] = marker;
+  function renderViewport(data) {
+    if (data.clustered) {
+      // Zoomed out: the server's grid clusters replace everything on the map
+      clearMarkers();
+      data.clusters.forEach(function (c) {
+        const m = L.marker([c.lat, c.lon], { icon: createServerClusterIcon(c.count) });
+        m.on("click", function () {
+          dashMap.fitBounds(L.latLngBounds(c.bounds).pad(0.2), { maxZoom: dashMap.getZoom() + 3 });
+        });
+        serverClusters.addLayer(m);
+      });
+    } else {
+      serverClusters.clearLayers();
     }
+    // Zoomed in: keep markers already loaded and add the new ones in view
+    const fresh = [];
+    data.markers.forEach(function (p) {
+      if (!markersByPropertyId[p.id]) fresh.push(addMarker(p));
+    });
+    cluster.addLayers(fresh);
+  }
 
-    dashMap.addLayer(cluster);
-    if (data.length > 0) {
-      dashMap.fitBounds(cluster.getBounds().pad(0.1));
+  async function loadViewport() {
+    if (viewportController) viewportController.abort();
+    const controller = new AbortController();
+    viewportController = controller;
+
+    // Current filters come from the (HTMX-pushed) page URL
+    const params = new URLSearchParams(window.location.search);
+    ["page", "sort", "after", "before"].forEach(function (k) { params.delete(k); });
+    const b = dashMap.getBounds().pad(0.25);
+    params.set("south", Math.max(-90, b.getSouth()).toFixed(6));
+    params.set("west", Math.max(-180, b.getWest()).toFixed(6));
+    params.set("north", Math.min(90, b.getNorth()).toFixed(6));
+    params.set("east", Math.min(180, b.getEast()).toFixed(6));
+    params.set("zoom", String(Math.round(dashMap.getZoom())));
+
+    try {
+      const r = await fetch("/map/markers?" + params.toString(), { signal: controller.signal });
+      if (!r.ok) throw new Error(r.status);
+      const data = await r.json();
+      if (controller !== viewportController) return;
+      renderViewport(data);
+    } catch (err) {
+      if (err.name !== "AbortError") console.warn("map markers failed", err);
     }
   }
 
+  function scheduleViewportLoad() {
+    clearTimeout(viewportTimer);
+    viewportTimer = setTimeout(loadViewport, 150);
+  }
+
+  function frameExtent(extent) {
+    clearMarkers();
+    if (!extent) return;
+    dashMap.fitBounds(L.latLngBounds(extent.bounds).pad(0.1), { maxZoom: 16 });
+    // fitBounds doesn't fire moveend when the view is unchanged
+    scheduleViewportLoad();
+  }
+
   function initMap() {
     if (mapInitialized) return;
-    mapInitialized = true;
 
-    const data = readMapData();
-    if (data.length === 0) return;
+    const extent = readMapExtent();
+    if (!extent) return;
+    mapInitialized = true;
 
     dashMap = L.map("dashboard-map").setView([51.545, -0.055], 13);
     L.tileLayer("https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png", {
@@ -259,7 +329,13 @@ if (mapEl && resultsEl) {
       maxZoom: 20,
     }).addTo(dashMap);
 
-    buildMarkers(data);
+    cluster = L.markerClusterGroup({ maxClusterRadius: 40 });
+    serverClusters = L.layerGroup();
+    dashMap.addLayer(cluster);
+    dashMap.addLayer(serverClusters);
+    dashMap.on("moveend", scheduleViewportLoad);
+
+    frameExtent(extent);
   }
 
   // Card -> Marker hover sync (event delegation)
@@ -279,11 +355,10 @@ if (mapEl && resultsEl) {
     if (pill) pill.classList.remove("highlighted");
   }, true);
 
-  // HTMX map data sync: re-read JSON data element after swap
+  // HTMX map data sync: filters changed, so reframe and reload the viewport
   document.addEventListener("htmx:afterSwap", function (e) {
-    if (e.detail.target === resultsEl && dashMap && cluster) {
-      const data = readMapData();
-      buildMarkers(data);
+    if (e.detail.target === resultsEl && dashMap) {
+      frameExtent(readMapExtent());
     }
   });
 
@@ -304,8 +379,7 @@ if (mapEl && resultsEl) {
         resultsEl.hidden = false;
         mapEl.hidden = true;
       } else if (view === "split") {
-        const data = readMapData();
-        if (data.length === 0) {
+        if (!readMapExtent()) {
           // No map data -- fall back to grid-like display
           if (splitContainer) splitContainer.classList.remove("split-active");
           resultsEl.hidden = false;
@@ -72,6 +72,12 @@ def _isolate_settings_from_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def _image_work_on_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run image work on threads: patches made in a test don't reach pool workers."""
+    monkeypatch.setenv("HOME_FINDER_IMAGE_WORKERS", "0")
+
+
 @pytest.fixture(autouse=True)
 def _cleanup_aiosqlite_threads(request: pytest.FixtureRequest):
     """Safety net: detect and stop leaked aiosqlite worker threads.
@@ -161,7 +161,9 @@ class TestFullPipelineE2E:
             MockFetcher.return_value = mock_fetcher_instance
 
             mock_commute_instance = MagicMock()
-            mock_commute_instance.filter_properties = AsyncMock(return_value=mock_commute_results)
+            mock_commute_instance.filter_properties_by_modes = AsyncMock(
+                return_value=mock_commute_results
+            )
             mock_commute_instance.geocode_properties = AsyncMock(side_effect=lambda merged: merged)
             MockCommuteFilter.return_value = mock_commute_instance
 
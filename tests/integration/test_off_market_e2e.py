@@ -21,13 +21,21 @@ from home_finder.filters.off_market import BatchResult, CheckResult, ListingStat
 from home_finder.models import MergedProperty, Property, PropertySource
 
 
-def _make_batch_result(results: list[CheckResult]) -> BatchResult:
+def _make_batch_result(
+    results: list[CheckResult],
+    unchecked: list[tuple[str, str, str]] | None = None,
+) -> BatchResult:
     """Build a BatchResult from a flat list of CheckResults."""
     by_source: dict[str, dict[str, int]] = {}
     for r in results:
         counts = by_source.setdefault(r.source, {s.value: 0 for s in ListingStatus})
         counts[r.status.value] += 1
-    return BatchResult(results=results, by_source=by_source, circuit_breakers_tripped=[])
+    return BatchResult(
+        results=results,
+        by_source=by_source,
+        circuit_breakers_tripped=[],
+        unchecked=unchecked or [],
+    )
 
 
 @pytest_asyncio.fixture
@@ -90,6 +98,7 @@ class TestRunCheckOffMarketIntegration:
         mock_results: list[CheckResult],
         *,
         only_scrapers: set[str] | None = None,
+        unchecked: list[tuple[str, str, str]] | None = None,
     ) -> None:
         """Invoke run_check_off_market with patched storage and checker."""
         from home_finder.pipeline.commands import run_check_off_market
@@ -109,7 +118,7 @@ class TestRunCheckOffMarketIntegration:
             patch(
                 "home_finder.filters.off_market.OffMarketChecker.check_batch",
                 new_callable=AsyncMock,
-                return_value=_make_batch_result(mock_results),
+                return_value=_make_batch_result(mock_results, unchecked),
             ),
             patch(
                 "home_finder.filters.off_market.OffMarketChecker.close",
@@ -320,7 +329,9 @@ class TestRunCheckOffMarketIntegration:
         # Mock check_batch to capture what checks were requested
         captured_checks: list[tuple[str, str, str]] = []
 
-        async def _capture_batch(checks: list[tuple[str, str, str]]) -> BatchResult:
+        async def _capture_batch(
+            checks: list[tuple[str, str, str]], *, time_budget: float | None = None
+        ) -> BatchResult:
             captured_checks.extend(checks)
             results = [
                 CheckResult(
@@ -400,3 +411,36 @@ class TestRunCheckOffMarketIntegration:
         assert row["is_off_market"] == 1
         # Reason from first inactive source (let_agreed takes precedence)
         assert row["off_market_reason"] == "let_agreed"
+
+    async def test_budget_skipped_source_does_not_mark_off_market(self, storage: PropertyStorage):
+        """A source the time budget never reached must not count as inactive."""
+        merged = _make_merged(
+            PropertySource.RIGHTMOVE,
+            "800",
+            extra_sources={PropertySource.ZOOPLA: "https://zoopla.co.uk/to-rent/800"},
+        )
+        await storage.save_merged_property(merged)
+        await storage.mark_notified(merged.unique_id)
+
+        await self._run(
+            storage,
+            [
+                CheckResult(
+                    source="rightmove",
+                    url=str(merged.canonical.url),
+                    status=ListingStatus.REMOVED,
+                    property_id=merged.unique_id,
+                ),
+            ],
+            unchecked=[(merged.unique_id, "zoopla", "https://zoopla.co.uk/to-rent/800")],
+        )
+
+        conn = await storage._get_connection()
+        cursor = await conn.execute(
+            "SELECT is_off_market, last_checked_at FROM properties WHERE unique_id = ?",
+            (merged.unique_id,),
+        )
+        row = await cursor.fetchone()
+        assert row["is_off_market"] == 0
+        # Golden record stays unstamped so it leads the next run's queue
+        assert row["last_checked_at"] is None
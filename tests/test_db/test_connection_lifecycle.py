@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sqlite3
 import time
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -221,3 +223,84 @@ class TestClosePragmas:
         # close() should complete without raising
         await storage.close()
         assert storage._conn is None
+
+
+class TestReadConnectionPool:
+    """Web reads use pooled read-only connections separate from the writer."""
+
+    @pytest.mark.asyncio
+    async def test_in_memory_falls_back_to_writer(self) -> None:
+        storage = PropertyStorage(":memory:", read_pool_size=3)
+        await storage.initialize()
+
+        assert storage._read_pool is None
+        async with storage._read_connection() as conn:
+            assert conn is storage._conn
+
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_use_separate_read_only_connection(self, tmp_path: Path) -> None:
+        storage = PropertyStorage(str(tmp_path / "test.db"), read_pool_size=2)
+        await storage.initialize()
+
+        async with storage._read_connection() as conn:
+            assert conn is not storage._conn
+            cursor = await conn.execute("PRAGMA query_only")
+            assert (await cursor.fetchone())[0] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("DELETE FROM properties")
+
+        assert await storage.web.get_property_count() == 0
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_reader_not_blocked_by_open_write_transaction(self, tmp_path: Path) -> None:
+        storage = PropertyStorage(str(tmp_path / "test.db"), read_pool_size=1)
+        await storage.initialize()
+
+        async with storage._transaction() as conn:
+            await conn.execute(
+                "INSERT INTO properties (unique_id, source, source_id, url, title, "
+                "price_pcm, bedrooms, address, first_seen) "
+                "VALUES ('openrent:1', 'openrent', '1', 'https://x/1', 't', 1, 1, 'a', "
+                "datetime('now'))"
+            )
+            # WAL reader sees the last committed snapshot without waiting
+            assert await storage.web.get_property_count() == 0
+
+        assert await storage.web.get_property_count() == 1
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_reused(self, tmp_path: Path) -> None:
+        storage = PropertyStorage(str(tmp_path / "test.db"), read_pool_size=2)
+        await storage.initialize()
+
+        async with storage._read_connection() as conn1:
+            pass
+        async with storage._read_connection() as conn2:
+            assert conn2 is conn1
+
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_dead_reader_replaced_not_closed(self, tmp_path: Path) -> None:
+        storage = PropertyStorage(str(tmp_path / "test.db"), read_pool_size=1)
+        await storage.initialize()
+
+        async with storage._read_connection() as old_conn:
+            pass
+        pool = storage._read_pool
+        assert pool is not None
+        pool._idle = [(old_conn, time.monotonic() - 60)]
+        old_conn.execute = AsyncMock(side_effect=OSError("hung"))  # type: ignore[method-assign]
+        old_conn.close = AsyncMock()  # type: ignore[method-assign]
+
+        async with storage._read_connection() as conn:
+            assert conn is not old_conn
+            cursor = await conn.execute("SELECT 1")
+            assert (await cursor.fetchone())[0] == 1
+        old_conn.close.assert_not_awaited()
+
+        await storage.close()
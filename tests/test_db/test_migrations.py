@@ -346,3 +346,179 @@ class TestBackfillSourceListings:
         assert secondary["is_backfilled"] == 1
         # URL should come from source_urls JSON
         assert secondary["url"] == "https://zoopla.co.uk/456"
+
+
+class TestQualityFilterColumns:
+    """Tests for the analysis_json → column backfill in migrate_008."""
+
+    async def test_backfills_existing_analyses(self, fresh_conn: aiosqlite.Connection):
+        await fresh_conn.execute("BEGIN IMMEDIATE")
+        for version, migration_fn in enumerate(MIGRATIONS[:7], start=1):
+            await migration_fn(fresh_conn)
+            await fresh_conn.execute(f"PRAGMA user_version = {version}")
+        await fresh_conn.commit()
+
+        await fresh_conn.execute(
+            """INSERT INTO properties (
+                unique_id, source, source_id, url, title, price_pcm,
+                bedrooms, address, first_seen
+            ) VALUES ('openrent:1', 'openrent', '1', 'https://openrent.com/1', 't',
+                      2000, 2, 'a', '2025-01-15T10:00:00')"""
+        )
+        analysis = {
+            "kitchen": {"hob_type": "gas"},
+            "light_space": {"natural_light": "good", "floor_level": "upper"},
+            "space": {"living_room_sqm": 18, "total_area_sqm": 55.5},
+            "listing_extraction": {"pets_allowed": "yes", "property_type": "victorian"},
+            "value": {"rating": "excellent", "quality_adjusted_rating": "good"},
+            "one_line": "Bright flat",
+        }
+        await fresh_conn.execute(
+            "INSERT INTO quality_analyses (property_unique_id, analysis_json) VALUES (?, ?)",
+            ("openrent:1", json.dumps(analysis)),
+        )
+        await fresh_conn.commit()
+
+        await run_migrations(fresh_conn)
+
+        cursor = await fresh_conn.execute("SELECT * FROM quality_analyses")
+        row = await cursor.fetchone()
+        assert row["hob_type"] == "gas"
+        assert row["natural_light"] == "good"
+        assert row["floor_level"] == "upper"
+        assert row["living_room_sqm"] == 18.0
+        assert row["total_area_sqm"] == 55.5
+        assert row["pets_allowed"] == "yes"
+        assert row["property_type"] == "victorian"
+        assert row["value_rating"] == "good"
+        assert row["one_line"] == "Bright flat"
+        assert row["broadband_type"] is None
+
+
+class TestCardDenormalization:
+    """Tests for the first-gallery / latest-price backfill in migrate_009."""
+
+    async def test_backfills_card_columns(self, fresh_conn: aiosqlite.Connection):
+        await fresh_conn.execute("BEGIN IMMEDIATE")
+        for version, migration_fn in enumerate(MIGRATIONS[:8], start=1):
+            await migration_fn(fresh_conn)
+            await fresh_conn.execute(f"PRAGMA user_version = {version}")
+        await fresh_conn.commit()
+
+        for uid in ("openrent:1", "openrent:2"):
+            await fresh_conn.execute(
+                """INSERT INTO properties (
+                    unique_id, source, source_id, url, title, price_pcm,
+                    bedrooms, address, first_seen
+                ) VALUES (?, 'openrent', ?, ?, 't', 2000, 2, 'a', '2025-01-15T10:00:00')""",
+                (uid, uid, f"https://openrent.com/{uid}"),
+            )
+        await fresh_conn.executemany(
+            "INSERT INTO property_images (property_unique_id, source, url, image_type)"
+            " VALUES ('openrent:1', 'openrent', ?, ?)",
+            [
+                ("https://x.com/floor.jpg", "floorplan"),
+                ("https://x.com/EPC_chart.png", "gallery"),
+                ("https://x.com/living.jpg", "gallery"),
+                ("https://x.com/kitchen.jpg", "gallery"),
+            ],
+        )
+        await fresh_conn.executemany(
+            "INSERT INTO price_history"
+            " (property_unique_id, old_price, new_price, change_amount, detected_at)"
+            " VALUES ('openrent:1', ?, ?, ?, ?)",
+            [
+                (2100, 2050, -50, "2025-01-16 10:00:00"),
+                (2050, 2000, -50, "2025-01-18 10:00:00"),
+                (2000, 2100, 100, "2025-01-17 10:00:00"),
+            ],
+        )
+        await fresh_conn.commit()
+
+        await run_migrations(fresh_conn)
+
+        cursor = await fresh_conn.execute(
+            "SELECT unique_id, first_gallery_url, last_price_change, price_changed_at"
+            " FROM properties ORDER BY unique_id"
+        )
+        with_data, without = await cursor.fetchall()
+        assert with_data["first_gallery_url"] == "https://x.com/living.jpg"
+        assert with_data["last_price_change"] == -50
+        assert with_data["price_changed_at"] == "2025-01-18 10:00:00"
+        assert without["first_gallery_url"] is None
+        assert without["last_price_change"] is None
+        assert without["price_changed_at"] is None
+
+
+class TestDataVersion:
+    """Tests for the data_version write counter from migrate_010."""
+
+    async def _version(self, conn: aiosqlite.Connection) -> int:
+        cursor = await conn.execute("SELECT version FROM data_version WHERE id = 1")
+        row = await cursor.fetchone()
+        assert row is not None
+        return int(row[0])
+
+    async def test_writes_bump_version(self, fresh_conn: aiosqlite.Connection):
+        await run_migrations(fresh_conn)
+        start = await self._version(fresh_conn)
+
+        await fresh_conn.execute(
+            """INSERT INTO properties (
+                unique_id, source, source_id, url, title, price_pcm,
+                bedrooms, address, first_seen
+            ) VALUES ('openrent:1', 'openrent', '1', 'https://openrent.com/1', 't', 2000, 2,
+                'a', '2025-01-15T10:00:00')"""
+        )
+        assert await self._version(fresh_conn) == start + 1
+
+        await fresh_conn.execute(
+            "INSERT INTO property_images (property_unique_id, source, url, image_type)"
+            " VALUES ('openrent:1', 'openrent', 'https://x.com/a.jpg', 'gallery')"
+        )
+        await fresh_conn.execute("UPDATE properties SET price_pcm = 1900")
+        await fresh_conn.execute("DELETE FROM property_images")
+        assert await self._version(fresh_conn) == start + 4
+
+        # Reads and writes to untracked tables leave it alone
+        await fresh_conn.execute("SELECT * FROM properties")
+        await fresh_conn.execute(
+            "INSERT INTO pipeline_runs (started_at, status) VALUES ('2025-01-15', 'running')"
+        )
+        assert await self._version(fresh_conn) == start + 4
+
+
+class TestPropertyRtree:
+    """Tests for the spatial index backfill in migrate_011 and migrate_021."""
+
+    async def test_backfills_located_properties(self, fresh_conn: aiosqlite.Connection):
+        await fresh_conn.execute("BEGIN IMMEDIATE")
+        for version, migration_fn in enumerate(MIGRATIONS[:10], start=1):
+            await migration_fn(fresh_conn)
+            await fresh_conn.execute(f"PRAGMA user_version = {version}")
+        await fresh_conn.commit()
+
+        for uid, lat in (("openrent:1", 51.5), ("openrent:2", None)):
+            await fresh_conn.execute(
+                """INSERT INTO properties (
+                    unique_id, source, source_id, url, title, price_pcm,
+                    bedrooms, address, first_seen, latitude, longitude
+                ) VALUES (?, 'openrent', ?, ?, 't', 2000, 2, 'a', '2025-01-15', ?, -0.05)""",
+                (uid, uid, f"https://openrent.com/{uid}", lat),
+            )
+        await fresh_conn.commit()
+
+        await run_migrations(fresh_conn)
+
+        cursor = await fresh_conn.execute(
+            "SELECT s.unique_id FROM property_rtree r"
+            " JOIN property_spatial_ids s ON s.id = r.id"
+            " WHERE r.min_lat <= 51.6 AND r.max_lat >= 51.4"
+        )
+        assert [row[0] for row in await cursor.fetchall()] == ["openrent:1"]
+
+        await fresh_conn.execute("DELETE FROM properties WHERE unique_id = 'openrent:1'")
+        for table in ("property_rtree", "property_spatial_ids"):
+            cursor = await fresh_conn.execute(f"SELECT COUNT(*) FROM {table}")
+            row = await cursor.fetchone()
+            assert row is not None and row[0] == 0
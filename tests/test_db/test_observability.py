@@ -148,6 +148,9 @@ class TestScraperRuns:
                 "parse_errors": 0,
                 "is_healthy": True,
                 "error_message": None,
+                "loop_lag_max_ms": 42.5,
+                "loop_lag_p95_ms": 3.1,
+                "watermark_stops": 2,
             },
             {
                 "scraper_name": "zoopla",
@@ -183,11 +186,15 @@ class TestScraperRuns:
         assert openrent["pages_failed"] == 0
         assert openrent["is_healthy"] == 1  # SQLite stores bool as int
         assert openrent["duration_seconds"] == pytest.approx(12.3)
+        assert openrent["loop_lag_max_ms"] == pytest.approx(42.5)
+        assert openrent["loop_lag_p95_ms"] == pytest.approx(3.1)
+        assert openrent["watermark_stops"] == 2
 
         zoopla = dict(rows[1])
         assert zoopla["scraper_name"] == "zoopla"
         assert zoopla["areas_completed"] == 2
         assert zoopla["is_healthy"] == 0
+        assert zoopla["loop_lag_max_ms"] is None
 
     async def test_save_scraper_runs_empty_list_is_noop(self, storage: PropertyStorage) -> None:
         run_id = await storage.pipeline.create_pipeline_run()
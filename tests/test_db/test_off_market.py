@@ -291,6 +291,54 @@ class TestGetPropertiesForOffMarketCheck:
         if sls:  # May be empty if migration backfill didn't create it
             assert sls[0]["source"] == "openrent"
 
+    async def test_orders_by_churn_priority(
+        self,
+        storage: PropertyStorage,
+        merged_a: MergedProperty,
+        multi_source_merged: MergedProperty,
+    ):
+        """Never-checked first, then stalest check; recent price drops jump the queue."""
+        fresh = multi_source_merged.model_copy(
+            update={
+                "canonical": multi_source_merged.canonical.model_copy(update={"source_id": "300"})
+            }
+        )
+        for merged in (merged_a, multi_source_merged, fresh):
+            await storage.save_merged_property(merged)
+            await storage.update_property_last_checked(merged.unique_id)
+        conn = await storage._get_connection()
+        await conn.execute(
+            "UPDATE properties SET last_checked_at = datetime('now', '-10 days')"
+            " WHERE unique_id = ?",
+            (merged_a.unique_id,),
+        )
+        await conn.execute(
+            "UPDATE properties SET last_checked_at = NULL WHERE unique_id = ?",
+            (fresh.unique_id,),
+        )
+        await conn.commit()
+
+        props = await storage.get_properties_for_off_market_check()
+        assert [p["unique_id"] for p in props] == [
+            fresh.unique_id,
+            merged_a.unique_id,
+            multi_source_merged.unique_id,
+        ]
+
+        # A price drop yesterday outweighs a 10-day-old check
+        await conn.execute(
+            "UPDATE properties SET last_price_change = -100,"
+            " price_changed_at = datetime('now', '-1 day') WHERE unique_id = ?",
+            (multi_source_merged.unique_id,),
+        )
+        await conn.commit()
+
+        props = await storage.get_properties_for_off_market_check()
+        assert [p["unique_id"] for p in props][1:] == [
+            multi_source_merged.unique_id,
+            merged_a.unique_id,
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Per-source off-market tracking
@@ -116,6 +116,27 @@ class TestDetectAndRecordPriceChange:
         row = await cursor.fetchone()
         assert row["price_drop_notified"] == 0
 
+    @pytest.mark.asyncio
+    async def test_denormalizes_latest_change(
+        self, storage: PropertyStorage, merged_a: MergedProperty
+    ) -> None:
+        await storage.save_merged_property(merged_a)
+        await storage.detect_and_record_price_change(merged_a.unique_id, 1800)
+        await storage.detect_and_record_price_change(merged_a.unique_id, 1850)
+        conn = await storage._get_connection()
+        cursor = await conn.execute(
+            "SELECT last_price_change, price_changed_at FROM properties WHERE unique_id = ?",
+            (merged_a.unique_id,),
+        )
+        row = await cursor.fetchone()
+        cursor = await conn.execute(
+            "SELECT MAX(id), detected_at FROM price_history WHERE property_unique_id = ?",
+            (merged_a.unique_id,),
+        )
+        latest = await cursor.fetchone()
+        assert row["last_price_change"] == 50
+        assert row["price_changed_at"] == latest["detected_at"]
+
 
 class TestGetPriceHistory:
     @pytest.mark.asyncio
@@ -1,5 +1,6 @@
 """Tests for property storage with SQLite."""
 
+import asyncio
 import json
 from collections.abc import AsyncGenerator
 from datetime import datetime, timedelta
@@ -414,6 +415,79 @@ class TestGetMapMarkers:
         assert len(markers) == 1
         assert markers[0]["id"] == one_bed.unique_id
 
+    @pytest.mark.asyncio
+    async def test_bounds_use_spatial_index(self, storage: PropertyStorage) -> None:
+        """Viewport bounds filter via property_rtree and follow coordinate updates."""
+        for i, (lat, lon) in enumerate([(51.5465, -0.0553), (51.5615, -0.0750)]):
+            await storage.save_property(
+                Property(
+                    source=PropertySource.OPENRENT,
+                    source_id=f"bbox-{i}",
+                    url=HttpUrl(f"https://openrent.com/bbox-{i}"),
+                    title=f"Flat {i}",
+                    price_pcm=1900,
+                    bedrooms=1,
+                    address=f"{i} Test Street",
+                    postcode="E8 3RH",
+                    latitude=lat,
+                    longitude=lon,
+                    image_url=HttpUrl("https://example.com/img.jpg"),
+                )
+            )
+        e8 = (51.54, -0.06, 51.55, -0.05)
+
+        markers = await storage.web.get_map_markers(PropertyFilter(), bounds=e8)
+        assert [m["id"] for m in markers] == ["openrent:bbox-0"]
+
+        conn = await storage._get_connection()
+        await conn.execute(
+            "UPDATE properties SET latitude = 51.545, longitude = -0.055"
+            " WHERE unique_id = 'openrent:bbox-1'"
+        )
+        await conn.commit()
+        markers = await storage.web.get_map_markers(PropertyFilter(), bounds=e8)
+        assert {m["id"] for m in markers} == {"openrent:bbox-0", "openrent:bbox-1"}
+
+        # VACUUM may renumber the implicit rowids of a TEXT-keyed table
+        await conn.execute("UPDATE properties SET rowid = rowid + 1000")
+        await conn.commit()
+        markers = await storage.web.get_map_markers(PropertyFilter(), bounds=e8)
+        assert {m["id"] for m in markers} == {"openrent:bbox-0", "openrent:bbox-1"}
+
+    @pytest.mark.asyncio
+    async def test_clusters_and_extent(self, storage: PropertyStorage) -> None:
+        """Nearby properties share a grid cell; a lone one is returned as a marker."""
+        coords = [(51.5465, -0.0553), (51.5470, -0.0550), (51.4000, -0.3000)]
+        for i, (lat, lon) in enumerate(coords):
+            await storage.save_property(
+                Property(
+                    source=PropertySource.OPENRENT,
+                    source_id=f"cl-{i}",
+                    url=HttpUrl(f"https://openrent.com/cl-{i}"),
+                    title=f"Flat {i}",
+                    price_pcm=2000 - i * 100,
+                    bedrooms=1,
+                    address=f"{i} Test Street",
+                    postcode="E8 3RH",
+                    latitude=lat,
+                    longitude=lon,
+                    image_url=HttpUrl("https://example.com/img.jpg"),
+                )
+            )
+
+        clusters, markers = await storage.web.get_map_clusters(
+            PropertyFilter(), (51.0, -1.0, 52.0, 1.0), cell_degrees=0.05
+        )
+        assert len(clusters) == 1
+        assert clusters[0]["count"] == 2
+        assert clusters[0]["min_price"] == 1900
+        assert clusters[0]["bounds"] == [[51.5465, -0.0553], [51.547, -0.055]]
+        assert [m["id"] for m in markers] == ["openrent:cl-2"]
+
+        extent = await storage.web.get_map_extent(PropertyFilter())
+        assert extent == {"count": 3, "bounds": [[51.4, -0.3], [51.547, -0.055]]}
+        assert await storage.web.get_map_extent(PropertyFilter(bedrooms=3)) is None
+
 
 class TestGetRecentPropertiesForDedup:
     """Tests for get_recent_properties_for_dedup."""
@@ -559,6 +633,55 @@ class TestGetRecentPropertiesForDedup:
         assert PropertySource.OPENRENT in result.descriptions
         assert PropertySource.ZOOPLA in result.descriptions
 
+    @pytest.mark.asyncio
+    async def test_batch_loaded_images_match_per_property(self, storage: PropertyStorage) -> None:
+        """Batch-loaded galleries/floorplans match what per-property loads return."""
+        props = [
+            Property(
+                source=PropertySource.OPENRENT,
+                source_id=f"lazy-{i}",
+                url=HttpUrl(f"https://openrent.com/lazy-{i}"),
+                title="Lazy flat",
+                price_pcm=2000,
+                bedrooms=2,
+                address=f"{i} Mare Street",
+                postcode="E8 3RH",
+            )
+            for i in range(3)
+        ]
+        for prop in props:
+            await storage.save_property(prop)
+        for prop in props[:2]:
+            await storage.save_property_images(
+                prop.unique_id,
+                [
+                    PropertyImage(
+                        url=HttpUrl(f"https://example.com/{prop.source_id}/{n}.jpg"),
+                        source=PropertySource.OPENRENT,
+                        image_type="gallery",
+                    )
+                    for n in range(2)
+                ]
+                + [
+                    PropertyImage(
+                        url=HttpUrl(f"https://example.com/{prop.source_id}/floor.jpg"),
+                        source=PropertySource.OPENRENT,
+                        image_type="floorplan",
+                    )
+                ],
+            )
+
+        results = {m.unique_id: m for m in await storage.get_recent_properties_for_dedup(days=7)}
+        assert len(results) == 3
+        for prop in props[:2]:
+            stored = await storage.get_property_images(prop.unique_id)
+            assert list(results[prop.unique_id].images) == [
+                img for img in stored if img.image_type == "gallery"
+            ]
+            assert results[prop.unique_id].floorplan is not None
+        assert results[props[2].unique_id].images == ()
+        assert results[props[2].unique_id].floorplan is None
+
 
 class TestUpdateMergedSources:
     """Tests for update_merged_sources.
@@ -965,6 +1088,64 @@ class TestWardOperations:
     async def test_update_wards_empty_map(self, storage: PropertyStorage) -> None:
         assert await storage.update_wards({}) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_properties_without_ward_uses_postcode_cache(
+        self,
+        storage: PropertyStorage,
+        storage_sample_property: Property,
+        sample_property_2: Property,
+    ) -> None:
+        known = storage_sample_property.model_copy(update={"postcode": "E8 3RH"})
+        invalid = sample_property_2.model_copy(
+            update={"postcode": "ZZ9 9ZZ", "latitude": None, "longitude": None}
+        )
+        for prop in (known, invalid):
+            await storage.save_merged_property(
+                MergedProperty(
+                    canonical=prop,
+                    sources=(prop.source,),
+                    source_urls={prop.source: prop.url},
+                    min_price=prop.price_pcm,
+                    max_price=prop.price_pcm,
+                )
+            )
+        await storage.save_postcode_wards({"E8 3RH": "London Fields", "ZZ9 9ZZ": None})
+
+        assert await storage.get_properties_without_ward() == []
+        detail = await storage.web.get_property_detail(known.unique_id)
+        assert detail is not None and detail["ward"] == "London Fields"
+
+    @pytest.mark.asyncio
+    async def test_get_properties_without_ward_normalises_postcodes(
+        self,
+        storage: PropertyStorage,
+        storage_sample_property: Property,
+        sample_property_2: Property,
+    ) -> None:
+        """Stray whitespace and case still hit the normalised postcode cache."""
+        known = storage_sample_property.model_copy(update={"postcode": " e8  3rh "})
+        invalid = sample_property_2.model_copy(
+            update={"postcode": "ZZ9 9ZZ ", "latitude": 51.5, "longitude": -0.05}
+        )
+        for prop in (known, invalid):
+            await storage.save_merged_property(
+                MergedProperty(
+                    canonical=prop,
+                    sources=(prop.source,),
+                    source_urls={prop.source: prop.url},
+                    min_price=prop.price_pcm,
+                    max_price=prop.price_pcm,
+                )
+            )
+        await storage.save_postcode_wards({"E8 3RH": "London Fields", "ZZ9 9ZZ": None})
+
+        pending = await storage.get_properties_without_ward()
+        assert [(p["unique_id"], p["postcode_invalid"]) for p in pending] == [
+            (invalid.unique_id, True)
+        ]
+        detail = await storage.web.get_property_detail(known.unique_id)
+        assert detail is not None and detail["ward"] == "London Fields"
+
 
 class TestGetPropertiesNeedingCommute:
     """Tests for get_properties_needing_commute."""
@@ -1212,6 +1393,8 @@ class TestSourceListingsReadPath:
         assert "rightmove" in known
         assert "55555" in known["rightmove"]
 
+        assert await storage.get_all_known_source_ids(sources={"onthemarket"}) == {}
+
     @pytest.mark.asyncio
     async def test_get_all_known_source_ids_empty_table(self, storage: PropertyStorage) -> None:
         """Empty source_listings returns empty dict, not error."""
@@ -1345,3 +1528,179 @@ class TestOnDeleteCascade:
                 f"SELECT COUNT(*) FROM {table} WHERE property_unique_id = ?", (uid,)
             )
             assert (await cursor.fetchone())[0] == 0, f"Expected 0 rows in {table} after CASCADE"
+
+
+class TestTelegramFileIds:
+    """Telegram file_id cache for uploaded images."""
+
+    async def test_round_trip_upsert_and_delete(self, storage: PropertyStorage) -> None:
+        assert await storage.get_telegram_file_ids(["a.jpg"]) == {}
+
+        await storage.save_telegram_file_ids({"a.jpg": ("id-a", 10), "b.jpg": ("id-b", 20)})
+        await storage.save_telegram_file_ids({"a.jpg": ("id-a2", 11)})
+        assert await storage.get_telegram_file_ids(["a.jpg", "b.jpg", "c.jpg"]) == {
+            "a.jpg": ("id-a2", 11),
+            "b.jpg": ("id-b", 20),
+        }
+
+        await storage.delete_telegram_file_ids(["a.jpg"])
+        assert await storage.get_telegram_file_ids(["a.jpg", "b.jpg"]) == {"b.jpg": ("id-b", 20)}
+
+    async def test_writes_wait_for_open_transaction(self, storage: PropertyStorage) -> None:
+        """Writes from the notification worker don't commit mid-transaction."""
+        await storage.save_telegram_file_ids({"old.jpg": ("id-old", 1)})
+
+        async with storage._transaction() as conn:
+            save = asyncio.create_task(storage.save_telegram_file_ids({"a.jpg": ("id-a", 10)}))
+            delete = asyncio.create_task(storage.delete_telegram_file_ids(["old.jpg"]))
+            await asyncio.sleep(0.05)
+            assert not save.done() and not delete.done()
+            await conn.execute(
+                "INSERT INTO telegram_file_ids (cache_path, file_id, file_size) "
+                "VALUES ('b.jpg', 'id-b', 20)"
+            )
+        await asyncio.gather(save, delete)
+
+        assert await storage.get_telegram_file_ids(["a.jpg", "b.jpg", "old.jpg"]) == {
+            "a.jpg": ("id-a", 10),
+            "b.jpg": ("id-b", 20),
+        }
+
+
+class TestDedupBlocks:
+    """Block-at-a-time loading for retroactive dedup."""
+
+    async def test_groups_by_outcode_and_bedrooms(
+        self, storage: PropertyStorage, storage_sample_property: Property
+    ) -> None:
+        base = storage_sample_property
+        props = [
+            base.model_copy(update={"source_id": "1", "postcode": "E8 3RH", "bedrooms": 2}),
+            base.model_copy(update={"source_id": "2", "postcode": "E8 1AA", "bedrooms": 2}),
+            base.model_copy(update={"source_id": "3", "postcode": "E8 1AA", "bedrooms": 1}),
+            base.model_copy(update={"source_id": "4", "postcode": "N1 2AB", "bedrooms": 2}),
+            base.model_copy(update={"source_id": "5", "postcode": None, "bedrooms": 2}),
+        ]
+        for prop in props:
+            await storage.save_property(prop)
+
+        blocks = await storage.get_dedup_blocks()
+
+        assert list(blocks) == ["E8:1", "E8:2", "N1:2"]
+        assert sorted(blocks["E8:2"]) == [props[0].unique_id, props[1].unique_id]
+
+        loaded = await storage.get_properties_for_dedup(blocks["E8:2"])
+        assert sorted(m.unique_id for m in loaded) == sorted(blocks["E8:2"])
+
+    async def test_commit_dedup_block_records_checkpoint(self, storage: PropertyStorage) -> None:
+        assert await storage.get_job_checkpoint("dedup_existing") is None
+
+        await storage.commit_dedup_block([], job="dedup_existing", block_key="E8:2")
+        assert await storage.get_job_checkpoint("dedup_existing") == "E8:2"
+
+        await storage.clear_job_checkpoint("dedup_existing")
+        assert await storage.get_job_checkpoint("dedup_existing") is None
+
+
+class TestCommuteCaches:
+    """Persistent geocode and commute-time caches."""
+
+    async def test_geocode_round_trip_and_ttl(self, storage: PropertyStorage) -> None:
+        await storage.save_geocodes({"E8 3RH": (51.5465, -0.0553), "N1 5AA": (51.54, -0.09)})
+        assert await storage.get_cached_geocodes(["E8 3RH", "E2 0AA"], max_age_days=30) == {
+            "E8 3RH": (51.5465, -0.0553)
+        }
+
+        conn = await storage._get_connection()
+        await conn.execute(
+            "UPDATE geocode_cache SET fetched_at = datetime('now', '-40 days') "
+            "WHERE postcode = 'E8 3RH'"
+        )
+        await conn.commit()
+        assert await storage.get_cached_geocodes(["E8 3RH"], max_age_days=30) == {}
+
+    async def test_commute_round_trip_scoped_by_mode_and_destination(
+        self, storage: PropertyStorage
+    ) -> None:
+        await storage.save_commutes(
+            {(515465, -553): (20, 30), (515489, -612): (None, 30)},
+            transport_mode="cycling",
+            destination="N1 5AA",
+        )
+        await storage.save_commutes(
+            {(515465, -553): (18, 45)}, transport_mode="cycling", destination="N1 5AA"
+        )
+
+        cached = await storage.get_cached_commutes(
+            [(515465, -553), (515489, -612), (1, 1)],
+            transport_mode="cycling",
+            destination="N1 5AA",
+            max_age_days=30,
+        )
+        assert cached == {(515465, -553): (18, 45), (515489, -612): (None, 30)}
+
+        assert (
+            await storage.get_cached_commutes(
+                [(515465, -553)],
+                transport_mode="public_transport",
+                destination="N1 5AA",
+                max_age_days=30,
+            )
+            == {}
+        )
+
+    async def test_isochrone_round_trip(self, storage: PropertyStorage) -> None:
+        rings = [[(51.5, -0.1), (51.6, -0.1), (51.6, 0.0)]]
+        await storage.save_isochrones({30: rings}, transport_mode="cycling", destination="N1 5AA")
+
+        assert await storage.get_isochrones(
+            transport_mode="cycling", destination="N1 5AA", limits=[20, 30], max_age_days=30
+        ) == {30: rings}
+        assert (
+            await storage.get_isochrones(
+                transport_mode="walking", destination="N1 5AA", limits=[30], max_age_days=30
+            )
+            == {}
+        )
+
+
+class TestRightmoveOutcodes:
+    """Persistent Rightmove outcode identifiers."""
+
+    async def test_round_trip_and_ttl(self, storage: PropertyStorage) -> None:
+        await storage.save_rightmove_outcodes({"SE15": "OUTCODE^2298", "N19": "OUTCODE^1676"})
+        await storage.save_rightmove_outcodes({"SE15": "OUTCODE^2299"})
+
+        assert await storage.get_rightmove_outcodes(["SE15", "W1"], max_age_days=30) == {
+            "SE15": "OUTCODE^2299"
+        }
+
+        conn = await storage._get_connection()
+        await conn.execute(
+            "UPDATE rightmove_outcodes SET fetched_at = datetime('now', '-40 days') "
+            "WHERE outcode = 'N19'"
+        )
+        await conn.commit()
+        assert await storage.get_rightmove_outcodes(["N19"], max_age_days=30) == {}
+
+
+class TestScrapeWatermarks:
+    """Per-(platform, area) scrape watermarks."""
+
+    async def test_round_trip_scoped_by_search_key(self, storage: PropertyStorage) -> None:
+        await storage.save_scrape_watermarks(
+            "price=1500-2500", {("rightmove", "e8"): ("sortType=6", 160000001)}
+        )
+        await storage.save_scrape_watermarks(
+            "price=1500-2500",
+            {
+                ("rightmove", "e8"): ("sortType=6", 160000042),
+                ("zoopla", "hackney"): ("results_sort=newest_listings", 70000001),
+            },
+        )
+
+        assert await storage.get_scrape_watermarks("price=1500-2500") == {
+            ("rightmove", "e8"): ("sortType=6", 160000042),
+            ("zoopla", "hackney"): ("results_sort=newest_listings", 70000001),
+        }
+        assert await storage.get_scrape_watermarks("price=1500-3000") == {}
@@ -7,6 +7,7 @@ import pytest_asyncio
 from pydantic import HttpUrl
 
 from home_finder.db.storage import PropertyStorage
+from home_finder.db.web_queries import build_filter_clauses, encode_page_cursor
 from home_finder.models import (
     ConditionAnalysis,
     KitchenAnalysis,
@@ -488,6 +489,50 @@ class TestGetPropertiesPaginated:
         props, _ = await storage.web.get_properties_paginated(PropertyFilter())
         assert props[0]["value_rating"] == "good"
 
+    @pytest.mark.asyncio
+    async def test_filter_by_analysis_columns(
+        self,
+        storage: PropertyStorage,
+        prop_a: Property,
+        merged_a: MergedProperty,
+        merged_b: MergedProperty,
+        sample_analysis: PropertyQualityAnalysis,
+    ) -> None:
+        """Filters on promoted analysis fields match via the denormalized columns."""
+        await storage.save_merged_property(merged_a)
+        await storage.save_merged_property(merged_b)
+        await storage.save_quality_analysis(prop_a.unique_id, sample_analysis)
+
+        for filters, expected in [
+            (PropertyFilter(hob_type="gas"), 1),
+            (PropertyFilter(hob_type="induction"), 0),
+            (PropertyFilter(natural_light="good"), 1),
+            (PropertyFilter(value_rating="excellent"), 1),
+            (PropertyFilter(min_living_room_sqm=15), 1),
+            (PropertyFilter(min_living_room_sqm=20), 0),
+        ]:
+            _, total = await storage.web.get_properties_paginated(filters)
+            assert total == expected, filters
+
+    @pytest.mark.asyncio
+    async def test_selective_filters_use_index(self, storage: PropertyStorage) -> None:
+        """Selective analysis filters are answered from their quality_analyses index."""
+        conn = await storage._get_connection()
+        for filters, index in [
+            (PropertyFilter(hob_type="gas"), "idx_quality_hob_type"),
+            (PropertyFilter(property_type="victorian"), "idx_quality_property_type"),
+            (PropertyFilter(broadband_type="fttp"), "idx_quality_broadband_type"),
+        ]:
+            where_sql, params = build_filter_clauses(filters)
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM properties p "
+                "LEFT JOIN quality_analyses q ON p.unique_id = q.property_unique_id "
+                f"WHERE {where_sql}",
+                params,
+            )
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+            assert f"USING INDEX {index}" in plan, plan
+
     @pytest.mark.asyncio
     async def test_invalid_sort_falls_back(
         self, storage: PropertyStorage, merged_a: MergedProperty
@@ -498,6 +543,114 @@ class TestGetPropertiesPaginated:
         assert total == 1
 
 
+class TestKeysetPagination:
+    @pytest_asyncio.fixture
+    async def seeded(self, storage: PropertyStorage) -> PropertyStorage:
+        """Seven listings with tied prices and tied first_seen timestamps."""
+        for i in range(7):
+            prop = Property(
+                source=PropertySource.OPENRENT,
+                source_id=str(i),
+                url=HttpUrl(f"https://openrent.com/{i}"),
+                title=f"Flat {i}",
+                price_pcm=1800 + (i % 3) * 100,
+                bedrooms=1,
+                address=f"{i} Test St",
+                postcode="E8 1AA",
+                image_url=HttpUrl("https://example.com/img.jpg"),
+            )
+            await storage.save_merged_property(
+                MergedProperty(
+                    canonical=prop,
+                    sources=(PropertySource.OPENRENT,),
+                    source_urls={PropertySource.OPENRENT: prop.url},
+                    min_price=prop.price_pcm,
+                    max_price=prop.price_pcm,
+                )
+            )
+        conn = await storage._get_connection()
+        await conn.execute(
+            "UPDATE properties SET first_seen = '2026-01-0' || (CAST(source_id AS INTEGER) / 2 + 1)"
+        )
+        await conn.commit()
+        return storage
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "sort", ["newest", "price_asc", "price_desc", "fit_desc", "longest_listed"]
+    )
+    async def test_after_cursor_matches_offset_pages(
+        self, seeded: PropertyStorage, sort: str
+    ) -> None:
+        web = seeded.web
+        expected = [
+            p["unique_id"]
+            for page in range(1, 5)
+            for p in (
+                await web.get_properties_paginated(
+                    PropertyFilter(), sort=sort, page=page, per_page=2
+                )
+            )[0]
+        ]
+
+        walked: list[str] = []
+        after = None
+        while True:
+            props, total = await web.get_properties_paginated(
+                PropertyFilter(), sort=sort, per_page=2, after=after
+            )
+            if not props:
+                break
+            walked.extend(p["unique_id"] for p in props)
+            after = encode_page_cursor(props[-1], sort)
+
+        assert total == 7
+        assert walked == expected
+        assert len(set(walked)) == 7
+
+    @pytest.mark.asyncio
+    async def test_before_cursor_returns_previous_page(self, seeded: PropertyStorage) -> None:
+        web = seeded.web
+        page2, _ = await web.get_properties_paginated(
+            PropertyFilter(), sort="price_asc", page=2, per_page=2
+        )
+        page3, _ = await web.get_properties_paginated(
+            PropertyFilter(), sort="price_asc", page=3, per_page=2
+        )
+        back, _ = await web.get_properties_paginated(
+            PropertyFilter(),
+            sort="price_asc",
+            per_page=2,
+            before=encode_page_cursor(page3[0], "price_asc"),
+        )
+        assert [p["unique_id"] for p in back] == [p["unique_id"] for p in page2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_falls_back_to_page(self, seeded: PropertyStorage) -> None:
+        web = seeded.web
+        by_page, _ = await web.get_properties_paginated(PropertyFilter(), page=2, per_page=2)
+        for bad in ["not-base64!", "bnVsbA", encode_page_cursor(by_page[0], "fit_desc")]:
+            props, total = await web.get_properties_paginated(
+                PropertyFilter(), page=2, per_page=2, after=bad
+            )
+            assert total == 7
+            assert [p["unique_id"] for p in props] == [p["unique_id"] for p in by_page]
+
+    @pytest.mark.asyncio
+    async def test_count_cache_invalidated_by_writes(
+        self, seeded: PropertyStorage, merged_a: MergedProperty
+    ) -> None:
+        web = seeded.web
+        assert await web.get_filter_count(PropertyFilter()) == 7
+        assert len(web._count_cache) == 1
+
+        await seeded.save_merged_property(merged_a)
+
+        assert await web.get_filter_count(PropertyFilter()) == 8
+        _, total = await web.get_properties_paginated(PropertyFilter())
+        assert total == 8
+
+
 class TestGetPropertyDetail:
     @pytest.mark.asyncio
     async def test_found(self, storage: PropertyStorage, merged_a: MergedProperty) -> None:
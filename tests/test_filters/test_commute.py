@@ -5,8 +5,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import HttpUrl
 
-from home_finder.filters.commute import CommuteFilter, CommuteResult
-from home_finder.models import Property, PropertySource, TransportMode
+from home_finder.filters.commute import (
+    CommuteFilter,
+    CommuteResult,
+    _coord_key,
+    best_commutes,
+)
+from home_finder.models import MergedProperty, Property, PropertySource, TransportMode
 
 
 @pytest.fixture
@@ -108,11 +113,14 @@ def create_geocoding_response(lat: float, lon: float) -> MagicMock:
     return mock_response
 
 
-def create_time_filter_response(locations: list[tuple[str, int]]) -> MagicMock:
+def create_time_filter_response(
+    locations: list[tuple[str, int]], search_id: str = "property-search"
+) -> MagicMock:
     """Create a mock time_filter response.
 
     Args:
         locations: List of (property_id, travel_time_seconds) tuples.
+        search_id: Id of the search the locations answer.
     """
     mock_locations = []
     for prop_id, travel_time in locations:
@@ -122,6 +130,7 @@ def create_time_filter_response(locations: list[tuple[str, int]]) -> MagicMock:
         mock_locations.append(mock_loc)
 
     mock_search_result = MagicMock()
+    mock_search_result.search_id = search_id
     mock_search_result.locations = mock_locations
 
     mock_response = MagicMock()
@@ -130,6 +139,43 @@ def create_time_filter_response(locations: list[tuple[str, int]]) -> MagicMock:
     return mock_response
 
 
+class _MemoryCommuteCache:
+    """In-memory stand-in for PropertyStorage's commute caches."""
+
+    def __init__(self) -> None:
+        self.geocodes: dict[str, tuple[float, float]] = {}
+        self.commutes: dict[tuple[str, str, tuple[int, int]], tuple[int | None, int]] = {}
+
+    async def get_cached_geocodes(
+        self, postcodes: list[str], *, max_age_days: int
+    ) -> dict[str, tuple[float, float]]:
+        return {pc: self.geocodes[pc] for pc in postcodes if pc in self.geocodes}
+
+    async def save_geocodes(self, geocodes: dict[str, tuple[float, float]]) -> None:
+        self.geocodes.update(geocodes)
+
+    async def get_cached_commutes(
+        self,
+        coords: list[tuple[int, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+        max_age_days: int,
+    ) -> dict[tuple[int, int], tuple[int | None, int]]:
+        keys = {c: (transport_mode, destination, c) for c in coords}
+        return {c: self.commutes[k] for c, k in keys.items() if k in self.commutes}
+
+    async def save_commutes(
+        self,
+        commutes: dict[tuple[int, int], tuple[int | None, int]],
+        *,
+        transport_mode: str,
+        destination: str,
+    ) -> None:
+        for coord, value in commutes.items():
+            self.commutes[(transport_mode, destination, coord)] = value
+
+
 class TestCommuteFilter:
     """Tests for CommuteFilter."""
 
@@ -272,8 +318,44 @@ class TestCommuteFilter:
                 transport_mode=TransportMode.CYCLING,
             )
 
-        # Should return empty results on geocoding failure
-        assert len(results) == 0
+        # Should pass every property through unfiltered on geocoding failure
+        assert {r.property_id for r in results} == {p.unique_id for p in sample_properties}
+        assert all(r.within_limit and r.travel_time_minutes == 0 for r in results)
+        mock_client.time_filter.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_geocoding_failure_keeps_cached_results(
+        self, sample_properties: list[Property]
+    ) -> None:
+        """Cached results survive a destination geocoding failure; only misses pass through."""
+        cache = _MemoryCommuteCache()
+        cached = sample_properties[0]
+        assert cached.latitude is not None and cached.longitude is not None
+        cache.commutes[("cycling", "INVALID", _coord_key(cached.latitude, cached.longitude))] = (
+            45,
+            30,
+        )
+        commute_filter = CommuteFilter(
+            app_id="test-app-id",
+            api_key="test-api-key",
+            destination_postcode="INVALID",
+            cache=cache,
+        )
+
+        mock_client = create_mock_client()
+
+        with patch("traveltimepy.AsyncClient", return_value=mock_client):
+            results = await commute_filter.filter_properties(
+                sample_properties,
+                max_minutes=30,
+                transport_mode=TransportMode.CYCLING,
+            )
+
+        by_id = {r.property_id: r for r in results}
+        assert len(results) == len(sample_properties)
+        assert by_id[cached.unique_id].travel_time_minutes == 45
+        assert not by_id[cached.unique_id].within_limit
+        assert all(by_id[p.unique_id].within_limit for p in sample_properties[1:])
 
     @pytest.mark.asyncio
     async def test_client_configured_with_rate_limiting(
@@ -452,6 +534,171 @@ class TestCommuteFilter:
         assert "commute_filter_skipped" in warning_events
 
 
+class TestCommuteCache:
+    """Persistent caching of geocodes and journey times."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_served_from_cache(self, sample_properties: list[Property]) -> None:
+        CommuteFilter._geocoding_cache.clear()
+        cache = _MemoryCommuteCache()
+        mock_client = create_mock_client(
+            geocoding_response=create_geocoding_response(51.5448, -0.0934),
+            time_filter_response=create_time_filter_response(
+                [("openrent:1", 1200), ("rightmove:2", 2400)]  # zoopla:3 unreachable
+            ),
+        )
+
+        with patch("traveltimepy.AsyncClient", return_value=mock_client):
+            first = CommuteFilter(
+                app_id="id", api_key="key", destination_postcode="n1  5aa", cache=cache
+            )
+            await first.filter_properties(
+                sample_properties, max_minutes=30, transport_mode=TransportMode.CYCLING
+            )
+            second = CommuteFilter(
+                app_id="id", api_key="key", destination_postcode="N1 5AA", cache=cache
+            )
+            results = await second.filter_properties(
+                sample_properties, max_minutes=30, transport_mode=TransportMode.CYCLING
+            )
+
+        assert mock_client.time_filter.await_count == 1
+        assert cache.geocodes == {"N1 5AA": (51.5448, -0.0934)}
+        assert {r.property_id: r.travel_time_minutes for r in results} == {
+            "openrent:1": 20,
+            "rightmove:2": 40,
+        }
+        assert second.cache_stats.commute_cache_hits == 3
+        assert second.cache_stats.commute_cache_misses == 0
+        prop = sample_properties[2]
+        assert prop.latitude is not None and prop.longitude is not None
+        key = ("cycling", "N1 5AA", _coord_key(prop.latitude, prop.longitude))
+        assert cache.commutes[key] == (None, 30)
+
+    @pytest.mark.asyncio
+    async def test_unreachable_entry_requeried_for_longer_limit(
+        self, sample_properties: list[Property]
+    ) -> None:
+        cache = _MemoryCommuteCache()
+        for prop in sample_properties:
+            assert prop.latitude is not None and prop.longitude is not None
+            cache.commutes[("cycling", "N1 5AA", _coord_key(prop.latitude, prop.longitude))] = (
+                None,
+                30,
+            )
+        mock_client = create_mock_client(
+            geocoding_response=create_geocoding_response(51.5448, -0.0934),
+            time_filter_response=create_time_filter_response([("zoopla:3", 2400)]),
+        )
+        commute_filter = CommuteFilter(
+            app_id="id", api_key="key", destination_postcode="N1 5AA", cache=cache
+        )
+
+        with patch("traveltimepy.AsyncClient", return_value=mock_client):
+            shorter = await commute_filter.filter_properties(
+                sample_properties, max_minutes=20, transport_mode=TransportMode.CYCLING
+            )
+            assert shorter == []
+            assert mock_client.time_filter.await_count == 0
+
+            longer = await commute_filter.filter_properties(
+                sample_properties, max_minutes=45, transport_mode=TransportMode.CYCLING
+            )
+
+        assert mock_client.time_filter.await_count == 1
+        assert [(r.property_id, r.travel_time_minutes) for r in longer] == [("zoopla:3", 40)]
+
+    @pytest.mark.asyncio
+    async def test_geocodes_read_from_and_written_to_cache(
+        self, properties_without_coords: list[Property]
+    ) -> None:
+        CommuteFilter._geocoding_cache.clear()
+        cache = _MemoryCommuteCache()
+        cache.geocodes["E8 3AA"] = (51.54, -0.06)
+        prop = properties_without_coords[0]
+        merged = [
+            MergedProperty(
+                canonical=prop,
+                sources=(prop.source,),
+                source_urls={prop.source: prop.url},
+                min_price=prop.price_pcm,
+                max_price=prop.price_pcm,
+            )
+        ]
+        commute_filter = CommuteFilter(
+            app_id="id", api_key="key", destination_postcode="N1 5AA", cache=cache
+        )
+
+        with patch("traveltimepy.AsyncClient") as client_cls:
+            result = await commute_filter.geocode_properties(merged)
+
+        client_cls.assert_not_called()
+        assert (result[0].canonical.latitude, result[0].canonical.longitude) == (51.54, -0.06)
+        assert commute_filter.cache_stats.geocode_cache_hits == 1
+        CommuteFilter._geocoding_cache.clear()
+
+
+class TestMultiModeCommute:
+    """All transport modes in one time-filter request."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_with_a_search_per_mode(
+        self, sample_properties: list[Property]
+    ) -> None:
+        cycling = create_time_filter_response([("openrent:1", 1200), ("rightmove:2", 2400)])
+        transit = create_time_filter_response([("openrent:1", 1500), ("zoopla:3", 900)])
+        response = MagicMock()
+        response.results = [
+            MagicMock(search_id="cycling", locations=cycling.results[0].locations),
+            MagicMock(search_id="public_transport", locations=transit.results[0].locations),
+        ]
+        mock_client = create_mock_client(
+            geocoding_response=create_geocoding_response(51.5448, -0.0934),
+            time_filter_response=response,
+        )
+        commute_filter = CommuteFilter(app_id="id", api_key="key", destination_postcode="N1 5AA")
+
+        with patch("traveltimepy.AsyncClient", return_value=mock_client):
+            results = await commute_filter.filter_properties_by_modes(
+                sample_properties,
+                max_minutes=30,
+                transport_modes=[TransportMode.CYCLING, TransportMode.PUBLIC_TRANSPORT],
+            )
+
+        assert mock_client.time_filter.await_count == 1
+        request = mock_client.time_filter.await_args.kwargs
+        assert [s.id for s in request["arrival_searches"]] == ["cycling", "public_transport"]
+        assert len(request["locations"]) == 1 + len(sample_properties)
+        assert best_commutes(results) == {
+            "openrent:1": (20, TransportMode.CYCLING),
+            "zoopla:3": (15, TransportMode.PUBLIC_TRANSPORT),
+        }
+
+    @pytest.mark.asyncio
+    async def test_locations_chunked_into_concurrent_requests(
+        self, sample_properties: list[Property]
+    ) -> None:
+        mock_client = create_mock_client(
+            geocoding_response=create_geocoding_response(51.5448, -0.0934),
+            time_filter_response=create_time_filter_response([], search_id="cycling"),
+        )
+        commute_filter = CommuteFilter(app_id="id", api_key="key", destination_postcode="N1 5AA")
+
+        with (
+            patch("traveltimepy.AsyncClient", return_value=mock_client),
+            patch("home_finder.filters.commute.MAX_LOCATIONS_PER_SEARCH", 2),
+        ):
+            await commute_filter.filter_properties_by_modes(
+                sample_properties, max_minutes=30, transport_modes=[TransportMode.CYCLING]
+            )
+
+        sent = [
+            call.kwargs["arrival_searches"][0].departure_location_ids
+            for call in mock_client.time_filter.await_args_list
+        ]
+        assert sent == [["openrent:1", "rightmove:2"], ["zoopla:3"]]
+
+
 class TestCommuteResult:
     """Tests for CommuteResult model."""
 
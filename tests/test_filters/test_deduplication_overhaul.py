@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from io import BytesIO
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 from hypothesis import given, settings
 from hypothesis import strategies as st
@@ -492,6 +493,37 @@ class TestPerceptualImageDedup:
 
         assert len(result) == 2
 
+    def test_known_file_hashes_skip_disk_hashing(self, tmp_path: Path) -> None:
+        """Hashes already loaded for dedup scoring are reused, not recomputed."""
+        uid = "openrent:100"
+        data_dir = str(tmp_path)
+
+        img1 = PropertyImage(
+            url=HttpUrl("https://cdn-a.com/photo1.jpg"),
+            source=PropertySource.OPENRENT,
+            image_type="gallery",
+        )
+        img2 = PropertyImage(
+            url=HttpUrl("https://cdn-b.com/photo2.jpg"),
+            source=PropertySource.ZOOPLA,
+            image_type="gallery",
+        )
+        cache_dir = get_cache_dir(data_dir, uid)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for i, img in enumerate([img1, img2]):
+            path = cache_dir / url_to_filename(str(img.url), "gallery", i)
+            save_image_bytes(path, _make_image_bytes((255, 0, 0)))
+            paths.append(path)
+
+        # Distinct known hashes win over identical bytes on disk
+        known = {paths[0]: "0" * 16, paths[1]: "f" * 16}
+        with patch("home_finder.filters.deduplication.hash_from_disk") as mock_hash:
+            result = _perceptual_dedup_images([img1, img2], data_dir, [uid], file_hashes=known)
+
+        mock_hash.assert_not_called()
+        assert len(result) == 2
+
     def test_source_priority_keeps_zoopla_over_openrent(self, tmp_path: Path) -> None:
         """Zoopla version kept when deduping identical images."""
         uid = "openrent:100"
@@ -1,5 +1,6 @@
 """Tests for detail enrichment pipeline step."""
 
+import asyncio
 from collections.abc import Callable
 from io import BytesIO
 from pathlib import Path
@@ -11,7 +12,7 @@ from pydantic import HttpUrl
 from home_finder.filters.detail_enrichment import (
     _detect_epc_in_gallery,
     _detect_floorplan_in_gallery,
-    _generate_gallery_thumbnails,
+    _extract_gallery_features,
     _load_cached_property,
     enrich_merged_properties,
     filter_by_floorplan,
@@ -206,6 +207,7 @@ class TestEnrichMergedProperties:
         # Mock storage returns NO images (property never saved to DB)
         mock_storage = AsyncMock()
         mock_storage.get_property_images_and_row = AsyncMock(return_value=([], None))
+        mock_storage.get_gallery_hashes = AsyncMock(return_value={})
 
         # Detail fetcher should be called after cache is cleared
         detail_data = DetailPageData(
@@ -455,6 +457,43 @@ class TestEnrichMergedProperties:
         assert len(enriched.images) == 1
         assert "img1" in str(enriched.images[0].url)
 
+    async def test_downloads_gallery_concurrently_in_order(
+        self, tmp_path: Path, make_merged_property: Callable[..., MergedProperty]
+    ) -> None:
+        """Gallery downloads overlap but images keep the detail page's order."""
+        merged = make_merged_property()
+        urls = [f"https://example.com/img{i}.jpg" for i in range(6)]
+        detail_data = DetailPageData(
+            gallery_urls=urls, floorplan_url="https://example.com/floor.jpg"
+        )
+        # Later images finish first
+        delays = {u: 0.01 * (len(urls) - i) for i, u in enumerate(urls)}
+        in_flight = 0
+        peak = 0
+
+        async def mock_download(url: str) -> bytes | None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delays.get(url, 0.01))
+            in_flight -= 1
+            return None if "img3" in url else b"imgdata"
+
+        fetcher = DetailFetcher()
+        with (
+            patch.object(
+                fetcher, "fetch_detail_page", new_callable=AsyncMock, return_value=detail_data
+            ),
+            patch.object(fetcher, "download_image_bytes", side_effect=mock_download),
+        ):
+            result = await enrich_merged_properties([merged], fetcher, data_dir=str(tmp_path))
+
+        assert peak == 7  # whole gallery plus the floorplan
+        enriched = result.enriched[0]
+        assert [str(img.url) for img in enriched.images] == [u for u in urls if "img3" not in u]
+        assert enriched.floorplan is not None
+        assert len(list(get_cache_dir(str(tmp_path), merged.unique_id).iterdir())) == 6
+
 
 class TestFilterByFloorplan:
     """Tests for filter_by_floorplan()."""
@@ -621,13 +660,19 @@ class TestFilterByFloorplan:
         assert len(result[0].images) == 8
 
 
-def _make_floorplan_bytes() -> bytes:
-    """Create synthetic floorplan image bytes (black lines on white)."""
+def _make_floorplan_bytes(size: int = 400) -> bytes:
+    """Create synthetic floorplan image bytes (black lines on white).
+
+    Args:
+        size: Width of the image in pixels. Height is 75% of width.
+    """
     img = Image.new("RGB", (400, 300), (255, 255, 255))
     draw = ImageDraw.Draw(img)
     draw.rectangle([20, 20, 380, 280], outline="black", width=3)
     draw.line([(200, 20), (200, 280)], fill="black", width=2)
     draw.line([(20, 150), (200, 150)], fill="black", width=2)
+    if size != 400:
+        img = img.resize((size, int(size * 0.75)), Image.Resampling.NEAREST)
     buf = BytesIO()
     img.save(buf, format="JPEG")
     return buf.getvalue()
@@ -1231,7 +1276,7 @@ class TestEnrichSingleEpcDetection:
 
 
 class TestEpcThumbnailInteraction:
-    """Integration: EPC reclassification must not leave orphaned thumbnails."""
+    """Integration: EPC/floorplan reclassification must not leave orphaned thumbnails."""
 
     async def test_no_orphaned_thumbnails_for_epc_images(
         self, tmp_path: Path, make_merged_property: Callable[..., MergedProperty]
@@ -1295,8 +1340,53 @@ class TestEpcThumbnailInteraction:
         epc_cached = find_cached_file(data_dir, merged.unique_id, epc_url, "gallery")
         assert epc_cached is None  # was renamed to epc_*, so gallery lookup returns None
 
-    def test_generate_gallery_thumbnails_skips_missing_cache(self, tmp_path: Path) -> None:
-        """_generate_gallery_thumbnails should skip images with no cached file."""
+    async def test_no_orphaned_thumbnail_for_gallery_floorplan(
+        self, tmp_path: Path, make_merged_property: Callable[..., MergedProperty]
+    ) -> None:
+        """A gallery image detected as a floorplan must not keep its gallery thumbnail."""
+        merged = make_merged_property(sources=(PropertySource.OPENRENT,), source_id="or_fp")
+        data_dir = str(tmp_path)
+
+        detail_data = DetailPageData(
+            gallery_urls=[
+                "https://example.com/photo1.jpg",
+                "https://example.com/floor.jpg",
+            ],
+        )
+
+        fetcher = DetailFetcher()
+
+        # Images must be > 480px (THUMBNAIL_MAX_DIM) for thumbnail generation
+        async def mock_download(url: str) -> bytes:
+            if "floor" in url:
+                return _make_floorplan_bytes(size=800)
+            return _make_photo_bytes(size=800)
+
+        with (
+            patch.object(
+                fetcher, "fetch_detail_page", new_callable=AsyncMock, return_value=detail_data
+            ),
+            patch.object(fetcher, "download_image_bytes", side_effect=mock_download),
+        ):
+            result = await enrich_merged_properties([merged], fetcher, data_dir=data_dir)
+
+        enriched = result.enriched[0]
+        assert enriched.floorplan is not None
+        assert len(enriched.images) == 1
+
+        photo_path = find_cached_file(
+            data_dir, merged.unique_id, "https://example.com/photo1.jpg", "gallery"
+        )
+        assert photo_path is not None
+        thumb_files = {
+            f.name
+            for f in get_cache_dir(data_dir, merged.unique_id).iterdir()
+            if f.name.startswith("thumb_")
+        }
+        assert thumb_files == {f"thumb_{photo_path.stem}.jpg"}
+
+    def test_extract_gallery_features_skips_missing_cache(self, tmp_path: Path) -> None:
+        """_extract_gallery_features should skip images with no cached file."""
         images = [
             PropertyImage(
                 url=HttpUrl("https://example.com/missing.jpg"),
@@ -1305,8 +1395,7 @@ class TestEpcThumbnailInteraction:
             )
         ]
         # Don't create any cache files
-        count = _generate_gallery_thumbnails(images, "test:1", str(tmp_path))
-        assert count == 0
+        assert _extract_gallery_features(images, "test:1", str(tmp_path)) == {}
 
 
 class TestIsFloorplanExempt:
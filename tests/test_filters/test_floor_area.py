@@ -29,6 +29,7 @@ from home_finder.scrapers.detail_fetcher import (
     DetailFetcher,
     _zoopla_size_from_rsc,
 )
+from home_finder.scrapers.zoopla_rsc import parse_page
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -197,14 +198,14 @@ class TestZooplaFloorArea:
         html = f"""<!DOCTYPE html><html><body>
         <script>self.__next_f.push([1, {json.dumps(rsc_chunk)}])</script>
         </body></html>"""
-        result = _zoopla_size_from_rsc(html)
+        result = _zoopla_size_from_rsc(parse_page(html))
         assert result == 750
 
     def test_zoopla_size_from_rsc_no_size(self) -> None:
         html = """<!DOCTYPE html><html><body>
         <script>self.__next_f.push([1, "1:{}\\"otherField\\":42}"])</script>
         </body></html>"""
-        result = _zoopla_size_from_rsc(html)
+        result = _zoopla_size_from_rsc(parse_page(html))
         assert result is None
 
     def test_zoopla_size_from_rsc_rejects_too_small(self) -> None:
@@ -213,7 +214,7 @@ class TestZooplaFloorArea:
         html = f"""<!DOCTYPE html><html><body>
         <script>self.__next_f.push([1, {json.dumps(rsc_chunk)}])</script>
         </body></html>"""
-        result = _zoopla_size_from_rsc(html)
+        result = _zoopla_size_from_rsc(parse_page(html))
         assert result is None
 
     def test_zoopla_size_from_rsc_rejects_too_large(self) -> None:
@@ -222,7 +223,7 @@ class TestZooplaFloorArea:
         html = f"""<!DOCTYPE html><html><body>
         <script>self.__next_f.push([1, {json.dumps(rsc_chunk)}])</script>
         </body></html>"""
-        result = _zoopla_size_from_rsc(html)
+        result = _zoopla_size_from_rsc(parse_page(html))
         assert result is None
 
 
@@ -0,0 +1,190 @@
+"""Tests for offline isochrone classification."""
+
+import json
+import math
+import random
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import HttpUrl
+from traveltimepy.responses.time_map import TimeMapResponse
+
+from home_finder.filters.commute import CommuteFilter, best_commutes
+from home_finder.filters.isochrone import IsochroneIndex, Ring, band_limits
+from home_finder.models import Property, PropertySource, TransportMode
+
+DEST_LAT, DEST_LNG = 51.5448, -0.0934
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "traveltime_isochrones.json"
+
+
+def _offset(east_m: float, north_m: float) -> tuple[float, float]:
+    """(lat, lng) of a point offset from the destination by metres."""
+    return (
+        DEST_LAT + north_m / 110_574,
+        DEST_LNG + east_m / (111_320 * math.cos(math.radians(DEST_LAT))),
+    )
+
+
+def _load_bands() -> dict[int, list[Ring]]:
+    """Fixture rings per band limit (shells and holes)."""
+    bands: dict[int, list[Ring]] = {}
+    for result in json.loads(FIXTURE.read_text())["results"]:
+        limit = int(result["search_id"].split(":")[1])
+        rings = bands.setdefault(limit, [])
+        for shape in result["shapes"]:
+            for ring in [shape["shell"], *shape["holes"]]:
+                rings.append([(c["lat"], c["lng"]) for c in ring])
+    return bands
+
+
+def _ray_cast(rings: list[Ring], lat: float, lng: float) -> bool:
+    inside = False
+    for ring in rings:
+        for (lat1, lng1), (lat2, lng2) in zip(ring, ring[1:] + ring[:1], strict=True):
+            if (lat1 > lat) != (lat2 > lat) and lng < lng1 + (lat - lat1) * (lng2 - lng1) / (
+                lat2 - lat1
+            ):
+                inside = not inside
+    return inside
+
+
+def _property(source_id: str, lat: float, lng: float) -> Property:
+    return Property(
+        source=PropertySource.OPENRENT,
+        source_id=source_id,
+        url=HttpUrl(f"https://www.openrent.com/property/{source_id}"),
+        title=f"Flat {source_id}",
+        price_pcm=2000,
+        bedrooms=1,
+        address=f"{source_id} Test Street",
+        postcode="E8 3RH",
+        latitude=lat,
+        longitude=lng,
+    )
+
+
+class _MemoryIsochroneStore:
+    def __init__(self, bands: dict[int, list[Ring]] | None = None) -> None:
+        self.stored: dict[tuple[str, str], dict[int, list[Ring]]] = {}
+        if bands is not None:
+            self.stored[("cycling", "N1 5AA")] = bands
+
+    async def get_isochrones(
+        self, *, transport_mode: str, destination: str, limits: list[int], max_age_days: int
+    ) -> dict[int, list[Ring]]:
+        bands = self.stored.get((transport_mode, destination), {})
+        return {limit: bands[limit] for limit in limits if limit in bands}
+
+    async def save_isochrones(
+        self, isochrones: dict[int, list[Ring]], *, transport_mode: str, destination: str
+    ) -> None:
+        self.stored.setdefault((transport_mode, destination), {}).update(isochrones)
+
+
+def _mock_client(time_filter_ids: list[str]) -> AsyncMock:
+    client = AsyncMock()
+    feature = MagicMock()
+    feature.geometry.coordinates = [DEST_LNG, DEST_LAT]
+    client.geocoding = AsyncMock(return_value=MagicMock(features=[feature]))
+    locations = [MagicMock(id=i, properties=[MagicMock(travel_time=1740)]) for i in time_filter_ids]
+    client.time_filter = AsyncMock(
+        return_value=MagicMock(results=[MagicMock(search_id="cycling", locations=locations)])
+    )
+    client.time_map = AsyncMock(
+        return_value=TimeMapResponse.model_validate_json(FIXTURE.read_text())
+    )
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestIsochroneIndex:
+    def test_band_limits(self) -> None:
+        assert band_limits(30) == [10, 20, 30]
+        assert band_limits(45) == [10, 20, 30, 40, 45]
+        assert band_limits(5) == [5]
+
+    def test_classifies_inside_outside_hole_and_boundary(self) -> None:
+        index = IsochroneIndex(_load_bands()[30])
+
+        assert index.classify(*_offset(0, 0)) is True
+        assert index.classify(*_offset(0, 3000)) is True
+        assert index.classify(*_offset(3700, 0)) is False  # in the hole
+        assert index.classify(*_offset(-6000, 0)) is False
+        assert index.classify(*_offset(0, -4450)) is None  # 50 m from a vertex
+
+    def test_matches_ray_casting_away_from_edges(self) -> None:
+        rings = _load_bands()[30]
+        index = IsochroneIndex(rings, grid_size=16)
+        rng = random.Random(0)
+        decided = 0
+        for _ in range(2000):
+            lat, lng = _offset(rng.uniform(-5500, 5500), rng.uniform(-5500, 5500))
+            result = index.classify(lat, lng)
+            if result is not None:
+                decided += 1
+                assert result is _ray_cast(rings, lat, lng)
+        assert decided > 1800
+
+    def test_empty_isochrone_contains_nothing(self) -> None:
+        assert IsochroneIndex([]).classify(DEST_LAT, DEST_LNG) is False
+
+
+class TestOfflineCommuteFilter:
+    @pytest.mark.asyncio
+    async def test_decides_offline_and_sends_only_boundary_points(self) -> None:
+        CommuteFilter._geocoding_cache.clear()
+        props = [
+            _property("centre", *_offset(0, 0)),
+            _property("mid", *_offset(0, 2200)),
+            _property("hole", *_offset(3700, 0)),
+            _property("far", *_offset(-6000, 0)),
+            _property("edge", *_offset(0, -4450)),
+        ]
+        client = _mock_client(["openrent:edge"])
+        commute_filter = CommuteFilter(
+            app_id="id",
+            api_key="key",
+            destination_postcode="N1 5AA",
+            isochrones=_MemoryIsochroneStore(_load_bands()),
+        )
+
+        with patch("traveltimepy.AsyncClient", return_value=client):
+            results = await commute_filter.filter_properties(
+                props, max_minutes=30, transport_mode=TransportMode.CYCLING
+            )
+
+        client.time_map.assert_not_awaited()
+        search = client.time_filter.await_args.kwargs["arrival_searches"][0]
+        assert search.departure_location_ids == ["openrent:edge"]
+        assert best_commutes(results) == {
+            "openrent:centre": (10, TransportMode.CYCLING),
+            "openrent:mid": (20, TransportMode.CYCLING),
+            "openrent:edge": (29, TransportMode.CYCLING),
+        }
+        assert commute_filter.cache_stats.commute_isochrone_hits == 4
+
+    @pytest.mark.asyncio
+    async def test_fetches_and_stores_missing_isochrones(self) -> None:
+        CommuteFilter._geocoding_cache.clear()
+        store = _MemoryIsochroneStore()
+        client = _mock_client([])
+        commute_filter = CommuteFilter(
+            app_id="id", api_key="key", destination_postcode="N1 5AA", isochrones=store
+        )
+
+        with patch("traveltimepy.AsyncClient", return_value=client):
+            results = await commute_filter.filter_properties(
+                [_property("centre", *_offset(0, 0))],
+                max_minutes=30,
+                transport_mode=TransportMode.CYCLING,
+            )
+
+        searches = client.time_map.await_args.kwargs["arrival_searches"]
+        assert [s.id for s in searches] == ["cycling:10", "cycling:20", "cycling:30"]
+        assert sorted(store.stored[("cycling", "N1 5AA")]) == [10, 20, 30]
+        client.time_filter.assert_not_awaited()
+        assert [(r.property_id, r.travel_time_minutes) for r in results] == [
+            ("openrent:centre", 10)
+        ]
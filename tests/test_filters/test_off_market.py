@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -18,6 +19,7 @@ from home_finder.filters.off_market import (
     _check_zoopla,
     _CurlResponseAdapter,
     _is_cloudflare_challenge,
+    _SourcePacer,
 )
 
 # ---------------------------------------------------------------------------
@@ -414,11 +416,14 @@ class TestCircuitBreaker:
             checks = [(f"prop-{i}", "zoopla", f"https://zoopla.co.uk/{i}") for i in range(10)]
             batch = await checker.check_batch(checks)
 
-        assert len(batch.results) == 10
         # Circuit breaker triggers after 5 — check_url should only be called 5 times
         assert mock_check.call_count == 5
-        # All results are UNKNOWN
+        # Checked results are UNKNOWN; the rest were never requested
+        assert len(batch.results) == 5
         assert all(r.status == ListingStatus.UNKNOWN for r in batch.results)
+        assert batch.unchecked == [
+            (f"prop-{i}", "zoopla", f"https://zoopla.co.uk/{i}") for i in range(5, 10)
+        ]
         # Breaker should be reported as tripped
         assert "zoopla" in batch.circuit_breakers_tripped
 
@@ -445,9 +450,10 @@ class TestCircuitBreaker:
             checks = [(f"prop-{i}", "zoopla", f"https://zoopla.co.uk/{i}") for i in range(10)]
             batch = await checker.check_batch(checks)
 
-        # 8 actual calls before circuit breaker, remaining 2 marked UNKNOWN
+        # 8 actual calls before circuit breaker, remaining 2 left unchecked
         assert mock_check.call_count == 8
-        assert len(batch.results) == 10
+        assert len(batch.results) == 8
+        assert [prop_id for prop_id, _, _ in batch.unchecked] == ["prop-8", "prop-9"]
 
         await checker.close()
 
@@ -585,3 +591,77 @@ class TestCheckUrlLogging:
         assert len(unknown_logs) == 1
         assert unknown_logs[0]["reason"] == "fetch_failed"
         await checker.close()
+
+
+# ---------------------------------------------------------------------------
+# Adaptive pacing, concurrency and time budget
+# ---------------------------------------------------------------------------
+
+
+class TestSourcePacer:
+    def test_throttled_doubles_and_honours_retry_after(self):
+        pacer = _SourcePacer(1.0)
+        pacer.throttled()
+        assert pacer.delay == 2.0
+        pacer.throttled(retry_after=30)
+        assert pacer.delay == 30.0
+
+    def test_succeeded_shrinks_to_floor(self):
+        pacer = _SourcePacer(1.0)
+        for _ in range(100):
+            pacer.succeeded()
+        assert pacer.delay == 0.5
+
+    async def test_429_backs_off_source(self):
+        checker = OffMarketChecker()
+
+        with patch.object(checker, "_fetch", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = _make_response(
+                status_code=429, text="Slow down", headers={"retry-after": "7"}
+            )
+            await checker.check_url("rightmove", "https://rightmove.co.uk/1")
+
+        assert checker._pacer("rightmove").delay == 7.0
+        assert checker._pacer("zoopla").delay == 2.0
+        await checker.close()
+
+
+class TestCheckBatchScheduling:
+    async def test_requests_overlap_within_source(self):
+        """Slow responses don't serialise the source: several are in flight at once."""
+        checker = OffMarketChecker()
+        in_flight = 0
+        peak = 0
+
+        async def _slow_check(source: str, url: str) -> ListingStatus:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(1.2)
+            in_flight -= 1
+            return ListingStatus.ACTIVE
+
+        with patch.object(checker, "check_url", side_effect=_slow_check):
+            checks = [(f"p{i}", "rightmove", f"https://rightmove.co.uk/{i}") for i in range(4)]
+            batch = await checker.check_batch(checks)
+
+        assert len(batch.results) == 4
+        assert peak > 1
+        await checker.close()
+
+    async def test_time_budget_leaves_rest_unchecked(self):
+        checker = OffMarketChecker()
+
+        with patch.object(checker, "check_url", new_callable=AsyncMock) as mock_check:
+            mock_check.return_value = ListingStatus.ACTIVE
+
+            checks = [(f"p{i}", "zoopla", f"https://zoopla.co.uk/{i}") for i in range(5)]
+            batch = await checker.check_batch(checks, time_budget=0.1)
+
+        # First request starts immediately; the next slot is 2s away
+        assert [r.property_id for r in batch.results] == ["p0"]
+        assert batch.unchecked == [
+            (f"p{i}", "zoopla", f"https://zoopla.co.uk/{i}") for i in range(1, 5)
+        ]
+        assert batch.circuit_breakers_tripped == []
+        await checker.close()
@@ -96,18 +96,18 @@ async def _run_with_storage(storage: PropertyStorage, settings: Settings) -> Non
         self_storage.db_path = db_path
         self_storage._conn = storage._conn
         self_storage._last_health_check = 0.0
+        self_storage._write_lock = storage._write_lock
+        self_storage._read_pool = None
         self_storage._ensure_directory()
         from home_finder.db.pipeline_repo import PipelineRepository
         from home_finder.db.web_queries import WebQueryService
 
-        self_storage._web = WebQueryService(
-            self_storage._get_connection, self_storage.get_property_images
-        )
+        self_storage._web = WebQueryService(self_storage._read_connection)
         self_storage._pipeline = PipelineRepository(
             self_storage._get_connection,
-            self_storage.get_property_images,
             self_storage.save_quality_analysis,
             self_storage._transaction,
+            self_storage._write,
         )
 
     original_close = PropertyStorage.close
@@ -224,3 +224,50 @@ class TestRunDedupExisting:
         assert "dedup_no_properties_in_database" in events
 
         await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(
+        self,
+        settings: Settings,
+        merged_otm: MergedProperty,
+        merged_rm: MergedProperty,
+    ) -> None:
+        """Blocks at or before the checkpoint are skipped; completion clears it."""
+        storage = PropertyStorage(":memory:")
+        await storage.initialize()
+
+        await storage.save_merged_property(merged_otm)
+        await storage.save_merged_property(merged_rm)
+        await storage.commit_dedup_block([], job="dedup_existing", block_key="E8:2")
+
+        await _run_with_storage(storage, settings)
+
+        # The E8:2 block was already done, so both listings are untouched
+        assert len(await storage.get_all_properties()) == 2
+        assert await storage.get_job_checkpoint("dedup_existing") is None
+
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_reports_block_throughput(
+        self,
+        settings: Settings,
+        merged_otm: MergedProperty,
+        merged_rm: MergedProperty,
+    ) -> None:
+        storage = PropertyStorage(":memory:")
+        await storage.initialize()
+
+        await storage.save_merged_property(merged_otm)
+        await storage.save_merged_property(merged_rm)
+
+        with structlog.testing.capture_logs() as captured:
+            await _run_with_storage(storage, settings)
+
+        blocks = [e for e in captured if e["event"] == "dedup_block_complete"]
+        assert len(blocks) == 1
+        assert blocks[0]["block"] == "E8:2"
+        assert blocks[0]["properties"] == 2
+        assert blocks[0]["absorbed"] == 1
+
+        await storage.close()
@@ -0,0 +1,46 @@
+"""Tests for the Telegram token-bucket rate limiter."""
+
+import time
+
+import pytest
+
+from home_finder.notifiers.rate_limit import TelegramRateLimiter
+
+
+class TestTelegramRateLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self) -> None:
+        limiter = TelegramRateLimiter(global_rate=100, chat_rate=20, chat_burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire(1)
+        assert time.monotonic() - start < 0.03
+
+        # Burst used up: the next two calls wait ~1/20 s each
+        for _ in range(2):
+            await limiter.acquire(1)
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_chats_have_separate_buckets(self) -> None:
+        limiter = TelegramRateLimiter(global_rate=100, chat_rate=1, chat_burst=1)
+        start = time.monotonic()
+        await limiter.acquire(1)
+        await limiter.acquire(2)
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_global_limit_applies_across_chats(self) -> None:
+        limiter = TelegramRateLimiter(global_rate=20, chat_rate=100, chat_burst=100)
+        start = time.monotonic()
+        for chat in range(22):
+            await limiter.acquire(chat)
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_backoff_holds_callers(self) -> None:
+        limiter = TelegramRateLimiter()
+        limiter.backoff(0.1)
+        start = time.monotonic()
+        await limiter.acquire(1)
+        assert time.monotonic() - start >= 0.09
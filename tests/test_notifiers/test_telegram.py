@@ -1541,3 +1541,135 @@ class TestNotificationWithFSInputFile:
             assert isinstance(m.media, FSInputFile)
             # None should be thumbnails — albums use full-size
             assert THUMBNAIL_PREFIX not in str(m.media.path)
+
+
+class _MemoryFileIdStore:
+    """In-memory TelegramFileIdStore."""
+
+    def __init__(self) -> None:
+        self.file_ids: dict[str, tuple[str, int]] = {}
+
+    async def get_telegram_file_ids(self, cache_paths: list[str]) -> dict[str, tuple[str, int]]:
+        return {p: self.file_ids[p] for p in cache_paths if p in self.file_ids}
+
+    async def save_telegram_file_ids(self, file_ids: dict[str, tuple[str, int]]) -> None:
+        self.file_ids.update(file_ids)
+
+    async def delete_telegram_file_ids(self, cache_paths: list[str]) -> None:
+        for p in cache_paths:
+            self.file_ids.pop(p, None)
+
+
+class TestTelegramFileIdCache:
+    """Uploaded cache images are re-sent by file_id instead of re-uploaded."""
+
+    @staticmethod
+    def _cache_first_image(merged: MergedProperty, data_dir: Path) -> Path:
+        from home_finder.utils.image_cache import get_cache_dir, url_to_filename
+
+        cache_dir = get_cache_dir(str(data_dir), merged.unique_id)
+        cache_dir.mkdir(parents=True)
+        path = cache_dir / url_to_filename(str(merged.images[0].url), "gallery", 0)
+        path.write_bytes(b"\xff\xd8\xff" + b"\x00" * 100)
+        return path
+
+    @staticmethod
+    def _mock_bot() -> AsyncMock:
+        sent = MagicMock(message_id=1)
+        sent.photo = [MagicMock(file_id="small"), MagicMock(file_id="AgACfile")]
+        mock_bot = AsyncMock()
+        mock_bot.send_photo = AsyncMock(return_value=sent)
+        mock_bot.send_message = AsyncMock(return_value=MagicMock(message_id=2))
+        mock_bot.send_venue = AsyncMock(return_value=MagicMock(message_id=3))
+        return mock_bot
+
+    @pytest.mark.asyncio
+    async def test_second_send_reuses_file_id(
+        self,
+        sample_merged_property: MergedProperty,
+        sample_quality_analysis: PropertyQualityAnalysis,
+        tmp_path: Path,
+    ) -> None:
+        from aiogram.types import FSInputFile
+
+        path = self._cache_first_image(sample_merged_property, tmp_path)
+        store = _MemoryFileIdStore()
+        notifier = TelegramNotifier(
+            bot_token="123456:ABC-DEF",
+            chat_id=12345678,
+            data_dir=str(tmp_path),
+            file_id_store=store,
+        )
+        mock_bot = self._mock_bot()
+
+        with patch.object(notifier, "_get_bot", return_value=mock_bot):
+            for _ in range(2):
+                assert await notifier.send_merged_property_notification(
+                    sample_merged_property, quality_analysis=sample_quality_analysis
+                )
+
+        first, second = (c[1]["photo"] for c in mock_bot.send_photo.call_args_list)
+        assert isinstance(first, FSInputFile)
+        assert second == "AgACfile"
+        key = path.relative_to(tmp_path).as_posix()
+        assert store.file_ids == {key: ("AgACfile", path.stat().st_size)}
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_uploaded_again(
+        self,
+        sample_merged_property: MergedProperty,
+        sample_quality_analysis: PropertyQualityAnalysis,
+        tmp_path: Path,
+    ) -> None:
+        from aiogram.types import FSInputFile
+
+        path = self._cache_first_image(sample_merged_property, tmp_path)
+        store = _MemoryFileIdStore()
+        store.file_ids[path.relative_to(tmp_path).as_posix()] = ("stale", 1)
+        notifier = TelegramNotifier(
+            bot_token="123456:ABC-DEF",
+            chat_id=12345678,
+            data_dir=str(tmp_path),
+            file_id_store=store,
+        )
+        mock_bot = self._mock_bot()
+
+        with patch.object(notifier, "_get_bot", return_value=mock_bot):
+            await notifier.send_merged_property_notification(
+                sample_merged_property, quality_analysis=sample_quality_analysis
+            )
+
+        assert isinstance(mock_bot.send_photo.call_args[1]["photo"], FSInputFile)
+
+    @pytest.mark.asyncio
+    async def test_rejected_file_id_is_forgotten(
+        self,
+        sample_merged_property: MergedProperty,
+        sample_quality_analysis: PropertyQualityAnalysis,
+        tmp_path: Path,
+    ) -> None:
+        from aiogram.exceptions import TelegramBadRequest
+
+        path = self._cache_first_image(sample_merged_property, tmp_path)
+        key = path.relative_to(tmp_path).as_posix()
+        store = _MemoryFileIdStore()
+        store.file_ids[key] = ("expired", path.stat().st_size)
+        notifier = TelegramNotifier(
+            bot_token="123456:ABC-DEF",
+            chat_id=12345678,
+            data_dir=str(tmp_path),
+            file_id_store=store,
+        )
+        mock_bot = self._mock_bot()
+        mock_bot.send_photo.side_effect = TelegramBadRequest(
+            method=MagicMock(), message="wrong file identifier"
+        )
+
+        with patch.object(notifier, "_get_bot", return_value=mock_bot):
+            result = await notifier.send_merged_property_notification(
+                sample_merged_property, quality_analysis=sample_quality_analysis
+            )
+
+        assert result is True  # fell back to text
+        mock_bot.send_message.assert_called_once()
+        assert key not in store.file_ids
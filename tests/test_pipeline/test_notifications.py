@@ -0,0 +1,183 @@
+"""Tests for the background Telegram notification dispatcher."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest_asyncio
+from pydantic import HttpUrl
+
+from home_finder.db.storage import PropertyStorage
+from home_finder.models import (
+    MergedProperty,
+    NotificationStatus,
+    Property,
+    PropertySource,
+    TransportMode,
+)
+from home_finder.pipeline.event_recorder import EventRecorder
+from home_finder.pipeline.notifications import NotificationDispatcher
+
+
+@pytest_asyncio.fixture
+async def storage() -> AsyncGenerator[PropertyStorage, None]:
+    s = PropertyStorage(":memory:")
+    await s.initialize()
+    yield s
+    await s.close()
+
+
+def _merged(source_id: str) -> MergedProperty:
+    prop = Property(
+        source=PropertySource.OPENRENT,
+        source_id=source_id,
+        url=HttpUrl(f"https://openrent.com/{source_id}"),
+        title="1 bed flat",
+        price_pcm=1900,
+        bedrooms=1,
+        address="10 Mare Street",
+        postcode="E8 3RH",
+        image_url=HttpUrl("https://example.com/img.jpg"),
+    )
+    return MergedProperty(
+        canonical=prop,
+        sources=(PropertySource.OPENRENT,),
+        source_urls={PropertySource.OPENRENT: prop.url},
+        min_price=1900,
+        max_price=1900,
+    )
+
+
+async def _status(storage: PropertyStorage, unique_id: str) -> NotificationStatus:
+    tracked = await storage.get_property(unique_id)
+    assert tracked is not None
+    return tracked.notification_status
+
+
+class TestNotificationDispatcher:
+    async def test_submit_does_not_wait_for_delivery(self, storage: PropertyStorage) -> None:
+        release = asyncio.Event()
+
+        async def _slow_send(*args: object, **kwargs: object) -> bool:
+            await release.wait()
+            return True
+
+        notifier = MagicMock()
+        notifier.send_merged_property_notification = AsyncMock(side_effect=_slow_send)
+        merged = _merged("1")
+        await storage.save_merged_property(merged)
+
+        async with NotificationDispatcher(notifier, storage) as dispatcher:
+            dispatcher.submit(merged, (12, TransportMode.CYCLING), None)
+            await asyncio.sleep(0)
+            assert await _status(storage, merged.unique_id) == NotificationStatus.PENDING
+            release.set()
+            await dispatcher.drain()
+
+            assert dispatcher.sent_count == 1
+            assert await _status(storage, merged.unique_id) == NotificationStatus.SENT
+        call = notifier.send_merged_property_notification.await_args
+        assert call.kwargs["commute_minutes"] == 12
+
+    async def test_failures_are_recorded(self, storage: PropertyStorage) -> None:
+        notifier = MagicMock()
+        notifier.send_merged_property_notification = AsyncMock(
+            side_effect=[False, RuntimeError("boom"), True]
+        )
+        run_id = await storage.pipeline.create_pipeline_run()
+        recorder = EventRecorder(storage, run_id)
+        items = [_merged(str(i)) for i in range(3)]
+        for merged in items:
+            await storage.save_merged_property(merged)
+
+        async with NotificationDispatcher(notifier, storage, recorder=recorder) as dispatcher:
+            for merged in items:
+                dispatcher.submit(merged, None, None)
+        # Exiting the context drains the queue
+
+        assert (dispatcher.sent_count, dispatcher.failed_count) == (1, 2)
+        assert [await _status(storage, m.unique_id) for m in items] == [
+            NotificationStatus.FAILED,
+            NotificationStatus.FAILED,
+            NotificationStatus.SENT,
+        ]
+        events = [e.event_type for e in recorder._buffer]
+        assert events == ["notification_failed", "notification_failed", "notified"]
+
+    async def test_unsent_retry_uses_plain_notification(self, storage: PropertyStorage) -> None:
+        notifier = MagicMock()
+        notifier.send_property_notification = AsyncMock(return_value=True)
+        merged = _merged("1")
+        await storage.save_merged_property(merged)
+        await storage.mark_notification_failed(merged.unique_id)
+        (tracked,) = await storage.get_unsent_notifications()
+
+        async with NotificationDispatcher(notifier, storage) as dispatcher:
+            dispatcher.submit_unsent(tracked)
+
+        notifier.send_property_notification.assert_awaited_once()
+        assert await _status(storage, merged.unique_id) == NotificationStatus.SENT
+
+    async def test_failed_retry_keeps_status_and_records_attempt(
+        self, storage: PropertyStorage
+    ) -> None:
+        notifier = MagicMock()
+        notifier.send_property_notification = AsyncMock(return_value=False)
+        run_id = await storage.pipeline.create_pipeline_run()
+        recorder = EventRecorder(storage, run_id)
+        merged = _merged("1")
+        await storage.save_merged_property(merged)
+        (tracked,) = await storage.get_unsent_notifications()
+
+        async with NotificationDispatcher(notifier, storage, recorder=recorder) as dispatcher:
+            dispatcher.submit_unsent(tracked)
+
+        assert await _status(storage, merged.unique_id) == NotificationStatus.PENDING
+        (event,) = recorder._buffer
+        assert (event.event_type, event.metadata) == ("notification_failed", {"retry": True})
+
+    async def test_delivery_waits_for_open_transaction(self, storage: PropertyStorage) -> None:
+        notifier = MagicMock()
+        notifier.send_merged_property_notification = AsyncMock(return_value=True)
+        merged = _merged("1")
+        await storage.save_merged_property(merged)
+
+        async with (
+            NotificationDispatcher(notifier, storage) as dispatcher,
+            storage._transaction() as conn,
+        ):
+            dispatcher.submit(merged, None, None)
+            # Give the worker every chance to write mid-transaction
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await conn.execute(
+                "UPDATE properties SET title = 'updated' WHERE unique_id = ?",
+                (merged.unique_id,),
+            )
+            assert dispatcher.sent_count == 0
+
+        tracked = await storage.get_property(merged.unique_id)
+        assert tracked is not None
+        assert tracked.notification_status == NotificationStatus.SENT
+        assert tracked.property.title == "updated"
+
+    async def test_error_exit_leaves_queue_pending(self, storage: PropertyStorage) -> None:
+        async def _hang(*args: object, **kwargs: object) -> bool:
+            await asyncio.sleep(60)
+            return True
+
+        notifier = MagicMock()
+        notifier.send_merged_property_notification = AsyncMock(side_effect=_hang)
+        merged = _merged("1")
+        await storage.save_merged_property(merged)
+
+        try:
+            async with NotificationDispatcher(notifier, storage) as dispatcher:
+                dispatcher.submit(merged, None, None)
+                await asyncio.sleep(0)
+                raise RuntimeError("pipeline failed")
+        except RuntimeError:
+            pass
+
+        # Not delivered, still pending for the next run's step 0
+        assert await _status(storage, merged.unique_id) == NotificationStatus.PENDING
@@ -0,0 +1,112 @@
+"""Tests for the pipeline's postcodes.io ward lookup."""
+
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest_asyncio
+from pydantic import HttpUrl
+
+from home_finder.db.storage import PropertyStorage
+from home_finder.models import MergedProperty, Property, PropertySource
+from home_finder.pipeline.analysis import _lookup_wards
+
+
+@pytest_asyncio.fixture
+async def storage() -> AsyncGenerator[PropertyStorage, None]:
+    s = PropertyStorage(":memory:")
+    await s.initialize()
+    yield s
+    await s.close()
+
+
+async def _save(
+    storage: PropertyStorage, source_id: str, postcode: str, coords: tuple[float, float] | None
+) -> str:
+    prop = Property(
+        source=PropertySource.OPENRENT,
+        source_id=source_id,
+        url=HttpUrl(f"https://openrent.com/{source_id}"),
+        title="1 bed flat",
+        price_pcm=1900,
+        bedrooms=1,
+        address="10 Mare Street",
+        postcode=postcode,
+        latitude=coords[0] if coords else None,
+        longitude=coords[1] if coords else None,
+    )
+    await storage.save_merged_property(
+        MergedProperty(
+            canonical=prop,
+            sources=(prop.source,),
+            source_urls={prop.source: prop.url},
+            min_price=prop.price_pcm,
+            max_price=prop.price_pcm,
+        )
+    )
+    return prop.unique_id
+
+
+def _response(result: list[dict[str, object]]) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {"status": 200, "result": result}
+    return resp
+
+
+async def _ward(storage: PropertyStorage, unique_id: str) -> str | None:
+    detail = await storage.web.get_property_detail(unique_id)
+    assert detail is not None
+    return detail["ward"]
+
+
+class TestLookupWards:
+    async def test_forward_results_are_cached_across_runs(self, storage: PropertyStorage) -> None:
+        first = await _save(storage, "1", "E8 3RH", (51.546, -0.055))
+        coords_only = await _save(storage, "2", "E8", (51.549, -0.075))
+
+        async def _post(url: str, *, json: dict[str, list[object]]) -> MagicMock:
+            if "postcodes" in json:
+                return _response([{"query": "E8 3RH", "result": {"admin_ward": "London Fields"}}])
+            return _response([{"query": {}, "result": [{"admin_ward": "Dalston"}]}])
+
+        client = AsyncMock()
+        client.post = AsyncMock(side_effect=_post)
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("home_finder.pipeline.analysis.httpx.AsyncClient", return_value=client):
+            await _lookup_wards(storage)
+            assert client.post.await_count == 2
+            assert await _ward(storage, first) == "London Fields"
+            assert await _ward(storage, coords_only) == "Dalston"
+
+            # A new listing at an already-seen postcode needs no request
+            second = await _save(storage, "3", "e8 3rh", None)
+            await _lookup_wards(storage)
+
+        assert client.post.await_count == 2
+        assert await _ward(storage, second) == "London Fields"
+
+    async def test_cached_unknown_postcode_goes_straight_to_reverse(
+        self, storage: PropertyStorage
+    ) -> None:
+        uid = await _save(storage, "1", "ZZ9  9ZZ ", (51.546, -0.055))
+        await storage.save_postcode_wards({"ZZ9 9ZZ": None})
+
+        posted: list[dict[str, list[object]]] = []
+
+        async def _post(url: str, *, json: dict[str, list[object]]) -> MagicMock:
+            posted.append(json)
+            return _response([{"query": {}, "result": [{"admin_ward": "London Fields"}]}])
+
+        client = AsyncMock()
+        client.post = AsyncMock(side_effect=_post)
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("home_finder.pipeline.analysis.httpx.AsyncClient", return_value=client):
+            await _lookup_wards(storage)
+
+        # One reverse geocode, no forward lookup of the known-invalid postcode
+        assert [list(body) for body in posted] == [["geolocations"]]
+        assert await _ward(storage, uid) == "London Fields"
@@ -4,6 +4,7 @@ Tests the pipeline stages with injected fakes — mock scrapers, in-memory
 storage, and mock notifiers. Focuses on wiring correctness and stage ordering.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator, Callable
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -30,6 +31,7 @@ from home_finder.pipeline.analysis import (
     _save_one,
 )
 from home_finder.pipeline.scraping import (
+    KNOWN_ID_EARLY_STOP_SOURCES,
     _run_scrape,
     scrape_all_platforms,
 )
@@ -37,7 +39,7 @@ from home_finder.pipeline.stages import (
     PreAnalysisResult,
     _run_pre_analysis_pipeline,
 )
-from home_finder.scrapers.base import ScrapeResult
+from home_finder.scrapers.base import ScrapeResult, ScrapeWatermark
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -458,6 +460,59 @@ class TestScrapeAllPlatforms:
         assert len(result) == 1
         assert result[0].postcode == "E8"
 
+    @patch("home_finder.pipeline.scraping.OpenRentScraper")
+    @patch("home_finder.pipeline.scraping.RightmoveScraper")
+    @patch("home_finder.pipeline.scraping.ZooplaScraper")
+    @patch("home_finder.pipeline.scraping.OnTheMarketScraper")
+    async def test_watermarks_passed_to_scrapers_and_advanced(
+        self,
+        mock_otm_cls: Any,
+        mock_zoopla_cls: Any,
+        mock_rm_cls: Any,
+        mock_or_cls: Any,
+    ) -> None:
+        """Each scraper gets its own area watermark, advanced after a complete scrape."""
+        sources = [
+            PropertySource.OPENRENT,
+            PropertySource.RIGHTMOVE,
+            PropertySource.ZOOPLA,
+            PropertySource.ONTHEMARKET,
+        ]
+        mock_scrapers = []
+        for i, mock_cls in enumerate([mock_or_cls, mock_rm_cls, mock_zoopla_cls, mock_otm_cls]):
+            s = _mock_scraper(sources[i])
+            s.WATERMARK_SORT = None if i == 0 else "newest"
+            mock_cls.return_value = s
+            mock_scrapers.append(s)
+        # Rightmove scrapes completely up to listing 520
+        mock_scrapers[1].scrape.return_value = ScrapeResult(pages_fetched=1, newest_id=520)
+        # Zoopla's scrape was incomplete (no newest_id)
+
+        rm_old = ScrapeWatermark(500, "newest")
+        zoopla_old = ScrapeWatermark(700, "newest")
+        watermarks = {
+            ("openrent", "e8"): ScrapeWatermark(10, "distance"),
+            ("rightmove", "e8"): rm_old,
+            ("zoopla", "e8"): zoopla_old,
+            # onthemarket intentionally omitted — should get None
+        }
+
+        _result, _metrics = await scrape_all_platforms(
+            min_price=1500,
+            max_price=2500,
+            min_bedrooms=1,
+            max_bedrooms=2,
+            search_areas=["E8"],
+            watermarks=watermarks,
+        )
+
+        passed = [s.scrape.call_args.kwargs.get("watermark") for s in mock_scrapers]
+        assert passed == [ScrapeWatermark(10, "distance"), rm_old, zoopla_old, None]
+
+        assert watermarks[("rightmove", "e8")] == ScrapeWatermark(520, "newest")
+        assert watermarks[("zoopla", "e8")] == zoopla_old
+        assert ("onthemarket", "e8") not in watermarks
+
     @patch("home_finder.pipeline.scraping.OpenRentScraper")
     @patch("home_finder.pipeline.scraping.RightmoveScraper")
     @patch("home_finder.pipeline.scraping.ZooplaScraper")
@@ -483,13 +538,12 @@ class TestScrapeAllPlatforms:
             mock_scrapers.append(s)
 
         known_ids_by_source = {
-            "openrent": {"or-1", "or-2"},
-            "rightmove": {"rm-1"},
+            "onthemarket": {"otm-1", "otm-2"},
             "zoopla": set(),
-            # onthemarket intentionally omitted — should get None
+            # openrent and rightmove intentionally omitted — should get None
         }
 
-        _result, _metrics = await scrape_all_platforms(
+        await scrape_all_platforms(
             min_price=1500,
             max_price=2500,
             min_bedrooms=1,
@@ -498,37 +552,217 @@ class TestScrapeAllPlatforms:
             known_ids_by_source=known_ids_by_source,
         )
 
-        # Verify each scraper received its source-specific known IDs
-        or_known = mock_scrapers[0].scrape.call_args.kwargs.get("known_source_ids")
-        assert or_known == {"or-1", "or-2"}
+        passed = [s.scrape.call_args.kwargs.get("known_source_ids") for s in mock_scrapers]
+        assert passed == [None, None, set(), {"otm-1", "otm-2"}]
 
-        rm_known = mock_scrapers[1].scrape.call_args.kwargs.get("known_source_ids")
-        assert rm_known == {"rm-1"}
+    @patch("home_finder.pipeline.scraping.OpenRentScraper")
+    @patch("home_finder.pipeline.scraping.RightmoveScraper")
+    @patch("home_finder.pipeline.scraping.ZooplaScraper")
+    @patch("home_finder.pipeline.scraping.OnTheMarketScraper")
+    async def test_concurrent_runs_platforms_in_parallel(
+        self,
+        mock_otm_cls: Any,
+        mock_zoopla_cls: Any,
+        mock_rm_cls: Any,
+        mock_or_cls: Any,
+        make_property: Callable[..., Property],
+    ) -> None:
+        """concurrent=True overlaps platforms; results and metrics keep scraper order."""
+        sources = [
+            PropertySource.OPENRENT,
+            PropertySource.RIGHTMOVE,
+            PropertySource.ZOOPLA,
+            PropertySource.ONTHEMARKET,
+        ]
+        # Every scraper blocks until all four have started — deadlocks if sequential
+        started = 0
+        all_started = asyncio.Event()
+
+        def _blocking_scrape(src: PropertySource) -> Callable[..., Any]:
+            async def _scrape(**kwargs: Any) -> ScrapeResult:
+                nonlocal started
+                started += 1
+                if started == len(sources):
+                    all_started.set()
+                await all_started.wait()
+                return ScrapeResult(
+                    properties=[make_property(source=src, source_id=f"{src.value}-1")],
+                    pages_fetched=1,
+                )
+
+            return _scrape
+
+        for src, mock_cls in zip(
+            sources, [mock_or_cls, mock_rm_cls, mock_zoopla_cls, mock_otm_cls], strict=True
+        ):
+            scraper = _mock_scraper(src)
+            scraper.scrape.side_effect = _blocking_scrape(src)
+            mock_cls.return_value = scraper
+
+        result, metrics = await asyncio.wait_for(
+            scrape_all_platforms(
+                min_price=1500,
+                max_price=2500,
+                min_bedrooms=1,
+                max_bedrooms=2,
+                search_areas=["e8"],
+                concurrent=True,
+            ),
+            timeout=5,
+        )
 
-        zoopla_known = mock_scrapers[2].scrape.call_args.kwargs.get("known_source_ids")
-        assert zoopla_known == set()
+        assert [p.source for p in result] == sources
+        assert [m.scraper_name for m in metrics] == [s.value for s in sources]
+        assert all(m.areas_completed == 1 for m in metrics)
 
-        otm_known = mock_scrapers[3].scrape.call_args.kwargs.get("known_source_ids")
-        assert otm_known is None
+    @patch("home_finder.pipeline.scraping.OpenRentScraper")
+    @patch("home_finder.pipeline.scraping.RightmoveScraper")
+    @patch("home_finder.pipeline.scraping.ZooplaScraper")
+    @patch("home_finder.pipeline.scraping.OnTheMarketScraper")
+    async def test_concurrent_skip_remaining_areas_is_per_platform(
+        self,
+        mock_otm_cls: Any,
+        mock_zoopla_cls: Any,
+        mock_rm_cls: Any,
+        mock_or_cls: Any,
+    ) -> None:
+        """A blocked platform stops early without cutting short the others."""
+        blocked = _mock_scraper(PropertySource.ZOOPLA)
+        blocked.should_skip_remaining_areas = True
+        mock_zoopla_cls.return_value = blocked
+        for mock_cls, src in [
+            (mock_or_cls, PropertySource.OPENRENT),
+            (mock_rm_cls, PropertySource.RIGHTMOVE),
+            (mock_otm_cls, PropertySource.ONTHEMARKET),
+        ]:
+            mock_cls.return_value = _mock_scraper(src)
+
+        _result, metrics = await scrape_all_platforms(
+            min_price=1500,
+            max_price=2500,
+            min_bedrooms=1,
+            max_bedrooms=2,
+            search_areas=["e8", "n1"],
+            concurrent=True,
+        )
+
+        by_name = {m.scraper_name: m for m in metrics}
+        assert by_name["zoopla"].areas_completed == 0
+        assert blocked.scrape.await_count == 0
+        for name in ("openrent", "rightmove", "onthemarket"):
+            assert by_name[name].areas_completed == 2
 
     @patch("home_finder.pipeline.scraping.scrape_all_platforms", new_callable=AsyncMock)
-    async def test_full_scrape_skips_known_ids_lookup(
+    async def test_full_scrape_skips_watermark_lookup(
         self,
         mock_scrape: AsyncMock,
         storage: PropertyStorage,
         test_settings: Settings,
     ) -> None:
-        """full_scrape=True skips DB known-ID lookup and passes None to scrape_all_platforms."""
+        """full_scrape=True scrapes without watermarks but still records new ones."""
         mock_scrape.return_value = ([], [])
-
-        # Spy on storage.get_all_known_source_ids
-        storage.get_all_known_source_ids = AsyncMock()  # type: ignore[method-assign]
+        storage.get_scrape_watermarks = AsyncMock()  # type: ignore[method-assign]
 
         await _run_scrape(test_settings, storage, full_scrape=True)
 
-        storage.get_all_known_source_ids.assert_not_called()
+        storage.get_scrape_watermarks.assert_not_called()
+        assert mock_scrape.call_args.kwargs["watermarks"] == {}
         assert mock_scrape.call_args.kwargs["known_ids_by_source"] is None
 
+    @patch("home_finder.pipeline.scraping.scrape_all_platforms", new_callable=AsyncMock)
+    async def test_known_ids_loaded_only_for_platforms_without_watermark(
+        self,
+        mock_scrape: AsyncMock,
+        storage: PropertyStorage,
+        test_settings: Settings,
+    ) -> None:
+        """Known IDs are only loaded for platforms that early-stop on them."""
+        mock_scrape.return_value = ([], [])
+        storage.get_all_known_source_ids = AsyncMock(  # type: ignore[method-assign]
+            return_value={"onthemarket": {"otm-1"}}
+        )
+
+        await _run_scrape(test_settings, storage)
+
+        storage.get_all_known_source_ids.assert_awaited_once_with(
+            sources=KNOWN_ID_EARLY_STOP_SOURCES
+        )
+        assert {"onthemarket"} == KNOWN_ID_EARLY_STOP_SOURCES
+        assert mock_scrape.call_args.kwargs["known_ids_by_source"] == {"onthemarket": {"otm-1"}}
+
+    @patch("home_finder.pipeline.scraping.scrape_all_platforms", new_callable=AsyncMock)
+    async def test_watermarks_round_trip_through_storage(
+        self,
+        mock_scrape: AsyncMock,
+        storage: PropertyStorage,
+        test_settings: Settings,
+    ) -> None:
+        """Advanced watermarks are saved and only reused under the same search filters."""
+
+        async def scrape(**kwargs: Any) -> tuple[list[Property], list[Any]]:
+            kwargs["watermarks"][("rightmove", "e8")] = ScrapeWatermark(520, "sortType=6")
+            return [], []
+
+        mock_scrape.side_effect = scrape
+        await _run_scrape(test_settings, storage)
+
+        mock_scrape.side_effect = None
+        mock_scrape.return_value = ([], [])
+        await _run_scrape(test_settings, storage)
+        assert mock_scrape.call_args.kwargs["watermarks"] == {
+            ("rightmove", "e8"): ScrapeWatermark(520, "sortType=6")
+        }
+
+        test_settings.max_price = 3000
+        await _run_scrape(test_settings, storage)
+        assert mock_scrape.call_args.kwargs["watermarks"] == {}
+
+    @patch("home_finder.pipeline.scraping.scrape_all_platforms", new_callable=AsyncMock)
+    async def test_rightmove_outcodes_resolved_once_and_stored(
+        self,
+        mock_scrape: AsyncMock,
+        storage: PropertyStorage,
+        test_settings: Settings,
+    ) -> None:
+        """Unmapped outcodes come from the DB when stored, else are resolved and saved."""
+        mock_scrape.return_value = ([], [])
+        test_settings.search_areas = "e8,se15,n19,hackney"
+        await storage.save_rightmove_outcodes({"N19": "OUTCODE^1676"})
+
+        with (
+            patch("home_finder.scrapers.rightmove._outcode_cache", {}) as cache,
+            patch(
+                "home_finder.scrapers.rightmove._lookup_outcode_id",
+                new_callable=AsyncMock,
+                return_value="OUTCODE^2298",
+            ) as lookup,
+        ):
+            await _run_scrape(test_settings, storage)
+            await _run_scrape(test_settings, storage)
+
+        # The second run finds SE15 in the DB too
+        assert [c.args[1] for c in lookup.await_args_list] == ["SE15"]
+        assert cache == {"N19": "OUTCODE^1676", "SE15": "OUTCODE^2298"}
+        assert await storage.get_rightmove_outcodes(["SE15", "N19"], max_age_days=1) == {
+            "SE15": "OUTCODE^2298",
+            "N19": "OUTCODE^1676",
+        }
+
+    @patch("home_finder.pipeline.scraping.scrape_all_platforms", new_callable=AsyncMock)
+    async def test_rightmove_outcodes_skipped_without_rightmove(
+        self,
+        mock_scrape: AsyncMock,
+        storage: PropertyStorage,
+        test_settings: Settings,
+    ) -> None:
+        mock_scrape.return_value = ([], [])
+        test_settings.search_areas = "se15"
+        storage.get_rightmove_outcodes = AsyncMock()  # type: ignore[method-assign]
+
+        await _run_scrape(test_settings, storage, only_scrapers={"zoopla"})
+
+        storage.get_rightmove_outcodes.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # _run_pre_analysis_pipeline
@@ -4,8 +4,9 @@ Tests the parsing of each platform's detail page HTML without network access.
 HTTP calls are mocked to return fixture HTML; assertions verify parsing correctness.
 """
 
+import asyncio
+import json
 from pathlib import Path
-from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -17,10 +18,10 @@ from home_finder.models import Property, PropertySource
 from home_finder.scrapers.detail_fetcher import (
     _CDN_THROTTLE_CONFIG,
     _IMAGE_CB_THRESHOLD,
+    _IMAGE_CONCURRENCY_PER_HOST,
     _IMAGE_TIMEOUT,
     DetailFetcher,
     DetailPageData,
-    _find_dict_with_key,
     _is_epc_url,
     _zoopla_floorplan_from_html,
 )
@@ -58,6 +59,16 @@ def _mock_httpx_response(html: str) -> MagicMock:
     return resp
 
 
+def _rsc_gallery_html(*images: tuple[str | None, str], body: str = "") -> str:
+    """Zoopla detail page whose RSC payload lists (caption, filename) gallery images."""
+    row = json.dumps({"images": [{"caption": c, "filename": f} for c, f in images]})
+    push = json.dumps([1, f"1a:{row}\n"])
+    return (
+        f"<!DOCTYPE html><html><body>{body}"
+        f"<script>self.__next_f.push({push})</script></body></html>"
+    )
+
+
 def _mock_curl_response(html: str, status_code: int = 200) -> MagicMock:
     """Create a mock curl_cffi response."""
     resp = MagicMock()
@@ -66,47 +77,6 @@ def _mock_curl_response(html: str, status_code: int = 200) -> MagicMock:
     return resp
 
 
-# ---------------------------------------------------------------------------
-# _find_dict_with_key (pure utility)
-# ---------------------------------------------------------------------------
-
-
-class TestFindDictWithKey:
-    def test_finds_key_in_flat_dict(self) -> None:
-        data = {"foo": 1, "bar": 2}
-        assert _find_dict_with_key(data, "foo") == data
-
-    def test_finds_key_in_nested_dict(self) -> None:
-        data = {"outer": {"inner": {"target": 42}}}
-        result = _find_dict_with_key(data, "target")
-        assert result == {"target": 42}
-
-    def test_finds_key_in_list_of_dicts(self) -> None:
-        data = [{"a": 1}, {"target": 2}]
-        result = _find_dict_with_key(data, "target")
-        assert result == {"target": 2}
-
-    def test_returns_none_when_not_found(self) -> None:
-        data = {"a": {"b": {"c": 1}}}
-        assert _find_dict_with_key(data, "missing") is None
-
-    def test_respects_depth_limit(self) -> None:
-        # Build a deeply nested structure
-        data: dict[str, Any] = {"level": 0}
-        current: dict[str, Any] = data
-        for i in range(15):
-            current["child"] = {"level": i + 1}
-            current = current["child"]
-        current["target"] = "found"
-        # Default depth limit is 10, so this should not be found
-        assert _find_dict_with_key(data, "target") is None
-
-    def test_handles_non_dict_input(self) -> None:
-        assert _find_dict_with_key("string", "key") is None
-        assert _find_dict_with_key(42, "key") is None
-        assert _find_dict_with_key(None, "key") is None
-
-
 # ---------------------------------------------------------------------------
 # _is_epc_url (EPC image detection)
 # ---------------------------------------------------------------------------
@@ -383,12 +353,12 @@ class TestZooplaParsing:
 
     async def test_rsc_caption_filters_epc(self, fetcher: DetailFetcher) -> None:
         """RSC path skips images with 'epc' in caption, keeps null-caption and normal."""
-        html = """<!DOCTYPE html><html><body>
-        \\"caption\\":\\"Living room\\",\\"filename\\":\\"aaa111.jpg\\"
-        \\"caption\\":\\"EPC Rating\\",\\"filename\\":\\"epc222.jpg\\"
-        \\"caption\\":null,\\"filename\\":\\"ccc444.jpg\\"
-        \\"caption\\":\\"Bedroom\\",\\"filename\\":\\"bbb333.jpg\\"
-        </body></html>"""
+        html = _rsc_gallery_html(
+            ("Living room", "aaa111.jpg"),
+            ("EPC Rating", "epc222.jpg"),
+            (None, "ccc444.jpg"),
+            ("Bedroom", "bbb333.jpg"),
+        )
         fetcher._curl_get_with_retry = AsyncMock(  # type: ignore[method-assign]
             return_value=_mock_curl_response(html)
         )
@@ -405,11 +375,9 @@ class TestZooplaParsing:
 
     async def test_rsc_null_caption_gallery_images(self, fetcher: DetailFetcher) -> None:
         """Null-caption images are extracted as gallery photos."""
-        html = """<!DOCTYPE html><html><body>
-        \\"caption\\":null,\\"filename\\":\\"aa00aa01.jpg\\"
-        \\"caption\\":null,\\"filename\\":\\"bb00bb02.jpg\\"
-        \\"caption\\":null,\\"filename\\":\\"cc00cc03.jpg\\"
-        </body></html>"""
+        html = _rsc_gallery_html(
+            (None, "aa00aa01.jpg"), (None, "bb00bb02.jpg"), (None, "cc00cc03.jpg")
+        )
         fetcher._curl_get_with_retry = AsyncMock(  # type: ignore[method-assign]
             return_value=_mock_curl_response(html)
         )
@@ -423,11 +391,9 @@ class TestZooplaParsing:
 
     async def test_rsc_filters_ee_rating_epc(self, fetcher: DetailFetcher) -> None:
         """'EE Rating' caption (Zoopla's EPC chart label) is filtered out."""
-        html = """<!DOCTYPE html><html><body>
-        \\"caption\\":null,\\"filename\\":\\"aa00aa01.jpg\\"
-        \\"caption\\":\\"EE Rating\\",\\"filename\\":\\"ee00ee01.png\\"
-        \\"caption\\":null,\\"filename\\":\\"bb00bb02.jpg\\"
-        </body></html>"""
+        html = _rsc_gallery_html(
+            (None, "aa00aa01.jpg"), ("EE Rating", "ee00ee01.png"), (None, "bb00bb02.jpg")
+        )
         fetcher._curl_get_with_retry = AsyncMock(  # type: ignore[method-assign]
             return_value=_mock_curl_response(html)
         )
@@ -443,12 +409,12 @@ class TestZooplaParsing:
 
     async def test_rsc_excludes_floorplan_hashes(self, fetcher: DetailFetcher) -> None:
         """lc.zoocdn.com floorplan hashes are excluded from gallery results."""
-        html = """<!DOCTYPE html><html><body>
-        https://lc.zoocdn.com/8eb377a8.jpg
-        \\"caption\\":null,\\"filename\\":\\"aaa11111.jpg\\"
-        \\"caption\\":null,\\"filename\\":\\"8eb377a8.jpg\\"
-        \\"caption\\":null,\\"filename\\":\\"bbb22222.jpg\\"
-        </body></html>"""
+        html = _rsc_gallery_html(
+            (None, "aaa11111.jpg"),
+            (None, "8eb377a8.jpg"),
+            (None, "bbb22222.jpg"),
+            body="https://lc.zoocdn.com/8eb377a8.jpg",
+        )
         fetcher._curl_get_with_retry = AsyncMock(  # type: ignore[method-assign]
             return_value=_mock_curl_response(html)
         )
@@ -465,12 +431,14 @@ class TestZooplaParsing:
         """HTML fallback inherits seen_hashes from RSC pass so EPC hashes don't reappear."""
         # RSC pass finds 1 normal + 1 EPC (skipped) → only 1 gallery image → triggers fallback
         # HTML fallback sees the EPC hash in full URL form — should still skip it
-        html = """<!DOCTYPE html><html><body>
-        \\"caption\\":\\"Kitchen\\",\\"filename\\":\\"aaa111.jpg\\"
-        \\"caption\\":\\"EPC Rating\\",\\"filename\\":\\"epc222.jpg\\"
-        https://lid.zoocdn.com/u/1024/768/epc222.jpg
-        https://lid.zoocdn.com/u/1024/768/ccc333.jpg
-        </body></html>"""
+        html = _rsc_gallery_html(
+            ("Kitchen", "aaa111.jpg"),
+            ("EPC Rating", "epc222.jpg"),
+            body=(
+                "https://lid.zoocdn.com/u/1024/768/epc222.jpg\n"
+                "https://lid.zoocdn.com/u/1024/768/ccc333.jpg"
+            ),
+        )
         fetcher._curl_get_with_retry = AsyncMock(  # type: ignore[method-assign]
             return_value=_mock_curl_response(html)
         )
@@ -1182,3 +1150,85 @@ class TestPerCdnThrottling:
         """All CDN throttle names are distinct."""
         names = [name for name, _ in _CDN_THROTTLE_CONFIG.values()]
         assert len(names) == len(set(names))
+
+
+# ---------------------------------------------------------------------------
+# Concurrent image downloads
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentImageDownloads:
+    """Concurrent callers are bounded per host and counted per host."""
+
+    async def test_bounds_downloads_per_host(self) -> None:
+        fetcher = DetailFetcher()
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def slow_get(url: str) -> MagicMock:
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            resp = MagicMock()
+            resp.content = _VALID_JPEG
+            return resp
+
+        fetcher._httpx_get_with_retry = AsyncMock(side_effect=slow_get)  # type: ignore[method-assign]
+
+        urls = [f"https://{host}/{i}.jpg" for host in ("a.example", "b.example") for i in range(10)]
+        results = await asyncio.gather(*(fetcher.download_image_bytes(u) for u in urls))
+
+        assert results == [_VALID_JPEG] * 20
+        assert peak == {
+            "a.example": _IMAGE_CONCURRENCY_PER_HOST,
+            "b.example": _IMAGE_CONCURRENCY_PER_HOST,
+        }
+
+    async def test_queued_downloads_skip_once_breaker_trips(self) -> None:
+        fetcher = DetailFetcher()
+
+        async def timeout(*args: object, **kwargs: object) -> None:
+            await asyncio.sleep(0.01)
+            raise CurlError("Operation timed out", code=28)
+
+        fetcher._curl_get_with_retry = AsyncMock(side_effect=timeout)  # type: ignore[method-assign]
+
+        urls = [f"https://lid.zoocdn.com/{i}.jpg" for i in range(12)]
+        results = await asyncio.gather(*(fetcher.download_image_bytes(u) for u in urls))
+
+        assert results == [None] * 12
+        # Only the first wave of slots reached the CDN before the breaker opened
+        assert fetcher._curl_get_with_retry.await_count == _IMAGE_CONCURRENCY_PER_HOST
+        assert fetcher._image_skip_counts["zoocdn.com"] == 12 - _IMAGE_CONCURRENCY_PER_HOST
+
+    async def test_records_and_logs_throughput_per_host(self) -> None:
+        fetcher = DetailFetcher()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = _VALID_JPEG
+        fetcher._curl_get_with_retry = AsyncMock(return_value=mock_resp)  # type: ignore[method-assign]
+        fetcher._httpx_get_with_retry = AsyncMock(  # type: ignore[method-assign]
+            side_effect=Exception("Network error")
+        )
+
+        await fetcher.download_image_bytes("https://lid.zoocdn.com/a.jpg")
+        await fetcher.download_image_bytes("https://lid.zoocdn.com/b.jpg")
+        await fetcher.download_image_bytes("https://media.example.com/c.jpg")
+
+        stats = fetcher.image_download_stats()
+        assert stats["zoocdn.com"].downloaded == 2
+        assert stats["zoocdn.com"].total_bytes == 2 * len(_VALID_JPEG)
+        assert stats["media.example.com"].downloaded == 0
+        assert stats["media.example.com"].failed == 1
+
+        with structlog.testing.capture_logs() as captured:
+            await fetcher.close()
+
+        logs = {
+            log["host"]: log for log in captured if log.get("event") == "image_download_throughput"
+        }
+        assert set(logs) == {"zoocdn.com", "media.example.com"}
+        assert logs["zoocdn.com"]["downloaded"] == 2
+        assert logs["media.example.com"]["failed"] == 1
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from home_finder.models import PropertySource
+from home_finder.scrapers.base import ScrapeWatermark
 from home_finder.scrapers.onthemarket import OnTheMarketScraper
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
 
@@ -265,10 +266,9 @@ class TestOnTheMarketParser:
 
 
 class TestOnTheMarketEarlyStop:
-    """Tests for early-stop pagination (requires newest-first sort)."""
+    """Early-stop uses known IDs: results are sorted by update date, not listing age."""
 
-    def test_search_url_sorts_by_newest(self, onthemarket_scraper: OnTheMarketScraper) -> None:
-        """Verify sort-field=update_date — required for early-stop correctness."""
+    def test_search_url_sorts_by_recent(self, onthemarket_scraper: OnTheMarketScraper) -> None:
         url = onthemarket_scraper._build_search_url(
             area="e8",
             min_price=1800,
@@ -276,7 +276,41 @@ class TestOnTheMarketEarlyStop:
             min_bedrooms=0,
             max_bedrooms=2,
         )
-        assert "sort-field=update_date" in url
+        assert onthemarket_scraper.SEARCH_SORT == "sort-field=update_date"
+        assert onthemarket_scraper.SEARCH_SORT in url
+        assert onthemarket_scraper.WATERMARK_SORT is None
+
+    @pytest.mark.asyncio
+    async def test_watermark_does_not_stop_pagination(
+        self, onthemarket_scraper: OnTheMarketScraper, sample_next_data: str
+    ) -> None:
+        """A recently updated old listing can't end the scrape before newer pages."""
+        # Every listing on page 1 is at or below the watermark
+        watermark = ScrapeWatermark(15456789, "sort-field=update_date")
+
+        empty_data = json.dumps({"props": {"initialReduxState": {"results": {"list": []}}}})
+        empty_html = (
+            '<html><body><script id="__NEXT_DATA__" type="application/json">'
+            f"{empty_data}</script></body></html>"
+        )
+
+        mock_fetch = AsyncMock(side_effect=[sample_next_data, empty_html])
+        with (
+            patch.object(onthemarket_scraper, "_fetch_page", mock_fetch),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await onthemarket_scraper.scrape(
+                min_price=1800,
+                max_price=2500,
+                min_bedrooms=0,
+                max_bedrooms=2,
+                area="hackney",
+                watermark=watermark,
+            )
+
+        assert mock_fetch.call_count == 2  # Continued past page 1
+        assert len(result.properties) == 3
+        assert not result.stopped_at_watermark
 
     @pytest.mark.asyncio
     async def test_stops_when_all_results_known(
@@ -7,6 +7,7 @@ import pytest
 from bs4 import BeautifulSoup
 
 from home_finder.models import PropertySource
+from home_finder.scrapers.base import ScrapeWatermark
 from home_finder.scrapers.openrent import OpenRentScraper
 
 
@@ -402,16 +403,16 @@ class TestOpenRentNoEarlyStop:
     async def test_does_not_early_stop_even_when_all_known(
         self, openrent_scraper: OpenRentScraper, openrent_search_html: str
     ) -> None:
-        """Even when all page-1 properties are known, OpenRent fetches page 2.
+        """Even when page 1 is all below the watermark, OpenRent fetches page 2.
 
-        Because results are sorted by distance (not newest), all-known on
-        page 1 does NOT imply everything after is older — new listings may
-        appear on later pages.
+        Because results are sorted by distance (not newest), an old page 1
+        does NOT imply everything after is older — new listings may appear
+        on later pages.
         """
         soup = BeautifulSoup(openrent_search_html, "html.parser")
         page1_props = openrent_scraper._parse_search_results(soup, "https://test")
-        known_ids = {p.source_id for p in page1_props}
-        assert len(known_ids) >= 2  # sanity
+        assert len(page1_props) >= 2  # sanity
+        watermark = ScrapeWatermark(max(int(p.source_id) for p in page1_props), "distance")
 
         pages_fetched: list[int] = []
 
@@ -433,7 +434,7 @@ class TestOpenRentNoEarlyStop:
                 min_bedrooms=1,
                 max_bedrooms=2,
                 area="hackney",
-                known_source_ids=known_ids,
+                watermark=watermark,
             )
 
         assert len(pages_fetched) >= 2  # Did NOT early-stop on page 1
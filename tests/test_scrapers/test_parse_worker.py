@@ -0,0 +1,50 @@
+"""Tests for running page parsers in the shared worker pool."""
+
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from home_finder.models import Property
+from home_finder.scrapers import openrent, rightmove
+from home_finder.scrapers.parse_worker import (
+    parse_in_worker,
+    property_rows,
+    validate_properties,
+)
+from home_finder.utils.image_pool import image_pool
+
+
+class TestParseInWorker:
+    async def test_search_rows_round_trip_from_a_worker_process(self, fixtures_path: Path) -> None:
+        html = (fixtures_path / "rightmove_search.html").read_text()
+        url = "https://www.rightmove.co.uk/property-to-rent/find.html"
+        expected = rightmove.RightmoveScraper()._parse_search_results(
+            BeautifulSoup(html, "html.parser"), url
+        )
+
+        async with image_pool(1):
+            rows = await parse_in_worker(rightmove._parse_search_page, html, url)
+
+        assert rows is not None
+        assert expected
+        # first_seen is stamped at parse time, in the worker
+        assert [p.model_dump(exclude={"first_seen"}) for p in validate_properties(rows)] == [
+            p.model_dump(exclude={"first_seen"}) for p in expected
+        ]
+
+    async def test_runs_on_a_thread_without_a_pool(self, fixtures_path: Path) -> None:
+        html = (fixtures_path / "openrent_search.html").read_text()
+        url = "https://www.openrent.co.uk/properties-to-rent/hackney"
+
+        rows = await parse_in_worker(openrent._parse_search_page, html, url)
+
+        assert rows
+        assert [p.source_id for p in validate_properties(rows)] == [r["source_id"] for r in rows]
+
+
+class TestValidateProperties:
+    def test_skips_rows_that_do_not_validate(self, sample_property: Property) -> None:
+        rows = property_rows([sample_property])
+        rows.append({**rows[0], "price_pcm": "not a price"})
+
+        assert validate_properties(rows) == [sample_property]
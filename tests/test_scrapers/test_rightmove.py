@@ -1,8 +1,7 @@
 """Tests for Rightmove scraper."""
 
 from pathlib import Path
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
@@ -10,11 +9,15 @@ from bs4 import BeautifulSoup
 from pytest_httpx import HTTPXMock
 
 from home_finder.models import PropertySource
+from home_finder.scrapers.base import ScrapeWatermark
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
 from home_finder.scrapers.rightmove import (
     RightmoveScraper,
     _outcode_cache,
     get_rightmove_outcode_id,
+    resolve_rightmove_outcodes,
+    rightmove_session,
+    seed_outcode_ids,
 )
 
 
@@ -287,6 +290,35 @@ class TestRightmoveOutcodeResolver:
         """Clear the outcode cache before each test."""
         _outcode_cache.clear()
 
+    @pytest.mark.asyncio
+    async def test_resolve_outcodes_skips_mapped_and_cached(self, httpx_mock: HTTPXMock) -> None:
+        """Only unmapped, uncached outcodes are looked up, each once."""
+        seed_outcode_ids({"n19": "OUTCODE^1676"})
+        httpx_mock.add_response(
+            url="https://www.rightmove.co.uk/typeAhead/uknostreet/SE/15/",
+            json={
+                "typeAheadLocations": [
+                    {"displayName": "SE15", "locationIdentifier": "OUTCODE^2298"}
+                ]
+            },
+        )
+        httpx_mock.add_response(
+            url="https://www.rightmove.co.uk/typeAhead/uknostreet/W1/",
+            json={"typeAheadLocations": []},
+        )
+
+        resolved = await resolve_rightmove_outcodes(["E8", "N19", "se15", "SE15", "W1"])
+
+        assert resolved == {"SE15": "OUTCODE^2298"}
+        assert _outcode_cache["N19"] == "OUTCODE^1676"
+        assert await get_rightmove_outcode_id("SE15") == "OUTCODE^2298"
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_resolve_outcodes_nothing_pending(self, httpx_mock: HTTPXMock) -> None:
+        assert await resolve_rightmove_outcodes(["E8", "N1"]) == {}
+        assert httpx_mock.get_requests() == []
+
     @pytest.mark.asyncio
     async def test_get_outcode_id_success(self, httpx_mock: HTTPXMock) -> None:
         """Test successful outcode lookup via mocked API."""
@@ -454,100 +486,150 @@ class TestRightmoveEarlyStop:
             max_bedrooms=2,
         )
         assert "sortType=6" in url
+        # Watermarks are recorded under the sort the URL actually requests
+        assert rightmove_scraper.WATERMARK_SORT == rightmove_scraper.SEARCH_SORT == "sortType=6"
 
     @pytest.mark.asyncio
-    async def test_stops_when_all_results_known(
+    async def test_stops_after_page_crossing_watermark(
         self, rightmove_scraper: RightmoveScraper, rightmove_search_html: str
     ) -> None:
-        """When all page-1 properties are already in DB, stop without fetching page 2."""
+        """When page 1 is all at or below the watermark, stop without fetching page 2."""
         soup = BeautifulSoup(rightmove_search_html, "html.parser")
         page1_props = rightmove_scraper._parse_search_results(
             soup, "https://www.rightmove.co.uk/property-to-rent/find.html"
         )
-        known_ids = {p.source_id for p in page1_props}
-        assert len(known_ids) >= 2
-
-        pages_fetched: list[int] = []
+        assert len(page1_props) >= 2
+        newest = max(int(p.source_id) for p in page1_props)
 
-        with patch("home_finder.scrapers.rightmove.BeautifulSoupCrawler") as MockCrawler:
+        pages_fetched: list[str] = []
 
-            def make_crawler(**kwargs: Any) -> MagicMock:
-                idx = len(pages_fetched)
-                mock = MagicMock()
-                handler: list[Any] = []
-                mock.router = MagicMock()
-                mock.router.default_handler = handler.append
-
-                async def run(urls: list[str]) -> None:
-                    ctx = MagicMock()
-                    ctx.soup = BeautifulSoup(rightmove_search_html, "html.parser")
-                    ctx.request.url = urls[0]
-                    await handler[0](ctx)
-
-                mock.run = run
-                pages_fetched.append(idx)
-                return mock
-
-            MockCrawler.side_effect = make_crawler
+        async def fake_fetch(url: str) -> str:
+            pages_fetched.append(url)
+            return rightmove_search_html
 
+        with patch.object(rightmove_scraper, "_fetch_page", side_effect=fake_fetch):
             result = await rightmove_scraper.scrape(
                 min_price=1800,
                 max_price=2500,
                 min_bedrooms=1,
                 max_bedrooms=2,
                 area="hackney",
-                known_source_ids=known_ids,
+                watermark=ScrapeWatermark(newest, "sortType=6"),
             )
 
         assert len(pages_fetched) == 1  # Only page 1 fetched
-        assert result.properties == []  # All known → nothing returned
+        assert len(result.properties) == len(page1_props)
+        assert result.stopped_at_watermark
+        assert result.newest_id == newest
 
     @pytest.mark.asyncio
     async def test_continues_when_some_results_new(
         self, rightmove_scraper: RightmoveScraper, rightmove_search_html: str
     ) -> None:
-        """When only some results are known, don't early-stop — fetch next page."""
+        """When most results are newer than the watermark, don't early-stop — fetch next page."""
         soup = BeautifulSoup(rightmove_search_html, "html.parser")
         page1_props = rightmove_scraper._parse_search_results(
             soup, "https://www.rightmove.co.uk/property-to-rent/find.html"
         )
-        known_ids = {page1_props[0].source_id}
-
-        pages_fetched: list[int] = []
-
-        with patch("home_finder.scrapers.rightmove.BeautifulSoupCrawler") as MockCrawler:
-
-            def make_crawler(**kwargs: Any) -> MagicMock:
-                idx = len(pages_fetched)
-                mock = MagicMock()
-                handler: list[Any] = []
-                mock.router = MagicMock()
-                mock.router.default_handler = handler.append
-
-                async def run(urls: list[str]) -> None:
-                    ctx = MagicMock()
-                    if idx == 0:
-                        ctx.soup = BeautifulSoup(rightmove_search_html, "html.parser")
-                    else:
-                        ctx.soup = BeautifulSoup("<html></html>", "html.parser")
-                    ctx.request.url = urls[0]
-                    await handler[0](ctx)
-
-                mock.run = run
-                pages_fetched.append(idx)
-                return mock
-
-            MockCrawler.side_effect = make_crawler
-
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await rightmove_scraper.scrape(
-                    min_price=1800,
-                    max_price=2500,
-                    min_bedrooms=1,
-                    max_bedrooms=2,
-                    area="hackney",
-                    known_source_ids=known_ids,
-                )
+        # Only the oldest listing is at the watermark
+        oldest = min(int(p.source_id) for p in page1_props)
+
+        pages_fetched: list[str] = []
+
+        async def fake_fetch(url: str) -> str:
+            pages_fetched.append(url)
+            return rightmove_search_html if len(pages_fetched) == 1 else "<html></html>"
+
+        with (
+            patch.object(rightmove_scraper, "_fetch_page", side_effect=fake_fetch),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await rightmove_scraper.scrape(
+                min_price=1800,
+                max_price=2500,
+                min_bedrooms=1,
+                max_bedrooms=2,
+                area="hackney",
+                watermark=ScrapeWatermark(oldest, "sortType=6"),
+            )
 
         assert len(pages_fetched) >= 2  # Continued past page 1
         assert len(result.properties) == len(page1_props)
+
+
+class TestRightmoveSession:
+    """Tests for the persistent keep-alive HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_client_across_pages(
+        self, httpx_mock: HTTPXMock, rightmove_search_html: str
+    ) -> None:
+        """All pages of a scrape go through the same client instance."""
+        scraper = RightmoveScraper()
+        httpx_mock.add_response(text=rightmove_search_html)
+        httpx_mock.add_response(text="<html></html>")
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await scraper.scrape(
+                min_price=1800,
+                max_price=2500,
+                min_bedrooms=1,
+                max_bedrooms=2,
+                area="hackney",
+            )
+        client = scraper._client
+
+        assert result.pages_fetched == 2
+        assert len(result.properties) > 0
+        assert client is not None and client is await scraper._get_client()
+        await scraper.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_retries_429_then_succeeds(
+        self, httpx_mock: HTTPXMock, rightmove_search_html: str
+    ) -> None:
+        scraper = RightmoveScraper()
+        httpx_mock.add_response(status_code=429)
+        httpx_mock.add_response(text=rightmove_search_html)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            html = await scraper._fetch_page("https://www.rightmove.co.uk/property-to-rent/x")
+        await scraper.close()
+
+        assert html == rightmove_search_html
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_counts_as_failed_page(self, httpx_mock: HTTPXMock) -> None:
+        """Non-retryable HTTP errors are reported as failed pages, not end of results."""
+        scraper = RightmoveScraper()
+        httpx_mock.add_response(status_code=403, is_reusable=True)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await scraper.scrape(
+                min_price=1800,
+                max_price=2500,
+                min_bedrooms=1,
+                max_bedrooms=2,
+                area="hackney",
+            )
+        await scraper.close()
+
+        assert result.pages_fetched == 0
+        assert result.pages_failed == scraper.MAX_PAGES
+
+    @pytest.mark.asyncio
+    async def test_shared_session_outlives_scrapers(self) -> None:
+        """Scrapers inside rightmove_session() borrow the shared client without closing it."""
+        async with rightmove_session() as shared:
+            first, second = RightmoveScraper(), RightmoveScraper()
+            assert await first._get_client() is shared
+            assert await second._get_client() is shared
+            await first.close()
+            assert not shared.is_closed
+
+        assert shared.is_closed
+        outside = RightmoveScraper()
+        assert await outside._get_client() is not shared
+        await outside.close()
@@ -1,7 +1,7 @@
 """Tests for Zoopla scraper."""
 
 import json
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -9,7 +9,8 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from bs4 import BeautifulSoup
 
-from home_finder.models import PropertySource
+from home_finder.models import Property, PropertySource
+from home_finder.scrapers.base import ScrapeWatermark
 from home_finder.scrapers.parsing import extract_bedrooms, extract_postcode, extract_price
 from home_finder.scrapers.zoopla import ZooplaListing, ZooplaScraper
 
@@ -401,6 +402,22 @@ class TestZooplaRscExtraction:
         assert prop.bedrooms == 2
 
 
+def _rsc_search_html(listing_ids: list[int]) -> str:
+    """A search page whose RSC payload carries minimal listings with these IDs."""
+    listings = [
+        {
+            "listingId": listing_id,
+            "price": "£1,850 pcm",
+            "address": "Test Street, London E8 1AA",
+            "listingUris": {"detail": f"/to-rent/details/{listing_id}/"},
+            "features": [{"iconId": "bed", "content": 1}],
+        }
+        for listing_id in listing_ids
+    ]
+    inner_str = f"79:{json.dumps({'regularListingsFormatted': listings})}"
+    return f"<script>self.__next_f.push([1,{json.dumps(inner_str)}])</script>"
+
+
 class TestZooplaEarlyStop:
     """Tests for early-stop pagination (requires newest-first sort)."""
 
@@ -414,10 +431,13 @@ class TestZooplaEarlyStop:
             max_bedrooms=2,
         )
         assert "results_sort=newest_listings" in url
+        # Watermarks are recorded under the sort the URL actually requests
+        assert zoopla_scraper.WATERMARK_SORT == zoopla_scraper.SEARCH_SORT
+        assert zoopla_scraper.SEARCH_SORT in url
 
     @pytest.mark.asyncio
-    async def test_stops_when_all_results_known(self, zoopla_scraper: ZooplaScraper) -> None:
-        """When all page-1 properties are already in DB, stop without fetching page 2."""
+    async def test_stops_after_page_crossing_watermark(self, zoopla_scraper: ZooplaScraper) -> None:
+        """When page 1 is all at or below the watermark, stop without fetching page 2."""
         listings_data = [
             {
                 "listingId": 100,
@@ -443,7 +463,7 @@ class TestZooplaEarlyStop:
         push_content = f"1,{json.dumps(inner_str)}"
         page1_html = f"<script>self.__next_f.push([{push_content}])</script>"
 
-        known_ids = {"100", "200"}
+        watermark = ScrapeWatermark(200, "results_sort=newest_listings")
 
         # Skip _warm_up to avoid creating a real AsyncSession (curl_cffi bypasses
         # pytest-socket since libcurl operates at the C level).
@@ -456,15 +476,17 @@ class TestZooplaEarlyStop:
                 min_bedrooms=1,
                 max_bedrooms=2,
                 area="e8",
-                known_source_ids=known_ids,
+                watermark=watermark,
             )
 
         assert mock_fetch.call_count == 1  # Only page 1 fetched
-        assert result.properties == []  # All known → nothing returned
+        assert [p.source_id for p in result.properties] == ["100", "200"]
+        assert result.stopped_at_watermark
+        assert result.newest_id == 200
 
     @pytest.mark.asyncio
     async def test_continues_when_some_results_new(self, zoopla_scraper: ZooplaScraper) -> None:
-        """When only some results are known, don't early-stop — fetch next page."""
+        """When half the page is newer than the watermark, don't early-stop — fetch next page."""
         listings_data = [
             {
                 "listingId": 100,
@@ -490,7 +512,7 @@ class TestZooplaEarlyStop:
         push_content = f"1,{json.dumps(inner_str)}"
         page1_html = f"<script>self.__next_f.push([{push_content}])</script>"
 
-        known_ids = {"100"}  # Only one known — should not early-stop
+        watermark = ScrapeWatermark(100, "results_sort=newest_listings")
 
         # Skip _warm_up to avoid creating a real AsyncSession (curl_cffi bypasses
         # pytest-socket since libcurl operates at the C level).
@@ -506,11 +528,63 @@ class TestZooplaEarlyStop:
                 min_bedrooms=1,
                 max_bedrooms=2,
                 area="e8",
-                known_source_ids=known_ids,
+                watermark=watermark,
             )
 
         assert mock_fetch.call_count >= 2  # Continued past page 1
         assert len(result.properties) == 2  # Both page 1 properties returned
+        assert not result.stopped_at_watermark
+
+    @pytest.mark.asyncio
+    async def test_watermark_for_another_sort_is_ignored(
+        self, zoopla_scraper: ZooplaScraper
+    ) -> None:
+        page1_html = _rsc_search_html([100, 200])
+        zoopla_scraper._warmed_up = True
+        mock_fetch = AsyncMock(side_effect=[page1_html, "<html></html>"])
+        with (
+            patch.object(zoopla_scraper, "_fetch_page", mock_fetch),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await zoopla_scraper.scrape(
+                min_price=1800,
+                max_price=2500,
+                min_bedrooms=1,
+                max_bedrooms=2,
+                area="e8",
+                watermark=ScrapeWatermark(200, "results_sort=lowest_price"),
+            )
+
+        assert mock_fetch.call_count == 2
+        assert not result.stopped_at_watermark
+
+    @pytest.mark.asyncio
+    async def test_newest_id_withheld_when_a_page_failed(
+        self, zoopla_scraper: ZooplaScraper, make_property: Callable[..., Property]
+    ) -> None:
+        """Listings on a failed page went unseen, so the watermark mustn't pass them."""
+
+        async def fetch_page(page_idx: int) -> list[Property] | None:
+            if page_idx == 1:
+                return None
+            return [] if page_idx else [make_property(source_id="300")]
+
+        result = await zoopla_scraper._paginate(fetch_page, max_pages=5)
+
+        assert result.pages_failed == 1
+        assert result.newest_id is None
+
+    @pytest.mark.asyncio
+    async def test_newest_id_withheld_when_results_capped(
+        self, zoopla_scraper: ZooplaScraper, make_property: Callable[..., Property]
+    ) -> None:
+        async def fetch_page(page_idx: int) -> list[Property] | None:
+            return [make_property(source_id=str(300 - page_idx))]
+
+        result = await zoopla_scraper._paginate(fetch_page, max_pages=5, max_results=1)
+
+        assert len(result.properties) == 1
+        assert result.newest_id is None
 
 
 def _make_response(
@@ -0,0 +1,109 @@
+"""Tests for the single-pass Zoopla RSC payload decoder."""
+
+import base64
+import json
+
+from home_finder.scrapers.zoopla_rsc import (
+    RscCaption,
+    RscListing,
+    RscSize,
+    RscText,
+    iter_records,
+    parse_page,
+)
+
+
+def _push(chunk: str | bytes) -> str:
+    """A ``self.__next_f.push`` script tag carrying one flight chunk."""
+    if isinstance(chunk, bytes):
+        args = json.dumps([3, base64.b64encode(chunk).decode()])
+    else:
+        args = json.dumps([1, chunk])
+    return f"<script>self.__next_f.push({args})</script>"
+
+
+def _row(row_id: str, data: object) -> str:
+    return f"{row_id}:{json.dumps(data)}\n"
+
+
+class TestIterRecords:
+    def test_several_rows_per_chunk(self) -> None:
+        stream = _row("1", ["$", "div", None, {}]) + _row(
+            "2", {"regularListingsFormatted": [{"listingId": 1}, {"listingId": 2}]}
+        )
+        html = "<script>self.__next_f.push([0])</script>" + _push(stream)
+
+        assert list(iter_records(html)) == [
+            RscListing({"listingId": 1}),
+            RscListing({"listingId": 2}),
+        ]
+
+    def test_row_split_across_chunks(self) -> None:
+        row = _row("2a", {"details": {"sizeSqft": 750, "numBaths": 1}})
+        html = "\n".join(_push(row[i : i + 7]) for i in range(0, len(row), 7))
+
+        assert list(iter_records(html)) == [RscSize(750)]
+
+    def test_unterminated_rows_split_at_chunk_boundaries(self) -> None:
+        first = json.dumps({"listingId": 1})
+        second = json.dumps({"listingId": 2})
+        html = _push(f"4:{first}") + _push(f"5:{second}")
+
+        assert [r.data["listingId"] for r in iter_records(html)] == [1, 2]  # type: ignore[union-attr]
+
+    def test_text_rows_and_binary_chunks(self) -> None:
+        text = "Bright flat — two bedrooms\nnear the park"
+        header = f"3:T{len(text.encode()):x},"
+        html = _push(header) + _push(text.encode()) + _push(_row("4", {"listingId": 9}))
+
+        assert list(iter_records(html)) == [RscText("3", text), RscListing({"listingId": 9})]
+
+    def test_skips_malformed_pushes_and_rows(self) -> None:
+        html = (
+            "<script>self.__next_f.push([1, broken])</script>"
+            + _push('1:{"listingId": ')
+            + _push("\n")
+            + _push(_row("2", {"filename": "abc123.jpg", "caption": None}))
+            + _push("some other content")
+        )
+
+        assert list(iter_records(html)) == [RscCaption(None, "abc123.jpg")]
+
+
+class TestParsePage:
+    def test_collects_detail_page_records(self) -> None:
+        listing = {
+            "listingId": 123,
+            "epcRating": "C",
+            "numBaths": 1,
+            "detailedDescription": "$5",
+            "floorArea": {"sizeSqft": 650},
+            "images": [
+                {"caption": "Kitchen", "filename": "aaa111.jpg"},
+                {"caption": None, "filename": "bbb222.png"},
+                {"caption": None, "filename": "not-a-hash.gif"},
+            ],
+        }
+        html = _push(_row("4", listing)) + _push("5:T9,<p>") + _push("Hi</p>")
+
+        page = parse_page(html)
+
+        assert page.taxonomy == listing
+        assert page.resolve(page.taxonomy["detailedDescription"]) == "<p>Hi</p>"
+        assert page.sizes_sqft == [650]
+        assert page.captions == [
+            RscCaption("Kitchen", "aaa111.jpg"),
+            RscCaption(None, "bbb222.png"),
+        ]
+
+    def test_taxonomy_requires_bathroom_count_in_row(self) -> None:
+        html = _push(_row("1", {"similar": [{"epcRating": "B"}]}))
+
+        assert parse_page(html).taxonomy is None
+
+    def test_page_without_payload(self) -> None:
+        page = parse_page("<html><body>No RSC here</body></html>")
+
+        assert page.listings == []
+        assert page.taxonomy is None
+        assert page.resolve("$1") == "$1"
@@ -68,9 +68,24 @@ def _make_photo_bytes() -> bytes:
     return buf.getvalue()
 
 
-def _setup_db(db_path: Path, rows: list[tuple[str, str, str]]) -> None:
-    """Create property_images table and insert rows (property_unique_id, url, image_type)."""
+def _setup_db(
+    db_path: Path,
+    rows: list[tuple[str, str, str]],
+    first_gallery_urls: dict[str, str] | None = None,
+) -> None:
+    """Create properties and property_images tables and insert rows.
+
+    ``rows`` are (property_unique_id, url, image_type); ``first_gallery_urls``
+    maps property unique_id to its card thumbnail URL.
+    """
     conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE properties (unique_id TEXT PRIMARY KEY, first_gallery_url TEXT)")
+    prop_ids = dict.fromkeys(prop_id for prop_id, _url, _type in rows)
+    for prop_id in prop_ids:
+        conn.execute(
+            "INSERT INTO properties (unique_id, first_gallery_url) VALUES (?, ?)",
+            (prop_id, (first_gallery_urls or {}).get(prop_id)),
+        )
     conn.execute(
         "CREATE TABLE property_images ("
         "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
@@ -95,7 +110,8 @@ class TestReclassifyInDb:
         """Should update DB to image_type='epc' AND rename file to epc_* on disk."""
         data_dir = str(tmp_path)
         unique_id = "zoopla:11111"
-        epc_url = "https://example.com/epc.png"
+        # No "epc" in the URL, so only image detection can classify it
+        epc_url = "https://example.com/image_a.png"
         photo_url = "https://example.com/photo.jpg"
 
         # Cache files on disk
@@ -115,6 +131,7 @@ class TestReclassifyInDb:
                 (unique_id, epc_url, "gallery"),
                 (unique_id, photo_url, "gallery"),
             ],
+            first_gallery_urls={unique_id: epc_url},
         )
 
         scanned, reclassified, errors = _reclassify_in_db(db_path, data_dir, dry_run=False)
@@ -127,9 +144,12 @@ class TestReclassifyInDb:
         conn = sqlite3.connect(str(db_path))
         conn.row_factory = sqlite3.Row
         rows = conn.execute("SELECT url, image_type FROM property_images ORDER BY id").fetchall()
+        card = conn.execute("SELECT first_gallery_url FROM properties").fetchone()
         conn.close()
         assert rows[0]["image_type"] == "epc"
         assert rows[1]["image_type"] == "gallery"
+        # Card thumbnail moves off the reclassified EPC onto the photo
+        assert card["first_gallery_url"] == photo_url
 
         # Disk: EPC file renamed, photo file unchanged
         assert not epc_path.exists()
@@ -0,0 +1,156 @@
+"""Tests for single-decode image feature extraction."""
+
+from collections.abc import AsyncGenerator
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from home_finder.db import PropertyStorage
+from home_finder.utils.epc_detector import detect_epc
+from home_finder.utils.floorplan_detector import detect_floorplan
+from home_finder.utils.image_cache import find_thumbnail, get_cache_dir
+from home_finder.utils.image_features import extract_image_features
+from home_finder.utils.image_hash import hash_cached_gallery, hash_from_disk
+
+
+def _save(path: Path, img: Image.Image, fmt: str = "JPEG") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buf = BytesIO()
+    img.save(buf, format=fmt)
+    path.write_bytes(buf.getvalue())
+    return path
+
+
+def _photo(size: tuple[int, int] = (1200, 800)) -> Image.Image:
+    """Colourful scene with pixel noise, so its entropy is photo-like."""
+    w, h = size
+    img = Image.new("RGB", size, (135, 206, 235))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 2 * h // 3, w, h], fill=(34, 139, 34))
+    draw.rectangle([w // 8, h // 3, w // 3, 2 * h // 3], fill=(139, 69, 19))
+    draw.ellipse([w // 2, h // 4, 2 * w // 3, h // 2], fill=(255, 215, 0))
+    # Coarse noise survives the downscale to the 256px working copy
+    coarse = (w // 8, h // 8)
+    noise = Image.merge("RGB", [Image.effect_noise(coarse, 64) for _ in range(3)])
+    return Image.blend(img, noise.resize(size, Image.Resampling.NEAREST), 0.5)
+
+
+def _floorplan() -> Image.Image:
+    img = Image.new("RGB", (1000, 750), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([50, 50, 950, 700], outline="black", width=6)
+    draw.line([(500, 50), (500, 700)], fill="black", width=4)
+    draw.line([(50, 375), (500, 375)], fill="black", width=4)
+    return img
+
+
+def _epc_chart() -> Image.Image:
+    img = Image.new("RGB", (800, 600), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    colors = [(0, 128, 0), (50, 180, 50), (140, 200, 60), (255, 255, 0), (255, 165, 0)]
+    for i, color in enumerate(colors):
+        draw.rectangle([80, 100 + i * 60, 320 + 60 * i, 150 + i * 60], fill=color)
+    draw.rectangle([80, 400, 600, 450], fill=(255, 0, 0))
+    return img
+
+
+class TestExtractImageFeatures:
+    def test_photo_features_and_thumbnail(self, tmp_path: Path) -> None:
+        path = _save(tmp_path / "gallery_000_abc12345.jpg", _photo())
+
+        features = extract_image_features(path)
+
+        assert features is not None
+        assert (features.width, features.height) == (1200, 800)
+        assert features.file_size == path.stat().st_size
+        assert not features.is_floorplan
+        assert not features.is_epc
+        assert features.phash == hash_from_disk(path)
+        thumb = find_thumbnail(path)
+        assert thumb is not None
+        with Image.open(thumb) as img:
+            assert max(img.size) == 480
+
+    def test_phash_identical_to_hash_from_disk(self, tmp_path: Path) -> None:
+        """Indexed hashes must not depend on which path computed them."""
+        for i, size in enumerate([(1200, 800), (4000, 3000), (300, 200)]):
+            path = _save(tmp_path / f"gallery_{i:03d}_abc12345.jpg", _photo(size))
+            for thumbnail in (True, False):
+                features = extract_image_features(path, thumbnail=thumbnail)
+                assert features is not None
+                assert features.phash == hash_from_disk(path)
+
+    def test_scores_agree_with_detectors(self, tmp_path: Path) -> None:
+        for name, img, fmt, expected in [
+            ("gallery_000_a.png", _floorplan(), "PNG", (True, False)),
+            ("gallery_001_b.png", _epc_chart(), "PNG", (False, True)),
+            ("gallery_002_c.jpg", _photo(), "JPEG", (False, False)),
+        ]:
+            path = _save(tmp_path / name, img, fmt)
+            features = extract_image_features(path, thumbnail=False)
+            assert features is not None
+            assert (features.is_floorplan, features.is_epc) == expected
+            assert features.is_floorplan == detect_floorplan(path.read_bytes())[0]
+            assert features.is_epc == detect_epc(path.read_bytes())[0]
+
+    def test_no_thumbnail_for_epc_chart(self, tmp_path: Path) -> None:
+        path = _save(tmp_path / "gallery_000_abc12345.png", _epc_chart(), "PNG")
+
+        features = extract_image_features(path)
+
+        assert features is not None and features.is_epc
+        assert find_thumbnail(path) is None
+
+    def test_undecodable_files_return_none(self, tmp_path: Path) -> None:
+        svg = tmp_path / "gallery_000_a.jpg"
+        svg.write_bytes(b'<?xml version="1.0"?><svg></svg>')
+        html = tmp_path / "gallery_001_b.jpg"
+        html.write_bytes(b"<html>error</html>")
+
+        assert extract_image_features(svg) is None
+        assert extract_image_features(html) is None
+        assert extract_image_features(tmp_path / "missing.jpg") is None
+
+
+class TestPersistedImageFeatures:
+    @pytest.fixture
+    async def storage(self) -> AsyncGenerator[PropertyStorage, None]:
+        s = PropertyStorage(":memory:")
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_dedup_reads_extracted_phash(
+        self, tmp_path: Path, storage: PropertyStorage
+    ) -> None:
+        cache_dir = get_cache_dir(str(tmp_path), "openrent:1")
+        path = _save(cache_dir / "gallery_000_abc12345.jpg", _photo())
+        features = extract_image_features(path)
+        assert features is not None
+        await storage.save_image_features([features.row("openrent:1", path.name)])
+
+        with patch("home_finder.utils.image_hash.hash_from_disk") as mock_hash:
+            result = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        mock_hash.assert_not_called()
+        assert result == {"openrent:1": [features.phash]}
+
+    async def test_rehash_clears_stale_features(self, storage: PropertyStorage) -> None:
+        await storage.save_image_features(
+            [("openrent:1", "gallery_000_a.jpg", 100, "a" * 16, 1200, 800, 0.1, 0.0)]
+        )
+        conn = await storage._get_connection()
+        query = (
+            "SELECT file_size, phash, width, height, floorplan_score, epc_score"
+            " FROM image_hashes WHERE property_unique_id = 'openrent:1'"
+        )
+        cursor = await conn.execute(query)
+        assert tuple(await cursor.fetchone()) == (100, "a" * 16, 1200, 800, 0.1, 0.0)
+
+        await storage.save_gallery_hashes([("openrent:1", "gallery_000_a.jpg", 200, "b" * 16)])
+
+        cursor = await conn.execute(query)
+        assert tuple(await cursor.fetchone()) == (200, "b" * 16, None, None, None, None)
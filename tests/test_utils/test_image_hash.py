@@ -1,23 +1,31 @@
 """Tests for image hashing utilities."""
 
 import io
+from collections.abc import AsyncGenerator
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import imagehash
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 from PIL import Image
 from pydantic import HttpUrl
 
+from home_finder.db.storage import PropertyStorage
 from home_finder.models import Property, PropertySource
+from home_finder.utils.image_cache import get_cache_dir
 from home_finder.utils.image_hash import (
     HASH_DISTANCE_THRESHOLD,
+    PackedGalleryHashes,
     count_gallery_hash_matches,
     fetch_and_hash_image,
     fetch_image_hashes_batch,
     hash_cached_gallery,
+    hash_cached_gallery_files,
     hash_from_disk,
     hashes_match,
+    pack_hashes,
 )
 
 
@@ -371,6 +379,100 @@ class TestHashCachedGallery:
         assert "zoopla:2" in result
 
 
+class TestPersistedGalleryHashIndex:
+    """Tests for hash_cached_gallery reusing the image_hashes table."""
+
+    @pytest.fixture
+    async def storage(self) -> AsyncGenerator[PropertyStorage, None]:
+        s = PropertyStorage(":memory:")
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_first_lookup_persists_hashes(
+        self, tmp_path: Path, storage: PropertyStorage
+    ) -> None:
+        TestHashCachedGallery._setup_gallery(
+            tmp_path,
+            "openrent:1",
+            {
+                "gallery_000_abc12345.jpg": _make_test_image("red"),
+                "gallery_001_def67890.svg": b"<svg></svg>",
+            },
+        )
+
+        result = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        index = await storage.get_gallery_hashes(["openrent:1"])
+        assert set(index["openrent:1"]) == {"gallery_000_abc12345.jpg", "gallery_001_def67890.svg"}
+        assert index["openrent:1"]["gallery_000_abc12345.jpg"][1] == result["openrent:1"][0]
+        # Unhashable files are indexed too, so they aren't re-read next time
+        assert index["openrent:1"]["gallery_001_def67890.svg"][1] is None
+
+    async def test_indexed_files_are_not_decoded_again(
+        self, tmp_path: Path, storage: PropertyStorage
+    ) -> None:
+        TestHashCachedGallery._setup_gallery(
+            tmp_path, "openrent:1", {"gallery_000_abc12345.jpg": _make_test_image("red")}
+        )
+        first = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        with (
+            patch("home_finder.utils.image_hash.hash_from_disk") as mock_hash,
+            patch("home_finder.utils.image_hash._purge_if_corrupt") as mock_purge,
+        ):
+            second = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        mock_hash.assert_not_called()
+        mock_purge.assert_not_called()
+        assert second == first
+
+    async def test_changed_file_is_rehashed(self, tmp_path: Path, storage: PropertyStorage) -> None:
+        TestHashCachedGallery._setup_gallery(
+            tmp_path, "openrent:1", {"gallery_000_abc12345.jpg": _make_test_image("red")}
+        )
+        await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        # Overwrite with a different-sized image under the same filename
+        replacement = _make_test_image("blue", size=(64, 64))
+        TestHashCachedGallery._setup_gallery(
+            tmp_path, "openrent:1", {"gallery_000_abc12345.jpg": replacement}
+        )
+        result = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        path = get_cache_dir(str(tmp_path), "openrent:1") / "gallery_000_abc12345.jpg"
+        assert result["openrent:1"] == [hash_from_disk(path)]
+        index = await storage.get_gallery_hashes(["openrent:1"])
+        assert index["openrent:1"]["gallery_000_abc12345.jpg"][0] == len(replacement)
+
+    async def test_index_rows_for_deleted_files_are_ignored(
+        self, tmp_path: Path, storage: PropertyStorage
+    ) -> None:
+        await storage.save_gallery_hashes([("openrent:1", "gallery_000_gone.jpg", 10, "a" * 16)])
+        TestHashCachedGallery._setup_gallery(
+            tmp_path, "openrent:1", {"gallery_001_abc12345.jpg": _make_test_image("red")}
+        )
+
+        files = await hash_cached_gallery_files(["openrent:1"], str(tmp_path), storage=storage)
+
+        assert [p.name for p in files["openrent:1"]] == ["gallery_001_abc12345.jpg"]
+
+    async def test_corrupt_new_file_is_purged_not_indexed(
+        self, tmp_path: Path, storage: PropertyStorage
+    ) -> None:
+        TestHashCachedGallery._setup_gallery(
+            tmp_path, "openrent:1", {"gallery_000_abc12345.jpg": b"<html>error</html>"}
+        )
+
+        result = await hash_cached_gallery(["openrent:1"], str(tmp_path), storage=storage)
+
+        assert result == {}
+        assert not (
+            get_cache_dir(str(tmp_path), "openrent:1") / "gallery_000_abc12345.jpg"
+        ).exists()
+        assert await storage.get_gallery_hashes(["openrent:1"]) == {}
+
+
 class TestCountGalleryHashMatches:
     """Tests for count_gallery_hash_matches."""
 
@@ -529,3 +631,68 @@ class TestPurgeCorruptCachedImages:
         result = hash_from_disk(img_path)
         assert result is None
         assert img_path.exists()  # File should NOT be deleted
+
+
+def _reference_match_count(hashes1: list[str], hashes2: list[str]) -> int:
+    """The original scalar greedy loop, kept as an oracle for the vectorized path."""
+    matched: set[int] = set()
+    count = 0
+    for h1 in hashes1:
+        for j, h2 in enumerate(hashes2):
+            if j not in matched and hashes_match(h1, h2):
+                count += 1
+                matched.add(j)
+                break
+    return count
+
+
+# Hashes clustered around a few bases so near-threshold distances are common
+_near_hashes = st.builds(
+    lambda base, flips: f"{base ^ flips:016x}",
+    st.sampled_from([0, 0xFFFF_0000_FFFF_0000, 0x0123_4567_89AB_CDEF]),
+    st.integers(min_value=0, max_value=2**64 - 1).map(
+        lambda bits: bits & 0x0000_0000_0000_3FFF  # up to 14 flipped low bits
+    ),
+)
+
+
+class TestVectorizedGalleryMatching:
+    """pack_hashes / PackedGalleryHashes agree with scalar hashes_match semantics."""
+
+    @given(
+        st.lists(_near_hashes, max_size=12),
+        st.lists(_near_hashes, max_size=12),
+    )
+    @settings(max_examples=200, deadline=None)
+    def test_count_matches_reference(self, hashes1: list[str], hashes2: list[str]) -> None:
+        expected = _reference_match_count(hashes1, hashes2)
+        assert count_gallery_hash_matches(hashes1, hashes2) == expected
+        packed = PackedGalleryHashes({"a": hashes1, "b": hashes2})
+        assert packed.count_matches("a", "b") == expected
+
+    def test_threshold_boundary(self) -> None:
+        base = 0
+        at_threshold = f"{(1 << HASH_DISTANCE_THRESHOLD) - 1:016x}"
+        beyond = f"{(1 << (HASH_DISTANCE_THRESHOLD + 1)) - 1:016x}"
+        assert count_gallery_hash_matches([f"{base:016x}"], [at_threshold]) == 1
+        assert count_gallery_hash_matches([f"{base:016x}"], [beyond]) == 0
+
+    def test_invalid_hashes_never_match(self) -> None:
+        _, valid = pack_hashes(["a" * 16, "not_a_hash_str!!", "", "abc"])
+        assert valid.tolist() == [True, False, False, False]
+        assert count_gallery_hash_matches(["extra_hash_1"], ["extra_hash_1"]) == 0
+
+    def test_packed_unknown_or_empty_gallery(self) -> None:
+        packed = PackedGalleryHashes({"a": ["a" * 16], "b": []})
+        assert "a" in packed
+        assert "c" not in packed
+        assert packed.count_matches("a", "b") == 0
+        assert packed.count_matches("a", "c") == 0
+        assert packed.get("a") == ["a" * 16]
+
+    def test_packed_slices_are_per_property(self) -> None:
+        h = "a" * 16
+        packed = PackedGalleryHashes({"a": [h, h], "b": [h], "c": ["0" * 16]})
+        assert packed.count_matches("a", "b") == 1
+        assert packed.count_matches("b", "a") == 1
+        assert packed.count_matches("a", "c") == 0
@@ -0,0 +1,48 @@
+"""Tests for the shared image process pool."""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from unittest.mock import patch
+
+from home_finder.utils import image_pool as image_pool_module
+from home_finder.utils.image_pool import image_pool, run_image_task
+
+
+class TestRunImageTask:
+    async def test_runs_on_a_thread_without_a_pool(self) -> None:
+        assert await run_image_task(os.getpid) == os.getpid()
+
+    async def test_runs_in_a_worker_process_inside_the_pool(self) -> None:
+        async with image_pool(1):
+            assert await run_image_task(os.getpid) != os.getpid()
+            assert await run_image_task(divmod, 7, 2) == (3, 1)
+        assert image_pool_module._pool is None
+
+    async def test_zero_workers_keeps_threads(self) -> None:
+        async with image_pool(0):
+            assert image_pool_module._pool is None
+            assert await run_image_task(os.getpid) == os.getpid()
+
+    async def test_nested_pools_share_the_outer_one(self) -> None:
+        async with image_pool(1):
+            outer = image_pool_module._pool
+            async with image_pool(2):
+                assert image_pool_module._pool is outer
+            assert image_pool_module._pool is outer
+
+    async def test_broken_pool_falls_back_to_a_thread(self) -> None:
+        run_in_executor = asyncio.BaseEventLoop.run_in_executor
+
+        def _broken(
+            self: asyncio.BaseEventLoop, executor: Executor | None, *args: Any
+        ) -> asyncio.Future[Any]:
+            if isinstance(executor, ProcessPoolExecutor):
+                raise BrokenProcessPool("worker died")
+            return run_in_executor(self, executor, *args)
+
+        async with image_pool(1):
+            with patch("asyncio.BaseEventLoop.run_in_executor", new=_broken):
+                assert await run_image_task(os.getpid) == os.getpid()
@@ -0,0 +1,30 @@
+"""Tests for event-loop lag sampling."""
+
+import asyncio
+import time
+
+from home_finder.utils.loop_lag import LoopLagMonitor
+
+
+class TestLoopLagMonitor:
+    async def test_blocking_call_shows_as_lag(self) -> None:
+        async with LoopLagMonitor(interval=0.01) as lag:
+            await asyncio.sleep(0.03)
+            time.sleep(0.15)  # Holds the loop, as a synchronous parse would
+            await asyncio.sleep(0.03)
+
+        assert lag.max_ms >= 100
+        assert lag.p95_ms <= lag.max_ms
+
+    async def test_idle_loop_has_little_lag(self) -> None:
+        async with LoopLagMonitor(interval=0.01) as lag:
+            await asyncio.sleep(0.1)
+
+        assert lag.max_ms < 100
+
+    async def test_no_samples(self) -> None:
+        async with LoopLagMonitor(interval=10) as lag:
+            pass
+
+        assert lag.max_ms == 0.0
+        assert lag.p95_ms == 0.0
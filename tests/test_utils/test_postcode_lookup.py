@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from home_finder.utils.postcode_lookup import (
+    bulk_lookup_wards,
     bulk_reverse_lookup_wards,
     lookup_ward,
     reverse_lookup_ward,
@@ -154,3 +155,48 @@ class TestBulkReverseLookup:
 
             result = await bulk_reverse_lookup_wards([(51.549, -0.075)])
             assert result == [None]
+
+
+class TestBulkLookupWards:
+    async def test_empty_input(self) -> None:
+        assert await bulk_lookup_wards([]) == {}
+
+    async def test_maps_normalised_postcodes_including_unknown(self) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = {
+            "status": 200,
+            "result": [
+                {"query": "E8 3RH", "result": {"admin_ward": "London Fields"}},
+                {"query": "ZZ9 9ZZ", "result": None},
+            ],
+        }
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=mock_resp)
+
+        result = await bulk_lookup_wards(["e8  3rh", "ZZ9 9ZZ", "E8 3RH"], client=client)
+
+        assert result == {"E8 3RH": "London Fields", "ZZ9 9ZZ": None}
+        client.post.assert_awaited_once()
+        assert client.post.await_args.kwargs["json"] == {"postcodes": ["E8 3RH", "ZZ9 9ZZ"]}
+
+    async def test_batches_of_100_and_failed_batches_omitted(self) -> None:
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.json.return_value = {
+            "result": [
+                {"query": f"E8 {i}AA", "result": {"admin_ward": "Dalston"}} for i in range(3)
+            ]
+        }
+        failed = MagicMock()
+        failed.status_code = 500
+        client = AsyncMock()
+        client.post = AsyncMock(side_effect=[ok, failed])
+
+        postcodes = [f"E8 {i}AA" for i in range(150)]
+        result = await bulk_lookup_wards(postcodes, client=client)
+
+        assert client.post.await_count == 2
+        sizes = sorted(len(c.kwargs["json"]["postcodes"]) for c in client.post.await_args_list)
+        assert sizes == [50, 100]
+        assert result == {f"E8 {i}AA": "Dalston" for i in range(3)}
@@ -42,6 +42,11 @@ from home_finder.web.routes import (  # type: ignore[attr-defined]
     router,
 )
 
+# Markup marking a property's card in the results grid
+_CARD_A = 'data-property-id="openrent:100"'
+_CARD_B = 'data-property-id="rightmove:200"'
+_CARD_STUDIO = 'data-property-id="openrent:300"'
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -213,7 +218,7 @@ class TestDashboard:
         await storage.save_merged_property(merged_a)
         resp = client.get("/")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_filter_by_bedrooms(
@@ -222,7 +227,7 @@ class TestDashboard:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?bedrooms=1")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?bedrooms=3")
         assert resp.status_code == 200
@@ -235,7 +240,7 @@ class TestDashboard:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?area=E8")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?area=N16")
         assert resp.status_code == 200
@@ -290,6 +295,104 @@ class TestDashboard:
         await storage.save_merged_property(merged_a)
         resp = client.get("/")
         assert 'id="properties-map-data"' in resp.text
+        # Only the extent is embedded; markers are fetched per viewport
+        assert '"count": 1' in resp.text
+        assert merged_a.unique_id not in resp.text.split('id="properties-map-data"')[1][:200]
+
+
+# ---------------------------------------------------------------------------
+# Map viewport markers
+# ---------------------------------------------------------------------------
+
+
+_E8_VIEW = {"south": 51.54, "west": -0.06, "north": 51.55, "east": -0.05}
+
+
+class TestMapMarkersEndpoint:
+    @pytest.mark.asyncio
+    async def test_zoomed_in_returns_markers_in_view(
+        self,
+        client: TestClient,
+        storage: PropertyStorage,
+        merged_a: MergedProperty,
+        merged_b: MergedProperty,
+    ) -> None:
+        await storage.save_merged_property(merged_a)
+        await storage.save_merged_property(merged_b)
+
+        resp = client.get("/map/markers", params={**_E8_VIEW, "zoom": 16})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["clustered"] is False
+        assert [m["id"] for m in data["markers"]] == [merged_a.unique_id]
+        assert data["markers"][0]["image_url"] == f"/property/{merged_a.unique_id}/thumbnail"
+
+    @pytest.mark.asyncio
+    async def test_zoomed_out_returns_clusters(
+        self,
+        client: TestClient,
+        storage: PropertyStorage,
+        merged_a: MergedProperty,
+        merged_b: MergedProperty,
+    ) -> None:
+        await storage.save_merged_property(merged_a)
+        await storage.save_merged_property(merged_b)
+
+        resp = client.get(
+            "/map/markers",
+            params={"south": 51.0, "west": -1.0, "north": 52.0, "east": 1.0, "zoom": 8},
+        )
+        data = resp.json()
+        assert data["clustered"] is True
+        assert data["markers"] == []
+        assert len(data["clusters"]) == 1
+        assert data["clusters"][0]["count"] == 2
+        assert data["clusters"][0]["min_price"] == 1900
+
+    @pytest.mark.asyncio
+    async def test_filters_apply(
+        self,
+        client: TestClient,
+        storage: PropertyStorage,
+        merged_a: MergedProperty,
+        merged_b: MergedProperty,
+    ) -> None:
+        await storage.save_merged_property(merged_a)
+        await storage.save_merged_property(merged_b)
+
+        resp = client.get(
+            "/map/markers",
+            params={
+                "south": 51.0,
+                "west": -1.0,
+                "north": 52.0,
+                "east": 1.0,
+                "zoom": 8,
+                "bedrooms": 2,
+            },
+        )
+        data = resp.json()
+        # A lone property in its cell comes back as a full marker
+        assert data["clusters"] == []
+        assert [m["id"] for m in data["markers"]] == [merged_b.unique_id]
+
+    def test_requires_viewport(self, client: TestClient) -> None:
+        assert client.get("/map/markers", params={"zoom": 12}).status_code == 422
+        resp = client.get("/map/markers", params={**_E8_VIEW, "north": 95, "zoom": 12})
+        assert resp.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_redirects_to_source(
+        self, client: TestClient, storage: PropertyStorage, merged_a: MergedProperty
+    ) -> None:
+        await storage.save_merged_property(merged_a)
+
+        resp = client.get(f"/property/{merged_a.unique_id}/thumbnail", follow_redirects=False)
+        assert resp.status_code == 307
+        assert resp.headers["location"] == "https://example.com/img.jpg"
+
+        missing = client.get("/property/openrent:nope/thumbnail", follow_redirects=False)
+        assert missing.status_code == 404
 
 
 # ---------------------------------------------------------------------------
@@ -890,8 +993,8 @@ class TestPriceFilters:
         await storage.save_merged_property(merged_b)  # 2500
         resp = client.get("/?min_price=2000")
         assert resp.status_code == 200
-        assert "2 bed in N16" in resp.text
-        assert "1 bed in E8" not in resp.text
+        assert _CARD_B in resp.text
+        assert _CARD_A not in resp.text
 
     @pytest.mark.asyncio
     async def test_max_price_filter(
@@ -905,8 +1008,8 @@ class TestPriceFilters:
         await storage.save_merged_property(merged_b)  # 2500
         resp = client.get("/?max_price=2000")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
-        assert "2 bed in N16" not in resp.text
+        assert _CARD_A in resp.text
+        assert _CARD_B not in resp.text
 
     @pytest.mark.asyncio
     async def test_price_range_match(
@@ -920,8 +1023,8 @@ class TestPriceFilters:
         await storage.save_merged_property(merged_b)  # 2500
         resp = client.get("/?min_price=1800&max_price=2000")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
-        assert "2 bed in N16" not in resp.text
+        assert _CARD_A in resp.text
+        assert _CARD_B not in resp.text
 
     @pytest.mark.asyncio
     async def test_price_range_no_match(
@@ -958,8 +1061,8 @@ class TestCombinedFilters:
         await storage.save_merged_property(merged_b)  # 2 bed N16
         resp = client.get("/?bedrooms=1&area=E8")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
-        assert "2 bed in N16" not in resp.text
+        assert _CARD_A in resp.text
+        assert _CARD_B not in resp.text
 
     @pytest.mark.asyncio
     async def test_conflicting_filters(
@@ -986,7 +1089,7 @@ class TestCombinedFilters:
         await storage.save_merged_property(merged_a)  # 1 bed, 1900, E8
         resp = client.get("/?bedrooms=1&min_price=1500&max_price=2000&area=E8")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_htmx_partial_with_filters(
@@ -999,7 +1102,7 @@ class TestCombinedFilters:
         resp = client.get("/?bedrooms=1&area=E8", headers={"HX-Request": "true"})
         assert resp.status_code == 200
         assert "<!DOCTYPE html>" not in resp.text
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
 
 # ---------------------------------------------------------------------------
@@ -1072,7 +1175,7 @@ class TestQualityFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?property_type=evil_injection")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_invalid_hob_type_ignored(
@@ -1081,7 +1184,7 @@ class TestQualityFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?hob_type=nuclear")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_invalid_natural_light_ignored(
@@ -1090,7 +1193,7 @@ class TestQualityFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?natural_light=blazing")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_property_type_filter(
@@ -1111,7 +1214,7 @@ class TestQualityFilters:
 
         resp = client.get("/?property_type=warehouse")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?property_type=victorian")
         assert resp.status_code == 200
@@ -1131,7 +1234,7 @@ class TestQualityFilters:
 
         resp = client.get("/?hob_type=gas")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?hob_type=induction")
         assert resp.status_code == 200
@@ -1160,7 +1263,7 @@ class TestQualityFilters:
             "/?property_type=warehouse&hob_type=gas&outdoor_space=yes&natural_light=excellent"
         )
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?property_type=warehouse&hob_type=induction")
         assert resp.status_code == 200
@@ -1183,7 +1286,7 @@ class TestQualityFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?property_type=&outdoor_space=&hob_type=")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_filter_badge_shown_when_active(
@@ -1213,7 +1316,7 @@ class TestStudioSupport:
         await storage.save_merged_property(merged_studio)
         resp = client.get("/?bedrooms=0")
         assert resp.status_code == 200
-        assert "Studio in E8" in resp.text
+        assert _CARD_STUDIO in resp.text
 
     @pytest.mark.asyncio
     async def test_studio_chip_label(
@@ -1296,7 +1399,7 @@ class TestNewFilters:
 
         resp = client.get("/?office_separation=dedicated_room")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?office_separation=none")
         assert resp.status_code == 200
@@ -1321,7 +1424,7 @@ class TestNewFilters:
 
         resp = client.get("/?hosting_layout=excellent")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?hosting_layout=poor")
         assert resp.status_code == 200
@@ -1346,7 +1449,7 @@ class TestNewFilters:
 
         resp = client.get("/?hosting_noise_risk=low")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?hosting_noise_risk=high")
         assert resp.status_code == 200
@@ -1371,7 +1474,7 @@ class TestNewFilters:
 
         resp = client.get("/?broadband_type=fttp")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
         resp = client.get("/?broadband_type=standard")
         assert resp.status_code == 200
@@ -1384,7 +1487,7 @@ class TestNewFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?office_separation=evil_injection")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_invalid_hosting_layout_ignored(
@@ -1393,7 +1496,7 @@ class TestNewFilters:
         await storage.save_merged_property(merged_a)
         resp = client.get("/?hosting_layout=evil")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_new_filter_chips_rendered(
@@ -1911,8 +2014,8 @@ class TestTemporalFilter:
 
         resp = client.get("/?added=1d")
         assert resp.status_code == 200
-        assert "2 bed in N16" in resp.text
-        assert "1 bed in E8" not in resp.text
+        assert _CARD_B in resp.text
+        assert _CARD_A not in resp.text
 
     @pytest.mark.asyncio
     async def test_added_30d_includes_recent(
@@ -1935,7 +2038,7 @@ class TestTemporalFilter:
         await storage.save_merged_property(merged)
         resp = client.get("/?added=30d")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_empty_added_shows_all(
@@ -1956,7 +2059,7 @@ class TestTemporalFilter:
         await storage.save_merged_property(merged)
         resp = client.get("/?added=")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     def test_invalid_added_ignored(self, client: TestClient) -> None:
         """?added=evil should silently be ignored (200 OK)."""
@@ -1984,7 +2087,7 @@ class TestTemporalFilter:
         await storage.save_merged_property(merged)
         resp = client.get("/?added=7d&sort=fit_desc")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
+        assert _CARD_A in resp.text
 
     @pytest.mark.asyncio
     async def test_added_chip_rendered(
@@ -2223,8 +2326,8 @@ class TestStatusRoutes:
         await storage.update_user_status(merged_a.unique_id, UserStatus.INTERESTED)
         resp = client.get("/?status=interested")
         assert resp.status_code == 200
-        assert "1 bed in E8" in resp.text
-        assert "2 bed in N16" not in resp.text
+        assert _CARD_A in resp.text
+        assert _CARD_B not in resp.text
 
     @pytest.mark.asyncio
     async def test_status_filter_chip_rendered(
@@ -2457,10 +2560,19 @@ class TestOffMarketDisplay:
         await storage.save_merged_property(merged_a)
         await storage.mark_off_market(merged_a.unique_id)
 
-        resp = client.get("/?off_market=show")
+        resp = client.get(
+            "/map/markers",
+            params={
+                "off_market": "show",
+                "south": 51.5,
+                "west": -0.1,
+                "north": 51.6,
+                "east": 0.0,
+                "zoom": 16,
+            },
+        )
         assert resp.status_code == 200
-        # Map markers JSON includes is_off_market
-        assert "is_off_market" in resp.text
+        assert resp.json()["markers"][0]["is_off_market"] is True
 
 
 # ---------------------------------------------------------------------------